@@ -29,6 +29,17 @@ def main():
     backend_parser.add_argument("--port", type=int, help="Port to run the backend on")
     backend_parser.add_argument("--host", type=str, help="Host to bind the backend to")
     backend_parser.add_argument("--debug", action="store_true", help="Run in debug mode")
+    backend_parser.add_argument("--preload", action="store_true", help="Load ML libraries and models at startup")
+    
+    # Schema migrations command
+    migrate_parser = subparsers.add_parser("migrate", help="Apply schema migrations (constraints and indexes)")
+    migrate_parser.add_argument("--status", action="store_true", help="Show applied and pending migrations")
+    migrate_parser.add_argument("--check-indexes", action="store_true", help="Check that registered queries use indexes (EXPLAIN)")
+    migrate_parser.add_argument("--target", type=int, help="Highest migration version to apply")
+    migrate_parser.add_argument("--dry-run", action="store_true", help="Show pending migrations without applying them")
+    
+    # Startup benchmark command
+    benchmark_parser = subparsers.add_parser("benchmark-startup", help="Measure backend import and ML warm-up time")
     
     # Run frontend command
     frontend_parser = subparsers.add_parser("frontend", help="Run the frontend dev server")
@@ -48,7 +59,13 @@ def main():
         return load_main()
     elif args.command == "backend":
         from src.backend.cli import run_backend
-        return run_backend(args.port, args.host, args.debug)
+        return run_backend(args.port, args.host, args.debug, args.preload)
+    elif args.command == "migrate":
+        from src.backend.migrations.cli import run_migrations
+        return run_migrations(args.status, args.check_indexes, args.target, args.dry_run)
+    elif args.command == "benchmark-startup":
+        from src.backend.startup_benchmark import main as benchmark_main
+        return benchmark_main([])
     elif args.command == "frontend":
         from src.frontend.cli import run_frontend
         return run_frontend()
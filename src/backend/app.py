@@ -4,9 +4,9 @@ Talent Matcher API
 This module provides the main Flask application for the talent matching system.
 """
 
-from flask import Flask
+from flask import Flask, has_request_context
 from flask_cors import CORS
-from flask_jwt_extended import JWTManager
+from flask_jwt_extended import JWTManager, get_jwt_identity
 import os
 import datetime
 
@@ -14,16 +14,59 @@ from src.backend.services.graph_service import GraphService
 from src.backend.services.matching_service import MatchingService
 from src.backend.services.auth_service import AuthService
 from src.backend.routes import init_all_routes
-from src.backend.config import JWT_SECRET_KEY, JWT_ACCESS_TOKEN_EXPIRES_HOURS, API_PORT, API_HOST
+from src.backend.config import (
+    JWT_SECRET_KEY, JWT_ACCESS_TOKEN_EXPIRES_HOURS, API_PORT, API_HOST, PRELOAD_ML_MODELS
+)
+from src.backend.utils.formatters import RecordJSONProvider
+from src.backend.utils.lazy_loader import warm_up
+from src.backend.migrations.runner import MigrationRunner
+from src.backend.repositories.base.bookmarks import set_scope_resolver
+from src.backend.repositories.base.driver import warm_up_pool
 
 
-def create_app():
+def warn_pending_migrations(driver):
+    """Print a warning if schema migrations have not been applied to the database.
+    
+    Args:
+        driver: Neo4j driver
+    """
+    try:
+        pending = MigrationRunner(driver).pending()
+    except Exception as e:
+        print(f"Warning: Could not check schema migrations: {str(e)}")
+        return
+    if pending:
+        versions = ", ".join(str(migration.version) for migration in pending)
+        print(f"Warning: Schema migrations {versions} are pending; run `python run.py migrate`")
+
+
+def request_bookmark_scope():
+    """Get the signed-in user of the current request as its bookmark scope.
+    
+    Returns:
+        str: Identity of the user, or None outside a request or without a verified token
+    """
+    if not has_request_context():
+        return None
+    try:
+        return get_jwt_identity()
+    except RuntimeError:
+        # The route did not verify a token
+        return None
+
+
+def create_app(preload=None):
     """Create and configure the Flask application.
     
+    Args:
+        preload: Import ML libraries and load the embedding model now instead of
+            on first use. Defaults to the PRELOAD_ML_MODELS setting.
+    
     Returns:
         Flask: Configured Flask application
     """
     app = Flask(__name__)
+    app.json = RecordJSONProvider(app)  # Repository records are converted only when encoded
     CORS(app)  # Enable CORS for all routes
     
     # Configure JWT
@@ -36,9 +79,18 @@ def create_app():
     matching_service = MatchingService.get_instance(graph_service)
     auth_service = AuthService.get_instance(graph_service)
     
-    # Create database constraints and schema
-    graph_service.create_constraints()
-    graph_service.ensure_user_schema()
+    # Schema migrations are applied once per deployment with `run.py migrate`
+    warn_pending_migrations(graph_service.driver)
+    
+    # Reads of a signed-in user may run on a replica, but always see the user's own writes
+    set_scope_resolver(request_bookmark_scope)
+    
+    # Open pool connections now so the first requests do not pay for the handshakes
+    warm_up_pool(graph_service.driver)
+    
+    # Heavy ML dependencies are lazy by default; preload them e.g. before forking workers
+    if PRELOAD_ML_MODELS if preload is None else preload:
+        print(f"Preloaded ML dependencies (seconds): {warm_up()}")
     
     # User loader callback for Flask-JWT-Extended
     @jwt.user_lookup_loader
@@ -11,8 +11,15 @@ import sys
 import argparse
 from dotenv import load_dotenv
 
-def run_backend(port=None, host=None, debug=None):
-    """Run the backend server."""
+def run_backend(port=None, host=None, debug=None, preload=False):
+    """Run the backend server.
+    
+    Args:
+        port: Port to run the backend on
+        host: Host to bind the backend to
+        debug: Whether to run in debug mode
+        preload: Load ML dependencies at startup instead of on first use
+    """
     # Load environment variables
     load_dotenv()
     
@@ -25,7 +32,7 @@ def run_backend(port=None, host=None, debug=None):
     from src.backend.app import create_app
     from src.backend.config import API_PORT, API_HOST
     
-    app = create_app()
+    app = create_app(preload=preload or None)
     
     port = port or API_PORT
     host = host or API_HOST
@@ -55,11 +62,12 @@ def main():
     parser.add_argument('--port', type=int, help='Port to run the backend on (overrides config)')
     parser.add_argument('--host', type=str, help='Host to bind the backend to (overrides config)')
     parser.add_argument('--debug', action='store_true', help='Run in debug mode')
+    parser.add_argument('--preload', action='store_true', help='Load ML libraries and models at startup')
     
     args = parser.parse_args()
     
     # Run the backend
-    run_backend(args.port, args.host, args.debug)
+    run_backend(args.port, args.host, args.debug, args.preload)
     return 0
 
 if __name__ == "__main__":
@@ -23,4 +23,75 @@ JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "default-dev-key")
 JWT_ACCESS_TOKEN_EXPIRES_HOURS = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRES_HOURS", 24))
 
 # Data settings
-DATA_DIR = os.getenv("DATA_DIR", "data") 
\ No newline at end of file
+DATA_DIR = os.getenv("DATA_DIR", "data")
+
+# Embedding settings
+EMBEDDING_MODEL_NAME = os.getenv("EMBEDDING_MODEL_NAME", "all-MiniLM-L6-v2")
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", 256))
+SEMANTIC_MATCH_TOP_K = int(os.getenv("SEMANTIC_MATCH_TOP_K", 50))
+# Vector index neighbours requested per top-K match when refreshing single records,
+# since several experiences of one candidate can be among the nearest
+SEMANTIC_MATCH_OVERSAMPLING = int(os.getenv("SEMANTIC_MATCH_OVERSAMPLING", 4))
+
+# Hybrid retrieval settings (latency budgets in milliseconds)
+RETRIEVAL_GRAPH_BUDGET_MS = int(os.getenv("RETRIEVAL_GRAPH_BUDGET_MS", 1500))
+RETRIEVAL_LEXICAL_BUDGET_MS = int(os.getenv("RETRIEVAL_LEXICAL_BUDGET_MS", 500))
+RETRIEVAL_SEMANTIC_BUDGET_MS = int(os.getenv("RETRIEVAL_SEMANTIC_BUDGET_MS", 500))
+RETRIEVAL_RRF_K = int(os.getenv("RETRIEVAL_RRF_K", 60))
+RETRIEVAL_MAX_WORKERS = int(os.getenv("RETRIEVAL_MAX_WORKERS", 8))
+LEXICAL_INDEX_TTL_SECONDS = int(os.getenv("LEXICAL_INDEX_TTL_SECONDS", 300))
+
+# Embedding cache (set EMBEDDING_CACHE_PATH to an empty string to disable).
+# Bump EMBEDDING_MODEL_VERSION when the model weights change under the same name.
+EMBEDDING_MODEL_VERSION = os.getenv("EMBEDDING_MODEL_VERSION", "1")
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", os.path.join(DATA_DIR, "cache", "embeddings.sqlite3"))
+
+# Background embedding worker: encode every N queued records or after T milliseconds
+EMBEDDING_WORKER_BATCH_SIZE = int(os.getenv("EMBEDDING_WORKER_BATCH_SIZE", 32))
+EMBEDDING_WORKER_FLUSH_MS = int(os.getenv("EMBEDDING_WORKER_FLUSH_MS", 500))
+EMBEDDING_WORKER_MAX_QUEUE = int(os.getenv("EMBEDDING_WORKER_MAX_QUEUE", 10000))
+
+# Import ML libraries and load the embedding model at startup instead of on first use
+PRELOAD_ML_MODELS = os.getenv("PRELOAD_ML_MODELS", "false").lower() in ("1", "true", "yes")
+
+# Clearing the database: rows deleted per transaction, and the node count from which
+# indexes and constraints are dropped during the wipe and recreated afterwards
+CLEAR_BATCH_SIZE = int(os.getenv("CLEAR_BATCH_SIZE", 10000))
+CLEAR_SCHEMA_DROP_THRESHOLD = int(os.getenv("CLEAR_SCHEMA_DROP_THRESHOLD", 1000000))
+
+# Fuzzy (trigram) skill name resolution is off by default: it links names such as
+# "React Native" to the nearest known skill ("React"). Minimum similarity (0-1) when on
+SKILL_FUZZY_MATCHING = os.getenv("SKILL_FUZZY_MATCHING", "false").lower() in ("1", "true", "yes")
+SKILL_FUZZY_THRESHOLD = float(os.getenv("SKILL_FUZZY_THRESHOLD", 0.6))
+
+# Read-through cache of repository read queries (opt-in; the TTL bounds staleness
+# across API processes, since each process only sees its own writes, and behind read
+# replicas, which may lag). Reads in a bookmark scope, e.g. a signed-in user's, bypass it
+QUERY_CACHE_ENABLED = os.getenv("QUERY_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+QUERY_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", 2048))
+QUERY_CACHE_TTL_SECONDS = float(os.getenv("QUERY_CACHE_TTL_SECONDS", 30))
+
+# Query metrics: executions taking at least QUERY_SLOW_MS milliseconds are kept
+# in the slow-query log (a negative threshold disables it)
+QUERY_SLOW_MS = float(os.getenv("QUERY_SLOW_MS", 500))
+QUERY_SLOW_LOG_SIZE = int(os.getenv("QUERY_SLOW_LOG_SIZE", 100))
+
+# Neo4j connection pool of the process-wide driver. Requests wait up to the
+# acquisition timeout for a free connection once the pool is exhausted;
+# connections older than the maximum lifetime are replaced
+NEO4J_MAX_CONNECTION_POOL_SIZE = int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", 100))
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT = float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", 60))
+NEO4J_CONNECTION_TIMEOUT = float(os.getenv("NEO4J_CONNECTION_TIMEOUT", 30))
+NEO4J_MAX_CONNECTION_LIFETIME = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", 3600))
+NEO4J_KEEP_ALIVE = os.getenv("NEO4J_KEEP_ALIVE", "true").lower() in ("1", "true", "yes")
+NEO4J_FETCH_SIZE = int(os.getenv("NEO4J_FETCH_SIZE", 1000))
+# Connections opened when the API starts, so the first requests do not pay for the handshakes
+NEO4J_POOL_WARM_UP_CONNECTIONS = int(os.getenv("NEO4J_POOL_WARM_UP_CONNECTIONS", 4))
+# Users whose latest write bookmarks are kept, so their reads on a replica see their writes
+NEO4J_BOOKMARK_SCOPES_MAX = int(os.getenv("NEO4J_BOOKMARK_SCOPES_MAX", 10000))
+
+# Records the server sends per round trip while a streamed read is consumed
+STREAM_FETCH_SIZE = int(os.getenv("STREAM_FETCH_SIZE", 1000))
+
+# Seconds `run.py migrate` waits for new indexes to come online
+MIGRATION_INDEX_TIMEOUT_SECONDS = int(os.getenv("MIGRATION_INDEX_TIMEOUT_SECONDS", 300))
@@ -0,0 +1,17 @@
+"""
+Schema Migrations Package
+
+This package contains the versioned schema migrations of the knowledge graph
+and the runner that applies them.
+"""
+
+from src.backend.migrations.versions import Migration, IndexedQuery, MIGRATIONS, indexed_queries
+from src.backend.migrations.runner import MigrationRunner
+
+__all__ = [
+    'Migration',
+    'IndexedQuery',
+    'MIGRATIONS',
+    'indexed_queries',
+    'MigrationRunner'
+]
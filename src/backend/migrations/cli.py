@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Schema Migration CLI for Talent Matcher
+
+This module provides CLI functionality to apply the schema migrations, show
+their status and check that the registered queries use indexes. Must be run
+from the project root directory.
+"""
+
+import argparse
+import sys
+from dotenv import load_dotenv
+
+
+def run_migrations(status=False, check_indexes=False, target=None, dry_run=False):
+    """Apply pending schema migrations, or report their status or index usage.
+    
+    Args:
+        status: Only print the state of every migration
+        check_indexes: Only run EXPLAIN on the registered queries and report
+            those that do not use an index
+        target: Highest version to apply, None for all
+        dry_run: Print the migrations that would be applied without applying them
+        
+    Returns:
+        int: Exit code, 1 if a migration changed after it was applied or a
+            checked query does not use an index
+    """
+    # Load environment variables
+    load_dotenv()
+    
+    from src.backend.repositories.base.driver import get_driver, close_driver
+    from src.backend.migrations.runner import MigrationRunner
+    
+    driver = get_driver()
+    try:
+        runner = MigrationRunner(driver)
+        if status:
+            states = runner.status()
+            for migration in states:
+                applied_at = f" ({migration['applied_at']})" if migration['applied_at'] else ""
+                print(f"{migration['version']:>4}  {migration['state']:<8} {migration['description']}{applied_at}")
+            return 1 if any(migration['state'] == 'changed' for migration in states) else 0
+        
+        if check_indexes:
+            report = runner.check_index_usage()
+            for query in report:
+                ok = query['uses_index'] and not query['scans']
+                detail = "" if ok else f"  scans: {', '.join(query['scans']) or 'no index used'}"
+                print(f"{'OK  ' if ok else 'SCAN'}  {query['name']}{detail}")
+            return 0 if all(query['uses_index'] and not query['scans'] for query in report) else 1
+        
+        versions = runner.migrate(target=target, dry_run=dry_run)
+        if not versions:
+            print("Schema is up to date")
+        elif dry_run:
+            print(f"Would apply migrations: {', '.join(str(version) for version in versions)}")
+        else:
+            print(f"Applied migrations: {', '.join(str(version) for version in versions)}")
+        return 0
+    finally:
+        close_driver(driver)
+
+
+def main(argv=None):
+    """CLI entry point for schema migrations."""
+    parser = argparse.ArgumentParser(description='Apply Talent Matcher schema migrations')
+    parser.add_argument('--status', action='store_true', help='Show applied and pending migrations')
+    parser.add_argument('--check-indexes', action='store_true', help='Check that registered queries use indexes (EXPLAIN)')
+    parser.add_argument('--target', type=int, help='Highest migration version to apply')
+    parser.add_argument('--dry-run', action='store_true', help='Show pending migrations without applying them')
+    args = parser.parse_args(argv)
+    
+    return run_migrations(args.status, args.check_indexes, args.target, args.dry_run)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
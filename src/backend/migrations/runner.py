@@ -0,0 +1,168 @@
+"""
+Schema Migration Runner
+
+This module provides the runner that applies the declared schema migrations
+in version order and records each applied version as a (:SchemaMigration)
+node, so every migration runs once per database. It also provides the
+index-usage check, which runs EXPLAIN on the registered queries and reports
+those whose plans scan a whole label instead of seeking an index.
+
+Schema statements cannot share a transaction with data writes, so each
+statement runs in its own auto-commit transaction and the version is
+recorded after all statements of a migration succeeded. Since the statements
+are idempotent, a migration interrupted halfway is simply applied again.
+"""
+
+from src.backend.config import MIGRATION_INDEX_TIMEOUT_SECONDS
+from src.backend.migrations.versions import MIGRATIONS, indexed_queries
+from src.backend.utils.query_metrics import timed_run
+
+
+# Plan operators that read every node of a label or of the whole graph
+SCAN_OPERATORS = ('AllNodesScan', 'NodeByLabelScan', 'PartitionedAllNodesScan', 'PartitionedNodeByLabelScan')
+
+
+class MigrationRunner:
+    """Applies schema migrations and tracks the applied versions in the graph."""
+
+    def __init__(self, driver, migrations=MIGRATIONS):
+        """Initialize the runner.
+
+        Args:
+            driver: Neo4j driver
+            migrations: Migrations to manage, defaults to the declared ones
+        """
+        self.driver = driver
+        self.migrations = sorted(migrations, key=lambda migration: migration.version)
+
+    def applied(self):
+        """Get the versions recorded as applied.
+
+        Returns:
+            dict: Version to dictionary with description, checksum and applied_at
+        """
+        with self.driver.session() as session:
+            records = timed_run(session, "MigrationRunner.applied", """
+                MATCH (m:SchemaMigration)
+                RETURN m.version AS version, m.description AS description,
+                       m.checksum AS checksum, toString(m.applied_at) AS applied_at
+            """).data()
+        return {record["version"]: record for record in records}
+
+    def pending(self):
+        """Get the migrations not applied yet, in version order.
+
+        Returns:
+            list: Migration objects
+        """
+        applied = self.applied()
+        return [migration for migration in self.migrations if migration.version not in applied]
+
+    def status(self):
+        """Get the state of every migration.
+
+        A migration whose statements changed after it was applied is reported
+        as 'changed'; it is not applied again.
+
+        Returns:
+            list: Dictionaries with version, description, state
+                ('applied', 'changed' or 'pending') and applied_at
+        """
+        applied = self.applied()
+        status = []
+        for migration in self.migrations:
+            record = applied.get(migration.version)
+            if record is None:
+                state = 'pending'
+            elif record["checksum"] != migration.checksum:
+                state = 'changed'
+            else:
+                state = 'applied'
+            status.append({
+                'version': migration.version,
+                'description': migration.description,
+                'state': state,
+                'applied_at': record["applied_at"] if record else None
+            })
+        return status
+
+    def migrate(self, target=None, dry_run=False):
+        """Apply the pending migrations up to a target version.
+
+        Args:
+            target: Highest version to apply, None for all
+            dry_run: Only report the migrations that would be applied
+
+        Returns:
+            list: Versions applied (or that would be applied on a dry run)
+        """
+        pending = [migration for migration in self.pending()
+                   if target is None or migration.version <= target]
+        if dry_run or not pending:
+            return [migration.version for migration in pending]
+
+        with self.driver.session() as session:
+            timed_run(session, "MigrationRunner.migrate.tracking_constraint",
+                      "CREATE CONSTRAINT schema_migration_version IF NOT EXISTS "
+                      "FOR (m:SchemaMigration) REQUIRE m.version IS UNIQUE").consume()
+            for migration in pending:
+                print(f"Applying migration {migration.version}: {migration.description}")
+                for statement in migration.statements:
+                    timed_run(session, "MigrationRunner.migrate.statement", statement).consume()
+                timed_run(session, "MigrationRunner.migrate.record", """
+                    MERGE (m:SchemaMigration {version: $version})
+                    SET m.description = $description,
+                        m.checksum = $checksum,
+                        m.applied_at = datetime()
+                """, {
+                    "version": migration.version,
+                    "description": migration.description,
+                    "checksum": migration.checksum
+                }).consume()
+            # Queries issued right after migrating should already use the new indexes
+            timed_run(session, "MigrationRunner.migrate.await_indexes",
+                      "CALL db.awaitIndexes($timeout)", {"timeout": MIGRATION_INDEX_TIMEOUT_SECONDS}).consume()
+        return [migration.version for migration in pending]
+
+    def check_index_usage(self, queries=None):
+        """Run EXPLAIN on queries and report whether their plans use an index.
+
+        Args:
+            queries: IndexedQuery objects, defaults to indexed_queries()
+
+        Returns:
+            list: Dictionaries with name, uses_index, the scan operators found
+                and all operators of the plan
+        """
+        if queries is None:
+            queries = indexed_queries()
+        report = []
+        with self.driver.session() as session:
+            for indexed_query in queries:
+                summary = timed_run(session, "MigrationRunner.check_index_usage",
+                                    "EXPLAIN " + indexed_query.query, indexed_query.parameters).consume()
+                operators = self.plan_operators(getattr(summary, 'plan', None))
+                report.append({
+                    'name': indexed_query.name,
+                    'uses_index': any('Index' in operator for operator in operators),
+                    'scans': [operator for operator in operators if operator in SCAN_OPERATORS],
+                    'operators': operators
+                })
+        return report
+
+    @staticmethod
+    def plan_operators(plan):
+        """List the operator types of a query plan, depth first.
+
+        Args:
+            plan: Plan dictionary of a result summary, with operatorType and children
+
+        Returns:
+            list: Operator names without the runtime suffix, e.g. 'NodeIndexSeek'
+        """
+        if not plan:
+            return []
+        operators = [plan.get('operatorType', '').split('@')[0]]
+        for child in plan.get('children', []):
+            operators.extend(MigrationRunner.plan_operators(child))
+        return operators
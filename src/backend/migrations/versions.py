@@ -0,0 +1,123 @@
+"""
+Schema Migrations
+
+This module declares the versioned schema of the knowledge graph: the
+constraints, indexes and full-text indexes that are applied in order by the
+MigrationRunner, and the repository queries the index-usage check runs
+EXPLAIN on.
+
+Migrations are append-only. An applied migration must not be edited; add a
+new version instead. Every statement uses IF NOT EXISTS, so applying a
+migration again, e.g. after the database was cleared, is harmless.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A versioned set of schema statements."""
+    version: int
+    description: str
+    statements: Tuple[str, ...]
+
+    @property
+    def checksum(self) -> str:
+        """Hash of the statements, to detect edits of an applied migration."""
+        return hashlib.sha256("\n".join(self.statements).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class IndexedQuery:
+    """A query the schema is expected to serve from an index."""
+    name: str
+    query: str
+    parameters: Dict
+
+
+MIGRATIONS = (
+    Migration(1, "Unique identifiers of skills, jobs, candidates and users", (
+        "CREATE CONSTRAINT skill_skill_id IF NOT EXISTS FOR (s:Skill) REQUIRE s.skill_id IS UNIQUE",
+        "CREATE CONSTRAINT job_job_id IF NOT EXISTS FOR (j:Job) REQUIRE j.job_id IS UNIQUE",
+        "CREATE CONSTRAINT candidate_resume_id IF NOT EXISTS FOR (c:Candidate) REQUIRE c.resume_id IS UNIQUE",
+        "CREATE CONSTRAINT user_email IF NOT EXISTS FOR (u:User) REQUIRE u.email IS UNIQUE",
+    )),
+    Migration(2, "Lookup indexes for the experience and education MERGE keys", (
+        "CREATE INDEX experience_exp_id IF NOT EXISTS FOR (e:Experience) ON (e.exp_id)",
+        "CREATE INDEX experience_experience_id IF NOT EXISTS FOR (e:Experience) ON (e.experience_id)",
+        "CREATE INDEX education_education_id IF NOT EXISTS FOR (e:Education) ON (e.education_id)",
+    )),
+    Migration(3, "Indexes for the filtered and sorted properties", (
+        "CREATE INDEX job_domain IF NOT EXISTS FOR (j:Job) ON (j.domain)",
+        "CREATE INDEX job_location IF NOT EXISTS FOR (j:Job) ON (j.location)",
+        "CREATE INDEX job_company IF NOT EXISTS FOR (j:Job) ON (j.company)",
+        "CREATE INDEX job_created_at IF NOT EXISTS FOR (j:Job) ON (j.created_at)",
+        "CREATE INDEX job_owner_email IF NOT EXISTS FOR (j:Job) ON (j.owner_email)",
+        "CREATE INDEX candidate_domain IF NOT EXISTS FOR (c:Candidate) ON (c.domain)",
+        "CREATE INDEX candidate_location IF NOT EXISTS FOR (c:Candidate) ON (c.location)",
+        "CREATE INDEX candidate_title IF NOT EXISTS FOR (c:Candidate) ON (c.title)",
+        "CREATE INDEX candidate_name IF NOT EXISTS FOR (c:Candidate) ON (c.name)",
+        "CREATE INDEX skill_name IF NOT EXISTS FOR (s:Skill) ON (s.name)",
+        "CREATE INDEX skill_category IF NOT EXISTS FOR (s:Skill) ON (s.category)",
+        "CREATE INDEX user_created_at IF NOT EXISTS FOR (u:User) ON (u.created_at)",
+    )),
+    Migration(4, "Full-text indexes for searching skills, jobs and candidates", (
+        "CREATE FULLTEXT INDEX skill_text IF NOT EXISTS FOR (s:Skill) ON EACH [s.name, s.description]",
+        "CREATE FULLTEXT INDEX job_text IF NOT EXISTS FOR (j:Job) ON EACH [j.title, j.description]",
+        "CREATE FULLTEXT INDEX candidate_text IF NOT EXISTS FOR (c:Candidate) ON EACH [c.name, c.title, c.summary]",
+    )),
+)
+
+
+def indexed_queries():
+    """Build the queries the index-usage check runs EXPLAIN on.
+
+    The queries are the ones the repositories and services run, built with
+    representative filters and cursors, so the check follows their changes.
+    They are imported here rather than at module level, since the graph
+    service importing the migrations is itself imported by them.
+
+    Returns:
+        tuple: IndexedQuery objects
+    """
+    from src.backend.repositories.candidate_repository import (
+        ADD_EDUCATION_QUERY, ADD_EXPERIENCE_QUERY, CandidateRepository, GET_CANDIDATE_QUERY,
+        LINK_EXPERIENCE_SKILLS_QUERY
+    )
+    from src.backend.repositories.job_repository import GET_JOB_QUERY, JobRepository
+    from src.backend.repositories.skill_repository import GET_SKILL_QUERY, SkillRepository
+    from src.backend.services.auth_service import FIND_USER_QUERY
+    from src.backend.utils.pagination import encode_cursor
+
+    # Empty filter values are ignored by the query builders, so non-empty ones stand in
+    cursor = encode_cursor(["", ""])
+    experience = dict.fromkeys(("resume_id", "experience_id", "title", "company", "start_date",
+                                "end_date", "description", "location"), "")
+    education = dict.fromkeys(("resume_id", "education_id", "institution", "degree", "field",
+                               "start_date", "end_date", "gpa"), "")
+    return (
+        IndexedQuery("JobRepository.get_job", GET_JOB_QUERY, {"job_id": ""}),
+        IndexedQuery("JobRepository.find_jobs.domain", *JobRepository.find_jobs_query({"domain": "x"})),
+        IndexedQuery("JobRepository.find_jobs.location", *JobRepository.find_jobs_query({"location": "x"})),
+        IndexedQuery("JobRepository.find_jobs.company", *JobRepository.find_jobs_query({"company": "x"})),
+        IndexedQuery("JobRepository.find_jobs.cursor", *JobRepository.find_jobs_query(cursor=cursor)),
+        IndexedQuery("CandidateRepository.get_candidate", GET_CANDIDATE_QUERY, {"resume_id": ""}),
+        IndexedQuery("CandidateRepository.find_candidates.domain",
+                     *CandidateRepository.find_candidates_query({"domain": "x"})),
+        IndexedQuery("CandidateRepository.find_candidates.location",
+                     *CandidateRepository.find_candidates_query({"location": "x"})),
+        IndexedQuery("CandidateRepository.find_candidates.title",
+                     *CandidateRepository.find_candidates_query({"title": "x"})),
+        IndexedQuery("CandidateRepository.find_candidates.cursor",
+                     *CandidateRepository.find_candidates_query(cursor=cursor)),
+        IndexedQuery("CandidateRepository._link_experience_skills", LINK_EXPERIENCE_SKILLS_QUERY,
+                     {"exp_id": "", "skill_ids": []}),
+        IndexedQuery("CandidateRepository.add_candidate_experience", ADD_EXPERIENCE_QUERY, experience),
+        IndexedQuery("CandidateRepository.add_candidate_education", ADD_EDUCATION_QUERY, education),
+        IndexedQuery("SkillRepository.get_skill", GET_SKILL_QUERY, {"skill_id": ""}),
+        IndexedQuery("SkillRepository.find_skills.category", *SkillRepository.find_skills_query({"category": "x"})),
+        IndexedQuery("SkillRepository.find_skills.cursor", *SkillRepository.find_skills_query(cursor=cursor)),
+        IndexedQuery("AuthService.find_user_by_email", FIND_USER_QUERY, {"email": ""}),
+    )
@@ -10,7 +10,8 @@ __all__ = [
     'Job', 'JobSkill',
     'Candidate', 'CandidateSkill', 'Experience', 'Education',
     'Skill',
-    'SkillGapAnalysis', 'SkillRecommendation', 'CareerPath', 'DashboardStats'
+    'SkillGapAnalysis', 'SkillRecommendation', 'CareerPath', 'DashboardStats',
+    'Record', 'MatchRow', 'SkillRow', 'JobSummary', 'CandidateSummary'
 ]
 
 # Import models here to make them available when importing from the package,
@@ -19,4 +20,5 @@ from src.backend.models.user_model import User
 from src.backend.models.job_model import Job, JobSkill
 from src.backend.models.candidate_model import Candidate, CandidateSkill, Experience, Education
 from src.backend.models.skill_model import Skill
-from src.backend.models.analytics_model import SkillGapAnalysis, SkillRecommendation, CareerPath, DashboardStats 
\ No newline at end of file
+from src.backend.models.analytics_model import SkillGapAnalysis, SkillRecommendation, CareerPath, DashboardStats
+from src.backend.models.record_model import Record, MatchRow, SkillRow, JobSummary, CandidateSummary 
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""
+Record Model
+
+This module defines compact record types for the hottest repository results:
+match rows, skill rows and job and candidate list rows. A record keeps its
+columns in __slots__ instead of a per-row dictionary, so a large match or list
+response takes a fraction of the memory, and it is filled straight from the
+Neo4j record without an intermediate dictionary.
+
+Records behave like the dictionaries they replace: row['name'], row.get(),
+'key' in row, dict(row) and comparison with dictionaries all work, and a
+column that was never set is absent just like a missing key. Keys outside the
+declared columns are kept in a small overflow dictionary. Records are turned
+into JSON only at the API boundary (see RecordJSONProvider).
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator
+
+
+class Record(MutableMapping):
+    """Base class of slotted, dictionary-compatible result rows.
+
+    Subclasses declare their columns as __slots__.
+    """
+
+    __slots__ = ('_extra',)
+    _fields = ()
+    _field_set = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect the declared columns of a record type."""
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get('__slots__', ())
+            fields.extend(slot for slot in ((slots,) if isinstance(slots, str) else slots) if slot != '_extra')
+        clashes = [field for field in fields if hasattr(Record, field)]
+        if clashes:
+            raise TypeError(f"{cls.__name__} columns shadow mapping methods: {', '.join(clashes)}")
+        cls._fields = tuple(fields)
+        cls._field_set = frozenset(fields)
+
+    def __init__(self, values=(), **kwargs):
+        """Initialize a record from a mapping or (key, value) pairs and keywords."""
+        self._extra = None
+        self.update(values, **kwargs)
+
+    @classmethod
+    def from_record(cls, record) -> 'Record':
+        """Create a record from a Neo4j record or any mapping.
+
+        Args:
+            record: Neo4j record or dictionary
+
+        Returns:
+            Record: New record with the columns of the source
+        """
+        row = cls.__new__(cls)
+        row._extra = None
+        fields = cls._field_set
+        for key, value in record.items():
+            if key in fields:
+                setattr(row, key, value)
+            else:
+                row[key] = value
+        return row
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self._field_set:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._field_set:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self._fields:
+            if hasattr(self, field):
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key) -> bool:
+        if key in self._field_set:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def get(self, key, default=None):
+        """Get a column, or default if it is not set."""
+        if key in self._field_set:
+            return getattr(self, key, default)
+        return default if self._extra is None else self._extra.get(key, default)
+
+    def copy(self) -> 'Record':
+        """Get a shallow copy of the record."""
+        return type(self).from_record(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class MatchRow(Record):
+    """A job or candidate match, enriched with scores and skills by the matching service."""
+    __slots__ = (
+        'job_id', 'title', 'company', 'resume_id', 'name',
+        'primaryMatchCount', 'secondaryMatchCount', 'relatedMatchCount',
+        'primaryScore', 'secondaryScore', 'relatedScore', 'matchScore',
+        'hybrid_score', 'match_percentage', 'graph_score', 'graph_percentage',
+        'text_score', 'text_percentage', 'rrf_score', 'retrieval_sources',
+        'matching_skills', 'primary_matching_skills', 'secondary_matching_skills',
+        'missing_skills', 'exceeding_skills'
+    )
+
+
+class SkillRow(Record):
+    """A skill, optionally with the properties of the relationship it was reached through."""
+    __slots__ = (
+        'skill_id', 'name', 'category', 'domain', 'description',
+        'level', 'proficiency', 'importance', 'relationship_type',
+        'years', 'experience_years', 'candidate_proficiency', 'job_proficiency'
+    )
+
+
+class JobSummary(Record):
+    """A job in a job list."""
+    __slots__ = ('job_id', 'title', 'company', 'location', 'domain', 'owner_email', 'created_at', 'updated_at')
+
+
+class CandidateSummary(Record):
+    """A candidate in a candidate list."""
+    __slots__ = ('resume_id', 'name', 'title', 'location', 'domain', 'email')
@@ -5,7 +5,9 @@ This package contains the base classes for the knowledge graph.
 """
 
 from src.backend.repositories.base.repository import BaseRepository
+from src.backend.repositories.base.unit_of_work import UnitOfWork
 
 __all__ = [
-    'BaseRepository'
+    'BaseRepository',
+    'UnitOfWork'
 ] 
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Sessions and Causal Consistency Bookmarks
+
+This module provides the sessions repositories open. Read sessions use read
+access, so with a routing URI (neo4j://) a cluster routes them to followers
+or read replicas, while write sessions go to the leader. With a direct URI
+(bolt://) both reach the single server.
+
+A replica may lag behind the leader, so a user reading right after a write
+could miss it. Sessions opened inside a bookmark scope, usually the signed-in
+user, share a bookmark manager: each write session records the bookmark of
+its transaction and later sessions of the scope wait until the server they
+run on has caught up with it. Sessions outside any scope carry no bookmarks.
+Threads of a pool do not inherit the scope of the code submitting work to
+them, so that code passes current_scope() along and runs the work in a
+bookmark_scope.
+
+Bookmark managers live in the process, bounded to the most recently active
+NEO4J_BOOKMARK_SCOPES_MAX scopes per driver.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from neo4j import GraphDatabase, READ_ACCESS, WRITE_ACCESS
+
+from src.backend.config import NEO4J_BOOKMARK_SCOPES_MAX
+
+_scope = ContextVar('bookmark_scope', default=None)
+_scope_resolver = None
+_managers = OrderedDict()
+_managers_lock = threading.Lock()
+
+
+@contextmanager
+def bookmark_scope(key):
+    """Share bookmarks between the sessions opened in the block.
+
+    Args:
+        key: Scope identifier, e.g. a user's email
+    """
+    token = _scope.set(key)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def set_scope_resolver(resolver):
+    """Set the function deriving the bookmark scope outside a bookmark_scope block.
+
+    Args:
+        resolver: Callable returning the scope key (e.g. the identity of the
+            request's user) or None, or None to remove the resolver
+    """
+    global _scope_resolver
+    _scope_resolver = resolver
+
+
+def current_scope():
+    """Get the bookmark scope of the calling context.
+
+    Returns:
+        Scope key or None
+    """
+    key = _scope.get()
+    if key is None and _scope_resolver is not None:
+        key = _scope_resolver()
+    return key
+
+
+def bookmark_manager(driver):
+    """Get the bookmark manager of the current scope for a driver.
+
+    Args:
+        driver: Neo4j driver
+
+    Returns:
+        Bookmark manager, or None outside a scope
+    """
+    key = current_scope()
+    if key is None:
+        return None
+    with _managers_lock:
+        manager = _managers.get((id(driver), key))
+        if manager is None:
+            manager = GraphDatabase.bookmark_manager()
+            _managers[(id(driver), key)] = manager
+            while len(_managers) > NEO4J_BOOKMARK_SCOPES_MAX:
+                _managers.popitem(last=False)
+        else:
+            _managers.move_to_end((id(driver), key))
+        return manager
+
+
+def clear_bookmarks():
+    """Forget the bookmarks of all scopes."""
+    with _managers_lock:
+        _managers.clear()
+
+
+def open_session(driver, access_mode=WRITE_ACCESS, **config):
+    """Open a session with the bookmarks of the current scope.
+
+    Args:
+        driver: Neo4j driver
+        access_mode: READ_ACCESS to route the session to readers, WRITE_ACCESS for the leader
+        **config: Further session configuration, e.g. fetch_size
+
+    Returns:
+        Neo4j session object
+    """
+    manager = bookmark_manager(driver)
+    if manager is not None:
+        config.setdefault('bookmark_manager', manager)
+    return driver.session(default_access_mode=access_mode, **config)
+
+
+def read_session(driver, **config):
+    """Open a read session with the bookmarks of the current scope.
+
+    Args:
+        driver: Neo4j driver
+        **config: Further session configuration, e.g. fetch_size
+
+    Returns:
+        Neo4j session object
+    """
+    return open_session(driver, READ_ACCESS, **config)
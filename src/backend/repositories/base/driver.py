@@ -0,0 +1,200 @@
+"""
+Neo4j Driver
+
+This module provides the process-wide Neo4j drivers. Every driver is created
+here with the connection pool settings of src.backend.config, so the API,
+its repositories and the CLIs share one configured pool per database instead
+of each opening its own. It also provides pool warm-up and the pool status
+reported by the health endpoint.
+
+Shared drivers are reference counted: every get_driver call takes a
+reference and close_driver releases one, so a repository or service closing
+its connection does not close the pool the rest of the process still uses.
+
+The driver has no public pool metrics, so connection acquisitions are timed
+by wrapping the acquire method of each driver's pool. If a driver release
+changes that internal, drivers still work and only the wait times are missing
+from the status.
+"""
+
+import hashlib
+import threading
+import time
+
+from neo4j import GraphDatabase
+
+from src.config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
+from src.backend.config import (
+    NEO4J_MAX_CONNECTION_POOL_SIZE, NEO4J_CONNECTION_ACQUISITION_TIMEOUT, NEO4J_CONNECTION_TIMEOUT,
+    NEO4J_MAX_CONNECTION_LIFETIME, NEO4J_KEEP_ALIVE, NEO4J_FETCH_SIZE, NEO4J_POOL_WARM_UP_CONNECTIONS
+)
+from src.backend.utils.query_metrics import QueryMetrics
+
+# Connection acquisition wait times, recorded like query latencies
+acquisition_metrics = QueryMetrics(slow_ms=-1)
+
+_drivers = {}
+_references = {}
+_drivers_lock = threading.Lock()
+
+
+def driver_config():
+    """Get the configuration every driver is created with.
+
+    Returns:
+        dict: Keyword arguments of GraphDatabase.driver
+    """
+    return {
+        "max_connection_pool_size": NEO4J_MAX_CONNECTION_POOL_SIZE,
+        "connection_acquisition_timeout": NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        "connection_timeout": NEO4J_CONNECTION_TIMEOUT,
+        "max_connection_lifetime": NEO4J_MAX_CONNECTION_LIFETIME,
+        "keep_alive": NEO4J_KEEP_ALIVE,
+        "fetch_size": NEO4J_FETCH_SIZE,
+    }
+
+
+def get_driver(uri=None, user=None, password=None):
+    """Get the shared driver of a database, creating it on first use.
+
+    Drivers are shared per URI, user and password. Every call takes a
+    reference to be released with close_driver.
+
+    Args:
+        uri: Neo4j connection URI, defaults to NEO4J_URI
+        user: Neo4j username, defaults to NEO4J_USER
+        password: Neo4j password, defaults to NEO4J_PASSWORD
+
+    Returns:
+        Neo4j driver
+    """
+    uri = uri or NEO4J_URI
+    user = user or NEO4J_USER
+    password = password or NEO4J_PASSWORD
+    # The password is part of the key, hashed so the registry does not hold it in clear
+    key = (uri, user, hashlib.sha256(password.encode("utf-8")).hexdigest())
+    with _drivers_lock:
+        driver = _drivers.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(uri, auth=(user, password), **driver_config())
+            _instrument_pool(driver, uri)
+            _drivers[key] = driver
+        _references[key] = _references.get(key, 0) + 1
+        return driver
+
+
+def close_driver(driver):
+    """Release a reference to a driver, closing it once no reference is left.
+
+    The next get_driver after the last release creates a new driver.
+
+    Args:
+        driver: Driver returned by get_driver, or any other driver, which is
+            closed right away
+    """
+    with _drivers_lock:
+        for key, shared in list(_drivers.items()):
+            if shared is driver:
+                _references[key] -= 1
+                if _references[key] > 0:
+                    return
+                del _drivers[key]
+                del _references[key]
+    driver.close()
+
+
+def close_drivers():
+    """Close all shared drivers, regardless of their references."""
+    with _drivers_lock:
+        drivers = list(_drivers.values())
+        _drivers.clear()
+        _references.clear()
+    for driver in drivers:
+        driver.close()
+
+
+def warm_up_pool(driver, connections=NEO4J_POOL_WARM_UP_CONNECTIONS):
+    """Open pool connections ahead of the first requests.
+
+    Each connection is checked out by its own open transaction at the same
+    time, so the pool has to open that many distinct connections; they stay
+    idle in the pool afterwards.
+
+    Args:
+        driver: Neo4j driver
+        connections: Number of connections to open
+
+    Returns:
+        int: Number of connections opened
+    """
+    sessions = []
+    transactions = []
+    try:
+        for _ in range(min(connections, NEO4J_MAX_CONNECTION_POOL_SIZE)):
+            session = driver.session()
+            sessions.append(session)
+            transaction = session.begin_transaction()
+            transactions.append(transaction)
+            transaction.run("RETURN 1").consume()
+    except Exception as e:
+        print(f"Warning: Connection pool warm-up stopped after {len(transactions)} connections: {str(e)}")
+    finally:
+        for transaction in transactions:
+            transaction.close()
+        for session in sessions:
+            session.close()
+    return len(transactions)
+
+
+def pool_status(driver):
+    """Get the utilization of a driver's connection pool and the acquisition wait times.
+
+    Args:
+        driver: Neo4j driver
+
+    Returns:
+        dict: max_size, in_use, idle, utilization (in_use / max_size), per-server
+            in_use and idle counts, and 'acquisition' with the count, errors
+            (e.g. acquisition timeouts) and latency statistics of the waits
+    """
+    pool = getattr(driver, '_pool', None)
+    servers = {}
+    lock = getattr(pool, 'lock', None)
+    connections = getattr(pool, 'connections', None)
+    if lock is not None and connections is not None:
+        with lock:
+            for address, pooled in connections.items():
+                in_use = sum(1 for connection in pooled if connection.in_use)
+                servers[str(address)] = {'in_use': in_use, 'idle': len(pooled) - in_use}
+    in_use = sum(server['in_use'] for server in servers.values())
+    acquisitions = acquisition_metrics.snapshot()['queries']
+    return {
+        'max_size': NEO4J_MAX_CONNECTION_POOL_SIZE,
+        'in_use': in_use,
+        'idle': sum(server['idle'] for server in servers.values()),
+        'utilization': round(in_use / NEO4J_MAX_CONNECTION_POOL_SIZE, 3),
+        'servers': servers,
+        'acquisition': acquisitions.get(getattr(driver, '_acquisition_name', None), {'count': 0})
+    }
+
+
+def _instrument_pool(driver, uri):
+    """Record the time every connection acquisition of a driver waits."""
+    pool = getattr(driver, '_pool', None)
+    acquire = getattr(pool, 'acquire', None)
+    if acquire is None:
+        return
+    name = f"acquire {uri}"
+    driver._acquisition_name = name
+
+    def timed_acquire(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            connection = acquire(*args, **kwargs)
+        except Exception as e:
+            acquisition_metrics.record(name, (time.perf_counter() - started) * 1000, error=e)
+            raise
+        acquisition_metrics.record(name, (time.perf_counter() - started) * 1000)
+        return connection
+
+    pool.acquire = timed_acquire
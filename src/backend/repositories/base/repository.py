@@ -3,10 +3,20 @@ Base Repository for Knowledge Graph
 This module provides the base repository class for database operations.
 """
 
-from neo4j import GraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS
 import os
+import sys
+from contextlib import contextmanager
 from dotenv import load_dotenv
-from src.config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
+from src.config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD, ETL_BATCH_SIZE
+from src.backend.config import STREAM_FETCH_SIZE
+from src.backend.utils import write_counters
+from src.backend.utils.batching import chunked
+from src.backend.utils.query_cache import query_cache, query_labels
+from src.backend.utils.query_metrics import query_metrics
+from src.backend.repositories.base.bookmarks import current_scope, open_session
+from src.backend.repositories.base.driver import get_driver, close_driver
+from src.backend.repositories.base.unit_of_work import UnitOfWork, current_unit_of_work
 
 # Load environment variables
 load_dotenv()
@@ -23,6 +33,8 @@ class BaseRepository:
             user: Neo4j username
             password: Neo4j password
         """
+        # Only a driver the repository got from get_driver is released by close()
+        self._owns_driver = not driver
         if driver:
             self.driver = driver
         else:
@@ -33,83 +45,357 @@ class BaseRepository:
     
     def connect(self):
         """Connect to the Neo4j database."""
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+        self.driver = get_driver(self.uri, self.user, self.password)
         
     def close(self):
-        """Close the connection to Neo4j."""
-        if self.driver:
-            self.driver.close()
+        """Close the connection to Neo4j.
+        
+        The shared driver is only closed once every holder released it, and a
+        driver passed to the constructor is left to its owner.
+        """
+        if self.driver and self._owns_driver:
+            self._owns_driver = False
+            close_driver(self.driver)
             
-    def get_session(self):
+    def get_session(self, access_mode=WRITE_ACCESS, **config):
         """Get a new session from the driver.
         
+        Sessions carry the causal consistency bookmarks of the current
+        bookmark scope, see bookmarks.open_session.
+        
+        Args:
+            access_mode: READ_ACCESS to route the session to followers and read
+                replicas of a cluster, WRITE_ACCESS for the leader
+            **config: Session configuration, e.g. fetch_size
+            
         Returns:
             Neo4j session object
         """
-        return self.driver.session()
+        return open_session(self.driver, access_mode, **config)
     
-    def execute_query(self, query, parameters=None):
+    @contextmanager
+    def transaction(self):
+        """Run the queries of one logical operation in a single transaction.
+        
+        Inside the block, all execute_* calls of every repository sharing this
+        driver run in the same transaction, which is committed when the block
+        exits and rolled back if it raises. A nested call joins the open unit
+        of work.
+        
+            with candidate_repository.transaction():
+                candidate_repository.add_candidate(candidate)
+                candidate_repository.add_candidate_skills_bulk(skills)
+        
+        Yields:
+            UnitOfWork: The open unit of work
+        """
+        unit = current_unit_of_work(self.driver)
+        if unit is not None:
+            yield unit
+            return
+        with UnitOfWork(self.driver) as unit:
+            yield unit
+    
+    @staticmethod
+    def _query_name(depth=2):
+        """Name a query after the method executing it, e.g. 'JobRepository.get_job'.
+        
+        Args:
+            depth: Stack depth of that method relative to the caller of _query_name
+            
+        Returns:
+            str: Qualified name of the method
+        """
+        code = sys._getframe(depth).f_code
+        return getattr(code, 'co_qualname', code.co_name)
+    
+    def execute_query(self, query, parameters=None, query_name=None):
         """Execute a Cypher query and return the results.
         
         Args:
             query: Cypher query string
             parameters: Dictionary of query parameters
+            query_name: Name of the query in the query metrics, defaults to the calling method
             
         Returns:
             List of records as dictionaries
         """
+        query_name = query_name or self._query_name()
+        unit = current_unit_of_work(self.driver)
+        if unit is not None:
+            return unit.run(query, parameters, query_name)
         with self.get_session() as session:
-            result = session.run(query, parameters or {})
-            return [dict(record) for record in result]
+            with query_metrics.measure(query_name, query, parameters) as measurement:
+                result = session.run(query, parameters or {})
+                records = [dict(record) for record in result]
+                measurement.done(len(records), result.consume())
+            return records
     
-    def execute_write_query(self, query, parameters=None):
+    def execute_write_query(self, query, parameters=None, invalidates=None, query_name=None):
         """Execute a write query with transaction handling.
         
         Args:
             query: Cypher query string
             parameters: Dictionary of query parameters
+            invalidates: Cache tags the write affects, e.g. ['Job:job_1'];
+                defaults to the labels mentioned in the query
+            query_name: Name of the query in the query metrics, defaults to the calling method
             
         Returns:
             Result summary
         """
+        query_name = query_name or self._query_name()
+        unit = current_unit_of_work(self.driver)
+        if unit is not None:
+            return unit.write(query, parameters, invalidates, query_name)
         with self.get_session() as session:
             # Use a transaction function that collects records before consuming the result
             def run_query(tx):
-                result = tx.run(query, parameters or {})
-                # Collect any results before the transaction closes
-                records = list(result)
-                summary = result.consume()
+                with query_metrics.measure(query_name, query, parameters) as measurement:
+                    result = tx.run(query, parameters or {})
+                    # Collect any results before the transaction closes
+                    records = list(result)
+                    summary = result.consume()
+                    measurement.done(len(records), summary)
                 return summary
                 
-            return session.execute_write(run_query)
+            summary = session.execute_write(run_query)
+            write_counters.record(summary)
+            self._invalidate_cache(query, invalidates)
+            return summary
+    
+    def execute_batched_write(self, query, rows, batch_size=ETL_BATCH_SIZE, query_name=None):
+        """Execute an UNWIND write query over rows in fixed-size batches.
+        
+        The query receives each batch as the $rows parameter. All batches share
+        one session and each batch is committed in its own explicit transaction,
+        so a transient failure only retries that batch. Inside a unit of work
+        the batches run in its transaction instead.
+        
+        Args:
+            query: Cypher query starting with UNWIND $rows AS row
+            rows: Iterable of parameter dictionaries, one per row
+            batch_size: Maximum number of rows per transaction
+            query_name: Name of the query in the query metrics, defaults to the calling method
+            
+        Returns:
+            Number of rows written
+        """
+        query_name = query_name or self._query_name()
+        written = 0
+        unit = current_unit_of_work(self.driver)
+        if unit is not None:
+            for batch in chunked(rows, batch_size):
+                unit.write(query, {"rows": batch}, name=query_name)
+                written += len(batch)
+            return written
+        with self.get_session() as session:
+            for batch in chunked(rows, batch_size):
+                summary = session.execute_write(
+                    lambda tx: self._measured_write(tx, query_name, query, {"rows": batch}))
+                write_counters.record(summary)
+                written += len(batch)
+        self._invalidate_cache(query)
+        return written
+    
+    def execute_columnar_write(self, query, columns, batch_size=ETL_BATCH_SIZE, query_name=None):
+        """Execute a write query over equally long columns in fixed-size batches.
+        
+        Each column is passed as a list parameter of the same name, so no
+        per-row dictionaries are built. The query addresses row i as
+        $column[i], e.g. UNWIND range(0, size($job_id) - 1) AS i.
+        
+        Args:
+            query: Cypher query iterating over the row indexes of a batch
+            columns: Dictionary of column name to sequence (list or NumPy array)
+            batch_size: Maximum number of rows per transaction
+            query_name: Name of the query in the query metrics, defaults to the calling method
+            
+        Returns:
+            Number of rows written
+        """
+        query_name = query_name or self._query_name()
+        total = len(next(iter(columns.values()))) if columns else 0
+        unit = current_unit_of_work(self.driver)
+        if unit is not None:
+            for start in range(0, total, batch_size):
+                unit.write(query, self._column_batch(columns, start, batch_size), name=query_name)
+            return total
+        with self.get_session() as session:
+            for start in range(0, total, batch_size):
+                parameters = self._column_batch(columns, start, batch_size)
+                summary = session.execute_write(
+                    lambda tx: self._measured_write(tx, query_name, query, parameters))
+                write_counters.record(summary)
+        self._invalidate_cache(query)
+        return total
+    
+    @staticmethod
+    def _measured_write(tx, query_name, query, parameters):
+        """Transaction function running one write and recording it in the query metrics."""
+        with query_metrics.measure(query_name, query, parameters) as measurement:
+            summary = tx.run(query, parameters).consume()
+            measurement.done(0, summary)
+        return summary
     
-    def execute_read_query(self, query, parameters=None):
+    @staticmethod
+    def _column_batch(columns, start, batch_size):
+        """Slice the columns of one batch into list parameters."""
+        return {
+            name: values[start:start + batch_size].tolist() if hasattr(values, "tolist")
+            else list(values[start:start + batch_size])
+            for name, values in columns.items()
+        }
+    
+    def execute_read_query(self, query, parameters=None, cache_name=None, cache_tags=(), cache_ttl=None,
+                           query_name=None, row_type=None):
         """Execute a read query with transaction handling.
         
+        Reads given a cache_name are served from the query cache when it is
+        enabled; failed reads are never cached. Inside a unit of work the read
+        runs in its transaction, sees its uncommitted writes and bypasses the
+        cache; errors then propagate so the unit of work is rolled back.
+        
+        Reads inside a bookmark scope bypass the cache as well: a result read
+        without bookmarks from a lagging replica may have been cached, and the
+        scope's reads have to see its own writes.
+        
         Args:
             query: Cypher query string
             parameters: Dictionary of query parameters
+            cache_name: Stable name of the query for caching and statistics, None to bypass the cache
+            cache_tags: Label tags ('Skill') and entity tags ('Job:job_1') the result depends on
+            cache_ttl: Time to live of the cached result in seconds, defaults to QUERY_CACHE_TTL_SECONDS
+            query_name: Name of the query in the query metrics, defaults to the calling method;
+                cache hits are not recorded there
+            row_type: Record type (see record_model) to build the rows as instead of dictionaries
             
         Returns:
-            List of records as dictionaries
+            List of records as dictionaries, or as row_type
+        """
+        query_name = query_name or self._query_name()
+        unit = current_unit_of_work(self.driver)
+        if unit is not None:
+            return unit.run(query, parameters, query_name, row_type)
+        if not cache_name or not query_cache.enabled or current_scope() is not None:
+            return self._run_read_query(query, parameters, query_name, row_type)[0]
+        
+        key = query_cache.make_key(cache_name, query, parameters)
+        hit, records = query_cache.get(key)
+        if hit:
+            return [row_type.from_record(record) for record in records] if row_type else records
+        version = query_cache.version
+        records, succeeded = self._run_read_query(query, parameters, query_name, row_type)
+        if succeeded:
+            query_cache.put(key, records, cache_tags, cache_ttl, version)
+        return records
+    
+    def _run_read_query(self, query, parameters, query_name, row_type=None):
+        """Run a read query in a read transaction.
+        
+        Returns:
+            tuple: (records as dictionaries or row_type, whether the query succeeded)
         """
+        convert = row_type.from_record if row_type else dict
+        failed = []
         try:
-            with self.get_session() as session:
+            with self.get_session(READ_ACCESS) as session:
                 # Use a transaction function that properly collects all records
                 def run_query(tx):
                     try:
-                        result = tx.run(query, parameters or {})
-                        # Collect all records before the transaction closes
-                        return [dict(record) for record in result]
+                        with query_metrics.measure(query_name, query, parameters) as measurement:
+                            result = tx.run(query, parameters or {})
+                            # Collect all records before the transaction closes
+                            records = [convert(record) for record in result]
+                            measurement.done(len(records), result.consume())
+                        return records
                     except Exception as e:
                         print(f"Error executing query: {str(e)}")
                         print(f"Query: {query}")
                         print(f"Parameters: {parameters}")
+                        failed.append(e)
                         return []
                         
-                return session.execute_read(run_query)
+                return session.execute_read(run_query), not failed
         except Exception as e:
             print(f"Database error in execute_read_query: {str(e)}")
             print(f"Query: {query}")
             print(f"Parameters: {parameters}")
-            return [] 
\ No newline at end of file
+            return [], False
+    
+    def stream_read_query(self, query, parameters=None, fetch_size=STREAM_FETCH_SIZE, query_name=None,
+                          row_type=None):
+        """Execute a read query and yield its records one at a time.
+        
+        Unlike execute_read_query, the records are not collected into a list:
+        the server sends them fetch_size at a time while the caller consumes
+        them, so reads over all jobs or candidates run in bounded memory and
+        processing overlaps with the transfer. The records are read in one
+        explicit read transaction that stays open until the generator is
+        exhausted or closed.
+        
+        Since records may already have been consumed, a failure is not retried
+        and, unlike execute_read_query, it is raised to the caller. Inside a
+        unit of work the read runs in its transaction and is collected first.
+        
+            for row in repository.stream_read_query("MATCH (j:Job) RETURN j.job_id AS job_id"):
+                ...
+        
+        Args:
+            query: Cypher query string
+            parameters: Dictionary of query parameters
+            fetch_size: Number of records fetched per round trip
+            query_name: Name of the query in the query metrics, defaults to the calling method
+            row_type: Record type (see record_model) to build the rows as instead of dictionaries
+            
+        Returns:
+            Generator of records as dictionaries, or as row_type
+        """
+        query_name = query_name or self._query_name()
+        unit = current_unit_of_work(self.driver)
+        if unit is not None:
+            return iter(unit.run(query, parameters, query_name, row_type))
+        return self._stream_records(query, parameters, fetch_size, query_name, row_type)
+    
+    def stream_read_batches(self, query, parameters=None, batch_size=ETL_BATCH_SIZE, fetch_size=None,
+                            query_name=None):
+        """Execute a read query and yield its records in lists of at most batch_size.
+        
+        See stream_read_query; at most one batch is held in memory at a time.
+        
+        Args:
+            query: Cypher query string
+            parameters: Dictionary of query parameters
+            batch_size: Maximum number of records per batch
+            fetch_size: Number of records fetched per round trip, defaults to batch_size
+            query_name: Name of the query in the query metrics, defaults to the calling method
+            
+        Returns:
+            Generator of lists of records as dictionaries
+        """
+        records = self.stream_read_query(query, parameters, fetch_size or batch_size,
+                                         query_name or self._query_name())
+        return chunked(records, batch_size)
+    
+    def _stream_records(self, query, parameters, fetch_size, query_name, row_type=None):
+        """Generator behind stream_read_query, recording the whole read in the query metrics."""
+        convert = row_type.from_record if row_type else dict
+        with self.get_session(READ_ACCESS, fetch_size=fetch_size) as session:
+            with session.begin_transaction() as tx:
+                with query_metrics.measure(query_name, query, parameters) as measurement:
+                    result = tx.run(query, parameters or {})
+                    rows = 0
+                    try:
+                        for record in result:
+                            rows += 1
+                            yield convert(record)
+                    except GeneratorExit:
+                        # The caller stopped early; the driver discards the remaining records
+                        measurement.done(rows)
+                        return
+                    measurement.done(rows, result.consume())
+    
+    def _invalidate_cache(self, query, tags=None):
+        """Drop cached reads affected by a write, by default those of the labels in the query."""
+        if query_cache.enabled:
+            query_cache.invalidate(query_labels(query) if tags is None else tags)
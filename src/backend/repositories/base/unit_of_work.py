@@ -0,0 +1,127 @@
+"""
+Unit of Work for Knowledge Graph Repositories
+
+This module provides a unit of work that runs the statements of one logical
+operation in a single explicit transaction. While a unit of work is open in
+a thread, every repository using the same driver routes its queries through
+it instead of opening a session and transaction per call, so a service can
+combine writes of several repositories and commit or roll back all of them.
+"""
+
+import threading
+
+from src.backend.repositories.base.bookmarks import open_session
+from src.backend.utils import write_counters
+from src.backend.utils.query_cache import query_cache, query_labels
+from src.backend.utils.query_metrics import query_metrics
+
+
+_local = threading.local()
+
+
+def current_unit_of_work(driver):
+    """Get the unit of work open in this thread for a driver.
+
+    Args:
+        driver: Neo4j driver
+
+    Returns:
+        UnitOfWork or None
+    """
+    return getattr(_local, 'units', {}).get(id(driver))
+
+
+class UnitOfWork:
+    """An open transaction shared by the repositories of one driver in one thread."""
+
+    def __init__(self, driver):
+        """Open a session and begin a transaction.
+
+        Args:
+            driver: Neo4j driver
+        """
+        self.driver = driver
+        self.session = open_session(driver)
+        try:
+            self.tx = self.session.begin_transaction()
+        except Exception:
+            self.session.close()
+            raise
+        self._summaries = []
+        self._invalidations = []
+
+    def run(self, query, parameters=None, name='UnitOfWork.run', row_type=None):
+        """Run a query in the transaction and collect its records.
+
+        Args:
+            query: Cypher query string
+            parameters: Dictionary of query parameters
+            name: Stable name of the query in the query metrics
+            row_type: Record type to build the rows as instead of dictionaries
+
+        Returns:
+            List of records as dictionaries, or as row_type
+        """
+        convert = row_type.from_record if row_type else dict
+        with query_metrics.measure(name, query, parameters) as measurement:
+            result = self.tx.run(query, parameters or {})
+            records = [convert(record) for record in result]
+            summary = result.consume()
+            measurement.done(len(records), summary)
+        self._summaries.append(summary)
+        return records
+
+    def write(self, query, parameters=None, invalidates=None, name='UnitOfWork.write'):
+        """Run a write query in the transaction.
+
+        Write counters and cache invalidation are applied on commit.
+
+        Args:
+            query: Cypher query string
+            parameters: Dictionary of query parameters
+            invalidates: Cache tags the write affects, defaults to the labels in the query
+            name: Stable name of the query in the query metrics
+
+        Returns:
+            Result summary
+        """
+        with query_metrics.measure(name, query, parameters) as measurement:
+            summary = self.tx.run(query, parameters or {}).consume()
+            measurement.done(0, summary)
+        self._summaries.append(summary)
+        self._invalidations.extend(query_labels(query) if invalidates is None else invalidates)
+        return summary
+
+    def commit(self):
+        """Commit the transaction, then record write counters and invalidate cached reads."""
+        self.tx.commit()
+        for summary in self._summaries:
+            write_counters.record(summary)
+        if self._invalidations and query_cache.enabled:
+            query_cache.invalidate(self._invalidations)
+
+    def rollback(self):
+        """Roll back the transaction."""
+        self.tx.rollback()
+
+    def close(self):
+        """Close the session."""
+        self.session.close()
+
+    def __enter__(self):
+        units = getattr(_local, 'units', None)
+        if units is None:
+            units = _local.units = {}
+        units[id(self.driver)] = self
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        _local.units.pop(id(self.driver), None)
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
+        return False
@@ -3,10 +3,86 @@ Candidate Repository for Knowledge Graph
 This module provides candidate-related database operations.
 """
 
+from src.backend.config import STREAM_FETCH_SIZE
+from src.backend.models.record_model import CandidateSummary, MatchRow, SkillRow
 from src.backend.repositories.base.repository import BaseRepository
+from src.backend.utils.pagination import keyset_condition, cursor_parameters
+from src.backend.utils.skill_resolver import get_skill_resolver
+from src.config import ETL_BATCH_SIZE
+from typing import Dict, List, NamedTuple
 import json
 import uuid
 
+# Columns of the rows returned by find_candidates that its cursors encode
+CANDIDATE_PAGE_KEY = ("name", "resume_id")
+
+# Searchable text fields of candidates, all of them when $resume_ids is null
+CANDIDATE_TEXTS_QUERY = """
+    MATCH (c:Candidate)
+    WHERE $resume_ids IS NULL OR c.resume_id IN $resume_ids
+    RETURN c.resume_id AS resume_id, c.name AS name, c.title AS title,
+           c.summary AS summary,
+           [(c)-[:HAS_EXPERIENCE]->(e:Experience) |
+                e {.job_title, .title, .company, .description}] AS experiences,
+           [(c)-[:HAS_CORE_SKILL|HAS_SECONDARY_SKILL]->(s:Skill) | s.name] AS skills
+"""
+
+# A candidate by ID, as read by get_candidate
+GET_CANDIDATE_QUERY = """
+    MATCH (c:Candidate {resume_id: $resume_id})
+    RETURN c.resume_id as resume_id, 
+           c.name as name, 
+           c.title as title,
+           c.location as location, 
+           c.domain as domain,
+           c.email as email,
+           c.summary as summary,
+           c.education as education
+"""
+
+# Creates an experience node and links it to its candidate in one query
+ADD_EXPERIENCE_QUERY = """
+    MATCH (c:Candidate {resume_id: $resume_id})
+    MERGE (e:Experience {experience_id: $experience_id})
+    SET e.title = $title,
+        e.company = $company,
+        e.start_date = $start_date,
+        e.end_date = $end_date,
+        e.description = $description,
+        e.location = $location
+    MERGE (c)-[r:HAS_EXPERIENCE]->(e)
+"""
+
+# Creates an education node and links it to its candidate in one query
+ADD_EDUCATION_QUERY = """
+    MATCH (c:Candidate {resume_id: $resume_id})
+    MERGE (e:Education {education_id: $education_id})
+    SET e.institution = $institution,
+        e.degree = $degree,
+        e.field = $field,
+        e.start_date = $start_date,
+        e.end_date = $end_date,
+        e.gpa = $gpa
+    MERGE (c)-[r:HAS_EDUCATION]->(e)
+"""
+
+# Links an experience to the skills used in it
+LINK_EXPERIENCE_SKILLS_QUERY = """
+    MATCH (e:Experience {exp_id: $exp_id})
+    UNWIND $skill_ids AS skill_id
+    MATCH (s:Skill {skill_id: skill_id})
+    MERGE (e)-[r:USED_SKILL]->(s)
+"""
+
+
+class CandidateProfile(NamedTuple):
+    """A candidate with skills, experiences and education, as read by get_candidate_profile."""
+    candidate: Dict
+    skills: List[Dict]
+    experiences: List[Dict]
+    education: List[Dict]
+
+
 class CandidateRepository(BaseRepository):
     """Repository for candidate-related operations in the knowledge graph."""
     
@@ -46,7 +122,7 @@ class CandidateRepository(BaseRepository):
             "education": self._process_education(resume_data.get("education", []))
         }
         
-        self.execute_write_query(query, parameters)
+        self.execute_write_query(query, parameters, invalidates=[f"Candidate:{resume_data['resume_id']}"])
         
         # Add experiences as separate nodes with relationships
         if "experience" in resume_data:
@@ -74,19 +150,6 @@ class CandidateRepository(BaseRepository):
         start_date_str = start_date.strftime("%Y-%m-%d") if hasattr(start_date, 'strftime') else start_date
         end_date_str = end_date.strftime("%Y-%m-%d") if hasattr(end_date, 'strftime') else end_date
         
-        # Create the experience node and link to candidate in one query
-        query = """
-            MATCH (c:Candidate {resume_id: $resume_id})
-            MERGE (e:Experience {experience_id: $experience_id})
-            SET e.title = $title,
-                e.company = $company,
-                e.start_date = $start_date,
-                e.end_date = $end_date,
-                e.description = $description,
-                e.location = $location
-            MERGE (c)-[r:HAS_EXPERIENCE]->(e)
-        """
-        
         parameters = {
             "resume_id": resume_id,
             "experience_id": experience_id,
@@ -98,7 +161,7 @@ class CandidateRepository(BaseRepository):
             "location": location or ""
         }
         
-        self.execute_write_query(query, parameters)
+        self.execute_write_query(ADD_EXPERIENCE_QUERY, parameters, invalidates=[f"Candidate:{resume_id}"])
         return True
     
     def add_candidate_education(self, resume_id, education_id, institution, degree, field, start_date, end_date, gpa=None):
@@ -121,19 +184,6 @@ class CandidateRepository(BaseRepository):
         start_date_str = start_date.strftime("%Y-%m-%d") if hasattr(start_date, 'strftime') else start_date
         end_date_str = end_date.strftime("%Y-%m-%d") if hasattr(end_date, 'strftime') else end_date
         
-        # Create the education node and link to candidate in one query
-        query = """
-            MATCH (c:Candidate {resume_id: $resume_id})
-            MERGE (e:Education {education_id: $education_id})
-            SET e.institution = $institution,
-                e.degree = $degree,
-                e.field = $field,
-                e.start_date = $start_date,
-                e.end_date = $end_date,
-                e.gpa = $gpa
-            MERGE (c)-[r:HAS_EDUCATION]->(e)
-        """
-        
         parameters = {
             "resume_id": resume_id,
             "education_id": education_id,
@@ -145,9 +195,96 @@ class CandidateRepository(BaseRepository):
             "gpa": gpa
         }
         
-        self.execute_write_query(query, parameters)
+        self.execute_write_query(ADD_EDUCATION_QUERY, parameters, invalidates=[f"Candidate:{resume_id}"])
         return True
     
+    def add_candidate_experiences_batch(self, resume_id, experiences):
+        """Add several experiences to a candidate with a single write.
+        
+        Args:
+            resume_id: ID of the candidate
+            experiences: List of dictionaries with experience_id, title, company,
+                start_date, end_date, description and optional location
+            
+        Returns:
+            Number of experiences written
+        """
+        if not experiences:
+            return 0
+        
+        query = """
+            MATCH (c:Candidate {resume_id: $resume_id})
+            UNWIND $experiences AS exp
+            MERGE (e:Experience {experience_id: exp.experience_id})
+            SET e.title = exp.title,
+                e.company = exp.company,
+                e.start_date = exp.start_date,
+                e.end_date = exp.end_date,
+                e.description = exp.description,
+                e.location = exp.location
+            MERGE (c)-[r:HAS_EXPERIENCE]->(e)
+        """
+        
+        rows = [{
+            "experience_id": exp["experience_id"],
+            "title": exp["title"],
+            "company": exp["company"],
+            "start_date": self._format_date(exp.get("start_date", "")),
+            "end_date": self._format_date(exp.get("end_date", "Present")),
+            "description": exp.get("description", ""),
+            "location": exp.get("location") or ""
+        } for exp in experiences]
+        
+        self.execute_write_query(query, {"resume_id": resume_id, "experiences": rows},
+                                 invalidates=[f"Candidate:{resume_id}"])
+        return len(rows)
+    
+    def add_candidate_education_batch(self, resume_id, education):
+        """Add several education entries to a candidate with a single write.
+        
+        Args:
+            resume_id: ID of the candidate
+            education: List of dictionaries with education_id, institution, degree,
+                field, start_date, end_date and optional gpa
+            
+        Returns:
+            Number of education entries written
+        """
+        if not education:
+            return 0
+        
+        query = """
+            MATCH (c:Candidate {resume_id: $resume_id})
+            UNWIND $education AS edu
+            MERGE (e:Education {education_id: edu.education_id})
+            SET e.institution = edu.institution,
+                e.degree = edu.degree,
+                e.field = edu.field,
+                e.start_date = edu.start_date,
+                e.end_date = edu.end_date,
+                e.gpa = edu.gpa
+            MERGE (c)-[r:HAS_EDUCATION]->(e)
+        """
+        
+        rows = [{
+            "education_id": edu["education_id"],
+            "institution": edu["institution"],
+            "degree": edu["degree"],
+            "field": edu["field"],
+            "start_date": self._format_date(edu.get("start_date", "")),
+            "end_date": self._format_date(edu.get("end_date", "")),
+            "gpa": edu.get("gpa")
+        } for edu in education]
+        
+        self.execute_write_query(query, {"resume_id": resume_id, "education": rows},
+                                 invalidates=[f"Candidate:{resume_id}"])
+        return len(rows)
+    
+    @staticmethod
+    def _format_date(value):
+        """Format a date as YYYY-MM-DD, leaving strings unchanged."""
+        return value.strftime("%Y-%m-%d") if hasattr(value, 'strftime') else value
+    
     def _add_candidate_experiences(self, resume_id, experiences):
         """Add experience nodes and link them to the candidate.
         
@@ -184,7 +321,7 @@ class CandidateRepository(BaseRepository):
                 "description": self._process_text_list(exp.get("description", []))
             }
             
-            self.execute_write_query(query, parameters)
+            self.execute_write_query(query, parameters, invalidates=[f"Candidate:{resume_id}"])
             
             # Link the experience to the candidate
             link_query = """
@@ -196,7 +333,7 @@ class CandidateRepository(BaseRepository):
             self.execute_write_query(link_query, {
                 "resume_id": resume_id,
                 "exp_id": exp_id
-            })
+            }, invalidates=[f"Candidate:{resume_id}"])
             
             # If there are skills used in this experience, link them
             if "skills_used" in exp and exp["skills_used"]:
@@ -207,35 +344,24 @@ class CandidateRepository(BaseRepository):
     def _link_experience_skills(self, exp_id, skills_used):
         """Link skills to an experience.
         
+        Names are resolved in memory by the shared skill resolver and all links
+        are created with a single write.
+        
         Args:
             exp_id: ID of the experience
             skills_used: List of skill names or IDs
         """
         if not isinstance(skills_used, list):
             return
+        
+        skill_ids = get_skill_resolver(self).resolve_many(skills_used)
+        if not skill_ids:
+            return
             
-        for skill_name in skills_used:
-            # Try to find the skill by name (case insensitive)
-            skill_query = """
-                MATCH (s:Skill)
-                WHERE toLower(s.name) = toLower($skill_name)
-                RETURN s.skill_id as skill_id
-            """
-            
-            skill_results = self.execute_read_query(skill_query, {"skill_name": skill_name})
-            
-            # If skill found, create the relationship
-            if skill_results and skill_results[0]:
-                link_query = """
-                    MATCH (e:Experience {exp_id: $exp_id})
-                    MATCH (s:Skill {skill_id: $skill_id})
-                    MERGE (e)-[r:USED_SKILL]->(s)
-                """
-                
-                self.execute_write_query(link_query, {
-                    "exp_id": exp_id,
-                    "skill_id": skill_results[0]["skill_id"]
-                })
+        self.execute_write_query(LINK_EXPERIENCE_SKILLS_QUERY, {
+            "exp_id": exp_id,
+            "skill_ids": skill_ids
+        }, invalidates=[f"Experience:{exp_id}"])
     
     def add_candidate_skill(self, resume_id, skill_id, proficiency, experience_years, is_core=True):
         """Add a skill to a candidate.
@@ -267,9 +393,236 @@ class CandidateRepository(BaseRepository):
             "experience_years": experience_years
         }
         
-        self.execute_write_query(query, parameters)
+        self.execute_write_query(query, parameters, invalidates=[f"Candidate:{resume_id}"])
         return True
     
+    def add_candidates_bulk(self, candidates, batch_size=ETL_BATCH_SIZE):
+        """Add or update many candidate nodes with batched UNWIND writes.
+        
+        Unlike add_candidate, experiences are not created here; use
+        add_experiences_bulk for them.
+        
+        Args:
+            candidates: Iterable of candidate dictionaries with a resume_id
+            batch_size: Number of candidates per transaction
+            
+        Returns:
+            Number of candidates written
+        """
+        query = """
+            UNWIND $rows AS row
+            MERGE (c:Candidate {resume_id: row.resume_id})
+            SET c.name = row.name,
+                c.email = row.email,
+                c.title = row.title,
+                c.domain = row.domain,
+                c.location = row.location,
+                c.summary = row.summary,
+                c.education = row.education,
+                c.content_hash = row.content_hash
+        """
+        rows = ({
+            "resume_id": candidate["resume_id"],
+            "name": candidate["name"],
+            "email": candidate.get("email", ""),
+            "title": candidate.get("title", ""),
+            "domain": candidate.get("domain", ""),
+            "location": candidate.get("location", ""),
+            "summary": candidate.get("summary", ""),
+            "education": self._process_education(candidate.get("education", [])),
+            "content_hash": candidate.get("content_hash")
+        } for candidate in candidates)
+        return self.execute_batched_write(query, rows, batch_size)
+    
+    def add_candidate_skills_bulk(self, candidate_skills, batch_size=ETL_BATCH_SIZE):
+        """Add many candidate skills with batched UNWIND writes.
+        
+        Args:
+            candidate_skills: List of dictionaries with resume_id, skill_id, proficiency, experience_years and is_core
+            batch_size: Number of relationships per transaction
+            
+        Returns:
+            Number of relationships written
+        """
+        written = 0
+        for is_core in (True, False):
+            rel_type = "HAS_CORE_SKILL" if is_core else "HAS_SECONDARY_SKILL"
+            rows = [{
+                "resume_id": rel["resume_id"],
+                "skill_id": rel["skill_id"],
+                "proficiency": rel["proficiency"],
+                "experience_years": rel["experience_years"]
+            } for rel in candidate_skills if bool(rel.get("is_core", True)) == is_core]
+            if not rows:
+                continue
+            
+            query = f"""
+                UNWIND $rows AS row
+                MATCH (c:Candidate {{resume_id: row.resume_id}})
+                MATCH (s:Skill {{skill_id: row.skill_id}})
+                MERGE (c)-[r:`{rel_type}`]->(s)
+                SET r.proficiency = row.proficiency,
+                    r.experience_years = row.experience_years
+            """
+            written += self.execute_batched_write(query, rows, batch_size)
+        return written
+    
+    def add_candidate_skills_columns(self, columns, is_core=True, batch_size=ETL_BATCH_SIZE):
+        """Add many candidate skills of one kind from columns.
+        
+        Args:
+            columns: Dictionary with equally long resume_id, skill_id, proficiency and experience_years sequences
+            is_core: Whether the rows are core or secondary skills
+            batch_size: Number of relationships per transaction
+            
+        Returns:
+            Number of relationships written
+        """
+        rel_type = "HAS_CORE_SKILL" if is_core else "HAS_SECONDARY_SKILL"
+        query = f"""
+            UNWIND range(0, size($resume_id) - 1) AS i
+            MATCH (c:Candidate {{resume_id: $resume_id[i]}})
+            MATCH (s:Skill {{skill_id: $skill_id[i]}})
+            MERGE (c)-[r:`{rel_type}`]->(s)
+            SET r.proficiency = $proficiency[i],
+                r.experience_years = $experience_years[i]
+        """
+        return self.execute_columnar_write(query, columns, batch_size)
+    
+    def add_experiences_bulk(self, experiences, batch_size=ETL_BATCH_SIZE, link_skills=True):
+        """Add many experience nodes, linked to their candidates and skills, with batched UNWIND writes.
+        
+        Args:
+            experiences: Iterable of dictionaries with exp_id, resume_id, experience fields
+                and an optional skills_used list of skill names, resolved in memory
+            batch_size: Number of experiences per transaction
+            link_skills: Whether to create USED_SKILL links here; parallel loaders
+                pass False and write them with add_experience_skills_bulk instead
+            
+        Returns:
+            Number of experiences written
+        """
+        query = """
+            UNWIND $rows AS row
+            MERGE (e:Experience {exp_id: row.exp_id})
+            SET e.job_title = row.job_title,
+                e.company = row.company,
+                e.start_date = row.start_date,
+                e.end_date = row.end_date,
+                e.description = row.description
+            WITH e, row
+            MATCH (c:Candidate {resume_id: row.resume_id})
+            MERGE (c)-[:HAS_EXPERIENCE]->(e)
+            WITH e, row
+            UNWIND row.skill_ids AS skill_id
+            MATCH (s:Skill {skill_id: skill_id})
+            MERGE (e)-[:USED_SKILL]->(s)
+        """
+        resolver = get_skill_resolver(self)
+        rows = ({
+            "exp_id": exp["exp_id"],
+            "resume_id": exp["resume_id"],
+            "job_title": exp.get("job_title", ""),
+            "company": exp.get("company", ""),
+            "start_date": exp.get("start_date", ""),
+            "end_date": exp.get("end_date", "Present"),
+            "description": self._process_text_list(exp.get("description", [])),
+            "skill_ids": resolver.resolve_many(exp.get("skills_used")) if link_skills else []
+        } for exp in experiences)
+        return self.execute_batched_write(query, rows, batch_size)
+    
+    def get_content_hashes(self):
+        """Get the content hashes of candidates loaded by the ETL pipeline.
+        
+        Candidates created through the API have no content hash and are not returned.
+        
+        Returns:
+            Dictionary of resume_id to content hash
+        """
+        query = """
+            MATCH (c:Candidate)
+            WHERE c.content_hash IS NOT NULL
+            RETURN c.resume_id AS resume_id, c.content_hash AS content_hash
+        """
+        return {row["resume_id"]: row["content_hash"] for row in self.stream_read_query(query)}
+    
+    def reset_candidates_bulk(self, resume_ids, batch_size=ETL_BATCH_SIZE):
+        """Remove the skills, experiences and embeddings of candidates that are about to be reloaded.
+        
+        Args:
+            resume_ids: IDs of the candidates
+            batch_size: Number of candidates per transaction
+            
+        Returns:
+            Number of candidates reset
+        """
+        query = """
+            UNWIND $rows AS row
+            MATCH (c:Candidate {resume_id: row.resume_id})
+            OPTIONAL MATCH (c)-[r:HAS_CORE_SKILL|HAS_SECONDARY_SKILL]->(:Skill)
+            DELETE r
+            WITH DISTINCT c
+            OPTIONAL MATCH (c)-[:HAS_EXPERIENCE]->(e:Experience)
+            DETACH DELETE e
+            WITH DISTINCT c
+            REMOVE c.embedding
+        """
+        return self.execute_batched_write(query, ({"resume_id": resume_id} for resume_id in resume_ids), batch_size)
+    
+    def delete_candidates_bulk(self, resume_ids, batch_size=ETL_BATCH_SIZE):
+        """Delete many candidates with their experiences, education and relationships.
+        
+        Args:
+            resume_ids: IDs of the candidates to delete
+            batch_size: Number of candidates per transaction
+            
+        Returns:
+            Number of candidates deleted
+        """
+        query = """
+            UNWIND $rows AS row
+            MATCH (c:Candidate {resume_id: row.resume_id})
+            OPTIONAL MATCH (c)-[:HAS_EXPERIENCE|HAS_EDUCATION]->(owned)
+            DETACH DELETE owned
+            WITH DISTINCT c
+            DETACH DELETE c
+        """
+        return self.execute_batched_write(query, ({"resume_id": resume_id} for resume_id in resume_ids), batch_size)
+    
+    def resolve_experience_skills(self, experiences):
+        """Resolve the skills_used names of experiences to (experience, skill) link rows.
+        
+        Args:
+            experiences: Iterable of dictionaries with exp_id and an optional skills_used list
+            
+        Returns:
+            List of dictionaries with exp_id and skill_id
+        """
+        resolver = get_skill_resolver(self)
+        return [
+            {"exp_id": exp["exp_id"], "skill_id": skill_id}
+            for exp in experiences
+            for skill_id in resolver.resolve_many(exp.get("skills_used"))
+        ]
+    
+    def add_experience_skills_bulk(self, experience_skills, batch_size=ETL_BATCH_SIZE):
+        """Link experiences to skills with batched UNWIND writes.
+        
+        Args:
+            experience_skills: Iterable of dictionaries with exp_id and skill_id
+            batch_size: Number of links per transaction
+            
+        Returns:
+            Number of links written
+        """
+        query = """
+            UNWIND $rows AS row
+            MATCH (e:Experience {exp_id: row.exp_id})
+            MATCH (s:Skill {skill_id: row.skill_id})
+            MERGE (e)-[:USED_SKILL]->(s)
+        """
+        return self.execute_batched_write(query, experience_skills, batch_size)
+    
     def get_candidate_experiences(self, resume_id):
         """Get all experiences for a candidate with their associated skills.
         
@@ -301,23 +654,30 @@ class CandidateRepository(BaseRepository):
         
         results = self.execute_read_query(query, {"resume_id": resume_id})
         
-        experiences = []
-        for exp_data in results:
-            # Convert description back from JSON string if needed
-            if exp_data.get("description") and isinstance(exp_data["description"], str):
-                try:
-                    exp_data["description"] = json.loads(exp_data["description"])
-                except:
-                    # If it's not valid JSON, keep as is
-                    pass
-            
-            # Filter out any null skills (from the OPTIONAL MATCH) if skills field exists
-            if "skills" in exp_data:
-                exp_data["skills"] = [s for s in exp_data["skills"] if s["skill_id"] is not None]
-                
-            experiences.append(exp_data)
+        return [self._parse_experience(exp_data) for exp_data in results]
+    
+    def _parse_experience(self, exp_data):
+        """Decode the stored description of an experience and drop empty skills.
+        
+        Args:
+            exp_data: Experience properties as dictionary, changed in place
             
-        return experiences
+        Returns:
+            The experience data
+        """
+        # Convert description back from JSON string if needed
+        if exp_data.get("description") and isinstance(exp_data["description"], str):
+            try:
+                exp_data["description"] = json.loads(exp_data["description"])
+            except:
+                # If it's not valid JSON, keep as is
+                pass
+        
+        # Filter out any null skills (from the OPTIONAL MATCH) if skills field exists
+        if "skills" in exp_data:
+            exp_data["skills"] = [s for s in exp_data["skills"] if s["skill_id"] is not None]
+        
+        return exp_data
     
     def get_candidate(self, resume_id):
         """Get a candidate by ID.
@@ -328,23 +688,81 @@ class CandidateRepository(BaseRepository):
         Returns:
             Candidate data as dictionary or None if not found
         """
+        results = self.execute_read_query(GET_CANDIDATE_QUERY, {"resume_id": resume_id},
+                                          cache_name="candidate.get", cache_tags=[f"Candidate:{resume_id}"])
+        if not results:
+            return None
+            
+        return results[0]
+    
+    def get_candidate_profile(self, resume_id):
+        """Get a candidate with skills, experiences and education in a single query.
+        
+        Each part is collected by its own subquery, in the order of
+        get_candidate_skills, get_candidate_experiences and
+        get_candidate_education, so a profile page costs one round trip
+        instead of four.
+        
+        Args:
+            resume_id: ID of the candidate
+            
+        Returns:
+            CandidateProfile or None if not found
+        """
         query = """
             MATCH (c:Candidate {resume_id: $resume_id})
-            RETURN c.resume_id as resume_id, 
-                   c.name as name, 
-                   c.title as title,
-                   c.location as location, 
-                   c.domain as domain,
-                   c.email as email,
-                   c.summary as summary,
-                   c.education as education
+            CALL {
+                WITH c
+                MATCH (c)-[r]->(s:Skill)
+                WITH s, r
+                ORDER BY COALESCE(r.level, 0) DESC, COALESCE(r.experience_years, r.years, 0) DESC, s.name
+                RETURN collect({
+                    skill_id: s.skill_id, name: s.name,
+                    category: s.category, level: r.level,
+                    experience_years: r.experience_years,
+                    years: r.years,
+                    proficiency: r.proficiency,
+                    relationship_type: type(r)
+                }) AS skills
+            }
+            CALL {
+                WITH c
+                MATCH (c)-[:HAS_EXPERIENCE]->(e:Experience)
+                WITH e
+                ORDER BY
+                    CASE
+                        WHEN e.end_date = 'Present' THEN 1
+                        ELSE 0
+                    END DESC,
+                    e.start_date DESC
+                RETURN collect(e {.experience_id, .title, .company, .start_date, .end_date,
+                                  .description, .location,
+                                  skills: [(e)-[:USED_SKILL]->(s:Skill) | s {.skill_id, .name, .category}]
+                }) AS experiences
+            }
+            CALL {
+                WITH c
+                MATCH (c)-[:HAS_EDUCATION]->(e:Education)
+                WITH e
+                ORDER BY e.end_date DESC
+                RETURN collect(e {.education_id, .institution, .degree, .field,
+                                  .start_date, .end_date, .gpa}) AS education
+            }
+            RETURN c {.resume_id, .name, .title, .location, .domain, .email, .summary, .education} AS candidate,
+                   skills, experiences, education
         """
         
         results = self.execute_read_query(query, {"resume_id": resume_id})
         if not results:
             return None
-            
-        return results[0]
+        
+        row = results[0]
+        return CandidateProfile(
+            row["candidate"],
+            row["skills"],
+            [self._parse_experience(exp_data) for exp_data in row["experiences"]],
+            row["education"]
+        )
     
     def get_candidate_skills(self, resume_id):
         """Get skills for a candidate.
@@ -366,7 +784,7 @@ class CandidateRepository(BaseRepository):
             ORDER BY COALESCE(r.level, 0) DESC, COALESCE(r.experience_years, r.years, 0) DESC, s.name
         """
         
-        return self.execute_read_query(query, {"resume_id": resume_id})
+        return self.execute_read_query(query, {"resume_id": resume_id}, row_type=SkillRow)
     
     def get_candidate_education(self, resume_id):
         """Get education history for a candidate.
@@ -458,7 +876,7 @@ class CandidateRepository(BaseRepository):
             LIMIT $limit
         """
         
-        return self.execute_read_query(query, {"resume_id": resume_id, "limit": limit})
+        return self.execute_read_query(query, {"resume_id": resume_id, "limit": limit}, row_type=MatchRow)
     
     def find_matching_jobs_enhanced(self, resume_id, limit=10, weights=None):
         """Find jobs matching a candidate with enhanced algorithm including
@@ -550,28 +968,12 @@ class CandidateRepository(BaseRepository):
                     ELSE 0.0  // No match
                  END as locationScore
             
-            // Semantic experience matching if embeddings exist
+            // Semantic experience matching from precomputed job/experience similarity
+            // (max cosine similarity across the candidate's experiences, see
+            // GraphService.refresh_semantic_matches)
+            OPTIONAL MATCH (c)-[sm:SEMANTIC_MATCH]->(j)
             WITH j, c, skillScore, locationScore,
-            
-            // Use Neo4j native vector functions for semantic matching
-            c as candidate, j as job
-            OPTIONAL MATCH (candidate)-[:HAS_EXPERIENCE]->(e:Experience)
-            WHERE e.text_embedding IS NOT NULL AND job.text_embedding IS NOT NULL
-            
-            // Calculate cosine similarity between job and each experience
-            WITH job, candidate, skillScore, locationScore, e,
-                 CASE 
-                    WHEN e.text_embedding IS NOT NULL AND job.text_embedding IS NOT NULL
-                    THEN vector.similarity.cosine(job.text_embedding, e.text_embedding) * 100
-                    ELSE 0
-                 END as expSimilarity
-            
-            // Get the maximum similarity across all experiences
-            WITH job as j, candidate as c, skillScore, locationScore,
-                 CASE 
-                    WHEN MAX(expSimilarity) IS NOT NULL THEN MAX(expSimilarity)
-                    ELSE 0
-                 END as semanticScore
+                 COALESCE(sm.score, 0.0) * 100 AS semanticScore
             
             // Calculate weighted total score
             WITH j, c, 
@@ -621,7 +1023,52 @@ class CandidateRepository(BaseRepository):
             "limit": limit,
             "weights": weights
         })
-    
+
+    def find_similar_jobs(self, resume_id, limit=10):
+        """Find jobs whose embedding is closest to a candidate's profile embedding.
+
+        Uses the job_embedding vector index created by GraphService.generate_embeddings.
+
+        Args:
+            resume_id: ID of the candidate
+            limit: Maximum number of results to return
+
+        Returns:
+            List of jobs with similarity scores
+        """
+        query = """
+            MATCH (c:Candidate {resume_id: $resume_id})
+            WHERE c.embedding IS NOT NULL
+            CALL db.index.vector.queryNodes('job_embedding', $limit, c.embedding)
+            YIELD node, score
+            RETURN node.job_id AS job_id, score AS similarity
+            ORDER BY similarity DESC
+        """
+
+        return self.execute_read_query(query, {"resume_id": resume_id, "limit": limit})
+
+    def get_candidate_texts(self, resume_ids=None):
+        """Get the searchable text fields of candidates.
+
+        Args:
+            resume_ids: Optional list of candidate IDs to restrict the result to
+
+        Returns:
+            List of candidates with text fields, experiences and skill names
+        """
+        return self.execute_read_query(CANDIDATE_TEXTS_QUERY, {"resume_ids": resume_ids})
+
+    def stream_candidate_texts(self, fetch_size=STREAM_FETCH_SIZE):
+        """Stream the searchable text fields of all candidates.
+
+        Args:
+            fetch_size: Number of candidates fetched per round trip
+
+        Returns:
+            Generator of candidates with text fields, experiences and skill names
+        """
+        return self.stream_read_query(CANDIDATE_TEXTS_QUERY, {"resume_ids": None}, fetch_size)
+
     def _process_text_list(self, text_list):
         """Process a list of text items into a JSON string to preserve array structure."""
         if not text_list:
@@ -652,16 +1099,46 @@ class CandidateRepository(BaseRepository):
         # Last resort: convert to JSON array with single item
         return json.dumps([education_list])
     
-    def find_candidates(self, filters=None, limit=20, offset=0):
-        """Find candidates matching specified filters.
+    def find_candidates(self, filters=None, limit=20, offset=0, cursor=None):
+        """Find candidates matching specified filters, by name.
+        
+        Pages are addressed by cursor (keyset pagination on name and
+        resume_id, see CANDIDATE_PAGE_KEY), so a deep page costs the same as
+        the first. The offset is only applied without a cursor.
         
         Args:
             filters: Dictionary containing filter criteria
             limit: Maximum number of results to return
             offset: Offset for pagination
+            cursor: Cursor of the page to return, from the previous page
             
         Returns:
             List of candidates matching the filters
+            
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        query, params = self.find_candidates_query(filters, limit, offset, cursor)
+        print(f"Debug - Executing candidate search query with params: {params}")
+        results = self.execute_read_query(query, params, row_type=CandidateSummary)
+        print(f"Debug - Found {len(results)} candidates")
+        return results
+    
+    @staticmethod
+    def find_candidates_query(filters=None, limit=20, offset=0, cursor=None):
+        """Build the query and parameters of find_candidates.
+        
+        Args:
+            filters: Dictionary containing filter criteria
+            limit: Maximum number of results to return
+            offset: Offset for pagination
+            cursor: Cursor of the page to return, from the previous page
+            
+        Returns:
+            tuple: Cypher query and its parameters
+            
+        Raises:
+            ValueError: If the cursor is invalid
         """
         # Prepare WHERE clauses based on filters
         where_clauses = []
@@ -691,6 +1168,12 @@ class CandidateRepository(BaseRepository):
                 where_clauses.append("(c)-[:HAS_CORE_SKILL|HAS_SECONDARY_SKILL]->(:Skill {name: $skill})")
                 params['skill'] = filters['skill']
         
+        # Seek past the last candidate of the previous page instead of skipping
+        if cursor:
+            params.update(cursor_parameters(cursor))
+            where_clauses.append(keyset_condition("c.name", "c.resume_id", null_key=params['after_key'] is None))
+            params['offset'] = 0
+        
         # Build query
         query = """
             MATCH (c:Candidate)
@@ -708,15 +1191,12 @@ class CandidateRepository(BaseRepository):
                    c.location as location, 
                    c.domain as domain,
                    c.email as email
-            ORDER BY c.name
+            ORDER BY c.name, c.resume_id
             SKIP $offset
             LIMIT $limit
         """
         
-        print(f"Debug - Executing candidate search query with params: {params}")
-        results = self.execute_read_query(query, params)
-        print(f"Debug - Found {len(results)} candidates")
-        return results
+        return query, params
     
     def get_candidate_filter_options(self):
         """Get options for candidate filters.
@@ -732,7 +1212,7 @@ class CandidateRepository(BaseRepository):
             RETURN domains, locations, titles
         """
         
-        result = self.execute_read_query(query)
+        result = self.execute_read_query(query, cache_name="candidate.filter_options", cache_tags=["Candidate"])
         if not result:
             return {"domains": [], "locations": [], "titles": []}
         
@@ -779,7 +1259,7 @@ class CandidateRepository(BaseRepository):
             RETURN c.resume_id as resume_id
         """
         
-        self.execute_write_query(query, params)
+        self.execute_write_query(query, params, invalidates=[f"Candidate:{resume_id}"])
         return resume_id
         
     def delete_candidate(self, resume_id):
@@ -802,7 +1282,7 @@ class CandidateRepository(BaseRepository):
             DETACH DELETE c
         """
         
-        self.execute_write_query(query, {"resume_id": resume_id})
+        self.execute_write_query(query, {"resume_id": resume_id}, invalidates=[f"Candidate:{resume_id}"])
         return True
         
     def remove_candidate_skills(self, resume_id):
@@ -819,7 +1299,7 @@ class CandidateRepository(BaseRepository):
             DELETE r
         """
         
-        self.execute_write_query(query, {"resume_id": resume_id})
+        self.execute_write_query(query, {"resume_id": resume_id}, invalidates=[f"Candidate:{resume_id}"])
         return True
         
     def remove_candidate_experiences(self, resume_id):
@@ -836,7 +1316,7 @@ class CandidateRepository(BaseRepository):
             DETACH DELETE e
         """
         
-        self.execute_write_query(query, {"resume_id": resume_id})
+        self.execute_write_query(query, {"resume_id": resume_id}, invalidates=[f"Candidate:{resume_id}"])
         return True
         
     def remove_candidate_education(self, resume_id):
@@ -853,5 +1333,5 @@ class CandidateRepository(BaseRepository):
             DETACH DELETE e
         """
         
-        self.execute_write_query(query, {"resume_id": resume_id})
+        self.execute_write_query(query, {"resume_id": resume_id}, invalidates=[f"Candidate:{resume_id}"])
         return True 
\ No newline at end of file
@@ -3,9 +3,49 @@ Job Repository for Knowledge Graph
 This module provides job-related database operations.
 """
 
+from src.backend.config import STREAM_FETCH_SIZE
+from src.backend.models.record_model import JobSummary, MatchRow, SkillRow
 from src.backend.repositories.base.repository import BaseRepository
+from src.backend.utils.pagination import keyset_condition, cursor_parameters
+from src.config import ETL_BATCH_SIZE
+from typing import Dict, List, NamedTuple
 import json
 
+# Columns of the rows returned by find_jobs that its cursors encode
+JOB_PAGE_KEY = ("created_at", "job_id")
+
+# Searchable text fields of jobs, all of them when $job_ids is null
+JOB_TEXTS_QUERY = """
+    MATCH (j:Job)
+    WHERE $job_ids IS NULL OR j.job_id IN $job_ids
+    RETURN j.job_id AS job_id, j.title AS title, j.company AS company,
+           j.description AS description,
+           j.responsibilities AS responsibilities,
+           j.qualifications AS qualifications,
+           [(j)-[:REQUIRES_PRIMARY|REQUIRES_SECONDARY]->(s:Skill) | s.name] AS skills
+"""
+
+# A job by ID, as read by get_job
+GET_JOB_QUERY = """
+    MATCH (j:Job {job_id: $job_id})
+    RETURN j.job_id as job_id, 
+           j.title as title, 
+           j.company as company,
+           j.location as location, 
+           j.domain as domain,
+           j.description as description,
+           j.responsibilities as responsibilities,
+           j.qualifications as qualifications,
+           j.owner_email as owner_email
+"""
+
+
+class JobProfile(NamedTuple):
+    """A job with its required skills, as read by get_job_profile."""
+    job: Dict
+    skills: List[Dict]
+
+
 class JobRepository(BaseRepository):
     """Repository for job-related operations in the knowledge graph."""
     
@@ -43,11 +83,12 @@ class JobRepository(BaseRepository):
             "responsibilities": self._process_text_list(job_data.get("responsibilities", [])),
             "qualifications": self._process_text_list(job_data.get("qualifications", [])),
             "owner_email": job_data.get("owner_email", ""),
-            "created_at": job_data.get("created_at", ""),
+            # Never null: find_jobs sorts and seeks on created_at
+            "created_at": job_data.get("created_at") or "",
             "updated_at": job_data.get("updated_at", "")
         }
         
-        result = self.execute_write_query(query, parameters)
+        result = self.execute_write_query(query, parameters, invalidates=[f"Job:{job_data['job_id']}"])
         return job_data["job_id"]
     
     def add_job_skill(self, job_id, skill_id, proficiency, importance, is_primary=True):
@@ -80,9 +121,157 @@ class JobRepository(BaseRepository):
             "importance": importance
         }
         
-        self.execute_write_query(query, parameters)
+        self.execute_write_query(query, parameters, invalidates=[f"Job:{job_id}"])
         return True
     
+    def add_jobs_bulk(self, jobs, batch_size=ETL_BATCH_SIZE):
+        """Add or update many job nodes with batched UNWIND writes.
+        
+        Args:
+            jobs: Iterable of job dictionaries, as accepted by add_job
+            batch_size: Number of jobs per transaction
+            
+        Returns:
+            Number of jobs written
+        """
+        query = """
+            UNWIND $rows AS row
+            MERGE (j:Job {job_id: row.job_id})
+            SET j.title = row.title,
+                j.company = row.company,
+                j.domain = row.domain,
+                j.location = row.location,
+                j.description = row.description,
+                j.responsibilities = row.responsibilities,
+                j.qualifications = row.qualifications,
+                j.owner_email = row.owner_email,
+                j.created_at = row.created_at,
+                j.updated_at = row.updated_at,
+                j.content_hash = row.content_hash
+        """
+        rows = ({
+            "job_id": job["job_id"],
+            "title": job["title"],
+            "company": job["company"],
+            "domain": job.get("domain", ""),
+            "location": job.get("location", ""),
+            "description": job.get("summary", ""),
+            "responsibilities": self._process_text_list(job.get("responsibilities", [])),
+            "qualifications": self._process_text_list(job.get("qualifications", [])),
+            "owner_email": job.get("owner_email", ""),
+            "created_at": job.get("created_at") or "",
+            "updated_at": job.get("updated_at", ""),
+            "content_hash": job.get("content_hash")
+        } for job in jobs)
+        return self.execute_batched_write(query, rows, batch_size)
+    
+    def add_job_skills_bulk(self, job_skills, batch_size=ETL_BATCH_SIZE):
+        """Add many job skill requirements with batched UNWIND writes.
+        
+        Args:
+            job_skills: List of dictionaries with job_id, skill_id, proficiency, importance and is_primary
+            batch_size: Number of relationships per transaction
+            
+        Returns:
+            Number of relationships written
+        """
+        written = 0
+        for is_primary in (True, False):
+            rel_type = "REQUIRES_PRIMARY" if is_primary else "REQUIRES_SECONDARY"
+            rows = [{
+                "job_id": rel["job_id"],
+                "skill_id": rel["skill_id"],
+                "proficiency": rel["proficiency"],
+                "importance": rel["importance"]
+            } for rel in job_skills if bool(rel.get("is_primary", True)) == is_primary]
+            if not rows:
+                continue
+            
+            query = f"""
+                UNWIND $rows AS row
+                MATCH (j:Job {{job_id: row.job_id}})
+                MATCH (s:Skill {{skill_id: row.skill_id}})
+                MERGE (j)-[r:`{rel_type}`]->(s)
+                SET r.proficiency = row.proficiency,
+                    r.importance = row.importance
+            """
+            written += self.execute_batched_write(query, rows, batch_size)
+        return written
+    
+    def add_job_skills_columns(self, columns, is_primary=True, batch_size=ETL_BATCH_SIZE):
+        """Add many job skill requirements of one kind from columns.
+        
+        Args:
+            columns: Dictionary with equally long job_id, skill_id, proficiency and importance sequences
+            is_primary: Whether the rows are primary or secondary requirements
+            batch_size: Number of relationships per transaction
+            
+        Returns:
+            Number of relationships written
+        """
+        rel_type = "REQUIRES_PRIMARY" if is_primary else "REQUIRES_SECONDARY"
+        query = f"""
+            UNWIND range(0, size($job_id) - 1) AS i
+            MATCH (j:Job {{job_id: $job_id[i]}})
+            MATCH (s:Skill {{skill_id: $skill_id[i]}})
+            MERGE (j)-[r:`{rel_type}`]->(s)
+            SET r.proficiency = $proficiency[i],
+                r.importance = $importance[i]
+        """
+        return self.execute_columnar_write(query, columns, batch_size)
+    
+    def get_content_hashes(self):
+        """Get the content hashes of jobs loaded by the ETL pipeline.
+        
+        Jobs created through the API have no content hash and are not returned.
+        
+        Returns:
+            Dictionary of job_id to content hash
+        """
+        query = """
+            MATCH (j:Job)
+            WHERE j.content_hash IS NOT NULL
+            RETURN j.job_id AS job_id, j.content_hash AS content_hash
+        """
+        return {row["job_id"]: row["content_hash"] for row in self.stream_read_query(query)}
+    
+    def reset_jobs_bulk(self, job_ids, batch_size=ETL_BATCH_SIZE):
+        """Remove the skill requirements and embeddings of jobs that are about to be reloaded.
+        
+        Args:
+            job_ids: IDs of the jobs
+            batch_size: Number of jobs per transaction
+            
+        Returns:
+            Number of jobs reset
+        """
+        query = """
+            UNWIND $rows AS row
+            MATCH (j:Job {job_id: row.job_id})
+            OPTIONAL MATCH (j)-[r:REQUIRES_PRIMARY|REQUIRES_SECONDARY]->(:Skill)
+            DELETE r
+            WITH DISTINCT j
+            REMOVE j.embedding
+        """
+        return self.execute_batched_write(query, ({"job_id": job_id} for job_id in job_ids), batch_size)
+    
+    def delete_jobs_bulk(self, job_ids, batch_size=ETL_BATCH_SIZE):
+        """Delete many jobs with their relationships.
+        
+        Args:
+            job_ids: IDs of the jobs to delete
+            batch_size: Number of jobs per transaction
+            
+        Returns:
+            Number of jobs deleted
+        """
+        query = """
+            UNWIND $rows AS row
+            MATCH (j:Job {job_id: row.job_id})
+            DETACH DELETE j
+        """
+        return self.execute_batched_write(query, ({"job_id": job_id} for job_id in job_ids), batch_size)
+    
     def find_matching_candidates(self, job_id, limit=10):
         """Find candidates matching a job based on skill graph analysis.
         
@@ -149,7 +338,7 @@ class JobRepository(BaseRepository):
             LIMIT $limit
         """
         
-        return self.execute_read_query(query, {"job_id": job_id, "limit": limit})
+        return self.execute_read_query(query, {"job_id": job_id, "limit": limit}, row_type=MatchRow)
     
     def find_matching_candidates_enhanced(self, job_id, limit=10, weights=None):
         """Find candidates matching a job with enhanced algorithm including
@@ -241,28 +430,12 @@ class JobRepository(BaseRepository):
                     ELSE 0.0  // No match
                  END as locationScore
             
-            // Semantic experience matching if embeddings exist
+            // Semantic experience matching from precomputed job/experience similarity
+            // (max cosine similarity across the candidate's experiences, see
+            // GraphService.refresh_semantic_matches)
+            OPTIONAL MATCH (c)-[sm:SEMANTIC_MATCH]->(j)
             WITH j, c, skillScore, locationScore,
-            
-            // Use Neo4j native vector functions for semantic matching
-            c as candidate, j as job
-            OPTIONAL MATCH (candidate)-[:HAS_EXPERIENCE]->(e:Experience)
-            WHERE e.text_embedding IS NOT NULL AND job.text_embedding IS NOT NULL
-            
-            // Calculate cosine similarity between job and each experience
-            WITH job, candidate, skillScore, locationScore, e,
-                 CASE 
-                    WHEN e.text_embedding IS NOT NULL AND job.text_embedding IS NOT NULL
-                    THEN vector.similarity.cosine(job.text_embedding, e.text_embedding) * 100
-                    ELSE 0
-                 END as expSimilarity
-            
-            // Get the maximum similarity across all experiences
-            WITH job as j, candidate as c, skillScore, locationScore,
-                 CASE 
-                    WHEN MAX(expSimilarity) IS NOT NULL THEN MAX(expSimilarity)
-                    ELSE 0
-                 END as semanticScore
+                 COALESCE(sm.score, 0.0) * 100 AS semanticScore
             
             // Calculate weighted total score
             WITH c, 
@@ -313,7 +486,52 @@ class JobRepository(BaseRepository):
             "limit": limit,
             "weights": weights
         })
-    
+
+    def find_similar_candidates(self, job_id, limit=10):
+        """Find candidates whose profile embedding is closest to a job's embedding.
+
+        Uses the candidate_embedding vector index created by GraphService.generate_embeddings.
+
+        Args:
+            job_id: ID of the job
+            limit: Maximum number of results to return
+
+        Returns:
+            List of candidates with similarity scores
+        """
+        query = """
+            MATCH (j:Job {job_id: $job_id})
+            WHERE j.embedding IS NOT NULL
+            CALL db.index.vector.queryNodes('candidate_embedding', $limit, j.embedding)
+            YIELD node, score
+            RETURN node.resume_id AS resume_id, score AS similarity
+            ORDER BY similarity DESC
+        """
+
+        return self.execute_read_query(query, {"job_id": job_id, "limit": limit})
+
+    def get_job_texts(self, job_ids=None):
+        """Get the searchable text fields of jobs.
+
+        Args:
+            job_ids: Optional list of job IDs to restrict the result to
+
+        Returns:
+            List of jobs with text fields and required skill names
+        """
+        return self.execute_read_query(JOB_TEXTS_QUERY, {"job_ids": job_ids})
+
+    def stream_job_texts(self, fetch_size=STREAM_FETCH_SIZE):
+        """Stream the searchable text fields of all jobs.
+
+        Args:
+            fetch_size: Number of jobs fetched per round trip
+
+        Returns:
+            Generator of jobs with text fields and required skill names
+        """
+        return self.stream_read_query(JOB_TEXTS_QUERY, {"job_ids": None}, fetch_size)
+
     def get_job(self, job_id):
         """Get a job by ID.
         
@@ -323,33 +541,66 @@ class JobRepository(BaseRepository):
         Returns:
             Job data as dictionary or None if not found
         """
+        results = self.execute_read_query(GET_JOB_QUERY, {"job_id": job_id},
+                                          cache_name="job.get", cache_tags=[f"Job:{job_id}"])
+        if not results:
+            return None
+        
+        return self._parse_job_fields(results[0])
+    
+    def get_job_profile(self, job_id):
+        """Get a job and its required skills in a single query.
+        
+        The skills are collected by a subquery next to the job properties, so
+        a job page costs one round trip instead of one per part.
+        
+        Args:
+            job_id: ID of the job
+            
+        Returns:
+            JobProfile or None if not found
+        """
         query = """
             MATCH (j:Job {job_id: $job_id})
-            RETURN j.job_id as job_id, 
-                   j.title as title, 
-                   j.company as company,
-                   j.location as location, 
-                   j.domain as domain,
-                   j.description as description,
-                   j.responsibilities as responsibilities,
-                   j.qualifications as qualifications,
-                   j.owner_email as owner_email
+            CALL {
+                WITH j
+                MATCH (j)-[r]->(s:Skill)
+                WITH s, r
+                ORDER BY r.importance DESC, s.name
+                RETURN collect({
+                    skill_id: s.skill_id, name: s.name,
+                    category: s.category, level: r.level,
+                    proficiency: r.proficiency,
+                    relationship_type: type(r),
+                    importance: r.importance
+                }) AS skills
+            }
+            RETURN j {.job_id, .title, .company, .location, .domain, .description,
+                      .responsibilities, .qualifications, .owner_email} AS job,
+                   skills
         """
         
         results = self.execute_read_query(query, {"job_id": job_id})
         if not results:
             return None
         
-        # Process the job data before returning
-        job_data = results[0]
+        return JobProfile(self._parse_job_fields(results[0]["job"]), results[0]["skills"])
+    
+    def _parse_job_fields(self, job_data):
+        """Turn the stored responsibilities and qualifications of a job into lists.
         
+        Args:
+            job_data: Job properties as dictionary, changed in place
+            
+        Returns:
+            The job data
+        """
         # Handle JSON strings for responsibilities and qualifications without logging errors
         for field in ['responsibilities', 'qualifications']:
             try:
                 if field in job_data and job_data[field] and isinstance(job_data[field], str):
                     # Try to parse as JSON if it's a string that looks like JSON
                     if job_data[field].strip().startswith('['):
-                        import json
                         job_data[field] = json.loads(job_data[field])
             except:
                 # On any error, fall back to a list with the original value
@@ -383,7 +634,7 @@ class JobRepository(BaseRepository):
             ORDER BY r.importance DESC, s.name
         """
         
-        return self.execute_read_query(query, {"job_id": job_id})
+        return self.execute_read_query(query, {"job_id": job_id}, row_type=SkillRow)
     
     def _process_text_list(self, text_list):
         """Process a list of text items into a JSON string to preserve array structure.
@@ -407,16 +658,43 @@ class JobRepository(BaseRepository):
         # If it's a single string (not a JSON array), convert to a list with one item
         return json.dumps([str(text_list)])
     
-    def find_jobs(self, filters=None, limit=20, offset=0):
-        """Find jobs matching specified filters.
+    def find_jobs(self, filters=None, limit=20, offset=0, cursor=None):
+        """Find jobs matching specified filters, newest first.
+        
+        Pages are addressed by cursor (keyset pagination on created_at and
+        job_id, see JOB_PAGE_KEY), so a deep page costs the same as the first.
+        The offset is only applied without a cursor.
         
         Args:
             filters: Dictionary containing filter criteria
             limit: Maximum number of results to return
             offset: Offset for pagination
+            cursor: Cursor of the page to return, from the previous page
             
         Returns:
             List of jobs matching the filters
+            
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        query, params = self.find_jobs_query(filters, limit, offset, cursor)
+        return self.execute_read_query(query, params, row_type=JobSummary)
+    
+    @staticmethod
+    def find_jobs_query(filters=None, limit=20, offset=0, cursor=None):
+        """Build the query and parameters of find_jobs.
+        
+        Args:
+            filters: Dictionary containing filter criteria
+            limit: Maximum number of results to return
+            offset: Offset for pagination
+            cursor: Cursor of the page to return, from the previous page
+            
+        Returns:
+            tuple: Cypher query and its parameters
+            
+        Raises:
+            ValueError: If the cursor is invalid
         """
         # Prepare WHERE clauses based on filters
         where_clauses = []
@@ -449,6 +727,13 @@ class JobRepository(BaseRepository):
                 where_clauses.append("j.domain = $domain")
                 params['domain'] = filters['domain']
         
+        # Seek past the last job of the previous page instead of skipping
+        if cursor:
+            params.update(cursor_parameters(cursor))
+            where_clauses.append(keyset_condition("j.created_at", "j.job_id", descending=True,
+                                                  null_key=params['after_key'] is None))
+            params['offset'] = 0
+        
         # Add WHERE clause if there are filters
         if where_clauses:
             query += " WHERE " + " AND ".join(where_clauses)
@@ -463,12 +748,12 @@ class JobRepository(BaseRepository):
                    j.owner_email as owner_email,
                    j.created_at as created_at,
                    j.updated_at as updated_at
-            ORDER BY j.created_at DESC
+            ORDER BY j.created_at DESC, j.job_id DESC
             SKIP $offset
             LIMIT $limit
         """
         
-        return self.execute_read_query(query, params)
+        return query, params
     
     def get_job_filter_options(self):
         """Get options for job filters.
@@ -484,7 +769,7 @@ class JobRepository(BaseRepository):
             RETURN companies, locations, domains
         """
         
-        result = self.execute_read_query(query)
+        result = self.execute_read_query(query, cache_name="job.filter_options", cache_tags=["Job"])
         if not result:
             return {"companies": [], "locations": [], "domains": []}
         
@@ -528,7 +813,7 @@ class JobRepository(BaseRepository):
             RETURN j.job_id as job_id
         """
         
-        self.execute_write_query(query, params)
+        self.execute_write_query(query, params, invalidates=[f"Job:{job_id}"])
         return job_id
     
     def delete_job(self, job_id):
@@ -549,7 +834,7 @@ class JobRepository(BaseRepository):
             DETACH DELETE j
         """
         
-        self.execute_write_query(query, {"job_id": job_id})
+        self.execute_write_query(query, {"job_id": job_id}, invalidates=[f"Job:{job_id}"])
         return True
     
     def remove_job_skills(self, job_id):
@@ -566,7 +851,7 @@ class JobRepository(BaseRepository):
             DELETE r
         """
         
-        self.execute_write_query(query, {"job_id": job_id})
+        self.execute_write_query(query, {"job_id": job_id}, invalidates=[f"Job:{job_id}"])
         return True
     
     def create_job_owner_relationship(self, job_id, owner_email):
@@ -588,7 +873,7 @@ class JobRepository(BaseRepository):
         self.execute_write_query(query, {
             "job_id": job_id,
             "owner_email": owner_email
-        })
+        }, invalidates=[f"Job:{job_id}"])
         return True
         
     def check_job_owner_relationship(self, job_id, owner_email):
@@ -3,9 +3,24 @@ Skill Repository for Knowledge Graph
 This module provides skill-related database operations.
 """
 
+from src.backend.models.record_model import SkillRow
 from src.backend.repositories.base.repository import BaseRepository
+from src.backend.utils.pagination import keyset_condition, cursor_parameters
+from src.backend.utils.skill_resolver import invalidate_skill_resolver
+from src.config import ETL_BATCH_SIZE
 import uuid
 
+# Columns of the rows returned by find_skills that its cursors encode
+SKILL_PAGE_KEY = ("name", "skill_id")
+
+# A skill by ID, as read by get_skill
+GET_SKILL_QUERY = """
+    MATCH (s:Skill {skill_id: $skill_id})
+    RETURN s.skill_id as skill_id, s.name as name, s.category as category, 
+           s.domain as domain, s.description as description
+"""
+
+
 class SkillRepository(BaseRepository):
     """Repository for skill-related operations in the knowledge graph."""
     
@@ -39,7 +54,8 @@ class SkillRepository(BaseRepository):
             "description": skill_data.get("description", "")
         }
         
-        self.execute_write_query(query, parameters)
+        self.execute_write_query(query, parameters, invalidates=[f"Skill:{skill_data['skill_id']}"])
+        invalidate_skill_resolver()
         return skill_data["skill_id"]
     
     def add_skill_relationship(self, source_id, target_id, rel_type, weight=1.0):
@@ -72,9 +88,169 @@ class SkillRepository(BaseRepository):
         }
         parameters.update(properties)
         
-        self.execute_write_query(query, parameters)
+        self.execute_write_query(query, parameters, invalidates=[f"Skill:{source_id}", f"Skill:{target_id}"])
         return True
     
+    def add_skills_bulk(self, skills, batch_size=ETL_BATCH_SIZE):
+        """Add or update many skill nodes with batched UNWIND writes.
+        
+        Args:
+            skills: Iterable of skill dictionaries with a skill_id
+            batch_size: Number of skills per transaction
+            
+        Returns:
+            Number of skills written
+        """
+        query = """
+            UNWIND $rows AS row
+            MERGE (s:Skill {skill_id: row.skill_id})
+            SET s.name = row.name,
+                s.category = row.category,
+                s.domain = row.domain,
+                s.description = row.description,
+                s.content_hash = row.content_hash
+        """
+        rows = ({
+            "skill_id": skill["skill_id"],
+            "name": skill["name"],
+            "category": skill.get("category", ""),
+            "domain": skill.get("domain", ""),
+            "description": skill.get("description", ""),
+            "content_hash": skill.get("content_hash")
+        } for skill in skills)
+        written = self.execute_batched_write(query, rows, batch_size)
+        invalidate_skill_resolver()
+        return written
+    
+    def add_skill_relationships_bulk(self, relationships, batch_size=ETL_BATCH_SIZE, on_existing='replace'):
+        """Add many skill-to-skill relationships with batched UNWIND writes.
+        
+        Relationships are merged on (source, target, type) and carry the
+        number of occurrences and the mean and maximum weight. Rows are usually
+        aggregated beforehand (see src.etl.aggregation); raw rows count as one
+        occurrence. Relationship types cannot be parameterized in Cypher, so
+        one query is run per type.
+        
+        Args:
+            relationships: List of dictionaries with source, target, type, optional weight
+                and, for aggregated rows, weight_max and count
+            batch_size: Number of relationships per transaction
+            on_existing: What happens to the statistics of existing relationships:
+                'replace' (full loads, so reloading is idempotent), 'keep' (delta
+                loads) or 'accumulate' (combine with partial results written before)
+            
+        Returns:
+            Number of relationships written
+        """
+        by_type = {}
+        for rel in relationships:
+            weight = rel.get("weight", 1.0)
+            by_type.setdefault(rel["type"], []).append({
+                "source": rel["source"],
+                "target": rel["target"],
+                "weight": weight,
+                "weight_max": rel.get("weight_max", weight),
+                "count": rel.get("count", 1)
+            })
+        
+        written = 0
+        for rel_type, rows in by_type.items():
+            query = f"""
+                UNWIND $rows AS row
+                MATCH (s1:Skill {{skill_id: row.source}})
+                MATCH (s2:Skill {{skill_id: row.target}})
+                {self._merge_skill_relationship(rel_type, "row.weight", "row.weight_max", "row.count", on_existing)}
+            """
+            written += self.execute_batched_write(query, rows, batch_size)
+        return written
+    
+    def add_skill_relationships_columns(self, columns, rel_type, batch_size=ETL_BATCH_SIZE, on_existing='replace'):
+        """Add many skill-to-skill relationships of one type from columns.
+        
+        Args:
+            columns: Dictionary with equally long source, target, weight, weight_max and count sequences
+            rel_type: Relationship type
+            batch_size: Number of relationships per transaction
+            on_existing: 'replace', 'keep' or 'accumulate', see add_skill_relationships_bulk
+            
+        Returns:
+            Number of relationships written
+        """
+        query = f"""
+            UNWIND range(0, size($source) - 1) AS i
+            MATCH (s1:Skill {{skill_id: $source[i]}})
+            MATCH (s2:Skill {{skill_id: $target[i]}})
+            {self._merge_skill_relationship(rel_type, "$weight[i]", "$weight_max[i]", "$count[i]", on_existing)}
+        """
+        return self.execute_columnar_write(query, columns, batch_size)
+    
+    @staticmethod
+    def _merge_skill_relationship(rel_type, weight, weight_max, count, on_existing):
+        """Build the Cypher that merges a skill relationship and updates its statistics.
+        
+        Args:
+            rel_type: Relationship type
+            weight, weight_max, count: Cypher expressions of the new mean weight,
+                maximum weight and number of occurrences
+            on_existing: 'replace', 'keep' or 'accumulate'
+            
+        Returns:
+            str: Cypher clauses following the MATCH of s1 and s2
+            
+        Raises:
+            ValueError: If on_existing is not one of the modes
+        """
+        if on_existing == 'replace':
+            return f"""MERGE (s1)-[r:`{rel_type}`]->(s2)
+                SET r.weight = {weight}, r.weight_max = {weight_max}, r.count = {count}"""
+        if on_existing == 'keep':
+            return f"""MERGE (s1)-[r:`{rel_type}`]->(s2)
+                ON CREATE SET r.weight = {weight}, r.weight_max = {weight_max}, r.count = {count}"""
+        if on_existing != 'accumulate':
+            raise ValueError(f"Unknown on_existing mode: {on_existing}")
+        # Read the stored statistics first; the mean is weighted by the occurrence counts
+        return f"""MERGE (s1)-[r:`{rel_type}`]->(s2)
+                WITH r, {weight} AS weight, {weight_max} AS weight_max, {count} AS count,
+                     coalesce(r.count, 0) AS seen, coalesce(r.weight, 0.0) AS mean,
+                     coalesce(r.weight_max, r.weight, {weight_max}) AS peak
+                SET r.count = seen + count,
+                    r.weight = (mean * seen + weight * count) / (seen + count),
+                    r.weight_max = CASE WHEN peak > weight_max THEN peak ELSE weight_max END"""
+    
+    def get_content_hashes(self):
+        """Get the content hashes of skills loaded by the ETL pipeline.
+        
+        Skills created through the API have no content hash and are not returned.
+        
+        Returns:
+            Dictionary of skill_id to content hash
+        """
+        query = """
+            MATCH (s:Skill)
+            WHERE s.content_hash IS NOT NULL
+            RETURN s.skill_id AS skill_id, s.content_hash AS content_hash
+        """
+        return {row["skill_id"]: row["content_hash"] for row in self.stream_read_query(query)}
+    
+    def delete_skills_bulk(self, skill_ids, batch_size=ETL_BATCH_SIZE):
+        """Delete many skills with their relationships.
+        
+        Args:
+            skill_ids: IDs of the skills to delete
+            batch_size: Number of skills per transaction
+            
+        Returns:
+            Number of skills deleted
+        """
+        query = """
+            UNWIND $rows AS row
+            MATCH (s:Skill {skill_id: row.skill_id})
+            DETACH DELETE s
+        """
+        written = self.execute_batched_write(query, ({"skill_id": skill_id} for skill_id in skill_ids), batch_size)
+        invalidate_skill_resolver()
+        return written
+    
     def get_skill(self, skill_id):
         """Get a skill by ID.
         
@@ -84,13 +260,8 @@ class SkillRepository(BaseRepository):
         Returns:
             Skill data as dictionary or None if not found
         """
-        query = """
-            MATCH (s:Skill {skill_id: $skill_id})
-            RETURN s.skill_id as skill_id, s.name as name, s.category as category, 
-                   s.domain as domain, s.description as description
-        """
-        
-        results = self.execute_read_query(query, {"skill_id": skill_id})
+        results = self.execute_read_query(GET_SKILL_QUERY, {"skill_id": skill_id},
+                                          cache_name="skill.get", cache_tags=[f"Skill:{skill_id}"])
         if not results:
             return None
             
@@ -128,18 +299,45 @@ class SkillRepository(BaseRepository):
             ORDER BY s.name
         """
         
-        return self.execute_read_query(query)
+        return self.execute_read_query(query, cache_name="skill.all", cache_tags=["Skill"])
     
-    def find_skills(self, filters=None, limit=50, offset=0):
-        """Find skills matching specified filters.
+    def find_skills(self, filters=None, limit=50, offset=0, cursor=None):
+        """Find skills matching specified filters, by name.
+        
+        Pages are addressed by cursor (keyset pagination on name and
+        skill_id, see SKILL_PAGE_KEY), so a deep page costs the same as the
+        first. The offset is only applied without a cursor.
         
         Args:
             filters: Dictionary containing filter criteria
             limit: Maximum number of results to return
             offset: Offset for pagination
+            cursor: Cursor of the page to return, from the previous page
             
         Returns:
             List of skills matching the filters
+            
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        query, params = self.find_skills_query(filters, limit, offset, cursor)
+        return self.execute_read_query(query, params, row_type=SkillRow)
+    
+    @staticmethod
+    def find_skills_query(filters=None, limit=50, offset=0, cursor=None):
+        """Build the query and parameters of find_skills.
+        
+        Args:
+            filters: Dictionary containing filter criteria
+            limit: Maximum number of results to return
+            offset: Offset for pagination
+            cursor: Cursor of the page to return, from the previous page
+            
+        Returns:
+            tuple: Cypher query and its parameters
+            
+        Raises:
+            ValueError: If the cursor is invalid
         """
         # Prepare WHERE clauses based on filters
         where_clauses = []
@@ -164,6 +362,12 @@ class SkillRepository(BaseRepository):
                 where_clauses.append("s.domain = $domain")
                 params['domain'] = filters['domain']
         
+        # Seek past the last skill of the previous page instead of skipping
+        if cursor:
+            params.update(cursor_parameters(cursor))
+            where_clauses.append(keyset_condition("s.name", "s.skill_id", null_key=params['after_key'] is None))
+            params['offset'] = 0
+        
         # Build query
         query = """
             MATCH (s:Skill)
@@ -177,12 +381,12 @@ class SkillRepository(BaseRepository):
         query += """
             RETURN s.skill_id as skill_id, s.name as name, s.category as category, 
                    s.domain as domain, s.description as description
-            ORDER BY s.name
+            ORDER BY s.name, s.skill_id
             SKIP $offset
             LIMIT $limit
         """
         
-        return self.execute_read_query(query, params)
+        return query, params
     
     def get_related_skills(self, skill_id, relationship_type=None):
         """Get skills related to a given skill.
@@ -199,14 +403,16 @@ class SkillRepository(BaseRepository):
                 MATCH (s1:Skill {{skill_id: $skill_id}})-[r:`{relationship_type}`]-(s2:Skill)
                 RETURN s2.skill_id as skill_id, s2.name as name, 
                        s2.category as category, type(r) as relationship_type,
-                       r.weight as weight
+                       r.weight as weight, coalesce(r.count, 1) as count
+                ORDER BY count DESC
             """
         else:
             query = """
                 MATCH (s1:Skill {skill_id: $skill_id})-[r]-(s2:Skill)
                 RETURN s2.skill_id as skill_id, s2.name as name, 
                        s2.category as category, type(r) as relationship_type,
-                       r.weight as weight
+                       r.weight as weight, coalesce(r.count, 1) as count
+                ORDER BY count DESC
             """
         
         return self.execute_read_query(query, {"skill_id": skill_id})
@@ -442,7 +648,8 @@ class SkillRepository(BaseRepository):
             LIMIT $limit
         """
         
-        nodes = self.execute_read_query(query_nodes, {"limit": limit})
+        nodes = self.execute_read_query(query_nodes, {"limit": limit},
+                                        cache_name="skill.network_nodes", cache_tags=["Skill"])
         
         # Handle empty results
         if not nodes:
@@ -465,7 +672,8 @@ class SkillRepository(BaseRepository):
             LIMIT 1000
         """
         
-        edges_results = self.execute_read_query(query_edges, {"skill_ids": skill_ids})
+        edges_results = self.execute_read_query(query_edges, {"skill_ids": skill_ids},
+                                                cache_name="skill.network_edges", cache_tags=["Skill"])
         
         # Process edges
         edges = []
@@ -29,6 +29,8 @@ def init_all_routes(app: Flask, auth_service: AuthService, graph_service: GraphS
     from src.backend.routes.candidate_routes import init_routes as init_candidate_routes
     from src.backend.routes.skill_routes import init_routes as init_skill_routes
     from src.backend.routes.analytics_routes import init_routes as init_analytics_routes
+    from src.backend.routes.admin_routes import init_routes as init_admin_routes
+    from src.backend.routes.health_routes import init_routes as init_health_routes
     
     # Initialize services
     job_service = JobService.get_instance(graph_service)
@@ -46,5 +48,7 @@ def init_all_routes(app: Flask, auth_service: AuthService, graph_service: GraphS
     init_candidate_routes(app, candidate_service)
     init_skill_routes(app, skill_service)
     init_analytics_routes(app, analytics_service)
+    init_admin_routes(app, graph_service)
+    init_health_routes(app, graph_service)
     
     
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Admin Routes
+
+This module defines API routes for operating the application.
+"""
+
+from flask import Blueprint, jsonify
+from flask_jwt_extended import jwt_required, current_user
+
+from src.backend.repositories.base.driver import pool_status
+from src.backend.utils import write_counters
+from src.backend.utils.query_cache import query_cache
+from src.backend.utils.query_metrics import query_metrics
+
+# Create blueprint
+admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
+
+# Service instances
+graph_service = None
+
+
+def init_routes(app, graph_svc=None):
+    """Initialize routes.
+
+    Args:
+        app: Flask application
+        graph_svc: GraphService instance whose connection pool is reported
+    """
+    global graph_service
+    graph_service = graph_svc
+
+    # Register blueprint
+    app.register_blueprint(admin_bp)
+
+
+@admin_bp.route('/metrics', methods=['GET'])
+@jwt_required()
+def get_metrics():
+    """Get query latency metrics, the slow-query log, cache and connection pool statistics (admin only)."""
+    # Check if user is admin
+    if not current_user.is_admin:
+        return jsonify({"error": "Unauthorized access"}), 403
+
+    metrics = query_metrics.snapshot()
+
+    return jsonify({
+        "queries": metrics['queries'],
+        "slow_queries": metrics['slow_queries'],
+        "slow_query_ms": metrics['slow_query_ms'],
+        "query_cache": {
+            "enabled": query_cache.enabled,
+            "stats": query_cache.stats()
+        },
+        "write_counters": write_counters.snapshot(),
+        "connection_pool": pool_status(graph_service.driver) if graph_service else None
+    })
@@ -48,6 +48,7 @@ def get_all_candidates():
     skill = request.args.get('skill')
     limit = request.args.get('limit', 20, type=int)
     offset = request.args.get('offset', 0, type=int)
+    cursor = request.args.get('cursor')
     
     # Build filters
     filters = {}
@@ -61,7 +62,7 @@ def get_all_candidates():
     print(f"Fetching candidates with filters: {filters}")
     
     # Get candidates
-    result = candidate_service.find_candidates(filters, limit, offset)
+    result = candidate_service.find_candidates(filters, limit, offset, cursor)
     
     if not result['success']:
         print(f"Error finding candidates: {result['error']}")
@@ -159,6 +160,9 @@ def get_candidate_matches_enhanced(resume_id):
     
     # Get parameters
     limit = request.args.get('limit', 10, type=int)
+    retrieval = request.args.get('retrieval', 'graph')
+    if retrieval not in ('graph', 'hybrid'):
+        return jsonify({"error": "retrieval must be 'graph' or 'hybrid'"}), 400
     
     # Get weights
     weights = {
@@ -176,7 +180,7 @@ def get_candidate_matches_enhanced(resume_id):
             weights[key] = weights[key] / total_weight
     
     # Get matching jobs
-    result = candidate_service.get_matching_jobs(resume_id, limit, weights)
+    result = candidate_service.get_matching_jobs(resume_id, limit, weights, retrieval=retrieval)
     
     if not result['success']:
         print(f"Error finding jobs for candidate {resume_id}: {result.get('error')}")
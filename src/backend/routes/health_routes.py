@@ -0,0 +1,61 @@
+"""
+Health Routes
+
+This module defines the API route reporting whether the application can reach
+its database and how busy the database connection pool is.
+"""
+
+from flask import Blueprint, jsonify
+
+from src.backend.repositories.base.driver import pool_status
+from src.backend.utils.query_metrics import timed_run
+
+# Create blueprint
+health_bp = Blueprint('health', __name__, url_prefix='/api/health')
+
+# Service instances
+graph_service = None
+
+
+def init_routes(app, graph_svc):
+    """Initialize routes with required services.
+
+    Args:
+        app: Flask application
+        graph_svc: GraphService instance
+    """
+    global graph_service
+    graph_service = graph_svc
+
+    # Register blueprint
+    app.register_blueprint(health_bp)
+
+
+@health_bp.route('', methods=['GET'])
+def get_health():
+    """Get the database status and the connection pool utilization and wait times."""
+    try:
+        with graph_service.driver.session() as session:
+            timed_run(session, "health.database", "RETURN 1").consume()
+        database = {"status": "up"}
+    except Exception as e:
+        database = {"status": "down", "error": str(e)}
+
+    pool = pool_status(graph_service.driver)
+    acquisition = pool['acquisition']
+    healthy = database["status"] == "up"
+
+    return jsonify({
+        "status": "ok" if healthy else "unavailable",
+        "database": database,
+        "connection_pool": {
+            "max_size": pool['max_size'],
+            "in_use": pool['in_use'],
+            "idle": pool['idle'],
+            "utilization": pool['utilization'],
+            "acquisition": {
+                key: acquisition[key] for key in ('count', 'errors', 'mean_ms', 'p95_ms', 'max_ms')
+                if key in acquisition
+            }
+        }
+    }), 200 if healthy else 503
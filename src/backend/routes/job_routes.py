@@ -40,6 +40,7 @@ def get_all_jobs():
     owner_email = request.args.get('owner_email')
     limit = request.args.get('limit', 20, type=int)
     offset = request.args.get('offset', 0, type=int)
+    cursor = request.args.get('cursor')
     
     # Build filters
     filters = {}
@@ -53,7 +54,7 @@ def get_all_jobs():
         filters['owner_email'] = owner_email
     
     # Get jobs
-    result = job_service.find_jobs(filters, limit, offset)
+    result = job_service.find_jobs(filters, limit, offset, cursor)
     
     if not result['success']:
         return jsonify({"error": result['error']}), 400
@@ -218,6 +219,9 @@ def get_job_candidates_enhanced(job_id):
     
     # Get parameters
     limit = request.args.get('limit', 10, type=int)
+    retrieval = request.args.get('retrieval', 'graph')
+    if retrieval not in ('graph', 'hybrid'):
+        return jsonify({"error": "retrieval must be 'graph' or 'hybrid'"}), 400
     
     # Get weights
     weights = {
@@ -233,7 +237,7 @@ def get_job_candidates_enhanced(job_id):
             weights[key] = weights[key] / total_weight
     
     # Get matching candidates with enhanced algorithm
-    result = job_service.get_matching_candidates(job_id, limit, weights)
+    result = job_service.get_matching_candidates(job_id, limit, weights, retrieval=retrieval)
     
     if not result['success']:
         return jsonify({"error": result['error']}), 400
@@ -40,6 +40,7 @@ def get_all_skills():
     category = request.args.get('category')
     limit = request.args.get('limit', 50, type=int)
     offset = request.args.get('offset', 0, type=int)
+    cursor = request.args.get('cursor')
     
     # Build filters
     filters = {}
@@ -49,7 +50,7 @@ def get_all_skills():
         filters['category'] = category
     
     # Get skills
-    result = skill_service.find_skills(filters, limit, offset)
+    result = skill_service.find_skills(filters, limit, offset, cursor)
     
     if not result['success']:
         return jsonify({"error": result['error']}), 400
@@ -8,6 +8,8 @@ import datetime
 from src.backend.repositories.job_repository import JobRepository
 from src.backend.repositories.candidate_repository import CandidateRepository
 from src.backend.repositories.skill_repository import SkillRepository
+from src.backend.repositories.base.bookmarks import read_session
+from src.backend.utils.query_metrics import timed_run
 
 
 class AnalyticsService:
@@ -194,10 +196,10 @@ class AnalyticsService:
         """
         try:
             # Query career path from database
-            with self.driver.session() as session:
+            with read_session(self.driver) as session:
                 if target_title:
                     # Path between two specific titles
-                    result = session.run("""
+                    result = timed_run(session, "AnalyticsService.get_career_path.to_target", """
                         MATCH path = (start:JobTitle {title: $current_title})-[:LEADS_TO*1..5]->(end:JobTitle {title: $target_title})
                         RETURN path, 
                                [node in nodes(path) | node.title] as titles,
@@ -212,7 +214,7 @@ class AnalyticsService:
                     })
                 else:
                     # All possible paths from current title
-                    result = session.run("""
+                    result = timed_run(session, "AnalyticsService.get_career_path.next_roles", """
                         MATCH path = (start:JobTitle {title: $current_title})-[:LEADS_TO*1..3]->(end:JobTitle)
                         WHERE start <> end
                         RETURN path, 
@@ -284,9 +286,9 @@ class AnalyticsService:
             end_date_str = end_date.isoformat()
             
             # Query database for statistics
-            with self.driver.session() as session:
+            with read_session(self.driver) as session:
                 # Job statistics
-                job_result = session.run("""
+                job_result = timed_run(session, "AnalyticsService.get_dashboard_stats.jobs", """
                     MATCH (j:Job)
                     WHERE j.created_at >= $start_date AND j.created_at <= $end_date
                     RETURN count(j) as job_count,
@@ -301,7 +303,7 @@ class AnalyticsService:
                 company_count = job_record["company_count"] if job_record else 0
                 
                 # Candidate statistics
-                candidate_result = session.run("""
+                candidate_result = timed_run(session, "AnalyticsService.get_dashboard_stats.candidates", """
                     MATCH (c:Candidate)
                     WHERE c.created_at >= $start_date AND c.created_at <= $end_date
                     RETURN count(c) as candidate_count
@@ -314,7 +316,7 @@ class AnalyticsService:
                 candidate_count = candidate_record["candidate_count"] if candidate_record else 0
                 
                 # Skill distribution
-                skill_result = session.run("""
+                skill_result = timed_run(session, "AnalyticsService.get_dashboard_stats.skills", """
                     MATCH (s:Skill)<-[r]-(n)
                     WHERE n:Job OR n:Candidate
                     RETURN s.name as skill_name, count(r) as usage_count
@@ -328,7 +330,7 @@ class AnalyticsService:
                 ]
                 
                 # Recent matches
-                match_result = session.run("""
+                match_result = timed_run(session, "AnalyticsService.get_dashboard_stats.matches", """
                     MATCH (j:Job)-[m:MATCHES]-(c:Candidate)
                     RETURN j.job_id as job_id, j.title as job_title,
                            c.resume_id as resume_id, c.name as candidate_name,
@@ -7,6 +7,18 @@ This module provides authentication and user management functionality.
 from werkzeug.security import generate_password_hash, check_password_hash
 from src.backend.models.user_model import User
 from src.backend.services.graph_service import GraphService
+from src.backend.utils.query_metrics import timed_run
+
+# A user by email, as read by find_user_by_email
+FIND_USER_QUERY = """
+    MATCH (u:User {email: $email})
+    RETURN u.email as email, 
+           u.password_hash as password_hash, 
+           u.name as name, 
+           u.role as role, 
+           u.profile_id as profile_id,
+           u.created_at as created_at
+"""
 
 class AuthService:
     """Service for authentication and user management."""
@@ -51,7 +63,7 @@ class AuthService:
             
             # Create user in database
             with self.driver.session() as session:
-                session.run("""
+                timed_run(session, "AuthService.register_user", """
                     CREATE (u:User {
                         email: $email,
                         password_hash: $password_hash,
@@ -66,7 +78,7 @@ class AuthService:
                     "name": user.name,
                     "role": user.role,
                     "profile_id": user.profile_id
-                })
+                }).consume()
                 
             return {'success': True, 'user': user}
         except ValueError as e:
@@ -115,15 +127,7 @@ class AuthService:
         """
         try:
             with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (u:User {email: $email})
-                    RETURN u.email as email, 
-                           u.password_hash as password_hash, 
-                           u.name as name, 
-                           u.role as role, 
-                           u.profile_id as profile_id,
-                           u.created_at as created_at
-                """, {"email": email})
+                result = timed_run(session, "AuthService.find_user_by_email", FIND_USER_QUERY, {"email": email})
                 
                 record = result.single()
                 if record:
@@ -182,10 +186,10 @@ class AuthService:
                 return {'success': False, 'error': 'No valid fields to update'}
                 
             with self.driver.session() as session:
-                session.run(f"""
+                timed_run(session, "AuthService.update_user", f"""
                     MATCH (u:User {{email: $email}})
                     SET {', '.join(update_fields)}
-                """, params)
+                """, params).consume()
                 
             # Get updated user
             updated_user = self.find_user_by_email(email)
@@ -209,7 +213,7 @@ class AuthService:
                 return {'success': False, 'error': 'User not found'}
             
             with self.driver.session() as session:
-                result = session.run("""
+                result = timed_run(session, "AuthService.delete_user", """
                     MATCH (u:User {email: $email})
                     DELETE u
                 """, {"email": email})
@@ -237,10 +241,10 @@ class AuthService:
                 return {'success': False, 'error': 'User not found'}
             
             with self.driver.session() as session:
-                session.run("""
+                timed_run(session, "AuthService.make_admin", """
                     MATCH (u:User {email: $email})
                     SET u.role = 'admin'
-                """, {"email": email})
+                """, {"email": email}).consume()
             
             # Get updated user
             updated_user = self.find_user_by_email(email)
@@ -277,13 +281,13 @@ class AuthService:
             
             # Update password in database
             with self.driver.session() as session:
-                session.run("""
+                timed_run(session, "AuthService.change_password", """
                     MATCH (u:User {email: $email})
                     SET u.password_hash = $password_hash
                 """, {
                     "email": email,
                     "password_hash": new_password_hash
-                })
+                }).consume()
                 
             return {'success': True, 'message': 'Password changed successfully'}
         except Exception as e:
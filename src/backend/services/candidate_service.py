@@ -7,9 +7,11 @@ This module provides business logic for candidate-related operations in the tale
 import uuid
 import datetime
 import json
-from src.backend.repositories.candidate_repository import CandidateRepository
+from src.backend.repositories.candidate_repository import CandidateRepository, CANDIDATE_PAGE_KEY
 from src.backend.models.candidate_model import Candidate, Experience, Education, CandidateSkill
 from src.backend.services.matching_service import MatchingService
+from src.backend.services.embedding_worker import EmbeddingWorker
+from src.backend.utils.pagination import next_cursor
 
 
 class CandidateService:
@@ -33,6 +35,7 @@ class CandidateService:
         self.graph_service = graph_service
         self.candidate_repository = CandidateRepository(graph_service.driver)
         self.matching_service = MatchingService.get_instance(graph_service)
+        self.embedding_worker = EmbeddingWorker.get_instance(graph_service)
     
     def create_candidate(self, candidate_data):
         """Create a new candidate profile.
@@ -56,22 +59,24 @@ class CandidateService:
             # Prepare candidate data
             prepared_candidate = self._prepare_candidate_data(candidate_data)
             
-            # Add candidate to database
-            resume_id = self.candidate_repository.add_candidate(prepared_candidate)
-            
-            # Add candidate skills if present
-            if 'skills' in candidate_data:
-                self._add_candidate_skills(resume_id, candidate_data['skills'])
-            
-            # Add experiences if present
-            if 'experience' in candidate_data and isinstance(candidate_data['experience'], list):
-                for i, exp in enumerate(candidate_data['experience']):
-                    self._add_candidate_experience(resume_id, exp, i)
+            # Write the candidate with its skills, experiences and education in one transaction
+            with self.candidate_repository.transaction():
+                resume_id = self.candidate_repository.add_candidate(prepared_candidate)
+                
+                # Add candidate skills if present
+                if 'skills' in candidate_data:
+                    self._add_candidate_skills(resume_id, candidate_data['skills'])
+                
+                # Add experiences if present
+                if 'experience' in candidate_data and isinstance(candidate_data['experience'], list):
+                    self._add_candidate_experiences(resume_id, candidate_data['experience'])
+                
+                # Add education if present
+                if 'education' in candidate_data and isinstance(candidate_data['education'], list):
+                    self._add_candidate_education(resume_id, candidate_data['education'])
             
-            # Add education if present
-            if 'education' in candidate_data and isinstance(candidate_data['education'], list):
-                for i, edu in enumerate(candidate_data['education']):
-                    self._add_candidate_education(resume_id, edu, i)
+            # Embed the new profile for semantic matching in the background
+            self.embedding_worker.enqueue_candidate(resume_id)
             
             return {'success': True, 'resume_id': resume_id}
         
@@ -88,20 +93,13 @@ class CandidateService:
             dict: Dictionary with 'success' (bool) and 'candidate' or 'error' keys
         """
         try:
-            # Get candidate from repository
-            candidate_data = self.candidate_repository.get_candidate(resume_id)
+            # Get candidate with skills, experiences and education from repository in one query
+            profile = self.candidate_repository.get_candidate_profile(resume_id)
             
-            if not candidate_data:
+            if not profile:
                 return {'success': False, 'error': f"Candidate with ID {resume_id} not found"}
             
-            # Get candidate skills
-            skills = self.candidate_repository.get_candidate_skills(resume_id)
-            
-            # Get candidate experiences
-            experiences = self.candidate_repository.get_candidate_experiences(resume_id)
-            
-            # Get candidate education
-            education = self.candidate_repository.get_candidate_education(resume_id)
+            candidate_data, skills, experiences, education = profile
             
             # Process education string into list if needed
             education_list = []
@@ -204,20 +202,24 @@ class CandidateService:
             # Prepare candidate data for update
             prepared_candidate = self._prepare_candidate_data(candidate_data, is_update=True)
             
-            # Update candidate in database
-            self.candidate_repository.add_candidate(prepared_candidate)  # Reuse add method for update
-            
-            # Update skills if present
-            if 'skills' in candidate_data:
-                self._update_candidate_skills(resume_id, candidate_data['skills'])
-            
-            # Update experiences if present
-            if 'experience' in candidate_data and isinstance(candidate_data['experience'], list):
-                self._update_candidate_experiences(resume_id, candidate_data['experience'])
+            # Update the candidate and its related data in one transaction
+            with self.candidate_repository.transaction():
+                self.candidate_repository.add_candidate(prepared_candidate)  # Reuse add method for update
+                
+                # Update skills if present
+                if 'skills' in candidate_data:
+                    self._update_candidate_skills(resume_id, candidate_data['skills'])
+                
+                # Update experiences if present
+                if 'experience' in candidate_data and isinstance(candidate_data['experience'], list):
+                    self._update_candidate_experiences(resume_id, candidate_data['experience'])
+                
+                # Update education if present
+                if 'education' in candidate_data and isinstance(candidate_data['education'], list):
+                    self._update_candidate_education(resume_id, candidate_data['education'])
             
-            # Update education if present
-            if 'education' in candidate_data and isinstance(candidate_data['education'], list):
-                self._update_candidate_education(resume_id, candidate_data['education'])
+            # Re-embed the profile in the background
+            self.embedding_worker.enqueue_candidate(resume_id)
             
             return {'success': True, 'resume_id': resume_id}
         
@@ -248,20 +250,21 @@ class CandidateService:
         except Exception as e:
             return {'success': False, 'error': f"Error deleting candidate: {str(e)}"}
     
-    def find_candidates(self, filters=None, limit=20, offset=0):
+    def find_candidates(self, filters=None, limit=20, offset=0, cursor=None):
         """Find candidates matching specified filters.
         
         Args:
             filters: Dictionary containing filter criteria
             limit: Maximum number of results to return
-            offset: Offset for pagination
+            offset: Offset for pagination, used without a cursor
+            cursor: next_cursor of the previous page
             
         Returns:
-            dict: Dictionary with 'success' (bool) and 'candidates' or 'error' keys
+            dict: Dictionary with 'success' (bool) and 'candidates', 'next_cursor' or 'error' keys
         """
         try:
             # Use repository's find_candidates method
-            candidates = self.candidate_repository.find_candidates(filters, limit, offset)
+            candidates = self.candidate_repository.find_candidates(filters, limit, offset, cursor)
             
             # Get filter options for the frontend
             filter_options = self.candidate_repository.get_candidate_filter_options()
@@ -272,25 +275,27 @@ class CandidateService:
                 'filters': filter_options,
                 'total': len(candidates),
                 'limit': limit,
-                'offset': offset
+                'offset': offset,
+                'next_cursor': next_cursor(candidates, limit, CANDIDATE_PAGE_KEY)
             }
         
         except Exception as e:
             return {'success': False, 'error': f"Error finding candidates: {str(e)}"}
     
-    def get_matching_jobs(self, resume_id, limit=10, weights=None):
+    def get_matching_jobs(self, resume_id, limit=10, weights=None, retrieval='graph'):
         """Find jobs matching a candidate.
         
         Args:
             resume_id: ID of the candidate to match against
             limit: Maximum number of results to return
             weights: Dictionary containing matching weights
+            retrieval: Retrieval mode, 'graph' or 'hybrid'
             
         Returns:
             dict: Dictionary with 'success' (bool) and 'jobs' or 'error' keys
         """
         # Delegate to the matching service
-        return self.matching_service.get_matching_jobs_for_candidate(resume_id, limit, 0.0, weights)
+        return self.matching_service.get_matching_jobs_for_candidate(resume_id, limit, 0.0, weights, retrieval=retrieval)
     
     def _validate_candidate_data(self, candidate_data, is_update=False):
         """Validate candidate data.
@@ -359,33 +364,25 @@ class CandidateService:
         return prepared_candidate
     
     def _add_candidate_skills(self, resume_id, skills_data):
-        """Add skills to a candidate.
+        """Add skills to a candidate with one write per skill group.
         
         Args:
             resume_id: ID of the candidate
             skills_data: Dictionary containing core and secondary skills
         """
-        # Add core skills
-        if 'core' in skills_data:
-            for skill in skills_data['core']:
-                self.candidate_repository.add_candidate_skill(
-                    resume_id,
-                    skill['skill_id'],
-                    skill.get('proficiency', 'Intermediate'),
-                    skill.get('experience_years', 0),
-                    is_core=True
-                )
-        
-        # Add secondary skills
-        if 'secondary' in skills_data:
-            for skill in skills_data['secondary']:
-                self.candidate_repository.add_candidate_skill(
-                    resume_id,
-                    skill['skill_id'],
-                    skill.get('proficiency', 'Beginner'),
-                    skill.get('experience_years', 0),
-                    is_core=False
-                )
+        rows = []
+        for group, is_core, default_proficiency in (('core', True, 'Intermediate'), ('secondary', False, 'Beginner')):
+            for skill in skills_data.get(group, []):
+                rows.append({
+                    'resume_id': resume_id,
+                    'skill_id': skill['skill_id'],
+                    'proficiency': skill.get('proficiency', default_proficiency),
+                    'experience_years': skill.get('experience_years', 0),
+                    'is_core': is_core
+                })
+        
+        if rows:
+            self.candidate_repository.add_candidate_skills_bulk(rows)
     
     def _update_candidate_skills(self, resume_id, skills_data):
         """Update skills for a candidate.
@@ -410,26 +407,28 @@ class CandidateService:
         # For now, we'll just add a placeholder implementation that does nothing
         pass
     
-    def _add_candidate_experience(self, resume_id, experience_data, index=0):
-        """Add an experience to a candidate.
+    def _add_candidate_experiences(self, resume_id, experiences_data):
+        """Add experiences to a candidate with a single write.
         
         Args:
             resume_id: ID of the candidate
-            experience_data: Dictionary containing experience details
-            index: Index for generating experience_id
+            experiences_data: List of experience dictionaries; list positions are used
+                to generate missing experience IDs
         """
-        experience_id = experience_data.get('experience_id', f"{resume_id}_exp_{index}")
-        
-        self.candidate_repository.add_candidate_experience(
-            resume_id,
-            experience_id,
-            experience_data['title'],
-            experience_data['company'],
-            experience_data.get('start_date', ''),
-            experience_data.get('end_date', 'Present'),
-            json.dumps(experience_data.get('description', [])) if isinstance(experience_data.get('description', []), list) else experience_data.get('description', ''),
-            experience_data.get('location', '')
-        )
+        experiences = []
+        for index, experience_data in enumerate(experiences_data):
+            description = experience_data.get('description', [])
+            experiences.append({
+                'experience_id': experience_data.get('experience_id', f"{resume_id}_exp_{index}"),
+                'title': experience_data['title'],
+                'company': experience_data['company'],
+                'start_date': experience_data.get('start_date', ''),
+                'end_date': experience_data.get('end_date', 'Present'),
+                'description': json.dumps(description) if isinstance(description, list) else description,
+                'location': experience_data.get('location', '')
+            })
+        
+        self.candidate_repository.add_candidate_experiences_batch(resume_id, experiences)
     
     def _update_candidate_experiences(self, resume_id, experiences_data):
         """Update experiences for a candidate.
@@ -442,29 +441,27 @@ class CandidateService:
         # self._remove_candidate_experiences(resume_id)
         
         # Add updated experiences
-        for i, exp in enumerate(experiences_data):
-            self._add_candidate_experience(resume_id, exp, i)
+        self._add_candidate_experiences(resume_id, experiences_data)
     
-    def _add_candidate_education(self, resume_id, education_data, index=0):
-        """Add an education entry to a candidate.
+    def _add_candidate_education(self, resume_id, education_data):
+        """Add education entries to a candidate with a single write.
         
         Args:
             resume_id: ID of the candidate
-            education_data: Dictionary containing education details
-            index: Index for generating education_id
+            education_data: List of education dictionaries; list positions are used
+                to generate missing education IDs
         """
-        education_id = education_data.get('education_id', f"{resume_id}_edu_{index}")
-        
-        self.candidate_repository.add_candidate_education(
-            resume_id,
-            education_id,
-            education_data['institution'],
-            education_data['degree'],
-            education_data['field'],
-            education_data.get('start_date', ''),
-            education_data.get('end_date', ''),
-            education_data.get('gpa')
-        )
+        education = [{
+            'education_id': edu.get('education_id', f"{resume_id}_edu_{index}"),
+            'institution': edu['institution'],
+            'degree': edu['degree'],
+            'field': edu['field'],
+            'start_date': edu.get('start_date', ''),
+            'end_date': edu.get('end_date', ''),
+            'gpa': edu.get('gpa')
+        } for index, edu in enumerate(education_data)]
+        
+        self.candidate_repository.add_candidate_education_batch(resume_id, education)
     
     def _update_candidate_education(self, resume_id, education_data):
         """Update education entries for a candidate.
@@ -477,5 +474,4 @@ class CandidateService:
         # self._remove_candidate_education(resume_id)
         
         # Add updated education entries
-        for i, edu in enumerate(education_data):
-            self._add_candidate_education(resume_id, edu, i) 
\ No newline at end of file
+        self._add_candidate_education(resume_id, education_data)
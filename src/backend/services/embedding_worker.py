@@ -0,0 +1,196 @@
+"""
+Embedding Worker
+
+This module provides a background worker that keeps job and candidate
+embeddings up to date after writes. Write paths enqueue record IDs and the
+worker thread encodes them in micro-batches, off the request path.
+"""
+
+import atexit
+import queue
+import threading
+import time
+
+from src.backend.config import (
+    EMBEDDING_WORKER_BATCH_SIZE,
+    EMBEDDING_WORKER_FLUSH_MS,
+    EMBEDDING_WORKER_MAX_QUEUE
+)
+from src.backend.services.graph_service import GraphService
+
+
+class EmbeddingWorker:
+    """In-process queue and background thread that micro-batches embedding updates."""
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls, graph_service=None):
+        """Get singleton instance of EmbeddingWorker."""
+        if cls._instance is None:
+            if graph_service is None:
+                graph_service = GraphService.get_instance()
+            cls._instance = cls(graph_service)
+        return cls._instance
+
+    def __init__(self, graph_service, batch_size=EMBEDDING_WORKER_BATCH_SIZE,
+                 flush_ms=EMBEDDING_WORKER_FLUSH_MS, max_queue=EMBEDDING_WORKER_MAX_QUEUE):
+        """Initialize the worker. The thread starts on the first enqueue.
+
+        Args:
+            graph_service: GraphService instance used to compute and store embeddings
+            batch_size: Maximum number of records encoded together
+            flush_ms: Maximum time a queued record waits for its batch to fill up
+            max_queue: Maximum number of pending records; further records are dropped
+        """
+        self.graph_service = graph_service
+        self.batch_size = batch_size
+        self.flush_interval = flush_ms / 1000.0
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._stats = {'enqueued': 0, 'dropped': 0, 'batches': 0, 'embedded': 0, 'errors': 0}
+
+        # Drain pending records when the process exits
+        atexit.register(self.stop)
+
+    # MAIN PUBLIC INTERFACE METHODS
+
+    def enqueue_job(self, job_id):
+        """Queue a job for (re-)embedding.
+
+        Args:
+            job_id: ID of the created or updated job
+
+        Returns:
+            bool: True if queued, False if the queue is full
+        """
+        return self._enqueue('job', job_id)
+
+    def enqueue_candidate(self, resume_id):
+        """Queue a candidate for (re-)embedding.
+
+        Args:
+            resume_id: ID of the created or updated candidate
+
+        Returns:
+            bool: True if queued, False if the queue is full
+        """
+        return self._enqueue('candidate', resume_id)
+
+    def start(self):
+        """Start the background thread if it is not running."""
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name='embedding-worker', daemon=True)
+            self._thread.start()
+
+    def flush(self, timeout=None):
+        """Wait until every queued record has been processed.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely
+
+        Returns:
+            bool: True if the queue was drained in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout=5.0):
+        """Process the remaining records and stop the background thread.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the thread
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_stats(self):
+        """Get worker counters.
+
+        Returns:
+            dict: Enqueued, dropped, embedded and error counts, batches run and queue depth
+        """
+        stats = dict(self._stats)
+        stats['pending'] = self._queue.qsize()
+        return stats
+
+    # PRIVATE HELPER METHODS
+
+    def _enqueue(self, kind, record_id):
+        """Put a record on the queue without ever blocking the caller."""
+        if not record_id:
+            return False
+        self.start()
+        try:
+            self._queue.put_nowait((kind, record_id))
+            self._stats['enqueued'] += 1
+            return True
+        except queue.Full:
+            self._stats['dropped'] += 1
+            print(f"Warning: embedding queue full, {kind} {record_id} will be embedded on the next full run")
+            return False
+
+    def _run(self):
+        """Worker loop: collect a micro-batch and embed it until stopped and drained."""
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._collect_batch()
+            if batch:
+                self._process_batch(batch)
+
+    def _collect_batch(self):
+        """Wait for a first record, then gather more until the batch is full or the flush interval passes."""
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _process_batch(self, batch):
+        """Embed a batch of records and refresh their semantic matches.
+
+        Records are grouped by type and duplicates are dropped.
+        """
+        try:
+            job_ids = list(dict.fromkeys(record_id for kind, record_id in batch if kind == 'job'))
+            resume_ids = list(dict.fromkeys(record_id for kind, record_id in batch if kind == 'candidate'))
+
+            jobs_embedded = (self.graph_service.embed_jobs(job_ids) or 0) if job_ids else 0
+            candidates_embedded = (self.graph_service.embed_candidates(resume_ids) or 0) if resume_ids else 0
+            self._stats['embedded'] += jobs_embedded + candidates_embedded
+
+            # The enhanced match queries score semantics from SEMANTIC_MATCH relationships
+            if jobs_embedded or candidates_embedded:
+                self.graph_service.refresh_semantic_matches_for(
+                    job_ids if jobs_embedded else (), resume_ids if candidates_embedded else ()
+                )
+            self._stats['batches'] += 1
+        except Exception as e:
+            self._stats['errors'] += 1
+            print(f"Error in embedding worker: {str(e)}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
@@ -5,15 +5,26 @@ This module provides access to the Neo4j knowledge graph database and repositori
 It acts as a central service for database operations.
 """
 
-from neo4j import GraphDatabase
 import os
 from dotenv import load_dotenv
 from src.backend.repositories.job_repository import JobRepository
 from src.backend.repositories.candidate_repository import CandidateRepository
 from src.backend.repositories.skill_repository import SkillRepository
-from src.backend.config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
+from src.backend.repositories.base.driver import get_driver, close_driver
+from src.backend.utils import write_counters
+from src.backend.utils.query_cache import query_cache
+from src.backend.utils.query_metrics import timed_run
+from src.backend.migrations.runner import MigrationRunner
+from src.backend.utils.lazy_loader import load, register_warmup_hook
+from src.backend.config import (
+    NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD,
+    EMBEDDING_MODEL_NAME, EMBEDDING_BATCH_SIZE, SEMANTIC_MATCH_TOP_K, SEMANTIC_MATCH_OVERSAMPLING,
+    CLEAR_BATCH_SIZE, CLEAR_SCHEMA_DROP_THRESHOLD
+)
 from datetime import datetime
 import json
+import threading
+import time
 
 # Load environment variables
 load_dotenv()
@@ -42,6 +53,7 @@ class GraphService:
         self.user = user or NEO4J_USER
         self.password = password or NEO4J_PASSWORD
         self.driver = None
+        self._owns_driver = False
         self.connect()
         
         # Initialize repositories
@@ -49,39 +61,63 @@ class GraphService:
         self.candidate_repository = CandidateRepository(self.driver)
         self.skill_repository = SkillRepository(self.driver)
         
+        # Embedding model is loaded on first use, or by warm_up() when preloading
+        self._embedding_model = None
+        self._embedding_model_lock = threading.Lock()
+        register_warmup_hook('embedding_model', self._get_embedding_model)
+        
     def connect(self):
         """Connect to the Neo4j database."""
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+        self.driver = get_driver(self.uri, self.user, self.password)
+        self._owns_driver = True
         print("Connected to Neo4j knowledge graph database")
         
     def close(self):
-        """Close the connection to Neo4j."""
-        if self.driver:
-            self.driver.close()
+        """Close the connection to Neo4j.
+        
+        The shared driver is only closed once every holder released it.
+        """
+        if self.driver and self._owns_driver:
+            self._owns_driver = False
+            close_driver(self.driver)
             
     def create_constraints(self):
         """Create constraints for the graph database."""
         with self.driver.session() as session:
             # Create constraints for unique IDs
-            session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (s:Skill) REQUIRE s.skill_id IS UNIQUE")
-            session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (j:Job) REQUIRE j.job_id IS UNIQUE")
-            session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (c:Candidate) REQUIRE c.resume_id IS UNIQUE")
-            session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (u:User) REQUIRE u.email IS UNIQUE")
+            for statement in (
+                "CREATE CONSTRAINT IF NOT EXISTS FOR (s:Skill) REQUIRE s.skill_id IS UNIQUE",
+                "CREATE CONSTRAINT IF NOT EXISTS FOR (j:Job) REQUIRE j.job_id IS UNIQUE",
+                "CREATE CONSTRAINT IF NOT EXISTS FOR (c:Candidate) REQUIRE c.resume_id IS UNIQUE",
+                "CREATE CONSTRAINT IF NOT EXISTS FOR (u:User) REQUIRE u.email IS UNIQUE"
+            ):
+                timed_run(session, "GraphService.create_constraints", statement).consume()
+            
+    def apply_migrations(self):
+        """Apply pending schema migrations (constraints, indexes and full-text indexes).
+        
+        Returns:
+            list: Versions applied
+        """
+        return MigrationRunner(self.driver).migrate()
             
     def ensure_user_schema(self):
         """Make sure the User schema exists in the database."""
         with self.driver.session() as session:
             # Check if User label already exists by looking for any User nodes
-            result = session.run("MATCH (u:User) RETURN COUNT(u) AS count")
+            result = timed_run(session, "GraphService.ensure_user_schema.count_users",
+                               "MATCH (u:User) RETURN COUNT(u) AS count")
             record = result.single()
             
             # If no User nodes exist, it's likely the schema has not been created
             if record["count"] == 0:
                 print("Initializing User schema in the database")
                 # Create an index on email for faster lookups
-                session.run("CREATE INDEX IF NOT EXISTS FOR (u:User) ON (u.email)")
+                timed_run(session, "GraphService.ensure_user_schema",
+                          "CREATE INDEX IF NOT EXISTS FOR (u:User) ON (u.email)").consume()
                 # Add timestamps index
-                session.run("CREATE INDEX IF NOT EXISTS FOR (u:User) ON (u.created_at)")
+                timed_run(session, "GraphService.ensure_user_schema",
+                          "CREATE INDEX IF NOT EXISTS FOR (u:User) ON (u.created_at)").consume()
                 print("User schema initialized successfully")
             else:
                 print(f"User schema already present with {record['count']} users")
@@ -103,160 +139,149 @@ class GraphService:
         else:
             return []  # Empty list as fallback
     
-    def generate_embeddings(self):
+    def generate_embeddings(self, batch_size=EMBEDDING_BATCH_SIZE):
         """Generate text embeddings for enhanced semantic search.
         
-        This method creates embeddings for job descriptions, candidate experiences,
-        and skills to enable semantic matching between jobs and candidates.
+        This method creates embeddings for job descriptions, candidate profiles,
+        individual experiences and skills to enable semantic matching between jobs
+        and candidates. Texts are encoded in batches and written back with one
+        UNWIND query per batch. Texts already present in the on-disk embedding
+        cache are not re-encoded. Afterwards the best job/candidate semantic pairs
+        are precomputed with refresh_semantic_matches.
+        
+        Args:
+            batch_size: Number of texts encoded and written per batch
         
         Returns:
             bool: True if embedding generation was successful, False otherwise
         """
         try:
             # Import the required libraries
-            from sentence_transformers import SentenceTransformer
-            import numpy as np
+            from src.backend.utils.embeddings import (
+                job_embedding_text, candidate_embedding_text, experience_embedding_text
+            )
             
             print("Starting embedding generation process...")
             
             # Load pre-trained model
-            model = SentenceTransformer('all-MiniLM-L6-v2')
-            print("Loaded embedding model: all-MiniLM-L6-v2")
+            model = self._get_embedding_model()
             
-            # Get all jobs
             with self.driver.session() as session:
                 # Get jobs needing embeddings
-                job_results = session.run("""
+                jobs = list(timed_run(session, "GraphService.generate_embeddings.jobs", """
                     MATCH (j:Job)
                     WHERE j.embedding IS NULL
                     RETURN j.job_id AS job_id, j.title AS title, 
                            j.description AS description, j.responsibilities AS responsibilities,
                            j.qualifications AS qualifications
-                """)
-                
-                job_count = 0
-                for job in job_results:
-                    # Combine job text for embedding
-                    job_text = f"{job['title'] or ''} {job['description'] or ''}"
-                    
-                    # Process responsibilities and qualifications
-                    responsibilities = self._process_text_list(job['responsibilities'])
-                    qualifications = self._process_text_list(job['qualifications'])
-                    
-                    # Join lists if they exist
-                    if responsibilities:
-                        job_text += " " + " ".join(responsibilities)
-                    if qualifications:
-                        job_text += " " + " ".join(qualifications)
-                    
-                    # Generate embedding
-                    embedding = model.encode(job_text)
-                    
-                    # Store embedding in Neo4j
-                    session.run("""
-                        MATCH (j:Job {job_id: $job_id})
-                        SET j.embedding = $embedding
-                    """, {
-                        "job_id": job['job_id'],
-                        "embedding": embedding.tolist()  # Convert to list for storage
-                    })
-                    
-                    job_count += 1
-                    if job_count % 10 == 0:
-                        print(f"Processed {job_count} job embeddings")
-                
+                """))
+                job_count = self._encode_and_store(
+                    session, model,
+                    [(job['job_id'], job_embedding_text(job)) for job in jobs],
+                    """
+                    UNWIND $rows AS row
+                    MATCH (j:Job {job_id: row.id})
+                    SET j.embedding = row.embedding
+                    """,
+                    batch_size
+                )
                 print(f"Completed job embeddings: {job_count} total")
                 
-                # Get candidates needing embeddings
-                candidate_results = session.run("""
+                # Get candidates needing embeddings together with their experiences
+                candidates = list(timed_run(session, "GraphService.generate_embeddings.candidates", """
                     MATCH (c:Candidate)
                     WHERE c.embedding IS NULL
                     RETURN c.resume_id AS resume_id, c.name AS name, 
-                           c.title AS title, c.summary AS summary
-                """)
-                
-                candidate_count = 0
-                for candidate in candidate_results:
-                    # Combine candidate text for embedding
-                    candidate_text = f"{candidate['name'] or ''} {candidate['title'] or ''} {candidate['summary'] or ''}"
-                    
-                    # Get candidate experiences
-                    experiences = self.candidate_repository.get_candidate_experiences(candidate['resume_id'])
-                    for exp in experiences:
-                        exp_text = f"{exp.get('job_title', '')} {exp.get('company', '')}"
-                        if exp.get('description'):
-                            if isinstance(exp['description'], list):
-                                exp_text += " " + " ".join(exp['description'])
-                            else:
-                                exp_text += " " + exp['description']
-                        candidate_text += " " + exp_text
-                    
-                    # Generate embedding
-                    embedding = model.encode(candidate_text)
-                    
-                    # Store embedding in Neo4j
-                    session.run("""
-                        MATCH (c:Candidate {resume_id: $resume_id})
-                        SET c.embedding = $embedding
-                    """, {
-                        "resume_id": candidate['resume_id'],
-                        "embedding": embedding.tolist()  # Convert to list for storage
-                    })
-                    
-                    candidate_count += 1
-                    if candidate_count % 10 == 0:
-                        print(f"Processed {candidate_count} candidate embeddings")
-                
+                           c.title AS title, c.summary AS summary,
+                           [(c)-[:HAS_EXPERIENCE]->(e:Experience) |
+                               {job_title: COALESCE(e.job_title, e.title),
+                                company: e.company,
+                                description: e.description}] AS experiences
+                """))
+                candidate_count = self._encode_and_store(
+                    session, model,
+                    [(candidate['resume_id'], candidate_embedding_text(candidate, candidate['experiences']))
+                     for candidate in candidates],
+                    """
+                    UNWIND $rows AS row
+                    MATCH (c:Candidate {resume_id: row.id})
+                    SET c.embedding = row.embedding
+                    """,
+                    batch_size
+                )
                 print(f"Completed candidate embeddings: {candidate_count} total")
                 
+                # Get experiences needing embeddings (used for job/experience similarity)
+                experiences = list(timed_run(session, "GraphService.generate_embeddings.experiences", """
+                    MATCH (e:Experience)
+                    WHERE e.text_embedding IS NULL
+                    RETURN elementId(e) AS node_id, COALESCE(e.job_title, e.title) AS job_title,
+                           e.company AS company, e.description AS description
+                """))
+                experience_count = self._encode_and_store(
+                    session, model,
+                    [(exp['node_id'], experience_embedding_text(exp)) for exp in experiences],
+                    """
+                    UNWIND $rows AS row
+                    MATCH (e:Experience)
+                    WHERE elementId(e) = row.id
+                    SET e.text_embedding = row.embedding
+                    """,
+                    batch_size
+                )
+                print(f"Completed experience embeddings: {experience_count} total")
+                
                 # Get skills needing embeddings
-                skill_results = session.run("""
+                skills = list(timed_run(session, "GraphService.generate_embeddings.skills", """
                     MATCH (s:Skill)
                     WHERE s.embedding IS NULL
                     RETURN s.skill_id AS skill_id, s.name AS name, 
                            s.category AS category
-                """)
-                
-                skill_count = 0
-                for skill in skill_results:
-                    # Combine skill text for embedding
-                    skill_text = f"{skill['name'] or ''} {skill['category'] or ''}"
-                    
-                    # Generate embedding
-                    embedding = model.encode(skill_text)
-                    
-                    # Store embedding in Neo4j
-                    session.run("""
-                        MATCH (s:Skill {skill_id: $skill_id})
-                        SET s.embedding = $embedding
-                    """, {
-                        "skill_id": skill['skill_id'],
-                        "embedding": embedding.tolist()  # Convert to list for storage
-                    })
-                    
-                    skill_count += 1
-                    if skill_count % 100 == 0:
-                        print(f"Processed {skill_count} skill embeddings")
-                
+                """))
+                skill_count = self._encode_and_store(
+                    session, model,
+                    [(skill['skill_id'], f"{skill['name'] or ''} {skill['category'] or ''}".strip())
+                     for skill in skills],
+                    """
+                    UNWIND $rows AS row
+                    MATCH (s:Skill {skill_id: row.id})
+                    SET s.embedding = row.embedding
+                    """,
+                    batch_size
+                )
                 print(f"Completed skill embeddings: {skill_count} total")
                 
                 # Create index for vector search if not exists (Neo4j 4.4+)
                 try:
-                    session.run("""
+                    timed_run(session, "GraphService.generate_embeddings.vector_index", """
                         CREATE VECTOR INDEX job_embedding IF NOT EXISTS
                         FOR (j:Job) ON j.embedding
-                    """)
-                    session.run("""
+                    """).consume()
+                    timed_run(session, "GraphService.generate_embeddings.vector_index", """
                         CREATE VECTOR INDEX candidate_embedding IF NOT EXISTS
                         FOR (c:Candidate) ON c.embedding
-                    """)
-                    session.run("""
+                    """).consume()
+                    timed_run(session, "GraphService.generate_embeddings.vector_index", """
                         CREATE VECTOR INDEX skill_embedding IF NOT EXISTS
                         FOR (s:Skill) ON s.embedding
-                    """)
+                    """).consume()
+                    # Searched by refresh_semantic_matches_for
+                    timed_run(session, "GraphService.generate_embeddings.vector_index", """
+                        CREATE VECTOR INDEX experience_text_embedding IF NOT EXISTS
+                        FOR (e:Experience) ON e.text_embedding
+                    """).consume()
                     print("Created vector indexes for embeddings")
                 except Exception as e:
                     print(f"Note: Vector indexes not created - may require Neo4j 4.4+ or Enterprise Edition: {e}")
+            
+            # Precompute job/experience similarity for the enhanced matching queries
+            if job_count or experience_count:
+                self.refresh_semantic_matches()
+                
+            from src.backend.utils.embedding_cache import get_embedding_cache
+            cache = get_embedding_cache()
+            if cache is not None:
+                print(f"Embedding cache: {cache.hits} hits, {cache.misses} texts encoded")
                 
             print("Embedding generation completed successfully")
             return True
@@ -267,12 +292,379 @@ class GraphService:
         except Exception as e:
             print(f"Error generating embeddings: {str(e)}")
             return False
+    
+    def embed_jobs(self, job_ids, batch_size=EMBEDDING_BATCH_SIZE):
+        """Compute and store the embeddings of specific jobs.
+        
+        Used after jobs are created or updated. Unchanged texts are served from
+        the embedding cache without running the model.
+        
+        Args:
+            job_ids: List of job IDs
+            batch_size: Number of texts encoded and written per batch
+            
+        Returns:
+            int: Number of jobs embedded, or 0 if embeddings are unavailable
+        """
+        try:
+            from src.backend.utils.embeddings import job_embedding_text
+            
+            model = self._get_embedding_model()
+            with self.driver.session() as session:
+                jobs = list(timed_run(session, "GraphService.embed_jobs", """
+                    MATCH (j:Job)
+                    WHERE j.job_id IN $job_ids
+                    RETURN j.job_id AS job_id, j.title AS title,
+                           j.description AS description, j.responsibilities AS responsibilities,
+                           j.qualifications AS qualifications
+                """, {"job_ids": list(job_ids)}))
+                return self._encode_and_store(
+                    session, model,
+                    [(job['job_id'], job_embedding_text(job)) for job in jobs],
+                    """
+                    UNWIND $rows AS row
+                    MATCH (j:Job {job_id: row.id})
+                    SET j.embedding = row.embedding
+                    """,
+                    batch_size,
+                    verbose=False
+                )
+        except ImportError:
+            print("Warning: sentence-transformers not installed, job embeddings not updated")
+            return 0
+        except Exception as e:
+            print(f"Error embedding jobs: {str(e)}")
+            return 0
+    
+    def embed_candidates(self, resume_ids, batch_size=EMBEDDING_BATCH_SIZE):
+        """Compute and store the profile and experience embeddings of specific candidates.
+        
+        Used after candidates are created or updated. Unchanged texts are served
+        from the embedding cache without running the model.
+        
+        Args:
+            resume_ids: List of candidate IDs
+            batch_size: Number of texts encoded and written per batch
+            
+        Returns:
+            int: Number of candidates embedded, or 0 if embeddings are unavailable
+        """
+        try:
+            from src.backend.utils.embeddings import candidate_embedding_text, experience_embedding_text
+            
+            model = self._get_embedding_model()
+            with self.driver.session() as session:
+                candidates = list(timed_run(session, "GraphService.embed_candidates", """
+                    MATCH (c:Candidate)
+                    WHERE c.resume_id IN $resume_ids
+                    RETURN c.resume_id AS resume_id, c.name AS name,
+                           c.title AS title, c.summary AS summary,
+                           [(c)-[:HAS_EXPERIENCE]->(e:Experience) |
+                               {node_id: elementId(e),
+                                job_title: COALESCE(e.job_title, e.title),
+                                company: e.company,
+                                description: e.description}] AS experiences
+                """, {"resume_ids": list(resume_ids)}))
+                count = self._encode_and_store(
+                    session, model,
+                    [(candidate['resume_id'], candidate_embedding_text(candidate, candidate['experiences']))
+                     for candidate in candidates],
+                    """
+                    UNWIND $rows AS row
+                    MATCH (c:Candidate {resume_id: row.id})
+                    SET c.embedding = row.embedding
+                    """,
+                    batch_size,
+                    verbose=False
+                )
+                self._encode_and_store(
+                    session, model,
+                    [(exp['node_id'], experience_embedding_text(exp))
+                     for candidate in candidates for exp in candidate['experiences']],
+                    """
+                    UNWIND $rows AS row
+                    MATCH (e:Experience)
+                    WHERE elementId(e) = row.id
+                    SET e.text_embedding = row.embedding
+                    """,
+                    batch_size,
+                    verbose=False
+                )
+                return count
+        except ImportError:
+            print("Warning: sentence-transformers not installed, candidate embeddings not updated")
+            return 0
+        except Exception as e:
+            print(f"Error embedding candidates: {str(e)}")
+            return 0
+    
+    def _get_embedding_model(self):
+        """Load the sentence transformer model once and reuse it.
+        
+        Returns:
+            SentenceTransformer: The embedding model
+            
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        with self._embedding_model_lock:
+            if self._embedding_model is None:
+                SentenceTransformer = load('sentence_transformers')
+                self._embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+                print(f"Loaded embedding model: {EMBEDDING_MODEL_NAME}")
+            return self._embedding_model
+    
+    def _encode_texts(self, model, texts, batch_size):
+        """Encode texts through the on-disk embedding cache when it is enabled.
+        
+        Args:
+            model: SentenceTransformer model
+            texts: List of texts
+            batch_size: Batch size passed to the model
+            
+        Returns:
+            list: One vector (list of floats) per text
+        """
+        from src.backend.utils.embedding_cache import get_embedding_cache
+        
+        cache = get_embedding_cache()
+        if cache is not None:
+            return cache.encode(model, texts, batch_size=batch_size)
+        return [list(map(float, vector)) for vector in model.encode(texts, batch_size=batch_size)]
+    
+    def _encode_and_store(self, session, model, items, write_query, batch_size, verbose=True):
+        """Encode texts in batches and store the vectors with one UNWIND query per batch.
+        
+        Args:
+            session: Open Neo4j session
+            model: SentenceTransformer model
+            items: List of (id, text) tuples
+            write_query: Cypher query reading $rows of {id, embedding}
+            batch_size: Number of texts encoded and written per batch
+            verbose: Whether to print progress after each batch
+            
+        Returns:
+            int: Number of embeddings stored
+        """
+        stored = 0
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            vectors = self._encode_texts(model, [text for _, text in batch], batch_size)
+            result = timed_run(session, "GraphService._encode_and_store", write_query, {
+                "rows": [
+                    {"id": item_id, "embedding": vector}
+                    for (item_id, _), vector in zip(batch, vectors)
+                ]
+            })
+            write_counters.record(result.consume())
+            stored += len(batch)
+            if verbose:
+                print(f"Processed {stored}/{len(items)} embeddings")
+        return stored
+    
+    def refresh_semantic_matches(self, top_k=SEMANTIC_MATCH_TOP_K, batch_size=EMBEDDING_BATCH_SIZE):
+        """Precompute semantic job/candidate scores from job and experience embeddings.
+        
+        The score of a (job, candidate) pair is the maximum cosine similarity between
+        the job embedding and the candidate's experience embeddings. It is computed
+        with NumPy and the top_k pairs per job and per candidate are stored as
+        SEMANTIC_MATCH relationships, so the enhanced matching queries only need a
+        single relationship lookup instead of per-row vector math. The previous
+        relationships are deleted in transactions of CLEAR_BATCH_SIZE rows.
+        
+        Args:
+            top_k: Number of matches kept per job and per candidate
+            batch_size: Number of relationships written per query
+            
+        Returns:
+            int: Number of SEMANTIC_MATCH relationships written
+        """
+        from src.backend.utils.embeddings import top_k_semantic_matches
+        
+        # Embeddings are streamed into float32 matrices, never held as lists of Python floats
+        job_ids, job_vectors, _ = self._read_embeddings("""
+            MATCH (j:Job)
+            WHERE j.embedding IS NOT NULL
+            RETURN count(j) AS count
+        """, """
+            MATCH (j:Job)
+            WHERE j.embedding IS NOT NULL
+            RETURN j.job_id AS id, [j.embedding] AS embeddings
+        """, "GraphService.refresh_semantic_matches.jobs")
+        resume_ids, experience_vectors, experience_counts = self._read_embeddings("""
+            MATCH (:Candidate)-[:HAS_EXPERIENCE]->(e:Experience)
+            WHERE e.text_embedding IS NOT NULL
+            RETURN count(e) AS count
+        """, """
+            MATCH (c:Candidate)-[:HAS_EXPERIENCE]->(e:Experience)
+            WHERE e.text_embedding IS NOT NULL
+            RETURN c.resume_id AS id, collect(e.text_embedding) AS embeddings
+        """, "GraphService.refresh_semantic_matches.candidates")
+        pairs = top_k_semantic_matches(job_ids, job_vectors, resume_ids, experience_vectors,
+                                       experience_counts, top_k=top_k)
+        
+        with self.driver.session() as session:
+            total = timed_run(session, "GraphService.refresh_semantic_matches.count",
+                              "MATCH ()-[r:SEMANTIC_MATCH]->() RETURN count(r) AS count").single()["count"]
+            self._delete_in_batches(
+                session, "MATCH (:Candidate)-[r:SEMANTIC_MATCH]->(:Job) WITH r LIMIT $limit DELETE r "
+                         "RETURN count(*) AS deleted",
+                "semantic matches", total, CLEAR_BATCH_SIZE)
+            self._write_semantic_matches(session, pairs, batch_size)
+        
+        print(f"Stored {len(pairs)} semantic job/candidate matches")
+        return len(pairs)
+    
+    def _read_embeddings(self, count_query, query, query_name):
+        """Stream embeddings into a float32 matrix, preallocated from their count.
+        
+        Args:
+            count_query: Query returning the number of vectors as 'count'
+            query: Query returning an 'id' and its list of 'embeddings' per row
+            query_name: Name of the query in the query metrics
+            
+        Returns:
+            tuple: IDs, matrix of all vectors in row order and the number of vectors per ID
+        """
+        import numpy as np
+        
+        with self.driver.session() as session:
+            capacity = timed_run(session, f"{query_name}.count", count_query).single()["count"]
+        ids, counts = [], []
+        matrix = None
+        size = 0
+        for record in self.job_repository.stream_read_query(query, query_name=query_name):
+            vectors = record["embeddings"]
+            if not vectors:
+                continue
+            if matrix is None:
+                matrix = np.empty((max(capacity, len(vectors)), len(vectors[0])), dtype=np.float32)
+            elif size + len(vectors) > len(matrix):
+                # Vectors written since the count; grow instead of failing
+                grown = np.empty((max(2 * len(matrix), size + len(vectors)), matrix.shape[1]), dtype=np.float32)
+                grown[:size] = matrix[:size]
+                matrix = grown
+            matrix[size:size + len(vectors)] = vectors
+            size += len(vectors)
+            ids.append(record["id"])
+            counts.append(len(vectors))
+        if matrix is None:
+            return ids, np.empty((0, 0), dtype=np.float32), counts
+        return ids, matrix[:size], counts
+    
+    def refresh_semantic_matches_for(self, job_ids=(), resume_ids=(), top_k=SEMANTIC_MATCH_TOP_K,
+                                     batch_size=EMBEDDING_BATCH_SIZE):
+        """Recompute the SEMANTIC_MATCH relationships of specific jobs and candidates.
+        
+        Used after jobs or candidates are re-embedded. The neighbours of the
+        given records are found with the job and experience vector indexes
+        created by generate_embeddings, so only those records are read, not
+        the whole corpus. Their relationships are deleted and rewritten in one
+        transaction, so readers never see them without matches. The top_k
+        lists of the other records are only revised by the next full
+        refresh_semantic_matches.
+        
+        The vector indexes are approximate and return experiences rather than
+        candidates, so SEMANTIC_MATCH_OVERSAMPLING times top_k neighbours are
+        requested before the best top_k candidates or jobs are kept.
+        
+        Args:
+            job_ids: IDs of re-embedded jobs
+            resume_ids: IDs of re-embedded candidates
+            top_k: Number of matches kept per job and per candidate
+            batch_size: Number of relationships written per query
+            
+        Returns:
+            int: Number of SEMANTIC_MATCH relationships written
+        """
+        job_ids = list(job_ids)
+        resume_ids = list(resume_ids)
+        if not job_ids and not resume_ids:
+            return 0
+        parameters = {"job_ids": job_ids, "resume_ids": resume_ids,
+                      "top_k": top_k, "neighbours": top_k * SEMANTIC_MATCH_OVERSAMPLING}
+        
+        def refresh(tx):
+            timed_run(tx, "GraphService.refresh_semantic_matches_for.delete", """
+                MATCH (c:Candidate)-[r:SEMANTIC_MATCH]->(j:Job)
+                WHERE j.job_id IN $job_ids OR c.resume_id IN $resume_ids
+                DELETE r
+            """, parameters).consume()
+            # Vector index scores are (1 + cosine) / 2; SEMANTIC_MATCH stores the cosine
+            jobs = timed_run(tx, "GraphService.refresh_semantic_matches_for.jobs", """
+                MATCH (j:Job)
+                WHERE j.job_id IN $job_ids AND j.embedding IS NOT NULL
+                CALL {
+                    WITH j
+                    CALL db.index.vector.queryNodes('experience_text_embedding', $neighbours, j.embedding)
+                    YIELD node, score
+                    MATCH (c:Candidate)-[:HAS_EXPERIENCE]->(node)
+                    WITH c, max(score) AS score
+                    ORDER BY score DESC
+                    LIMIT $top_k
+                    RETURN c.resume_id AS resume_id, 2 * score - 1 AS score
+                }
+                RETURN j.job_id AS job_id, resume_id, score
+            """, parameters)
+            candidates = timed_run(tx, "GraphService.refresh_semantic_matches_for.candidates", """
+                MATCH (c:Candidate)-[:HAS_EXPERIENCE]->(e:Experience)
+                WHERE c.resume_id IN $resume_ids AND e.text_embedding IS NOT NULL
+                CALL {
+                    WITH e
+                    CALL db.index.vector.queryNodes('job_embedding', $neighbours, e.text_embedding)
+                    YIELD node, score
+                    RETURN node.job_id AS job_id, score
+                }
+                WITH c, job_id, max(score) AS score
+                ORDER BY score DESC
+                WITH c, collect({job_id: job_id, score: 2 * score - 1})[..$top_k] AS matches
+                UNWIND matches AS match
+                RETURN match.job_id AS job_id, c.resume_id AS resume_id, match.score AS score
+            """, parameters)
+            pairs = {}
+            for result in (jobs, candidates):
+                for record in result:
+                    pairs[(record["job_id"], record["resume_id"])] = {
+                        "job_id": record["job_id"], "resume_id": record["resume_id"], "score": record["score"]
+                    }
+            self._write_semantic_matches(tx, list(pairs.values()), batch_size)
+            return len(pairs)
+        
+        with self.driver.session() as session:
+            return session.execute_write(refresh)
+    
+    @staticmethod
+    def _write_semantic_matches(runner, pairs, batch_size):
+        """Merge SEMANTIC_MATCH relationships from job_id, resume_id and score rows.
+        
+        Args:
+            runner: Neo4j session, or transaction to write in
+            pairs: Dictionaries with job_id, resume_id and score
+            batch_size: Number of relationships written per query
+        """
+        for start in range(0, len(pairs), batch_size):
+            timed_run(runner, "GraphService.refresh_semantic_matches.write", """
+                UNWIND $rows AS row
+                MATCH (c:Candidate {resume_id: row.resume_id})
+                MATCH (j:Job {job_id: row.job_id})
+                MERGE (c)-[r:SEMANTIC_MATCH]->(j)
+                SET r.score = row.score
+            """, {"rows": pairs[start:start + batch_size]}).consume()
             
-    def clear_database(self, force: bool = False) -> bool:
+    def clear_database(self, force: bool = False, batch_size: int = CLEAR_BATCH_SIZE,
+                       drop_schema: bool = None) -> bool:
         """Clear all data from the Neo4j database.
         
+        Relationships and then nodes are deleted in transactions of at most
+        batch_size rows, so memory use stays bounded on large graphs and
+        progress is reported as the wipe proceeds.
+        
         Args:
             force: Whether to bypass confirmation for clearing the database
+            batch_size: Rows deleted per transaction; 0 deletes everything in one transaction
+            drop_schema: Whether to drop indexes and constraints during the wipe and
+                recreate them afterwards, which avoids index maintenance on every delete.
+                None decides by graph size (CLEAR_SCHEMA_DROP_THRESHOLD nodes).
             
         Returns:
             bool: True if successful, False otherwise
@@ -286,10 +678,98 @@ class GraphService:
         
         print("Clearing database (this might take a while)...")
         with self.driver.session() as session:
-            session.run("MATCH (n) DETACH DELETE n")
+            if not batch_size:
+                timed_run(session, "GraphService.clear_database.detach_delete",
+                          "MATCH (n) DETACH DELETE n").consume()
+                query_cache.clear()
+                print("Database cleared successfully!")
+                return True
+            
+            started = time.perf_counter()
+            node_count = timed_run(session, "GraphService.clear_database.count_nodes",
+                                   "MATCH (n) RETURN count(n) AS count").single()["count"]
+            relationship_count = timed_run(session, "GraphService.clear_database.count_relationships",
+                                           "MATCH ()-[r]->() RETURN count(r) AS count").single()["count"]
+            if drop_schema is None:
+                drop_schema = node_count >= CLEAR_SCHEMA_DROP_THRESHOLD
+            schema = self._schema_statements(session) if drop_schema and node_count else []
+            dropped = []
+            
+            try:
+                # Track each drop as it happens, so a failure part way still restores it
+                for kind, name, statement in schema:
+                    timed_run(session, "GraphService.clear_database.drop_schema",
+                              f"DROP {kind} `{name}` IF EXISTS").consume()
+                    dropped.append(statement)
+                if schema:
+                    print(f"Dropped {len(dropped)} indexes and constraints for the wipe")
+                
+                # Relationships first, so no node delete has to detach a large number at once
+                self._delete_in_batches(
+                    session, "MATCH ()-[r]->() WITH r LIMIT $limit DELETE r RETURN count(*) AS deleted",
+                    "relationships", relationship_count, batch_size)
+                self._delete_in_batches(
+                    session, "MATCH (n) WITH n LIMIT $limit DETACH DELETE n RETURN count(*) AS deleted",
+                    "nodes", node_count, batch_size)
+            finally:
+                for statement in dropped:
+                    timed_run(session, "GraphService.clear_database.restore_schema", statement).consume()
+                if dropped:
+                    print(f"Recreated {len(dropped)} indexes and constraints")
         
-        print("Database cleared successfully!")
+        query_cache.clear()
+        print(f"Database cleared successfully in {time.perf_counter() - started:.1f}s!")
         return True
+    
+    def _delete_in_batches(self, session, query, label, total, batch_size):
+        """Run a delete query with LIMIT $limit until it deletes nothing, reporting progress.
+        
+        Args:
+            session: Neo4j session; each run is its own transaction
+            query: Delete query returning the number of deleted rows as 'deleted'
+            label: What is being deleted, for progress output
+            total: Expected number of rows, for progress output
+            batch_size: Rows per transaction
+            
+        Returns:
+            int: Number of rows deleted
+        """
+        deleted = 0
+        started = time.perf_counter()
+        while True:
+            result = timed_run(session, "GraphService._delete_in_batches", query, limit=batch_size)
+            batch = result.single()["deleted"]
+            write_counters.record(result.consume())
+            if not batch:
+                break
+            deleted += batch
+            elapsed = time.perf_counter() - started
+            percent = f" ({deleted / total:.0%})" if total else ""
+            print(f"  Deleted {deleted}/{total} {label}{percent}, {deleted / elapsed if elapsed else 0:.0f}/s")
+            if batch < batch_size:
+                break
+        return deleted
+    
+    def _schema_statements(self, session):
+        """Collect the constraints and indexes to drop for a wipe.
+        
+        Token lookup indexes and indexes owned by constraints are left to Neo4j.
+        
+        Args:
+            session: Neo4j session
+            
+        Returns:
+            list: (kind, name, create statement) tuples, constraints first
+        """
+        constraints = [("CONSTRAINT", record["name"], record["createStatement"]) for record in timed_run(
+            session, "GraphService._schema_statements.show_constraints",
+            "SHOW CONSTRAINTS YIELD name, createStatement RETURN name, createStatement")]
+        indexes = [("INDEX", record["name"], record["createStatement"]) for record in timed_run(
+            session, "GraphService._schema_statements.show_indexes",
+            "SHOW INDEXES YIELD name, type, owningConstraint, createStatement "
+            "WHERE type <> 'LOOKUP' AND owningConstraint IS NULL "
+            "RETURN name, createStatement")]
+        return constraints + indexes
         
     def create_test_accounts(self):
         """Create test admin, HR, and candidate accounts and link them to test data."""
@@ -300,7 +780,8 @@ class GraphService:
         with self.driver.session() as session:
             # Create unique constraint for User.email
             try:
-                session.run("CREATE CONSTRAINT unique_user_email IF NOT EXISTS FOR (u:User) REQUIRE u.email IS UNIQUE")
+                timed_run(session, "GraphService.create_test_accounts.constraint",
+                          "CREATE CONSTRAINT unique_user_email IF NOT EXISTS FOR (u:User) REQUIRE u.email IS UNIQUE").consume()
             except Exception as e:
                 print(f"Warning: Could not create constraint: {str(e)}")
         
@@ -328,7 +809,7 @@ class GraphService:
         
         # Link all existing jobs to the HR account
         with self.driver.session() as session:
-            job_count = session.run("""
+            job_count = timed_run(session, "GraphService.create_test_accounts.assign_jobs", """
                 MATCH (j:Job)
                 SET j.owner_email = $email
                 WITH j
@@ -342,7 +823,7 @@ class GraphService:
         # Create test candidate accounts (up to 30)
         with self.driver.session() as session:
             # Get all candidate profiles
-            candidates = session.run("""
+            candidates = timed_run(session, "GraphService.create_test_accounts.candidates", """
                 MATCH (c:Candidate)
                 RETURN c.resume_id as resume_id, c.name as name, c.email as email
                 LIMIT 30
@@ -7,8 +7,10 @@ This module provides business logic for job-related operations in the talent mat
 import uuid
 import datetime
 import json
-from src.backend.repositories.job_repository import JobRepository
+from src.backend.repositories.job_repository import JobRepository, JOB_PAGE_KEY
 from src.backend.services.matching_service import MatchingService
+from src.backend.services.embedding_worker import EmbeddingWorker
+from src.backend.utils.pagination import next_cursor
 
 
 class JobService:
@@ -32,6 +34,7 @@ class JobService:
         self.graph_service = graph_service
         self.job_repository = JobRepository(graph_service.driver)
         self.matching_service = MatchingService.get_instance(graph_service)
+        self.embedding_worker = EmbeddingWorker.get_instance(graph_service)
     
     def create_job(self, job_data, owner_email):
         """Create a new job posting.
@@ -65,6 +68,9 @@ class JobService:
             # Create relationship between user and job
             self._link_job_to_owner(job_id, owner_email)
             
+            # Embed the new job for semantic matching in the background
+            self.embedding_worker.enqueue_job(job_id)
+            
             return {'success': True, 'job_id': job_id}
         
         except Exception as e:
@@ -80,20 +86,17 @@ class JobService:
             dict: Dictionary with 'success' (bool) and 'job' or 'error' keys
         """
         try:
-            # Get job from repository
-            job = self.job_repository.get_job(job_id)
+            # Get job and skills from repository in one query
+            profile = self.job_repository.get_job_profile(job_id)
             
-            if not job:
+            if not profile:
                 return {'success': False, 'error': f"Job with ID {job_id} not found"}
             
-            # Get job skills
-            skills = self.job_repository.get_job_skills(job_id)
-            
             # Format response
             return {
                 'success': True,
-                'job': job,
-                'skills': skills
+                'job': profile.job,
+                'skills': profile.skills
             }
         
         except Exception as e:
@@ -143,6 +146,9 @@ class JobService:
             if 'skills' in job_data:
                 self._update_job_skills(job_id, job_data['skills'])
             
+            # Re-embed the job in the background
+            self.embedding_worker.enqueue_job(job_id)
+            
             return {'success': True, 'job_id': job_id}
         
         except Exception as e:
@@ -184,20 +190,21 @@ class JobService:
         except Exception as e:
             return {'success': False, 'error': f"Error deleting job: {str(e)}"}
     
-    def find_jobs(self, filters=None, limit=20, offset=0):
+    def find_jobs(self, filters=None, limit=20, offset=0, cursor=None):
         """Find jobs matching specified filters.
         
         Args:
             filters: Dictionary containing filter criteria
             limit: Maximum number of results to return
-            offset: Offset for pagination
+            offset: Offset for pagination, used without a cursor
+            cursor: next_cursor of the previous page
             
         Returns:
-            dict: Dictionary with 'success' (bool) and 'jobs' or 'error' keys
+            dict: Dictionary with 'success' (bool) and 'jobs', 'next_cursor' or 'error' keys
         """
         try:
             # Get jobs from repository
-            jobs = self.job_repository.find_jobs(filters, limit, offset)
+            jobs = self.job_repository.find_jobs(filters, limit, offset, cursor)
             
             # Get filter values for UI
             filter_data = self.job_repository.get_job_filter_options()
@@ -208,25 +215,27 @@ class JobService:
                 'filters': filter_data,
                 'total': len(jobs),
                 'limit': limit,
-                'offset': offset
+                'offset': offset,
+                'next_cursor': next_cursor(jobs, limit, JOB_PAGE_KEY)
             }
         
         except Exception as e:
             return {'success': False, 'error': f"Error finding jobs: {str(e)}"}
     
-    def get_matching_candidates(self, job_id, limit=10, weights=None):
+    def get_matching_candidates(self, job_id, limit=10, weights=None, retrieval='graph'):
         """Find candidates matching a job.
         
         Args:
             job_id: ID of the job to match against
             limit: Maximum number of results to return
             weights: Dictionary containing matching weights
+            retrieval: Retrieval mode, 'graph' or 'hybrid'
             
         Returns:
             dict: Dictionary with 'success' (bool) and 'candidates' or 'error' keys
         """
         # Delegate to the matching service
-        return self.matching_service.get_matching_candidates_for_job(job_id, limit, 0.0, weights)
+        return self.matching_service.get_matching_candidates_for_job(job_id, limit, 0.0, weights, retrieval=retrieval)
     
     def _validate_job_data(self, job_data, is_update=False):
         """Validate job data.
@@ -4,11 +4,13 @@ Matching Service
 This module implements algorithms for matching candidates to jobs using graph traversal.
 """
 
+from src.backend.models.record_model import MatchRow, SkillRow
 from src.backend.repositories.job_repository import JobRepository
 from src.backend.repositories.candidate_repository import CandidateRepository
 from src.backend.repositories.skill_repository import SkillRepository
 from src.backend.services.graph_service import GraphService
 from src.backend.utils.formatters import format_match_results, _score_to_percentage
+from src.backend.utils.lazy_loader import is_available, load
 
 class MatchingService:
     """Matching algorithms using the knowledge graph."""
@@ -38,25 +40,14 @@ class MatchingService:
         self.candidate_repository = CandidateRepository(self.driver)
         self.skill_repository = SkillRepository(self.driver)
         
-        # Initialize text processing tools
-        try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
-            from sklearn.metrics.pairwise import cosine_similarity
-            import nltk
-            from nltk.corpus import stopwords
-            
-            # Download required NLTK data if not already downloaded
-            try:
-                nltk.data.find('corpora/stopwords')
-            except LookupError:
-                nltk.download('stopwords')
-                
-            self.tfidf_vectorizer = TfidfVectorizer(stop_words='english')
-            self.text_matching_available = True
-        except ImportError:
+        # Hybrid retrieval is created on first use
+        self.retrieval_service = None
+        
+        # Text processing libraries are only imported on first use
+        self.text_matching_available = is_available('sklearn')
+        if not self.text_matching_available:
             # Fall back to simple word overlap if scikit-learn is not available
-            self.text_matching_available = False
-            print("Warning: scikit-learn or nltk not available. Using simplified text matching.")
+            print("Warning: scikit-learn not available. Using simplified text matching.")
 
     # MAIN PUBLIC INTERFACE METHODS
         
@@ -83,48 +74,7 @@ class MatchingService:
         for match in basic_matches:
             # Add the resume_id to each job match record (it's not included by default)
             match["resume_id"] = resume_id
-            
-            # Get skill details
-            matching_skills = self._get_matching_skills(resume_id, match["job_id"])
-            missing_skills = self._get_missing_skills(resume_id, match["job_id"])
-            exceeding_skills = self._get_exceeding_skills(resume_id, match["job_id"])
-            
-            # Calculate graph-based score (normalized to 0-1 range)
-            total_required_skills = matching_skills + missing_skills
-            skill_match_score = self._calculate_skill_match_score(matching_skills, total_required_skills)
-            graph_score = skill_match_score / 100  # Normalize to 0-1 range
-            
-            # Calculate text similarity score (already normalized in the method)
-            raw_text_score, normalized_text_score = self._calculate_text_similarity(resume_id, match["job_id"])
-            
-            # Calculate hybrid score using all components
-            hybrid_score = self._calculate_hybrid_score(
-                match["matchScore"],
-                matching_skills,
-                missing_skills,
-                exceeding_skills,
-                resume_id,
-                match["job_id"],
-                raw_text_score,
-                graph_score
-            )
-            
-            # Get the skill coverage ratio for additional context
-            skill_coverage_ratio = len(matching_skills) / max(len(total_required_skills), 1)
-            
-            # Enrich match data
-            match["hybrid_score"] = hybrid_score
-            match["match_percentage"] = _score_to_percentage(hybrid_score)
-            match["graph_score"] = graph_score
-            # Apply our percentage mapping to graph score for consistency
-            match["graph_percentage"] = _score_to_percentage(graph_score)
-            match["text_score"] = raw_text_score
-            # Use normalized text score for display
-            match["text_percentage"] = round(normalized_text_score * 100, 1)
-            match["matching_skills"] = matching_skills
-            match["missing_skills"] = missing_skills
-            match["exceeding_skills"] = exceeding_skills
-            matches.append(match)
+            matches.append(self._score_match(match, resume_id, match["job_id"]))
         
         # Filter and sort by hybrid score
         matches = [m for m in matches if m["match_percentage"] >= min_score]
@@ -153,55 +103,91 @@ class MatchingService:
         # Collect detailed data for hybrid scoring
         matches = []
         for match in basic_matches:
-            # Get skill details
-            matching_skills = self._get_matching_skills(match["resume_id"], job_id)
-            missing_skills = self._get_missing_skills(match["resume_id"], job_id)
-            exceeding_skills = self._get_exceeding_skills(match["resume_id"], job_id)
-            
-            # Calculate graph-based score (normalized to 0-1 range)
-            total_required_skills = matching_skills + missing_skills
-            skill_match_score = self._calculate_skill_match_score(matching_skills, total_required_skills)
-            graph_score = skill_match_score / 100  # Normalize to 0-1 range
-            
-            # Calculate text similarity score (already normalized in the method)
-            raw_text_score, normalized_text_score = self._calculate_text_similarity(match["resume_id"], job_id)
-            
-            # Calculate hybrid score using all components
-            hybrid_score = self._calculate_hybrid_score(
-                match["matchScore"],
-                matching_skills,
-                missing_skills,
-                exceeding_skills,
-                match["resume_id"],
-                job_id,
-                raw_text_score,
-                graph_score
-            )
+            matches.append(self._score_match(match, match["resume_id"], job_id))
+        
+        # Filter and sort by hybrid score
+        matches = [m for m in matches if m["match_percentage"] >= min_score]
+        matches = sorted(matches, key=lambda x: x["hybrid_score"], reverse=True)[:limit]
+        
+        return matches
+
+    def match_candidate_to_jobs_hybrid(self, resume_id, limit=10, min_score=0.0):
+        """Find the best matching jobs for a candidate using hybrid retrieval.
+        
+        Skill-graph, lexical and embedding retrievers are fused with reciprocal
+        rank fusion and the fused pool is reranked with the hybrid score.
+        
+        Args:
+            resume_id: ID of the candidate to match against
+            limit: Maximum number of results to return
+            min_score: Minimum match score to include in results
             
-            # Get the skill coverage ratio for additional context
-            skill_coverage_ratio = len(matching_skills) / max(len(total_required_skills), 1)
+        Returns:
+            tuple: (list of job matches, per-retriever statistics)
+        """
+        fused, retrieval_stats = self._get_retrieval_service().retrieve_jobs_for_candidate(resume_id, limit=limit*3)
+        if not fused:
+            return [], retrieval_stats
+        
+        # Jobs found only by the lexical or embedding retrievers need their display fields
+        details = {row["job_id"]: row for row in self.job_repository.get_job_texts([entry["id"] for entry in fused])}
+        
+        matches = []
+        for entry in fused:
+            # The graph hit is this request's own row, so it is enriched in place
+            match = entry["hits"].get("graph") or MatchRow()
+            match["job_id"] = entry["id"]
+            match["resume_id"] = resume_id
+            match.setdefault("title", details.get(entry["id"], {}).get("title"))
+            match.setdefault("company", details.get(entry["id"], {}).get("company"))
+            match["rrf_score"] = entry["rrf_score"]
+            match["retrieval_sources"] = entry["sources"]
+            matches.append(self._score_match(match, resume_id, entry["id"]))
+        
+        # Filter and sort by hybrid score
+        matches = [m for m in matches if m["match_percentage"] >= min_score]
+        matches = sorted(matches, key=lambda x: x["hybrid_score"], reverse=True)[:limit]
+        
+        return matches, retrieval_stats
+    
+    def match_job_to_candidates_hybrid(self, job_id, limit=10, min_score=0.0):
+        """Find the best matching candidates for a job using hybrid retrieval.
+        
+        Args:
+            job_id: ID of the job to match against
+            limit: Maximum number of results to return
+            min_score: Minimum match score to include in results
             
-            # Enrich match data
-            match["hybrid_score"] = hybrid_score
-            match["match_percentage"] = _score_to_percentage(hybrid_score)
-            match["graph_score"] = graph_score
-            # Apply our percentage mapping to graph score for consistency
-            match["graph_percentage"] = _score_to_percentage(graph_score)
-            match["text_score"] = raw_text_score
-            # Use normalized text score for display
-            match["text_percentage"] = round(normalized_text_score * 100, 1)
-            match["matching_skills"] = matching_skills
-            match["missing_skills"] = missing_skills
-            match["exceeding_skills"] = exceeding_skills
-            matches.append(match)
+        Returns:
+            tuple: (list of candidate matches, per-retriever statistics)
+        """
+        fused, retrieval_stats = self._get_retrieval_service().retrieve_candidates_for_job(job_id, limit=limit*3)
+        if not fused:
+            return [], retrieval_stats
+        
+        # Candidates found only by the lexical or embedding retrievers need their display fields
+        details = {
+            row["resume_id"]: row
+            for row in self.candidate_repository.get_candidate_texts([entry["id"] for entry in fused])
+        }
+        
+        matches = []
+        for entry in fused:
+            match = entry["hits"].get("graph") or MatchRow()
+            match["resume_id"] = entry["id"]
+            match.setdefault("name", details.get(entry["id"], {}).get("name"))
+            match.setdefault("title", details.get(entry["id"], {}).get("title"))
+            match["rrf_score"] = entry["rrf_score"]
+            match["retrieval_sources"] = entry["sources"]
+            matches.append(self._score_match(match, entry["id"], job_id))
         
         # Filter and sort by hybrid score
         matches = [m for m in matches if m["match_percentage"] >= min_score]
         matches = sorted(matches, key=lambda x: x["hybrid_score"], reverse=True)[:limit]
         
-        return matches
+        return matches, retrieval_stats
         
-    def get_matching_jobs_for_candidate(self, resume_id, limit=10, min_score=0.0, weights=None):
+    def get_matching_jobs_for_candidate(self, resume_id, limit=10, min_score=0.0, weights=None, retrieval='graph'):
         """Service-level method to find jobs matching a candidate.
         
         This is the method that JobService and CandidateService should call.
@@ -211,6 +197,8 @@ class MatchingService:
             limit: Maximum number of results to return
             min_score: Minimum match score to include in results
             weights: Optional dictionary of weights for different aspects of matching
+            retrieval: 'graph' for skill-graph retrieval only, 'hybrid' for fused
+                graph, lexical and embedding retrieval
             
         Returns:
             dict: Dictionary with 'success' (bool) and 'jobs'/'error' keys
@@ -222,20 +210,27 @@ class MatchingService:
                 return {'success': False, 'error': f"Candidate with ID {resume_id} not found"}
             
             # Get matching jobs using the core matching algorithm
-            matches = self.match_candidate_to_jobs(resume_id, limit, min_score)
+            retrieval_stats = None
+            if retrieval == 'hybrid':
+                matches, retrieval_stats = self.match_candidate_to_jobs_hybrid(resume_id, limit, min_score)
+            else:
+                matches = self.match_candidate_to_jobs(resume_id, limit, min_score)
             
             # Format the results for consistent API using the utility function
             formatted_matches = format_match_results(matches)
             
-            return {
+            result = {
                 'success': True,
                 'jobs': formatted_matches,
                 'total': len(formatted_matches)
             }
+            if retrieval_stats is not None:
+                result['retrieval'] = retrieval_stats
+            return result
         except Exception as e:
             return {'success': False, 'error': f"Error finding matching jobs: {str(e)}"}
             
-    def get_matching_candidates_for_job(self, job_id, limit=10, min_score=0.0, weights=None):
+    def get_matching_candidates_for_job(self, job_id, limit=10, min_score=0.0, weights=None, retrieval='graph'):
         """Service-level method to find candidates matching a job.
         
         This is the method that JobService and CandidateService should call.
@@ -245,6 +240,8 @@ class MatchingService:
             limit: Maximum number of results to return
             min_score: Minimum match score to include in results
             weights: Optional dictionary of weights for different aspects of matching
+            retrieval: 'graph' for skill-graph retrieval only, 'hybrid' for fused
+                graph, lexical and embedding retrieval
             
         Returns:
             dict: Dictionary with 'success' (bool) and 'candidates'/'error' keys
@@ -256,16 +253,23 @@ class MatchingService:
                 return {'success': False, 'error': f"Job with ID {job_id} not found"}
             
             # Get matching candidates using the core matching algorithm
-            matches = self.match_job_to_candidates(job_id, limit, min_score)
+            retrieval_stats = None
+            if retrieval == 'hybrid':
+                matches, retrieval_stats = self.match_job_to_candidates_hybrid(job_id, limit, min_score)
+            else:
+                matches = self.match_job_to_candidates(job_id, limit, min_score)
             
             # Format the results for consistent API using the utility function
             formatted_matches = format_match_results(matches)
             
-            return {
+            result = {
                 'success': True,
                 'candidates': formatted_matches,
                 'total': len(formatted_matches)
             }
+            if retrieval_stats is not None:
+                result['retrieval'] = retrieval_stats
+            return result
         except Exception as e:
             return {'success': False, 'error': f"Error finding matching candidates: {str(e)}"}
     
@@ -299,6 +303,67 @@ class MatchingService:
     
     # PRIVATE HELPER METHODS
     
+    def _get_retrieval_service(self):
+        """Get the retrieval service used for hybrid matching."""
+        if self.retrieval_service is None:
+            from src.backend.services.retrieval_service import RetrievalService
+            self.retrieval_service = RetrievalService.get_instance(self.graph_service)
+        return self.retrieval_service
+    
+    def _score_match(self, match, resume_id, job_id):
+        """Compute the hybrid score of a candidate/job pair and enrich the match with it.
+        
+        Args:
+            match: Match record to enrich
+            resume_id: ID of the candidate
+            job_id: ID of the job
+            
+        Returns:
+            dict: The enriched match record
+        """
+        # Get skill details
+        matching_skills = self._get_matching_skills(resume_id, job_id)
+        missing_skills = self._get_missing_skills(resume_id, job_id)
+        exceeding_skills = self._get_exceeding_skills(resume_id, job_id)
+        
+        # Calculate graph-based score (normalized to 0-1 range)
+        total_required_skills = matching_skills + missing_skills
+        skill_match_score = self._calculate_skill_match_score(matching_skills, total_required_skills)
+        graph_score = skill_match_score / 100  # Normalize to 0-1 range
+        
+        # Calculate text similarity score (already normalized in the method)
+        raw_text_score, normalized_text_score = self._calculate_text_similarity(resume_id, job_id)
+        
+        # Calculate hybrid score using all components
+        hybrid_score = self._calculate_hybrid_score(
+            match.get("matchScore", 0.0),
+            matching_skills,
+            missing_skills,
+            exceeding_skills,
+            resume_id,
+            job_id,
+            raw_text_score,
+            graph_score
+        )
+        
+        # Get the skill coverage ratio for additional context
+        skill_coverage_ratio = len(matching_skills) / max(len(total_required_skills), 1)
+        
+        # Enrich match data
+        match["hybrid_score"] = hybrid_score
+        match["match_percentage"] = _score_to_percentage(hybrid_score)
+        match["graph_score"] = graph_score
+        # Apply our percentage mapping to graph score for consistency
+        match["graph_percentage"] = _score_to_percentage(graph_score)
+        match["text_score"] = raw_text_score
+        # Use normalized text score for display
+        match["text_percentage"] = round(normalized_text_score * 100, 1)
+        match["matching_skills"] = matching_skills
+        match["missing_skills"] = missing_skills
+        match["exceeding_skills"] = exceeding_skills
+        
+        return match
+    
     def _format_match_skills(self, match):
         """Format skills in match results.
         
@@ -398,17 +463,18 @@ class MatchingService:
         if self.text_matching_available:
             try:
                 # Use TF-IDF and cosine similarity for more sophisticated matching
-                from sklearn.metrics.pairwise import cosine_similarity
+                text_tools = load('sklearn_text')
                 
                 # Join multiple text fields
                 job_description = ' '.join(job_text)
                 candidate_experience = ' '.join(candidate_text)
                 
                 # Create TF-IDF vectors
-                tfidf_matrix = self.tfidf_vectorizer.fit_transform([job_description, candidate_experience])
+                tfidf_vectorizer = text_tools.TfidfVectorizer(stop_words='english')
+                tfidf_matrix = tfidf_vectorizer.fit_transform([job_description, candidate_experience])
                 
                 # Calculate cosine similarity
-                raw_score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+                raw_score = text_tools.cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
                 
                 # Return both raw score and normalized score
                 return raw_score, self._normalize_text_similarity_score(raw_score)
@@ -530,7 +596,8 @@ class MatchingService:
             ORDER BY importance DESC
         """
         
-        return self.job_repository.execute_read_query(query, {"resume_id": resume_id, "job_id": job_id})
+        return self.job_repository.execute_read_query(query, {"resume_id": resume_id, "job_id": job_id},
+                                                     row_type=SkillRow)
     
     def _get_missing_skills(self, resume_id, job_id):
         """Get skills required by the job but missing from the candidate."""
@@ -542,7 +609,8 @@ class MatchingService:
             ORDER BY importance DESC
         """
         
-        return self.job_repository.execute_read_query(query, {"resume_id": resume_id, "job_id": job_id})
+        return self.job_repository.execute_read_query(query, {"resume_id": resume_id, "job_id": job_id},
+                                                     row_type=SkillRow)
     
     def _get_exceeding_skills(self, resume_id, job_id):
         """Get skills the candidate has that exceed job requirements."""
@@ -554,7 +622,8 @@ class MatchingService:
             ORDER BY experience_years DESC
         """
         
-        return self.candidate_repository.execute_read_query(query, {"resume_id": resume_id, "job_id": job_id})
+        return self.candidate_repository.execute_read_query(query, {"resume_id": resume_id, "job_id": job_id},
+                                                           row_type=SkillRow)
     
     def _get_total_job_importance(self, job_id):
         """Calculate the total possible score for a job (sum of all skill importances with appropriate weights)."""
@@ -0,0 +1,367 @@
+"""
+Retrieval Service
+
+This module provides hybrid candidate generation for matching. Skill-graph,
+BM25 lexical and embedding (ANN) retrievers run in parallel threads, each with
+its own latency budget, and their rankings are fused with reciprocal rank fusion.
+
+Each retriever has its own bounded thread pool and never queues work: when all
+of its threads are busy, e.g. with calls that outlived their budget, the
+retriever is skipped for the request instead of delaying it. Lexical indexes
+are refreshed in the background while the previous index keeps serving.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+
+from src.backend.config import (
+    RETRIEVAL_GRAPH_BUDGET_MS,
+    RETRIEVAL_LEXICAL_BUDGET_MS,
+    RETRIEVAL_SEMANTIC_BUDGET_MS,
+    RETRIEVAL_RRF_K,
+    RETRIEVAL_MAX_WORKERS,
+    LEXICAL_INDEX_TTL_SECONDS
+)
+from src.backend.repositories.base.bookmarks import bookmark_scope, current_scope
+from src.backend.repositories.job_repository import JobRepository
+from src.backend.repositories.candidate_repository import CandidateRepository
+from src.backend.services.graph_service import GraphService
+from src.backend.utils.bm25 import BM25Index
+from src.backend.utils.embeddings import job_embedding_text, candidate_embedding_text
+
+
+RETRIEVERS = ('graph', 'lexical', 'semantic')
+
+
+def reciprocal_rank_fusion(ranked_lists, k=RETRIEVAL_RRF_K):
+    """Fuse several rankings with reciprocal rank fusion.
+
+    Each document scores sum(1 / (k + rank)) over the rankings it appears in,
+    with ranks starting at 1.
+
+    Args:
+        ranked_lists: Dictionary mapping retriever name to an ordered list of
+            (doc_id, payload) tuples
+        k: RRF damping constant
+
+    Returns:
+        list: Dictionaries with 'id', 'rrf_score', 'sources' (retriever -> rank)
+            and 'hits' (retriever -> payload), sorted by descending 'rrf_score'
+    """
+    fused = {}
+    for name, hits in ranked_lists.items():
+        for rank, (doc_id, payload) in enumerate(hits, start=1):
+            entry = fused.setdefault(doc_id, {'id': doc_id, 'rrf_score': 0.0, 'sources': {}, 'hits': {}})
+            # Keep the best rank if a retriever returns the same document twice
+            if name in entry['sources']:
+                continue
+            entry['rrf_score'] += 1.0 / (k + rank)
+            entry['sources'][name] = rank
+            entry['hits'][name] = payload
+
+    return sorted(fused.values(), key=lambda entry: entry['rrf_score'], reverse=True)
+
+
+class RetrievalService:
+    """Parallel hybrid retrieval over the knowledge graph."""
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls, graph_service=None):
+        """Get singleton instance of RetrievalService."""
+        if cls._instance is None:
+            if graph_service is None:
+                graph_service = GraphService.get_instance()
+            cls._instance = cls(graph_service)
+        return cls._instance
+
+    def __init__(self, graph_service, budgets_ms=None, rrf_k=RETRIEVAL_RRF_K,
+                 max_workers=RETRIEVAL_MAX_WORKERS):
+        """Initialize the service with a graph service.
+
+        Args:
+            graph_service: GraphService instance
+            budgets_ms: Optional dictionary overriding the latency budget of each retriever
+            rrf_k: Reciprocal rank fusion damping constant
+            max_workers: Number of threads of each retriever
+        """
+        self.graph_service = graph_service
+        self.driver = graph_service.driver
+
+        # Initialize repositories
+        self.job_repository = JobRepository(self.driver)
+        self.candidate_repository = CandidateRepository(self.driver)
+
+        budgets = {
+            'graph': RETRIEVAL_GRAPH_BUDGET_MS,
+            'lexical': RETRIEVAL_LEXICAL_BUDGET_MS,
+            'semantic': RETRIEVAL_SEMANTIC_BUDGET_MS
+        }
+        budgets.update(budgets_ms or {})
+        self.budgets = {name: budget / 1000.0 for name, budget in budgets.items()}
+        self.rrf_k = rrf_k
+
+        # A stalled retriever can only exhaust its own threads
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'retrieval-{name}')
+            for name in RETRIEVERS
+        }
+        self._slots = {name: threading.BoundedSemaphore(max_workers) for name in RETRIEVERS}
+
+        # Lexical indexes are rebuilt from the graph after LEXICAL_INDEX_TTL_SECONDS
+        self.lexical_index_ttl = LEXICAL_INDEX_TTL_SECONDS
+        self._lexical_indexes = {}
+        self._index_builds = {}
+        self._index_lock = threading.Lock()
+        self._index_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='lexical-index')
+
+        # Cumulative per-retriever statistics
+        self._stats_lock = threading.Lock()
+        self._stats = {name: self._empty_stats() for name in RETRIEVERS}
+
+    # MAIN PUBLIC INTERFACE METHODS
+
+    def retrieve_jobs_for_candidate(self, resume_id, limit=30):
+        """Retrieve candidate jobs for a candidate from all retrievers.
+
+        Args:
+            resume_id: ID of the candidate
+            limit: Number of results requested from each retriever and kept after fusion
+
+        Returns:
+            tuple: (fused results, per-retriever statistics for this request)
+        """
+        retrievers = {
+            'graph': lambda: [
+                (match['job_id'], match)
+                for match in self.candidate_repository.find_matching_jobs(resume_id, limit=limit)
+            ],
+            'lexical': lambda: self._lexical_search(
+                'jobs', self._candidate_query_text(resume_id), limit
+            ),
+            'semantic': lambda: [
+                (row['job_id'], row)
+                for row in self.candidate_repository.find_similar_jobs(resume_id, limit=limit)
+            ]
+        }
+        return self._retrieve(retrievers, limit)
+
+    def retrieve_candidates_for_job(self, job_id, limit=30):
+        """Retrieve candidates for a job from all retrievers.
+
+        Args:
+            job_id: ID of the job
+            limit: Number of results requested from each retriever and kept after fusion
+
+        Returns:
+            tuple: (fused results, per-retriever statistics for this request)
+        """
+        retrievers = {
+            'graph': lambda: [
+                (match['resume_id'], match)
+                for match in self.job_repository.find_matching_candidates(job_id, limit=limit)
+            ],
+            'lexical': lambda: self._lexical_search(
+                'candidates', self._job_query_text(job_id), limit
+            ),
+            'semantic': lambda: [
+                (row['resume_id'], row)
+                for row in self.job_repository.find_similar_candidates(job_id, limit=limit)
+            ]
+        }
+        return self._retrieve(retrievers, limit)
+
+    def get_stats(self):
+        """Get cumulative latency and contribution statistics per retriever.
+
+        Returns:
+            dict: Statistics keyed by retriever name
+        """
+        with self._stats_lock:
+            stats = {name: dict(values) for name, values in self._stats.items()}
+
+        for values in stats.values():
+            calls = values['calls']
+            values['avg_latency_ms'] = round(values['total_latency_ms'] / calls, 1) if calls else 0.0
+            values['timeout_rate'] = round(values['timeouts'] / calls, 3) if calls else 0.0
+        return stats
+
+    def reset_stats(self):
+        """Reset the cumulative retriever statistics."""
+        with self._stats_lock:
+            self._stats = {name: self._empty_stats() for name in RETRIEVERS}
+
+    def invalidate_lexical_indexes(self):
+        """Expire the cached lexical indexes so they are rebuilt in the background on next use."""
+        with self._index_lock:
+            self._lexical_indexes = {
+                corpus: (float('-inf'), index) for corpus, (_, index) in self._lexical_indexes.items()
+            }
+
+    # PRIVATE HELPER METHODS
+
+    def _retrieve(self, retrievers, limit):
+        """Run retrievers in parallel, wait at most each one's budget and fuse the results."""
+        started = time.perf_counter()
+        ranked = {}
+        stats = {}
+        futures = {}
+        # The worker threads have neither the caller's context nor its request
+        scope = current_scope()
+        for name, retriever in retrievers.items():
+            slots = self._slots[name]
+            if not slots.acquire(blocking=False):
+                # All threads of the retriever are busy; queueing would only spend the budget waiting
+                stats[name] = {'status': 'rejected', 'latency_ms': 0.0, 'returned': 0}
+                continue
+            try:
+                futures[name] = self._executors[name].submit(self._run_timed, retriever, slots, scope)
+            except Exception:
+                slots.release()
+                raise
+
+        for name, future in futures.items():
+            budget = self.budgets.get(name, 0.0)
+            # Budgets are measured from submission since all retrievers start together
+            remaining = max(0.0, budget - (time.perf_counter() - started))
+            try:
+                hits, latency = future.result(timeout=remaining)
+                ranked[name] = hits
+                stats[name] = {'status': 'ok', 'latency_ms': round(latency * 1000, 1), 'returned': len(hits)}
+            except FuturesTimeoutError:
+                # The retriever keeps its thread until it finishes; continue without it
+                stats[name] = {'status': 'timeout', 'latency_ms': round(budget * 1000, 1), 'returned': 0}
+            except Exception as e:
+                print(f"Error in {name} retriever: {str(e)}")
+                stats[name] = {
+                    'status': 'error',
+                    'latency_ms': round((time.perf_counter() - started) * 1000, 1),
+                    'returned': 0,
+                    'error': str(e)
+                }
+
+        fused = reciprocal_rank_fusion(ranked, k=self.rrf_k)[:limit]
+
+        for name, values in stats.items():
+            values['contributed'] = sum(1 for entry in fused if name in entry['sources'])
+            values['unique'] = sum(1 for entry in fused if list(entry['sources']) == [name])
+
+        self._record(stats)
+        return fused, stats
+
+    @staticmethod
+    def _run_timed(retriever, slots, scope):
+        """Run a retriever in the caller's bookmark scope, measure its own latency and free its thread slot."""
+        try:
+            started = time.perf_counter()
+            with bookmark_scope(scope):
+                hits = retriever()
+            return hits, time.perf_counter() - started
+        finally:
+            slots.release()
+
+    def _record(self, request_stats):
+        """Add the statistics of a single request to the cumulative statistics."""
+        with self._stats_lock:
+            for name, values in request_stats.items():
+                totals = self._stats.setdefault(name, self._empty_stats())
+                totals['calls'] += 1
+                totals['total_latency_ms'] += values['latency_ms']
+                totals['returned'] += values['returned']
+                totals['contributed'] += values['contributed']
+                totals['unique'] += values['unique']
+                if values['status'] == 'timeout':
+                    totals['timeouts'] += 1
+                elif values['status'] == 'rejected':
+                    totals['rejected'] += 1
+                elif values['status'] == 'error':
+                    totals['errors'] += 1
+
+    @staticmethod
+    def _empty_stats():
+        return {
+            'calls': 0, 'timeouts': 0, 'rejected': 0, 'errors': 0, 'total_latency_ms': 0.0,
+            'returned': 0, 'contributed': 0, 'unique': 0
+        }
+
+    def _lexical_search(self, corpus, query_text, limit):
+        """Search a cached BM25 index with the given query text."""
+        if not query_text:
+            return []
+        index = self._get_lexical_index(corpus)
+        return [
+            (doc_id, {'bm25_score': score})
+            for doc_id, score in index.search(query_text, limit=limit)
+        ]
+
+    def _get_lexical_index(self, corpus):
+        """Get the BM25 index of jobs or candidates.
+
+        An expired index is still returned while its replacement is built in
+        the background; only the very first use waits for a build.
+        """
+        entry = self._lexical_indexes.get(corpus)
+        if entry is not None:
+            if time.monotonic() - entry[0] >= self.lexical_index_ttl:
+                self._refresh_lexical_index(corpus)
+            return entry[1]
+        return self._refresh_lexical_index(corpus).result()
+
+    def _refresh_lexical_index(self, corpus):
+        """Start building an index in the background unless a build is already running.
+
+        Returns:
+            Future: The running build, resolving to the new index
+        """
+        with self._index_lock:
+            build = self._index_builds.get(corpus)
+            if build is None:
+                build = self._index_executor.submit(self._build_lexical_index, corpus)
+                self._index_builds[corpus] = build
+            return build
+
+    def _build_lexical_index(self, corpus):
+        """Build the BM25 index of a corpus from the graph and publish it."""
+        try:
+            if corpus == 'jobs':
+                documents = {row['job_id']: self._job_text(row) for row in self.job_repository.stream_job_texts()}
+            else:
+                documents = {
+                    row['resume_id']: self._candidate_text(row)
+                    for row in self.candidate_repository.stream_candidate_texts()
+                }
+
+            index = BM25Index(documents)
+            with self._index_lock:
+                self._lexical_indexes[corpus] = (time.monotonic(), index)
+            return index
+        except Exception as e:
+            print(f"Error building {corpus} lexical index: {str(e)}")
+            raise
+        finally:
+            with self._index_lock:
+                self._index_builds.pop(corpus, None)
+
+    def _candidate_query_text(self, resume_id):
+        """Build the lexical query text for a candidate."""
+        rows = self.candidate_repository.get_candidate_texts([resume_id])
+        return self._candidate_text(rows[0]) if rows else ""
+
+    def _job_query_text(self, job_id):
+        """Build the lexical query text for a job."""
+        rows = self.job_repository.get_job_texts([job_id])
+        return self._job_text(rows[0]) if rows else ""
+
+    @staticmethod
+    def _job_text(row):
+        """Build the searchable text of a job row."""
+        return " ".join(filter(None, [job_embedding_text(row)] + list(row.get('skills') or [])))
+
+    @staticmethod
+    def _candidate_text(row):
+        """Build the searchable text of a candidate row (the name is left out on purpose)."""
+        profile = {'title': row.get('title'), 'summary': row.get('summary')}
+        text = candidate_embedding_text(profile, row.get('experiences') or [])
+        return " ".join(filter(None, [text] + list(row.get('skills') or [])))
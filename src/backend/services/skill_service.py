@@ -6,7 +6,8 @@ This module provides business logic for skill-related operations in the talent m
 
 import uuid
 import datetime
-from src.backend.repositories.skill_repository import SkillRepository
+from src.backend.repositories.skill_repository import SkillRepository, SKILL_PAGE_KEY
+from src.backend.utils.pagination import next_cursor
 
 
 class SkillService:
@@ -141,20 +142,21 @@ class SkillService:
         except Exception as e:
             return {'success': False, 'error': f"Error deleting skill: {str(e)}"}
     
-    def find_skills(self, filters=None, limit=50, offset=0):
+    def find_skills(self, filters=None, limit=50, offset=0, cursor=None):
         """Find skills matching specified filters.
         
         Args:
             filters: Dictionary containing filter criteria
             limit: Maximum number of results to return
-            offset: Offset for pagination
+            offset: Offset for pagination, used without a cursor
+            cursor: next_cursor of the previous page
             
         Returns:
-            dict: Dictionary with 'success' (bool) and 'skills' or 'error' keys
+            dict: Dictionary with 'success' (bool) and 'skills', 'next_cursor' or 'error' keys
         """
         try:
             # Get skills from repository
-            skills = self.skill_repository.find_skills(filters, limit, offset)
+            skills = self.skill_repository.find_skills(filters, limit, offset, cursor)
             
             # Get total count
             total = len(skills)
@@ -164,7 +166,8 @@ class SkillService:
                 'skills': skills,
                 'total': total,
                 'limit': limit,
-                'offset': offset
+                'offset': offset,
+                'next_cursor': next_cursor(skills, limit, SKILL_PAGE_KEY)
             }
         
         except Exception as e:
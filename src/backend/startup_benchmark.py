@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Startup Benchmark for Talent Matcher
+
+This module measures where API cold-start time goes: the import cost of the
+backend application per top-level package, and the cost of the lazily loaded
+ML dependencies when they are warmed up. Every measurement runs in a fresh
+interpreter so module caches do not hide import time.
+Must be run from the project root directory.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from collections import defaultdict
+
+
+def parse_importtime(output):
+    """Aggregate `python -X importtime` output per top-level package.
+
+    Args:
+        output: stderr of an interpreter started with -X importtime
+
+    Returns:
+        tuple: (total microseconds, dict of package name to self microseconds)
+    """
+    per_package = defaultdict(int)
+    total = 0
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, self_us, _, name = [part.strip() for part in line.replace("import time:", "|", 1).split("|")]
+            self_us = int(self_us)
+        except ValueError:
+            continue
+        per_package[name.split(".")[0]] += self_us
+        total += self_us
+    return total, dict(per_package)
+
+
+def measure_import_times(module="src.backend.app"):
+    """Import a module in a fresh interpreter and report import time per package.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        tuple: (total microseconds, dict of package name to self microseconds)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure_warm_up():
+    """Warm up the lazily loaded ML dependencies in a fresh interpreter.
+
+    Returns:
+        dict: Seconds per loader, or an error message for loaders that failed
+    """
+    code = (
+        "import json\n"
+        "from src.backend.utils.lazy_loader import warm_up\n"
+        "print(json.dumps(warm_up(include_hooks=False)))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Warm-up failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    """CLI entry point for the startup benchmark.
+
+    Args:
+        argv: Command-line arguments, defaults to sys.argv
+    """
+    parser = argparse.ArgumentParser(description="Measure Talent Matcher backend startup time")
+    parser.add_argument("--module", default="src.backend.app", help="Module whose import time is measured")
+    parser.add_argument("--top", type=int, default=15, help="Number of packages to show")
+    args = parser.parse_args(argv)
+
+    total, per_package = measure_import_times(args.module)
+    print(f"Import of {args.module}: {total / 1000:.1f} ms")
+    print(f"{'package':<30} {'ms':>10} {'share':>8}")
+    for package, self_us in sorted(per_package.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{package:<30} {self_us / 1000:>10.1f} {self_us / max(total, 1):>8.1%}")
+
+    print("\nDeferred ML dependencies (loaded on first use or with --preload):")
+    for name, seconds in measure_warm_up().items():
+        value = f"{seconds * 1000:.1f} ms" if isinstance(seconds, (int, float)) else seconds
+        print(f"{name:<30} {value:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""
+Batching Utilities
+
+This module provides helpers for splitting row streams into fixed-size batches
+for bulk database writes.
+"""
+
+from itertools import islice
+
+
+def chunked(rows, size):
+    """Split an iterable into lists of at most `size` items.
+
+    Works with any iterable, including generators, without materializing it.
+
+    Args:
+        rows: Iterable of items
+        size: Maximum number of items per batch
+
+    Yields:
+        list: The next batch of items
+    """
+    if size < 1:
+        raise ValueError("Batch size must be at least 1")
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,101 @@
+"""
+BM25 Utilities
+
+This module provides a small in-memory BM25 index used for lexical retrieval
+of jobs and candidates.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+
+
+# Very common words that carry no matching signal
+STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 'about', 'of', 'as', 'from',
+    'this', 'that', 'it', 'its', 'we', 'you', 'our', 'your', 'will', 'i', 'my'
+})
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def tokenize(text):
+    """Split text into lowercase tokens without stopwords.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        list: Tokens
+    """
+    if not text:
+        return []
+    tokens = (token.rstrip('.') for token in _TOKEN_PATTERN.findall(text.lower()))
+    return [token for token in tokens if token and token not in STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 index over a fixed set of documents."""
+
+    def __init__(self, documents, k1=1.5, b=0.75):
+        """Build the index.
+
+        Args:
+            documents: Dictionary mapping document ID to document text
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings = defaultdict(list)
+        self.doc_lengths = {}
+
+        for doc_id, text in documents.items():
+            term_counts = Counter(tokenize(text))
+            self.doc_lengths[doc_id] = sum(term_counts.values())
+            for term, count in term_counts.items():
+                self.postings[term].append((doc_id, count))
+
+        self.doc_count = len(self.doc_lengths)
+        total_length = sum(self.doc_lengths.values())
+        self.avg_doc_length = total_length / self.doc_count if self.doc_count else 0.0
+
+    def __len__(self):
+        return self.doc_count
+
+    def _idf(self, term):
+        """Inverse document frequency of a term (BM25+ style, never negative)."""
+        doc_freq = len(self.postings.get(term, ()))
+        return math.log(1 + (self.doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def search(self, query, limit=10, exclude=None):
+        """Score documents against a query.
+
+        Only documents sharing at least one term with the query are scored.
+
+        Args:
+            query: Query text
+            limit: Maximum number of results to return
+            exclude: Optional document ID to leave out of the results
+
+        Returns:
+            list: (doc_id, score) tuples sorted by descending score
+        """
+        if not self.doc_count:
+            return []
+
+        scores = defaultdict(float)
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf(term)
+            for doc_id, term_freq in postings:
+                length_norm = 1 - self.b + self.b * self.doc_lengths[doc_id] / (self.avg_doc_length or 1.0)
+                scores[doc_id] += idf * term_freq * (self.k1 + 1) / (term_freq + self.k1 * length_norm)
+
+        if exclude is not None:
+            scores.pop(exclude, None)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
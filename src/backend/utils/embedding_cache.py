@@ -0,0 +1,190 @@
+"""
+Embedding Cache
+
+This module provides an on-disk SQLite cache from (model, normalized text hash)
+to embedding vector, so unchanged texts are never encoded twice.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from array import array
+
+from src.backend.config import EMBEDDING_CACHE_PATH, EMBEDDING_MODEL_NAME, EMBEDDING_MODEL_VERSION
+
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text):
+    """Normalize text before hashing so whitespace-only changes hit the cache.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        str: Text with collapsed whitespace
+    """
+    return _WHITESPACE_PATTERN.sub(" ", text or "").strip()
+
+
+def text_hash(text):
+    """Hash the normalized form of a text.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite backed key-value store of text embeddings."""
+
+    def __init__(self, path, model_key):
+        """Open (or create) the cache.
+
+        Args:
+            path: SQLite database file, or ':memory:'
+            model_key: Model name and version; vectors of other models are never returned
+        """
+        self.path = path
+        self.model_key = model_key
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (model, text_hash)
+                )
+            """)
+            self._connection.commit()
+
+    def get_many(self, texts):
+        """Look up the cached vectors of several texts.
+
+        Args:
+            texts: List of texts
+
+        Returns:
+            dict: Mapping from text hash to vector (list of floats) for the cached texts
+        """
+        return self._lookup({text_hash(text) for text in texts})
+
+    def _lookup(self, hashes):
+        """Fetch the vectors stored under the given text hashes."""
+        hashes = list(hashes)
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's bound parameter limit
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    [self.model_key] + chunk
+                )
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        return found
+
+    def put_many(self, texts, vectors):
+        """Store vectors for texts.
+
+        Args:
+            texts: List of texts
+            vectors: Vectors in the same order as texts
+        """
+        rows = [
+            (self.model_key, text_hash(text), array("f", [float(value) for value in vector]).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)", rows
+            )
+            self._connection.commit()
+
+    def encode(self, model, texts, batch_size=32):
+        """Encode texts, only running the model for texts missing from the cache.
+
+        Duplicate texts are encoded once.
+
+        Args:
+            model: Object with a SentenceTransformer-compatible encode(texts, batch_size=...) method
+            texts: List of texts
+            batch_size: Batch size passed to the model
+
+        Returns:
+            list: One vector (list of floats) per text
+        """
+        hashes = [text_hash(text) for text in texts]
+        cached = self._lookup(set(hashes))
+
+        missing = {}
+        for key, text in zip(hashes, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+
+        self.hits += sum(1 for key in hashes if key in cached)
+        self.misses += len(missing)
+
+        if missing:
+            missing_texts = list(missing.values())
+            vectors = [list(map(float, vector)) for vector in model.encode(missing_texts, batch_size=batch_size)]
+            self.put_many(missing_texts, vectors)
+            cached.update(zip(missing.keys(), vectors))
+
+        return [cached[key] for key in hashes]
+
+    def stats(self):
+        """Get cache hit statistics.
+
+        Returns:
+            dict: Hits, misses and number of stored vectors for this model
+        """
+        with self._lock:
+            size = self._connection.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model = ?", (self.model_key,)
+            ).fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "size": size}
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache():
+    """Get the process-wide embedding cache configured in src.backend.config.
+
+    Returns:
+        EmbeddingCache: The cache, or None when EMBEDDING_CACHE_PATH is empty
+    """
+    global _cache
+    if not EMBEDDING_CACHE_PATH:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache(EMBEDDING_CACHE_PATH, f"{EMBEDDING_MODEL_NAME}@{EMBEDDING_MODEL_VERSION}")
+        return _cache
@@ -0,0 +1,205 @@
+"""
+Embedding Utilities
+
+This module provides helpers for building embedding texts and for computing
+semantic similarity between jobs and candidate experiences with NumPy.
+"""
+
+import json
+
+import numpy as np
+
+
+# Default number of semantic matches kept per job and per candidate
+DEFAULT_SEMANTIC_TOP_K = 50
+
+# Number of experience vectors scored against all jobs at once
+DEFAULT_SIMILARITY_BLOCK_SIZE = 20000
+
+
+def _as_text_list(value):
+    """Convert a stored text field (list, JSON string or plain string) to a list of strings."""
+    if isinstance(value, list):
+        return [str(item) for item in value if item]
+    if isinstance(value, str) and value:
+        try:
+            parsed = json.loads(value)
+            if isinstance(parsed, list):
+                return [str(item) for item in parsed if item]
+        except json.JSONDecodeError:
+            pass
+        return [value]
+    return []
+
+
+def job_embedding_text(job):
+    """Build the text that is embedded for a job.
+
+    Args:
+        job: Mapping with title, description, responsibilities and qualifications
+
+    Returns:
+        str: Combined job text
+    """
+    parts = [job.get('title') or '', job.get('description') or '']
+    parts.extend(_as_text_list(job.get('responsibilities')))
+    parts.extend(_as_text_list(job.get('qualifications')))
+    return " ".join(part for part in parts if part).strip()
+
+
+def experience_embedding_text(experience):
+    """Build the text that is embedded for a single experience.
+
+    Args:
+        experience: Mapping with job_title (or title), company and description
+
+    Returns:
+        str: Combined experience text
+    """
+    parts = [experience.get('job_title') or experience.get('title') or '',
+             experience.get('company') or '']
+    parts.extend(_as_text_list(experience.get('description')))
+    return " ".join(part for part in parts if part).strip()
+
+
+def candidate_embedding_text(candidate, experiences=None):
+    """Build the text that is embedded for a candidate profile.
+
+    Args:
+        candidate: Mapping with name, title and summary
+        experiences: Optional list of experience mappings
+
+    Returns:
+        str: Combined candidate text
+    """
+    parts = [candidate.get('name') or '', candidate.get('title') or '', candidate.get('summary') or '']
+    for experience in experiences or []:
+        parts.append(experience_embedding_text(experience))
+    return " ".join(part for part in parts if part).strip()
+
+
+def normalize_rows(vectors):
+    """L2-normalize each row of a matrix so dot products become cosine similarities.
+
+    Args:
+        vectors: Array-like of shape (n, d)
+
+    Returns:
+        numpy.ndarray: float32 array of shape (n, d) with unit-length rows
+    """
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def max_similarity_by_group(query_vectors, item_vectors, group_counts):
+    """Compute the maximum cosine similarity between each query and each group of items.
+
+    Items must be ordered so that the items of one group are contiguous, e.g. all
+    experiences of a candidate follow each other.
+
+    Args:
+        query_vectors: Array of shape (n_queries, d)
+        item_vectors: Array of shape (n_items, d)
+        group_counts: Number of items in each group, summing to n_items
+
+    Returns:
+        numpy.ndarray: Array of shape (n_queries, n_groups)
+    """
+    counts = np.asarray(group_counts, dtype=np.int64)
+    queries = normalize_rows(query_vectors)
+    if len(counts) == 0 or counts.sum() == 0:
+        return np.zeros((queries.shape[0], len(counts)), dtype=np.float32)
+
+    items = normalize_rows(item_vectors)
+    similarities = queries @ items.T
+
+    # reduceat cannot express empty groups, so reduce the non-empty ones only
+    result = np.zeros((queries.shape[0], len(counts)), dtype=np.float32)
+    non_empty = counts > 0
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))[non_empty]
+    result[:, non_empty] = np.maximum.reduceat(similarities, offsets, axis=1)
+    return result
+
+
+def _top_k_indices(scores, k):
+    """Return the indices of the k highest scores in each row, unordered."""
+    if scores.shape[1] <= k:
+        return np.tile(np.arange(scores.shape[1]), (scores.shape[0], 1))
+    return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+
+def top_k_semantic_matches(job_ids, job_vectors, resume_ids, experience_vectors, experience_counts,
+                           top_k=DEFAULT_SEMANTIC_TOP_K, block_size=DEFAULT_SIMILARITY_BLOCK_SIZE):
+    """Compute the best (job, candidate) semantic pairs from job and experience embeddings.
+
+    The candidate score for a job is the maximum similarity across the candidate's
+    experiences. The top_k candidates of every job and the top_k jobs of every
+    candidate are kept. Experiences are processed in blocks so memory stays bounded
+    by block_size * n_jobs.
+
+    Args:
+        job_ids: List of job IDs
+        job_vectors: Array of shape (n_jobs, d)
+        resume_ids: List of candidate IDs, in the same order as their experiences
+        experience_vectors: Array of shape (n_experiences, d)
+        experience_counts: Number of experiences per candidate
+        top_k: Number of matches to keep per job and per candidate
+        block_size: Approximate number of experiences scored at once
+
+    Returns:
+        list: Dictionaries with 'job_id', 'resume_id' and 'score' keys
+    """
+    if not job_ids or not resume_ids:
+        return []
+
+    jobs = normalize_rows(job_vectors)
+    experiences = np.asarray(experience_vectors, dtype=np.float32)
+    counts = np.asarray(experience_counts, dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    pairs = {}
+    best_scores = np.full((len(job_ids), 0), -np.inf, dtype=np.float32)
+    best_candidates = np.zeros((len(job_ids), 0), dtype=np.int64)
+
+    start = 0
+    while start < len(resume_ids):
+        # Grow the block candidate by candidate so experiences are never split
+        end = int(np.searchsorted(offsets, offsets[start] + block_size, side='right')) - 1
+        end = min(max(end, start + 1), len(resume_ids))
+
+        block_scores = max_similarity_by_group(
+            jobs, experiences[offsets[start]:offsets[end]], counts[start:end]
+        )
+        block_scores[:, counts[start:end] == 0] = -np.inf
+
+        # Top jobs for each candidate in this block are final
+        job_index = _top_k_indices(block_scores.T, top_k)
+        for local, row in enumerate(job_index):
+            for j in row:
+                score = block_scores[j, local]
+                if np.isfinite(score):
+                    pairs[(job_ids[j], resume_ids[start + local])] = float(score)
+
+        # Merge running top candidates for each job
+        merged_scores = np.concatenate((best_scores, block_scores), axis=1)
+        merged_candidates = np.concatenate(
+            (best_candidates, np.tile(np.arange(start, end), (len(job_ids), 1))), axis=1
+        )
+        keep = _top_k_indices(merged_scores, top_k)
+        best_scores = np.take_along_axis(merged_scores, keep, axis=1)
+        best_candidates = np.take_along_axis(merged_candidates, keep, axis=1)
+        start = end
+
+    for j, job_id in enumerate(job_ids):
+        for score, c in zip(best_scores[j], best_candidates[j]):
+            if np.isfinite(score):
+                pairs[(job_id, resume_ids[c])] = float(score)
+
+    return [
+        {'job_id': job_id, 'resume_id': resume_id, 'score': score}
+        for (job_id, resume_id), score in pairs.items()
+    ]
@@ -4,6 +4,25 @@ Formatter Utilities
 This module provides functions for formatting data for API responses.
 """
 
+from flask.json.provider import DefaultJSONProvider
+
+from src.backend.models.record_model import Record
+
+
+class RecordJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes repository records as objects.
+    
+    Records stay compact through the service layer and are converted to
+    dictionaries only while the response is encoded.
+    """
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, Record):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+
+
 def format_match_results(matches):
     """Format match results for frontend display with consistent scoring and skill data.
     
@@ -16,7 +35,9 @@ def format_match_results(matches):
     formatted_matches = []
     
     for match in matches:
-        formatted_match = dict(match)  # Create a copy to avoid modifying the original
+        # Records (see record_model) belong to the response being built and are
+        # formatted in place; plain dictionaries are copied to leave the original intact
+        formatted_match = match if isinstance(match, Record) else dict(match)
         
         # Ensure match_percentage exists
         if 'match_percentage' not in formatted_match:
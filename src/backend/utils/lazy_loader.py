@@ -0,0 +1,127 @@
+"""
+Lazy Loader
+
+This module defers heavy NLP/ML imports (scikit-learn, sentence-transformers
+and torch) until they are first used, so the API starts quickly. Production
+workers can still load everything eagerly with warm_up(), e.g. before forking.
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+from types import SimpleNamespace
+
+
+_loaders = {}
+_warmup_hooks = {}
+_load_times = {}
+_lock = threading.Lock()
+
+
+def register_loader(name, loader):
+    """Register a named loader.
+
+    Args:
+        name: Name used with load()
+        loader: Callable performing the imports and returning the loaded object
+    """
+    _loaders[name] = loader
+
+
+def register_warmup_hook(name, hook):
+    """Register an extra warm-up step, e.g. loading a model into memory.
+
+    Args:
+        name: Name of the step, reported by warm_up()
+        hook: Callable without arguments
+    """
+    _warmup_hooks[name] = hook
+
+
+def load(name):
+    """Run a registered loader.
+
+    Python caches imported modules, so calling this repeatedly is cheap. The
+    duration of the first successful load is recorded.
+
+    Args:
+        name: Name of a registered loader
+
+    Returns:
+        object: Whatever the loader returns
+
+    Raises:
+        ImportError: If the underlying library is not installed
+    """
+    started = time.perf_counter()
+    result = _loaders[name]()
+    with _lock:
+        _load_times.setdefault(name, time.perf_counter() - started)
+    return result
+
+
+def is_available(module_name):
+    """Check whether a module can be imported, without importing it.
+
+    Args:
+        module_name: Top-level module name
+
+    Returns:
+        bool: True if the module is installed
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def warm_up(names=None, include_hooks=True):
+    """Eagerly run loaders and warm-up hooks.
+
+    Args:
+        names: Loader names to run, or None for all registered loaders
+        include_hooks: Whether to run the registered warm-up hooks as well
+
+    Returns:
+        dict: Seconds taken per step, or the error message for steps that failed
+    """
+    report = {}
+    steps = [(name, lambda name=name: load(name)) for name in (names or list(_loaders))]
+    if include_hooks:
+        steps.extend(_warmup_hooks.items())
+
+    for name, step in steps:
+        started = time.perf_counter()
+        try:
+            step()
+            report[name] = round(time.perf_counter() - started, 3)
+        except Exception as e:
+            report[name] = f"failed: {str(e)}"
+    return report
+
+
+def get_load_times():
+    """Get the recorded first-load duration of each loader.
+
+    Returns:
+        dict: Seconds per loader name
+    """
+    with _lock:
+        return dict(_load_times)
+
+
+def _load_sklearn_text():
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    return SimpleNamespace(TfidfVectorizer=TfidfVectorizer, cosine_similarity=cosine_similarity)
+
+
+def _load_sentence_transformers():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer
+
+
+register_loader('numpy', lambda: importlib.import_module('numpy'))
+register_loader('sklearn_text', _load_sklearn_text)
+register_loader('sentence_transformers', _load_sentence_transformers)
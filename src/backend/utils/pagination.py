@@ -0,0 +1,115 @@
+"""
+Keyset Pagination
+
+This module provides the cursors of keyset (seek) pagination. A list query
+is ordered by a sort key plus a unique tiebreaker, e.g. (created_at, job_id).
+Instead of skipping the rows of all earlier pages, the next page starts after
+the key of the last row returned, which the cursor encodes. With an index on
+the sort key, every page costs the same as the first.
+
+Cursors are opaque to clients: URL-safe base64 of the JSON encoded key.
+
+Cypher sorts null last in ascending and first in descending order, and
+comparisons with null are never true. A cursor whose sort key is null, e.g.
+a job stored without created_at, therefore needs its own predicate; see
+keyset_condition.
+"""
+
+import base64
+import binascii
+import json
+
+
+def encode_cursor(values):
+    """Encode the key of the last row of a page as a cursor.
+
+    Args:
+        values: Sort key and tiebreaker values
+
+    Returns:
+        str: Opaque cursor
+    """
+    data = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, size=2):
+    """Decode a cursor into the key it encodes.
+
+    Args:
+        cursor: Cursor returned by encode_cursor
+        size: Expected number of key values
+
+    Returns:
+        list: Sort key and tiebreaker values
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (TypeError, ValueError, UnicodeError, binascii.Error):
+        raise ValueError("Invalid cursor") from None
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def next_cursor(rows, limit, key):
+    """Get the cursor of the page after a list of rows.
+
+    A page shorter than the limit is the last one. A full page always gets a
+    cursor, so the page after it may be empty.
+
+    Args:
+        rows: Rows of the current page as dictionaries
+        limit: Page size the rows were requested with
+        key: Names of the sort key and tiebreaker columns of the rows
+
+    Returns:
+        str: Cursor of the next page, or None after the last page
+    """
+    if not rows or len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1].get(column) for column in key)
+
+
+def keyset_condition(sort_property, tiebreaker, descending=False, null_key=False):
+    """Build the Cypher predicate selecting the rows after a cursor.
+
+    The predicate is written as a range on the sort property, which an index
+    on it can seek, refined by the tiebreaker for equal sort values. The
+    parameters are $after_key and $after_id, see cursor_parameters.
+
+    After a null sort key the page continues with the remaining rows of null
+    key, then, in descending order, with all rows that have one. Rows with a
+    null key sort after every cursor with a key in ascending order, so they
+    are only listed by ascending queries whose sort key is always written.
+
+    Args:
+        sort_property: Sort property, e.g. 'j.created_at'
+        tiebreaker: Unique property breaking ties, e.g. 'j.job_id'
+        descending: Whether the query orders both properties descending
+        null_key: Whether the sort key of the cursor is null
+
+    Returns:
+        str: Cypher predicate
+    """
+    inclusive, exclusive = ("<=", "<") if descending else (">=", ">")
+    if null_key and descending:
+        return f"({sort_property} IS NOT NULL OR {tiebreaker} < $after_id)"
+    if null_key:
+        return f"{sort_property} IS NULL AND {tiebreaker} > $after_id"
+    return (f"{sort_property} {inclusive} $after_key AND "
+            f"({sort_property} {exclusive} $after_key OR {tiebreaker} {exclusive} $after_id)")
+
+
+def cursor_parameters(cursor):
+    """Get the query parameters of keyset_condition from a cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    after_key, after_id = decode_cursor(cursor, 2)
+    return {"after_key": after_key, "after_id": after_id}
@@ -0,0 +1,184 @@
+"""
+Query Result Cache
+
+This module provides a process-wide, read-through cache for repository read
+queries. Entries are bounded by an LRU limit, expire after a per-query TTL
+and carry tags so writes can invalidate exactly the reads they affect:
+
+- A label tag such as 'Job' marks a read over many nodes of that label
+  (lists, filter options, networks).
+- An entity tag such as 'Job:job_1' marks a read of one node.
+
+Invalidating a label tag drops every entry of that label, entity tags
+included. Invalidating an entity tag drops the entries of that entity and
+the label-level entries, since collections may contain it. Statistics are
+kept per query name.
+
+The cache only sees writes made by this process, so in deployments with
+several API processes the TTL bounds how stale a read can be.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from src.backend.config import QUERY_CACHE_ENABLED, QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_TTL_SECONDS
+
+
+_LABEL_PATTERN = re.compile(r":\s*`?([A-Z][A-Za-z0-9_]*)")
+
+_STAT_NAMES = ('hits', 'misses', 'expired', 'evictions', 'invalidations')
+
+
+@lru_cache(maxsize=1024)
+def query_labels(query):
+    """Get the labels and relationship types a Cypher query mentions.
+
+    Used as the invalidation tags of writes that declare none.
+
+    Args:
+        query: Cypher query string
+
+    Returns:
+        tuple: Sorted label and relationship type names
+    """
+    return tuple(sorted(set(_LABEL_PATTERN.findall(query))))
+
+
+class QueryCache:
+    """LRU cache of read query results with TTL and tag invalidation."""
+
+    def __init__(self, max_entries=QUERY_CACHE_MAX_ENTRIES, ttl_seconds=QUERY_CACHE_TTL_SECONDS,
+                 enabled=QUERY_CACHE_ENABLED):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            ttl_seconds: Default time to live of an entry
+            enabled: Whether lookups and stores are performed at all
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        # Incremented by every invalidation; a result read before the last
+        # invalidation may be stale and is not stored
+        self.version = 0
+        # key -> (name, expires_at, tags, rows)
+        self._entries = OrderedDict()
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(name, query, parameters):
+        """Build the cache key of a query execution."""
+        return name, query, json.dumps(parameters or {}, sort_keys=True, default=str)
+
+    def get(self, key):
+        """Look up a result.
+
+        Args:
+            key: Key returned by make_key
+
+        Returns:
+            tuple: (True, rows) on a hit, (False, None) otherwise; rows are copies
+        """
+        name = key[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                self._count(name, 'expired')
+                entry = None
+            if entry is None:
+                self._count(name, 'misses')
+                return False, None
+            self._entries.move_to_end(key)
+            self._count(name, 'hits')
+            rows = entry[3]
+        return True, [dict(row) for row in rows]
+
+    def put(self, key, rows, tags=(), ttl=None, version=None):
+        """Store a result.
+
+        Args:
+            key: Key returned by make_key
+            rows: List of records as dictionaries
+            tags: Label and entity tags of the result
+            ttl: Time to live in seconds, defaults to the cache TTL
+            version: Cache version read before the query ran; the result is
+                dropped if an invalidation happened since
+        """
+        ttl = self.ttl_seconds if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._entries[key] = (key[0], time.monotonic() + ttl, frozenset(tags),
+                                  [dict(row) for row in rows])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, (evicted_name, _, _, _) = self._entries.popitem(last=False)
+                self._count(evicted_name, 'evictions')
+
+    def invalidate(self, tags):
+        """Drop the entries affected by a write.
+
+        Args:
+            tags: Label tags ('Job') and entity tags ('Job:job_1') written to
+        """
+        labels = {tag for tag in tags if ':' not in tag}
+        entities = {tag for tag in tags if ':' in tag}
+        # Label-level entries of the written entities' labels
+        collections = {tag.split(':', 1)[0] for tag in entities}
+
+        def affected(entry_tags):
+            return any(tag in entities or tag in collections or tag.split(':', 1)[0] in labels
+                       for tag in entry_tags)
+
+        with self._lock:
+            self.version += 1
+            stale = [key for key, (_, _, entry_tags, _) in self._entries.items() if affected(entry_tags)]
+            for key in stale:
+                self._count(key[0], 'invalidations')
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all entries, e.g. after the database was cleared."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def stats(self):
+        """Get the statistics per query name.
+
+        Returns:
+            dict: Query name to hits, misses, expired, evictions, invalidations,
+                current entries and hit rate
+        """
+        with self._lock:
+            entries = {}
+            for name, _, _, _ in self._entries.values():
+                entries[name] = entries.get(name, 0) + 1
+            stats = {}
+            for name, counts in self._stats.items():
+                lookups = counts['hits'] + counts['misses']
+                stats[name] = {
+                    **counts,
+                    'entries': entries.get(name, 0),
+                    'hit_rate': round(counts['hits'] / lookups, 3) if lookups else None
+                }
+            return stats
+
+    def _count(self, name, stat):
+        """Increment a statistic of a query name; the lock must be held."""
+        counts = self._stats.get(name)
+        if counts is None:
+            counts = self._stats[name] = dict.fromkeys(_STAT_NAMES, 0)
+        counts[stat] += 1
+
+
+query_cache = QueryCache()
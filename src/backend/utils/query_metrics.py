@@ -0,0 +1,334 @@
+"""
+Query Metrics
+
+This module provides process-wide timing of Cypher executions. Every
+execution is recorded under a stable query name together with the number of
+rows it returned, the server time and the update counters of its result
+summary, and aggregated per name into a latency histogram. Executions
+slower than QUERY_SLOW_MS are also kept in a bounded slow-query log.
+
+Repositories record their queries through BaseRepository. Services and ETL
+code that run queries on a session directly use timed_run, which wraps the
+result and records the execution once it has been consumed.
+"""
+
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+
+from src.backend.config import QUERY_SLOW_MS, QUERY_SLOW_LOG_SIZE
+from src.backend.utils.write_counters import COUNTER_NAMES
+
+
+# Upper bounds of the latency histogram buckets in milliseconds; the last
+# bucket counts everything slower
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Length of the query text kept in the slow-query log
+SLOW_QUERY_TEXT_LENGTH = 500
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryMetrics:
+    """Latency histograms, row and update counts per query name, and a slow-query log."""
+
+    def __init__(self, slow_ms=QUERY_SLOW_MS, slow_log_size=QUERY_SLOW_LOG_SIZE):
+        """Initialize empty metrics.
+
+        Args:
+            slow_ms: Executions taking at least this many milliseconds are
+                logged as slow; a negative value disables the log
+            slow_log_size: Number of slow executions kept, oldest dropped first
+        """
+        self.slow_ms = slow_ms
+        self._queries = {}
+        self._slow = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+
+    def record(self, name, elapsed_ms, rows=0, summary=None, query=None, parameters=None, error=None):
+        """Record one query execution.
+
+        Args:
+            name: Stable name of the query, e.g. 'JobRepository.get_job'
+            elapsed_ms: Client-side duration of the execution
+            rows: Number of records returned
+            summary: neo4j ResultSummary, if the result was consumed
+            query: Cypher query string, kept in the slow-query log
+            parameters: Query parameters; only their names are logged
+            error: Exception the execution failed with, if any
+        """
+        counters = self._summary_counters(summary)
+        server_ms = self._server_ms(summary)
+        with self._lock:
+            stats = self._queries.get(name)
+            if stats is None:
+                stats = self._queries[name] = {
+                    'count': 0,
+                    'errors': 0,
+                    'rows': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'server_ms': 0,
+                    'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                    'counters': dict.fromkeys(COUNTER_NAMES, 0)
+                }
+            stats['count'] += 1
+            stats['errors'] += error is not None
+            stats['rows'] += rows
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            stats['server_ms'] += server_ms
+            stats['buckets'][bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+            for counter, value in counters.items():
+                stats['counters'][counter] += value
+
+            slow = 0 <= self.slow_ms <= elapsed_ms
+            if slow:
+                self._slow.append({
+                    'name': name,
+                    'elapsed_ms': round(elapsed_ms, 3),
+                    'server_ms': server_ms,
+                    'rows': rows,
+                    'error': str(error) if error is not None else None,
+                    'query': _WHITESPACE.sub(" ", query or "").strip()[:SLOW_QUERY_TEXT_LENGTH],
+                    'parameters': sorted(parameters) if isinstance(parameters, dict) else [],
+                    'at': time.time()
+                })
+        if slow:
+            print(f"Slow query {name}: {elapsed_ms:.1f} ms, {rows} rows")
+
+    @contextmanager
+    def measure(self, name, query=None, parameters=None):
+        """Time the execution of a query in a with block.
+
+        The block reports its outcome on the yielded Measurement; an exception
+        raised in the block is recorded as an error and re-raised.
+
+            with query_metrics.measure(name, query, parameters) as measurement:
+                result = tx.run(query, parameters)
+                records = [dict(record) for record in result]
+                measurement.done(len(records), result.consume())
+
+        Yields:
+            Measurement: Receives the row count and summary of the execution
+        """
+        measurement = Measurement()
+        started = time.perf_counter()
+        try:
+            yield measurement
+        except BaseException as e:
+            self.record(name, (time.perf_counter() - started) * 1000, measurement.rows,
+                        measurement.summary, query, parameters, error=e)
+            raise
+        self.record(name, (time.perf_counter() - started) * 1000, measurement.rows,
+                    measurement.summary, query, parameters)
+
+    def snapshot(self):
+        """Get the metrics of all query names and the slow-query log.
+
+        Returns:
+            dict: 'queries' maps each name to count, errors, rows, total, mean,
+                max and estimated percentile latencies, server time, update
+                counters and histogram; 'slow_queries' lists the slow
+                executions, most recent last
+        """
+        with self._lock:
+            queries = {name: self._summarize(stats) for name, stats in self._queries.items()}
+            slow = [dict(entry) for entry in self._slow]
+        return {
+            'slow_query_ms': self.slow_ms,
+            'queries': queries,
+            'slow_queries': slow
+        }
+
+    def reset(self):
+        """Drop all recorded executions."""
+        with self._lock:
+            self._queries.clear()
+            self._slow.clear()
+
+    @staticmethod
+    def _summarize(stats):
+        """Derive the reported metrics of one query name; the lock must be held."""
+        count = stats['count']
+        bounds = [str(bound) for bound in LATENCY_BUCKETS_MS] + ['+Inf']
+        return {
+            'count': count,
+            'errors': stats['errors'],
+            'rows': stats['rows'],
+            'total_ms': round(stats['total_ms'], 3),
+            'mean_ms': round(stats['total_ms'] / count, 3) if count else None,
+            'max_ms': round(stats['max_ms'], 3),
+            'p50_ms': QueryMetrics._percentile(stats, 0.50),
+            'p95_ms': QueryMetrics._percentile(stats, 0.95),
+            'p99_ms': QueryMetrics._percentile(stats, 0.99),
+            'server_ms': stats['server_ms'],
+            'counters': dict(stats['counters']),
+            'histogram': dict(zip(bounds, stats['buckets']))
+        }
+
+    @staticmethod
+    def _percentile(stats, fraction):
+        """Estimate a latency percentile as the upper bound of its histogram bucket."""
+        rank = fraction * stats['count']
+        seen = 0
+        for index, count in enumerate(stats['buckets']):
+            seen += count
+            if count and seen >= rank:
+                if index == len(LATENCY_BUCKETS_MS):
+                    return round(stats['max_ms'], 3)
+                return min(LATENCY_BUCKETS_MS[index], round(stats['max_ms'], 3))
+        return None
+
+    @staticmethod
+    def _summary_counters(summary):
+        """Get the integer update counters of a result summary."""
+        counters = getattr(summary, 'counters', None)
+        if counters is None:
+            return {}
+        values = {name: getattr(counters, name, 0) for name in COUNTER_NAMES}
+        return {name: value for name, value in values.items() if isinstance(value, int) and value}
+
+    @staticmethod
+    def _server_ms(summary):
+        """Get the time the server took to produce and stream a result."""
+        total = 0
+        for attribute in ('result_available_after', 'result_consumed_after'):
+            value = getattr(summary, attribute, None)
+            if isinstance(value, int):
+                total += value
+        return total
+
+
+class Measurement:
+    """Outcome of a measured query execution."""
+
+    __slots__ = ('rows', 'summary')
+
+    def __init__(self):
+        self.rows = 0
+        self.summary = None
+
+    def done(self, rows, summary=None):
+        """Report the rows and summary of the execution."""
+        self.rows = rows
+        self.summary = summary
+
+
+class TimedResult:
+    """A neo4j Result that records its execution in the query metrics once consumed.
+
+    The execution is recorded when the records have been iterated to the end
+    or when single(), data(), value(), values() or consume() is called. Other
+    attributes are delegated to the wrapped result.
+    """
+
+    def __init__(self, metrics, name, query, parameters, result, started):
+        self._metrics = metrics
+        self._name = name
+        self._query = query
+        self._parameters = parameters
+        self._result = result
+        self._started = started
+        self._rows = 0
+        self._recorded = False
+
+    def __iter__(self):
+        exhausted = False
+        try:
+            for record in self._result:
+                self._rows += 1
+                yield record
+            exhausted = True
+        except Exception as e:
+            self._record(error=e)
+            raise
+        finally:
+            # A loop left early is recorded without consuming the remaining records
+            self._record(self._summary() if exhausted else None)
+
+    def single(self, *args, **kwargs):
+        record = self._consume('single', *args, **kwargs)
+        self._rows += record is not None
+        self._record(self._summary())
+        return record
+
+    def data(self, *args, **kwargs):
+        records = self._consume('data', *args, **kwargs)
+        self._rows += len(records)
+        self._record(self._summary())
+        return records
+
+    def value(self, *args, **kwargs):
+        values = self._consume('value', *args, **kwargs)
+        self._rows += len(values)
+        self._record(self._summary())
+        return values
+
+    def values(self, *args, **kwargs):
+        values = self._consume('values', *args, **kwargs)
+        self._rows += len(values)
+        self._record(self._summary())
+        return values
+
+    def consume(self):
+        summary = self._consume('consume')
+        self._record(summary)
+        return summary
+
+    def __getattr__(self, name):
+        return getattr(self._result, name)
+
+    def _consume(self, method, *args, **kwargs):
+        """Call a consuming method of the result, recording a failure."""
+        try:
+            return getattr(self._result, method)(*args, **kwargs)
+        except Exception as e:
+            self._record(error=e)
+            raise
+
+    def _summary(self):
+        """Get the summary of the fully consumed result, if it provides one."""
+        try:
+            return self._result.consume()
+        except Exception:
+            return None
+
+    def _record(self, summary=None, error=None):
+        """Record the execution the first time the result is consumed."""
+        if self._recorded:
+            return
+        self._recorded = True
+        self._metrics.record(self._name, (time.perf_counter() - self._started) * 1000, self._rows,
+                             summary, self._query, self._parameters, error)
+
+
+def timed_run(runner, name, query, *args, **kwargs):
+    """Run a query on a session or transaction and record it in the query metrics.
+
+    The arguments after the query are passed to runner.run unchanged.
+
+    Args:
+        runner: neo4j Session or Transaction
+        name: Stable name of the query, e.g. 'AuthService.find_user_by_email'
+        query: Cypher query string
+
+    Returns:
+        TimedResult: The result, recorded when it is consumed
+    """
+    parameters = args[0] if args and isinstance(args[0], dict) else kwargs
+    started = time.perf_counter()
+    try:
+        result = runner.run(query, *args, **kwargs)
+    except Exception as e:
+        query_metrics.record(name, (time.perf_counter() - started) * 1000, query=query,
+                             parameters=parameters, error=e)
+        raise
+    return TimedResult(query_metrics, name, query, parameters, result, started)
+
+
+query_metrics = QueryMetrics()
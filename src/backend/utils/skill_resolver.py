@@ -0,0 +1,212 @@
+"""
+Skill Name Resolver
+
+This module provides an in-memory index that maps free-text skill names (such
+as an experience's skills_used) to skill IDs. Names are normalized, known
+aliases are honored and, when enabled (SKILL_FUZZY_MATCHING or fuzzy=True),
+near misses are matched through a trigram index. The index is built once from the skill taxonomy and the skills
+stored in the graph, so resolution is a dictionary lookup instead of a label
+scan per name.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+
+from src.backend.config import SKILL_FUZZY_MATCHING, SKILL_FUZZY_THRESHOLD
+from src.data_generation.skill_taxonomy import SKILLS, SKILL_ALIASES
+
+
+_SEPARATORS = re.compile(r"[^a-z0-9+#]+")
+
+SKILL_NAMES_QUERY = """
+    MATCH (s:Skill)
+    RETURN s.skill_id AS skill_id, s.name AS name
+"""
+
+
+def normalize_skill_name(name):
+    """Normalize a skill name for lookups.
+
+    Lowercases, folds unicode and collapses punctuation and whitespace into
+    single spaces, keeping '+' and '#' so 'C++' and 'C#' stay distinct.
+
+    Args:
+        name: Raw skill name
+
+    Returns:
+        str: Normalized name, empty if nothing is left
+    """
+    if not isinstance(name, str):
+        return ""
+    name = unicodedata.normalize("NFKC", name).lower()
+    return _SEPARATORS.sub(" ", name).strip()
+
+
+def _trigrams(text):
+    """Character trigrams of a normalized name, padded so short names still have some."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SkillResolver:
+    """Resolves skill names and aliases to skill IDs."""
+
+    def __init__(self, fuzzy_threshold=SKILL_FUZZY_THRESHOLD):
+        """Initialize an empty resolver.
+
+        Args:
+            fuzzy_threshold: Minimum trigram similarity (0-1) for a fuzzy match
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+        self._exact = {}
+        self._trigram_index = defaultdict(set)
+        self._key_trigrams = {}
+        self._lock = threading.Lock()
+        self._stats = {'exact': 0, 'fuzzy': 0, 'unresolved': 0}
+
+    @classmethod
+    def build(cls, skills=SKILLS, aliases=SKILL_ALIASES, graph_skills=None, fuzzy_threshold=SKILL_FUZZY_THRESHOLD):
+        """Build a resolver from the taxonomy, its aliases and skills stored in the graph.
+
+        Args:
+            skills: Taxonomy dictionary of skill_id to skill data
+            aliases: Dictionary of skill_id to alternative names
+            graph_skills: Iterable of dictionaries with skill_id and name
+            fuzzy_threshold: Minimum trigram similarity (0-1) for a fuzzy match
+
+        Returns:
+            SkillResolver: The populated resolver
+        """
+        resolver = cls(fuzzy_threshold)
+        for skill in graph_skills or []:
+            if skill.get("skill_id") and skill.get("name"):
+                resolver.add(skill["skill_id"], skill["name"])
+                resolver.add(skill["skill_id"], skill["skill_id"])
+        # Taxonomy names win over graph names that normalize to the same key
+        for skill_id, skill in (skills or {}).items():
+            resolver.add(skill_id, skill_id)
+            resolver.add(skill_id, skill["name"])
+        for skill_id, names in (aliases or {}).items():
+            for name in names:
+                resolver.add(skill_id, name)
+        return resolver
+
+    def add(self, skill_id, name):
+        """Register a name or alias for a skill.
+
+        Args:
+            skill_id: ID of the skill
+            name: Name or alias
+        """
+        key = normalize_skill_name(name)
+        if not key:
+            return
+        with self._lock:
+            self._exact[key] = skill_id
+            # Also index the name without spaces so 'nodejs' finds 'node js'
+            self._exact.setdefault(key.replace(" ", ""), skill_id)
+            if key not in self._key_trigrams:
+                grams = _trigrams(key)
+                self._key_trigrams[key] = grams
+                for gram in grams:
+                    self._trigram_index[gram].add(key)
+
+    def resolve(self, name, fuzzy=SKILL_FUZZY_MATCHING):
+        """Resolve one skill name to a skill ID.
+
+        Args:
+            name: Free-text skill name
+            fuzzy: Whether to fall back to trigram matching, defaults to SKILL_FUZZY_MATCHING
+
+        Returns:
+            str: The skill ID, or None if the name could not be resolved
+        """
+        key = normalize_skill_name(name)
+        if not key:
+            return None
+
+        skill_id = self._exact.get(key) or self._exact.get(key.replace(" ", ""))
+        if skill_id:
+            self._stats['exact'] += 1
+            return skill_id
+
+        if fuzzy:
+            match = self._best_trigram_match(key)
+            if match:
+                self._stats['fuzzy'] += 1
+                return self._exact[match]
+
+        self._stats['unresolved'] += 1
+        return None
+
+    def resolve_many(self, names, fuzzy=SKILL_FUZZY_MATCHING):
+        """Resolve a list of skill names, dropping unknown names and duplicates.
+
+        Args:
+            names: Iterable of free-text skill names
+            fuzzy: Whether to fall back to trigram matching, defaults to SKILL_FUZZY_MATCHING
+
+        Returns:
+            list: Skill IDs in first-seen order
+        """
+        if not isinstance(names, (list, tuple, set)):
+            return []
+        resolved = (self.resolve(name, fuzzy) for name in names)
+        return list(dict.fromkeys(skill_id for skill_id in resolved if skill_id))
+
+    def get_stats(self):
+        """Get resolution counters.
+
+        Returns:
+            dict: Exact, fuzzy and unresolved counts and the number of indexed names
+        """
+        stats = dict(self._stats)
+        stats['names'] = len(self._key_trigrams)
+        return stats
+
+    def _best_trigram_match(self, key):
+        """Find the indexed name with the highest trigram similarity (Dice coefficient) above the threshold."""
+        grams = _trigrams(key)
+        overlap = defaultdict(int)
+        for gram in grams:
+            for candidate in self._trigram_index.get(gram, ()):
+                overlap[candidate] += 1
+
+        best, best_score = None, self.fuzzy_threshold
+        for candidate, shared in overlap.items():
+            score = 2.0 * shared / (len(grams) + len(self._key_trigrams[candidate]))
+            if score >= best_score:
+                best, best_score = candidate, score
+        return best
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_skill_resolver(repository=None):
+    """Get the shared resolver, building it on first use.
+
+    Args:
+        repository: Repository used to read the skills stored in the graph; when
+            omitted, only the taxonomy and its aliases are indexed
+
+    Returns:
+        SkillResolver: The shared resolver
+    """
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            graph_skills = repository.execute_read_query(SKILL_NAMES_QUERY) if repository is not None else []
+            _resolver = SkillResolver.build(graph_skills=graph_skills)
+            print(f"Skill resolver built with {_resolver.get_stats()['names']} names")
+        return _resolver
+
+
+def invalidate_skill_resolver():
+    """Drop the shared resolver so the next use rebuilds it from the graph."""
+    global _resolver
+    with _resolver_lock:
+        _resolver = None
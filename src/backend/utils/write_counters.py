@@ -0,0 +1,61 @@
+"""
+Write Counters
+
+This module provides process-wide totals of the update counters that Neo4j
+reports in result summaries (nodes and relationships created or deleted,
+properties set). Repositories record every write, and callers such as the ETL
+pipeline take snapshots before and after a stage to attribute the changes to it.
+"""
+
+import threading
+
+
+COUNTER_NAMES = (
+    'nodes_created',
+    'nodes_deleted',
+    'relationships_created',
+    'relationships_deleted',
+    'properties_set'
+)
+
+_totals = dict.fromkeys(COUNTER_NAMES, 0)
+_lock = threading.Lock()
+
+
+def record(summary):
+    """Add the counters of a result summary to the totals.
+
+    Args:
+        summary: neo4j ResultSummary; objects without integer counters are ignored
+    """
+    counters = getattr(summary, 'counters', None)
+    if counters is None:
+        return
+    values = {name: getattr(counters, name, 0) for name in COUNTER_NAMES}
+    with _lock:
+        for name, value in values.items():
+            if isinstance(value, int):
+                _totals[name] += value
+
+
+def snapshot():
+    """Get the current totals.
+
+    Returns:
+        dict: Count per counter name
+    """
+    with _lock:
+        return dict(_totals)
+
+
+def since(before):
+    """Get the counts recorded since an earlier snapshot.
+
+    Args:
+        before: Dictionary returned by snapshot()
+
+    Returns:
+        dict: Count per counter name
+    """
+    now = snapshot()
+    return {name: now[name] - before.get(name, 0) for name in COUNTER_NAMES}
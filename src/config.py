@@ -18,4 +18,11 @@ API_PORT = int(os.getenv("API_PORT", 8000))
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
 
 # Data settings
-DATA_DIR = os.getenv("DATA_DIR", "data") 
\ No newline at end of file
+DATA_DIR = os.getenv("DATA_DIR", "data") 
+
+# Bulk loading settings
+ETL_BATCH_SIZE = int(os.getenv("ETL_BATCH_SIZE", 5000))
+
+# Parallel ETL: transform worker processes and concurrent write sessions
+ETL_WORKERS = int(os.getenv("ETL_WORKERS", os.cpu_count() or 1))
+ETL_WRITE_SESSIONS = int(os.getenv("ETL_WRITE_SESSIONS", 4))
@@ -335,6 +335,27 @@ SKILLS = {
     }
 }
 
+# Alternative spellings and abbreviations for skill names, used when
+# resolving free-text skill mentions (e.g. an experience's skills_used)
+SKILL_ALIASES = {
+    "python": ["py", "python3"],
+    "javascript": ["js", "ecmascript"],
+    "react": ["reactjs", "react.js"],
+    "nodejs": ["node", "node js"],
+    "ci_cd": ["continuous integration", "continuous delivery", "cicd"],
+    "frontend_dev": ["front-end development", "frontend"],
+    "backend_dev": ["back-end development", "backend"],
+    "machine_learning": ["ml"],
+    "deep_learning": ["dl"],
+    "data_visualization": ["data viz", "dataviz"],
+    "sql": ["structured query language"],
+    "tensorflow": ["tf"],
+    "ui_design": ["user interface design"],
+    "ux_design": ["user experience design"],
+    "agile": ["scrum"],
+    "problem_solving": ["problem-solving"]
+}
+
 # Proficiency levels for skills
 PROFICIENCY_LEVELS = {
     "beginner": "Beginner",
@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+"""
+Offline Import Export for the ETL Pipeline
+
+This module provides an export of the transformed ETL data as CSV files for
+`neo4j-admin database import full`. The offline importer writes the store
+files directly and is much faster than transactional Cypher for initial
+loads of millions of records, but it needs an empty, stopped database.
+
+Each node and relationship type gets a header file and a data file. Nodes use
+one ID space per label (Skill, Job, Candidate, Experience), and the stored
+properties match those written by the online bulk loaders. Relationships to
+skills outside the taxonomy are left out, just as the online MATCH-based
+writes skip them. Skill-to-skill relationships are aggregated over all
+records and written once per edge with their occurrence count.
+"""
+
+import csv
+import json
+import os
+import time
+from typing import Dict, Iterable, List
+
+from src.backend.utils.skill_resolver import SkillResolver
+from src.etl.aggregation import SkillRelationshipAggregator
+
+# Output name -> (label or relationship type, header columns)
+NODE_FILES = {
+    "skills": ("Skill", ["skill_id:ID(Skill)", "name", "category", "domain", "description", "content_hash"]),
+    "jobs": ("Job", ["job_id:ID(Job)", "title", "company", "domain", "location", "description",
+                     "responsibilities", "qualifications", "owner_email", "created_at", "updated_at",
+                     "content_hash"]),
+    "candidates": ("Candidate", ["resume_id:ID(Candidate)", "name", "email", "title", "domain", "location",
+                                 "summary", "education", "content_hash"]),
+    "experiences": ("Experience", ["exp_id:ID(Experience)", "job_title", "company", "start_date", "end_date",
+                                   "description"])
+}
+RELATIONSHIP_FILES = {
+    "requires_primary": ("REQUIRES_PRIMARY", [":START_ID(Job)", ":END_ID(Skill)", "proficiency", "importance:float"]),
+    "requires_secondary": ("REQUIRES_SECONDARY",
+                           [":START_ID(Job)", ":END_ID(Skill)", "proficiency", "importance:float"]),
+    "has_core_skill": ("HAS_CORE_SKILL",
+                       [":START_ID(Candidate)", ":END_ID(Skill)", "proficiency", "experience_years:float"]),
+    "has_secondary_skill": ("HAS_SECONDARY_SKILL",
+                            [":START_ID(Candidate)", ":END_ID(Skill)", "proficiency", "experience_years:float"]),
+    "has_experience": ("HAS_EXPERIENCE", [":START_ID(Candidate)", ":END_ID(Experience)"]),
+    "used_skill": ("USED_SKILL", [":START_ID(Experience)", ":END_ID(Skill)"]),
+    # Skill-to-skill relationships have several types, given per row
+    "skill_relationships": (None, [":START_ID(Skill)", ":END_ID(Skill)", ":TYPE", "weight:float",
+                                   "weight_max:float", "count:long"])
+}
+
+
+def _json_list(value, stringify: bool = False) -> str:
+    """Encode a list property as a JSON string, the format used by the online loaders.
+
+    Args:
+        value: List, JSON array string or single value
+        stringify: Whether to convert the items to strings, as job text lists are
+
+    Returns:
+        str: JSON array
+    """
+    if not value:
+        return "[]"
+    if isinstance(value, list):
+        return json.dumps([str(item) for item in value] if stringify else value)
+    if isinstance(value, str) and not stringify:
+        try:
+            json.loads(value)
+            return value
+        except ValueError:
+            pass
+    return json.dumps([str(value)])
+
+
+class AdminImportExporter:
+    """Writes transformed ETL records as neo4j-admin import CSV files."""
+
+    def __init__(self, output_dir: str, database: str = "neo4j"):
+        """Initialize the exporter.
+
+        Args:
+            output_dir: Directory for the CSV files, created if missing
+            database: Database name used in the suggested import command
+        """
+        self.output_dir = output_dir
+        self.database = database
+        self._files = {}
+        self._writers = {}
+        self.rows = {}
+
+    def export(self, skill_nodes: List[Dict], skill_relationships: List[Dict],
+               jobs: Iterable[Dict], resumes: Iterable[Dict]) -> Dict:
+        """Transform the source records and write all CSV files.
+
+        Jobs and resumes are transformed and written one record at a time, so
+        memory use does not grow with the size of the input; only the
+        aggregated skill relationships, one per edge, are kept until the end.
+        Records whose ID was already written are skipped.
+
+        Args:
+            skill_nodes: Transformed taxonomy skill nodes
+            skill_relationships: Transformed taxonomy skill relationships
+            jobs: Raw job records
+            resumes: Raw resume records
+
+        Returns:
+            dict: Record counts, elapsed seconds, per-file rows and bytes, and the import command
+        """
+        from src.etl.data_loader import ETLPipeline
+
+        started = time.perf_counter()
+        self._open()
+        try:
+            skill_ids = set()
+            for node in skill_nodes:
+                if node["skill_id"] not in skill_ids:
+                    skill_ids.add(node["skill_id"])
+                    self._write_skill(node)
+            resolver = SkillResolver.build(graph_skills=skill_nodes)
+            relationships = SkillRelationshipAggregator()
+            relationships.add_all(skill_relationships)
+
+            job_ids = set()
+            for job in jobs:
+                if job["job_id"] in job_ids:
+                    continue
+                job_ids.add(job["job_id"])
+                nodes, job_skill_rels, skill_rels = ETLPipeline._transform_job(job)
+                self._write_job(nodes[0], job_skill_rels, skill_ids)
+                relationships.add_all(skill_rels)
+
+            resume_ids = set()
+            for resume in resumes:
+                if resume["resume_id"] in resume_ids:
+                    continue
+                resume_ids.add(resume["resume_id"])
+                nodes, candidate_skill_rels, skill_rels, experiences = ETLPipeline._transform_resume(resume)
+                self._write_candidate(nodes[0], candidate_skill_rels, experiences, skill_ids, resolver)
+                relationships.add_all(skill_rels)
+            
+            self._write_skill_relationships(relationships.rows(), skill_ids)
+        finally:
+            self._close()
+
+        seconds = time.perf_counter() - started
+        files = {name: {"rows": self.rows[name], "bytes": self._size(name)}
+                 for name in list(NODE_FILES) + list(RELATIONSHIP_FILES)}
+        return {
+            "output_dir": self.output_dir,
+            "seconds": round(seconds, 3),
+            "records": len(job_ids) + len(resume_ids),
+            "records_per_second": round((len(job_ids) + len(resume_ids)) / seconds, 1) if seconds > 0 else None,
+            "files": files,
+            "bytes": sum(entry["bytes"] for entry in files.values()),
+            "command": self.import_command()
+        }
+
+    def import_command(self) -> str:
+        """Build the neo4j-admin command that imports the exported files.
+
+        Returns:
+            str: Shell command line
+        """
+        parts = ["neo4j-admin database import full", self.database, "--overwrite-destination",
+                 "--multiline-fields=true"]
+        for name, (label, _) in NODE_FILES.items():
+            parts.append(f"--nodes={label}={self._path(name, header=True)},{self._path(name)}")
+        for name, (rel_type, _) in RELATIONSHIP_FILES.items():
+            prefix = f"{rel_type}=" if rel_type else ""
+            parts.append(f"--relationships={prefix}{self._path(name, header=True)},{self._path(name)}")
+        return " \\\n    ".join(parts)
+
+    # PRIVATE HELPER METHODS
+
+    def _path(self, name, header=False):
+        """Path of the data or header file of an output."""
+        return os.path.join(self.output_dir, f"{name}_header.csv" if header else f"{name}.csv")
+
+    def _size(self, name):
+        """Combined size in bytes of the header and data file of an output."""
+        return os.path.getsize(self._path(name)) + os.path.getsize(self._path(name, header=True))
+
+    def _open(self):
+        """Write the header files and open the data files."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        for name, (_, header) in list(NODE_FILES.items()) + list(RELATIONSHIP_FILES.items()):
+            with open(self._path(name, header=True), "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(header)
+            self._files[name] = open(self._path(name), "w", newline="", encoding="utf-8")
+            self._writers[name] = csv.writer(self._files[name], quoting=csv.QUOTE_MINIMAL)
+            self.rows[name] = 0
+
+    def _close(self):
+        """Close the data files."""
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+        self._writers = {}
+
+    def _write(self, name, row):
+        """Append a row to a data file."""
+        self._writers[name].writerow(["" if value is None else value for value in row])
+        self.rows[name] += 1
+
+    def _write_skill(self, node):
+        """Write a skill node."""
+        self._write("skills", [node["skill_id"], node["name"], node.get("category", ""), node.get("domain", ""),
+                               node.get("description", ""), node.get("content_hash")])
+
+    def _write_skill_relationships(self, relationships, skill_ids):
+        """Write aggregated skill-to-skill relationships between taxonomy skills."""
+        for rel in relationships:
+            if rel["source"] in skill_ids and rel["target"] in skill_ids:
+                self._write("skill_relationships", [rel["source"], rel["target"], rel["type"], rel["weight"],
+                                                    rel["weight_max"], rel["count"]])
+
+    def _write_job(self, job, job_skill_rels, skill_ids):
+        """Write a job node and its skill requirements."""
+        self._write("jobs", [
+            job["job_id"], job["title"], job["company"], job.get("domain", ""), job.get("location", ""),
+            job.get("summary", ""), _json_list(job.get("responsibilities"), stringify=True),
+            _json_list(job.get("qualifications"), stringify=True), job.get("owner_email", ""),
+            job.get("created_at", ""), job.get("updated_at", ""), job.get("content_hash")
+        ])
+        linked = set()
+        for rel in job_skill_rels:
+            if rel["skill_id"] not in skill_ids or (rel["skill_id"], rel["is_primary"]) in linked:
+                continue
+            linked.add((rel["skill_id"], rel["is_primary"]))
+            name = "requires_primary" if rel["is_primary"] else "requires_secondary"
+            self._write(name, [rel["job_id"], rel["skill_id"], rel["proficiency"], rel["importance"]])
+
+    def _write_candidate(self, candidate, candidate_skill_rels, experiences, skill_ids, resolver):
+        """Write a candidate node with its skills, experiences and the skills used in them."""
+        self._write("candidates", [
+            candidate["resume_id"], candidate["name"], candidate.get("email", ""), candidate.get("title", ""),
+            candidate.get("domain", ""), candidate.get("location", ""), candidate.get("summary", ""),
+            _json_list(candidate.get("education")), candidate.get("content_hash")
+        ])
+        linked = set()
+        for rel in candidate_skill_rels:
+            if rel["skill_id"] not in skill_ids or (rel["skill_id"], rel["is_core"]) in linked:
+                continue
+            linked.add((rel["skill_id"], rel["is_core"]))
+            name = "has_core_skill" if rel["is_core"] else "has_secondary_skill"
+            self._write(name, [rel["resume_id"], rel["skill_id"], rel["proficiency"], rel["experience_years"]])
+
+        for exp in experiences:
+            self._write("experiences", [
+                exp["exp_id"], exp.get("job_title", ""), exp.get("company", ""), exp.get("start_date", ""),
+                exp.get("end_date", "Present"), _json_list(exp.get("description"))
+            ])
+            self._write("has_experience", [exp["resume_id"], exp["exp_id"]])
+            for skill_id in resolver.resolve_many(exp.get("skills_used")):
+                if skill_id in skill_ids:
+                    self._write("used_skill", [exp["exp_id"], skill_id])
+
+
+def print_export_report(report: Dict) -> None:
+    """Print an export report as a table, followed by the import command.
+
+    Args:
+        report: Report returned by AdminImportExporter.export
+    """
+    rate = f"{report['records_per_second']:.0f} records/s" if report["records_per_second"] else "-"
+    print(f"Exported {report['records']} jobs and resumes in {report['seconds']:.2f}s ({rate}) "
+          f"to {report['output_dir']}")
+    print(f"{'file':<22} {'rows':>10} {'MB':>10}")
+    for name, entry in report["files"].items():
+        print(f"{name:<22} {entry['rows']:>10} {entry['bytes'] / 1e6:>10.2f}")
+    print(f"{'total':<22} {sum(entry['rows'] for entry in report['files'].values()):>10} "
+          f"{report['bytes'] / 1e6:>10.2f}")
+    print("\nStop the database, then import with:")
+    print(report["command"])
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Skill Relationship Aggregation for the ETL Pipeline
+
+This module provides the aggregation of skill-to-skill relationships before
+they are loaded. Jobs and resumes repeat the same (source, target, type)
+edge many times, so the transformed rows are reduced to one row per edge
+with the number of occurrences and the mean and maximum weight. Each edge is
+then written once, and the occurrence count is kept on the relationship as
+a popularity signal for related-skill scoring.
+
+Rows that are already aggregated (they carry a count) can be aggregated
+again, so partial results from batches or worker processes combine exactly.
+"""
+
+from typing import Dict, Iterable, List
+
+# Weight of relationships that do not specify one, as in the repository writes
+DEFAULT_WEIGHT = 1.0
+
+
+class SkillRelationshipAggregator:
+    """Accumulates skill relationship rows per (source, target, type)."""
+
+    def __init__(self):
+        """Initialize an empty aggregator."""
+        # (source, target, type) -> [count, weight sum, weight max]
+        self._edges = {}
+        self.occurrences = 0
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def add(self, rel: Dict) -> None:
+        """Add a relationship row.
+
+        Args:
+            rel: Dictionary with source, target, type and optional weight;
+                aggregated rows also carry count and weight_max
+        """
+        count = rel.get("count", 1)
+        weight = rel.get("weight", DEFAULT_WEIGHT)
+        weight_max = rel.get("weight_max", weight)
+        key = (rel["source"], rel["target"], rel["type"])
+        edge = self._edges.get(key)
+        if edge is None:
+            self._edges[key] = [count, weight * count, weight_max]
+        else:
+            edge[0] += count
+            edge[1] += weight * count
+            if weight_max > edge[2]:
+                edge[2] = weight_max
+        self.occurrences += count
+
+    def add_all(self, relationships: Iterable[Dict]) -> None:
+        """Add relationship rows."""
+        for rel in relationships:
+            self.add(rel)
+
+    def rows(self) -> List[Dict]:
+        """Get one row per edge.
+
+        Returns:
+            list: Dictionaries with source, target, type, weight (the mean),
+                weight_max and count
+        """
+        return [{
+            "source": source,
+            "target": target,
+            "type": rel_type,
+            "weight": weight_sum / count,
+            "weight_max": weight_max,
+            "count": count
+        } for (source, target, rel_type), (count, weight_sum, weight_max) in self._edges.items()]
+
+
+def aggregate_skill_relationships(relationships: Iterable[Dict]) -> List[Dict]:
+    """Reduce skill relationship rows to one row per (source, target, type).
+
+    Args:
+        relationships: Relationship rows, raw or already aggregated
+
+    Returns:
+        list: Aggregated rows, see SkillRelationshipAggregator.rows
+    """
+    aggregator = SkillRelationshipAggregator()
+    aggregator.add_all(relationships)
+    return aggregator.rows()
@@ -6,6 +6,7 @@ This module provides CLI functionality to run the ETL pipeline and load test dat
 into the Neo4j database. Must be run from the project root directory.
 """
 
+import argparse
 import os
 import sys
 from dotenv import load_dotenv
@@ -15,6 +16,11 @@ from src.etl.data_loader import initialize_knowledge_graph, ETLPipeline
 
 def main():
     """Run the ETL pipeline to load data into the database."""
+    parser = argparse.ArgumentParser(description='Load data into the Talent Matcher knowledge graph')
+    parser.add_argument('--delta', action='store_true',
+                        help='Apply only new, changed and removed records instead of clearing and reloading')
+    args = parser.parse_args()
+    
     # Load environment variables
     load_dotenv()
     
@@ -34,9 +40,10 @@ def main():
     # Run the pipeline with all data
     print("Loading data into Knowledge Graph...")
     success = etl.run_pipeline(
-        clear_db=True,  # Clear existing data
+        clear_db=not args.delta,  # Clear existing data unless applying a delta
         force=True,     # Skip confirmation prompts
-        generate_embeddings=True  # Generate embeddings for enhanced matching
+        generate_embeddings=True,  # Generate embeddings for enhanced matching
+        delta=args.delta
     )
     
     # Create test accounts
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+"""
+Columnar Transform for the ETL Pipeline
+
+This module provides an alternative to the per-row dictionaries built by
+ETLPipeline.transform_jobs and transform_resumes for the relationship rows,
+which outnumber nodes by far. Relationship rows are appended to typed arrays
+while records are parsed: IDs, skill IDs, proficiencies and relationship
+types are stored as integer codes into shared vocabularies, and importance,
+experience years, weights and flags as NumPy number and boolean columns.
+A relationship costs a few dozen bytes instead of a dictionary with its own
+keys and values. Nodes keep their dictionary form since they carry free text.
+Skill-to-skill relationships are aggregated per (source, target, type) when
+the columns are built, as src.etl.aggregation does for dictionary rows.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class Vocabulary:
+    """Assigns dense integer codes to strings."""
+
+    def __init__(self):
+        """Initialize an empty vocabulary."""
+        self.codes = {}
+        self.values = []
+
+    def code(self, value: str) -> int:
+        """Get the code of a value, adding it if it is new."""
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Map codes back to their values.
+
+        The result is an object array referencing the vocabulary strings, so
+        no string is copied.
+        """
+        return np.asarray(self.values, dtype=object)[codes] if len(codes) else np.empty(0, dtype=object)
+
+
+class ColumnarBatch:
+    """Relationship rows stored as equally long NumPy columns.
+
+    Columns listed in `vocabularies` hold codes and are decoded to strings by
+    to_columns().
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], vocabularies: Dict[str, Vocabulary]):
+        """Initialize the batch.
+
+        Args:
+            columns: Column name to array, all of the same length
+            vocabularies: Vocabulary of each coded column
+        """
+        self.columns = columns
+        self.vocabularies = vocabularies
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the columns, excluding the shared vocabularies."""
+        return sum(column.nbytes for column in self.columns.values())
+
+    def to_columns(self, mask: Optional[np.ndarray] = None, names: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """Get decoded columns, optionally for a subset of rows.
+
+        Args:
+            mask: Boolean array selecting rows, or None for all rows
+            names: Columns to return, or None for all
+
+        Returns:
+            dict: Column name to array, with coded columns decoded to strings
+        """
+        result = {}
+        for name in names or self.columns:
+            column = self.columns[name] if mask is None else self.columns[name][mask]
+            result[name] = self.vocabularies[name].decode(column) if name in self.vocabularies else column
+        return result
+
+
+class ColumnarTransformer:
+    """Transforms raw job and resume records into node dictionaries and columnar relationship batches.
+
+    The field defaults and validation match ETLPipeline._transform_job and
+    _transform_resume.
+    """
+
+    def __init__(self):
+        """Initialize an empty transformer."""
+        self.ids = Vocabulary()
+        self.skills = Vocabulary()
+        self.proficiencies = Vocabulary()
+        self.relationship_types = Vocabulary()
+
+        self.job_nodes = []
+        self.candidate_nodes = []
+        self.experiences = []
+        self._job_skills = self._columns(job_id="i", skill_id="i", proficiency="h", importance="d", is_primary="b")
+        self._candidate_skills = self._columns(resume_id="i", skill_id="i", proficiency="h",
+                                               experience_years="d", is_core="b")
+        self._skill_relationships = self._columns(source="i", target="i", type="h", weight="d")
+
+    @staticmethod
+    def _columns(**typecodes) -> Dict[str, array]:
+        """Create empty typed arrays: 'i' and 'h' for codes, 'd' for numbers, 'b' for flags."""
+        return {name: array(typecode) for name, typecode in typecodes.items()}
+
+    def add_jobs(self, jobs: Iterable[Dict]) -> None:
+        """Transform job records."""
+        for job in jobs:
+            self.add_job(job)
+
+    def add_resumes(self, resumes: Iterable[Dict]) -> None:
+        """Transform resume records."""
+        for resume in resumes:
+            self.add_resume(resume)
+
+    def add_job(self, job: Dict) -> None:
+        """Transform one job record."""
+        from src.etl.data_loader import ETLPipeline
+
+        # The node carries the same content_hash as the dictionary transform, for --delta runs
+        self.job_nodes.append(ETLPipeline._transform_job(job)[0][0])
+        job_code = self.ids.code(job["job_id"])
+        columns = self._job_skills
+        skills = job.get("skills", {})
+        for is_primary, group, importance, proficiency in ((True, "primary", 0.8, "advanced"),
+                                                           (False, "secondary", 0.5, "intermediate")):
+            for skill in skills.get(group, []):
+                columns["job_id"].append(job_code)
+                columns["skill_id"].append(self.skills.code(skill["skill_id"]))
+                columns["proficiency"].append(self.proficiencies.code(skill.get("proficiency", proficiency)))
+                columns["importance"].append(skill.get("importance", importance))
+                columns["is_primary"].append(is_primary)
+        self._add_skill_relationships(job.get("skill_relationships", []), validate=False)
+
+    def add_resume(self, resume: Dict) -> None:
+        """Transform one resume record."""
+        from src.etl.data_loader import ETLPipeline
+
+        nodes, _, _, experiences = ETLPipeline._transform_resume(resume)
+        self.candidate_nodes.extend(nodes)
+        self.experiences.extend(experiences)
+        resume_code = self.ids.code(resume["resume_id"])
+        columns = self._candidate_skills
+        skills = resume.get("skills", {})
+        if not isinstance(skills, dict):
+            skills = {}
+        for is_core, group in ((True, "core"), (False, "secondary")):
+            for skill in skills.get(group, []):
+                if not isinstance(skill, dict) or "skill_id" not in skill:
+                    continue
+                columns["resume_id"].append(resume_code)
+                columns["skill_id"].append(self.skills.code(skill["skill_id"]))
+                columns["proficiency"].append(
+                    self.proficiencies.code(ETLPipeline._get_proficiency_value(skill.get("proficiency", ""))))
+                columns["experience_years"].append(skill.get("experience_years", 0))
+                columns["is_core"].append(is_core)
+        self._add_skill_relationships(resume.get("skill_relationships", []), validate=True)
+
+    def add_skill_relationships(self, relationships: Iterable[Dict]) -> None:
+        """Add skill-to-skill relationship rows not tied to a record, e.g. the taxonomy's."""
+        self._add_skill_relationships(relationships, validate=False)
+
+    def _add_skill_relationships(self, relationships: List[Dict], validate: bool) -> None:
+        """Append skill-to-skill relationship rows, skipping malformed entries if validate is set."""
+        columns = self._skill_relationships
+        for rel in relationships:
+            if validate and (not isinstance(rel, dict) or "source" not in rel or "target" not in rel or "type" not in rel):
+                continue
+            columns["source"].append(self.skills.code(rel["source"]))
+            columns["target"].append(self.skills.code(rel["target"]))
+            columns["type"].append(self.relationship_types.code(rel["type"]))
+            columns["weight"].append(rel.get("weight", 1.0))
+
+    def build(self) -> Dict:
+        """Convert the accumulated rows to NumPy columns.
+
+        Returns:
+            dict: job_nodes, candidate_nodes and experiences as lists of dictionaries;
+                job_skills, candidate_skills and skill_relationships as ColumnarBatch,
+                with one skill relationship row per (source, target, type)
+        """
+        job_vocabularies = {"job_id": self.ids, "skill_id": self.skills, "proficiency": self.proficiencies}
+        candidate_vocabularies = {"resume_id": self.ids, "skill_id": self.skills, "proficiency": self.proficiencies}
+        relationship_vocabularies = {"source": self.skills, "target": self.skills, "type": self.relationship_types}
+        return {
+            "job_nodes": self.job_nodes,
+            "candidate_nodes": self.candidate_nodes,
+            "experiences": self.experiences,
+            "job_skills": ColumnarBatch(self._to_numpy(self._job_skills), job_vocabularies),
+            "candidate_skills": ColumnarBatch(self._to_numpy(self._candidate_skills), candidate_vocabularies),
+            "skill_relationships": ColumnarBatch(
+                self._aggregate_relationships(self._to_numpy(self._skill_relationships)), relationship_vocabularies)
+        }
+    
+    @staticmethod
+    def _aggregate_relationships(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Reduce relationship columns to one row per (source, target, type).
+        
+        Returns:
+            dict: source, target, type, weight (the mean), weight_max and count columns
+        """
+        keys = np.stack([columns["source"], columns["target"], columns["type"].astype(np.int32)], axis=1)
+        unique, inverse = np.unique(keys.reshape(-1, 3), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        count = np.bincount(inverse, minlength=len(unique))
+        weight_max = np.full(len(unique), -np.inf)
+        np.maximum.at(weight_max, inverse, columns["weight"])
+        return {
+            "source": unique[:, 0].copy(),
+            "target": unique[:, 1].copy(),
+            "type": unique[:, 2].astype(np.int16),
+            "weight": np.bincount(inverse, weights=columns["weight"], minlength=len(unique)) / np.maximum(count, 1),
+            "weight_max": weight_max,
+            "count": count
+        }
+
+    @staticmethod
+    def _to_numpy(columns: Dict[str, array]) -> Dict[str, np.ndarray]:
+        """Copy typed arrays into NumPy columns; 'b' columns become booleans."""
+        numpy_columns = {}
+        for name, values in columns.items():
+            column = np.frombuffer(values, dtype=values.typecode) if len(values) else np.empty(0, dtype=values.typecode)
+            numpy_columns[name] = column.astype(np.bool_) if values.typecode == "b" else column.copy()
+        return numpy_columns
@@ -7,25 +7,40 @@ This module handles extracting, transforming, and loading data into the Neo4j kn
 import json
 import os
 import glob
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
+from src.backend.repositories.candidate_repository import LINK_EXPERIENCE_SKILLS_QUERY
 from src.backend.services.graph_service import GraphService
 from src.backend.services.skill_service import SkillService
+from src.backend.utils.batching import chunked
+from src.backend.utils.query_metrics import timed_run
+from src.backend.utils.skill_resolver import get_skill_resolver
+from src.etl.admin_import import AdminImportExporter, print_export_report
+from src.etl.aggregation import SkillRelationshipAggregator, aggregate_skill_relationships
+from src.etl.columnar import ColumnarTransformer
+from src.etl.delta import content_hash, plan_changes
+from src.etl.instrumentation import PipelineReport, print_pipeline_report
+from src.etl.json_stream import iter_json_records
+from src.etl.parallel import ParallelLoader, print_report
 from src.data_generation.skill_taxonomy import SKILLS
-from src.config import DATA_DIR
+from src.config import DATA_DIR, ETL_BATCH_SIZE, ETL_WORKERS, ETL_WRITE_SESSIONS
 
 
 class ETLPipeline:
     """ETL Pipeline for Knowledge Graph data."""
     
-    def __init__(self, kg: GraphService, data_dir: str = DATA_DIR):
-        """Initialize ETL Pipeline with knowledge graph and data directory."""
+    def __init__(self, kg: GraphService, data_dir: str = DATA_DIR, batch_size: int = ETL_BATCH_SIZE):
+        """Initialize ETL Pipeline with knowledge graph, data directory and bulk write batch size.
+        
+        kg may be None for offline steps such as run_admin_export.
+        """
         self.kg = kg
-        self.skill_service = SkillService.get_instance(kg)
+        self.skill_service = SkillService.get_instance(kg) if kg else None
         self.data_dir = data_dir
+        self.batch_size = batch_size
+        self.report = PipelineReport()
         
     def extract_skills(self) -> Dict[str, Dict]:
         """Extract skills data from taxonomy."""
-        print("Extracting skills taxonomy...")
         return SKILLS
     
     def extract_jobs(self) -> List[Dict]:
@@ -64,9 +79,38 @@ class ETLPipeline:
                 print(f"Error: Invalid JSON in {resume_file}")
                 return []
     
+    def stream_jobs(self) -> Iterator[Dict]:
+        """Stream job records from job_dataset.jsonl or job_dataset.json without loading the whole file."""
+        return self._stream_records("job_dataset", "jobs")
+    
+    def stream_resumes(self) -> Iterator[Dict]:
+        """Stream resume records from resume_dataset.jsonl or resume_dataset.json without loading the whole file."""
+        return self._stream_records("resume_dataset", "resumes")
+    
+    def input_files(self) -> List[str]:
+        """Get the job and resume dataset files in the data directory."""
+        paths = [self._find_dataset("job_dataset"), self._find_dataset("resume_dataset")]
+        return [path for path in paths if path]
+    
+    def _find_dataset(self, basename: str) -> Optional[str]:
+        """Find the dataset file named basename, preferring JSON Lines over JSON."""
+        for extension in (".jsonl", ".ndjson", ".json"):
+            path = os.path.join(self.data_dir, basename + extension)
+            if os.path.exists(path):
+                return path
+        return None
+    
+    def _stream_records(self, basename: str, key: str) -> Iterator[Dict]:
+        """Stream records from the dataset file named basename."""
+        path = self._find_dataset(basename)
+        if not path:
+            print(f"Warning: No {basename} file found in {self.data_dir}")
+            return iter(())
+        print(f"Streaming records from {path}")
+        return iter_json_records(path, key)
+    
     def transform_skills(self, skills_data: Dict[str, Dict]) -> Tuple[List[Dict], List[Dict]]:
         """Transform skills data for loading."""
-        print("Transforming skills data...")
         skill_nodes = []
         skill_relationships = []
         
@@ -88,156 +132,203 @@ class ETLPipeline:
                         "type": rel_type
                     })
         
+        # Hash each skill with the relationships it owns, for delta loads
+        relationships_by_skill = {}
+        for rel in skill_relationships:
+            relationships_by_skill.setdefault(rel["source"], []).append(rel)
+        for node in skill_nodes:
+            node["content_hash"] = content_hash(node, relationships_by_skill.get(node["skill_id"], []))
+        
         return skill_nodes, skill_relationships
     
     def transform_jobs(self, jobs_data: List[Dict]) -> Tuple[List[Dict], List[Dict], List[Dict]]:
         """Transform jobs data for loading."""
-        print("Transforming jobs data...")
         job_nodes = []
         job_skill_relationships = []
         skill_relationships = []
         
         for job in jobs_data:
-            # Create job node
-            job_nodes.append({
+            nodes, job_skill_rels, skill_rels = self._transform_job(job)
+            job_nodes.extend(nodes)
+            job_skill_relationships.extend(job_skill_rels)
+            skill_relationships.extend(skill_rels)
+        
+        return job_nodes, job_skill_relationships, skill_relationships
+    
+    @classmethod
+    def _transform_job(cls, job: Dict) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """Transform a single job into its node, job-skill and skill-skill relationships."""
+        job_nodes = [cls._job_node(job)]
+        job_skill_relationships = []
+        skill_relationships = []
+        
+        # Extract primary skills
+        for skill in job.get("skills", {}).get("primary", []):
+            job_skill_relationships.append({
                 "job_id": job["job_id"],
-                "title": job["title"],
-                "company": job["company"],
-                "location": job["location"],
-                "domain": job.get("domain", ""),
-                "summary": job.get("summary", ""),
-                "responsibilities": job.get("responsibilities", []),
-                "qualifications": job.get("qualifications", [])
+                "skill_id": skill["skill_id"],
+                "importance": skill.get("importance", 0.8),  # Keep as decimal value
+                "is_primary": True,
+                "proficiency": skill.get("proficiency", "advanced")  # Keep as string
             })
             
-            # Extract primary skills
-            for skill in job.get("skills", {}).get("primary", []):
-                job_skill_relationships.append({
-                    "job_id": job["job_id"],
-                    "skill_id": skill["skill_id"],
-                    "importance": skill.get("importance", 0.8),  # Keep as decimal value
-                    "is_primary": True,
-                    "proficiency": skill.get("proficiency", "advanced")  # Keep as string
-                })
-                
-            # Extract secondary skills
-            for skill in job.get("skills", {}).get("secondary", []):
-                job_skill_relationships.append({
-                    "job_id": job["job_id"],
-                    "skill_id": skill["skill_id"],
-                    "importance": skill.get("importance", 0.5),  # Keep as decimal value
-                    "is_primary": False,
-                    "proficiency": skill.get("proficiency", "intermediate")  # Keep as string
-                })
-                
-            # Extract skill relationships
-            for rel in job.get("skill_relationships", []):
-                skill_relationships.append({
-                    "source": rel["source"],
-                    "target": rel["target"],
-                    "type": rel["type"],
-                    "weight": rel.get("weight", 1.0)
-                })
+        # Extract secondary skills
+        for skill in job.get("skills", {}).get("secondary", []):
+            job_skill_relationships.append({
+                "job_id": job["job_id"],
+                "skill_id": skill["skill_id"],
+                "importance": skill.get("importance", 0.5),  # Keep as decimal value
+                "is_primary": False,
+                "proficiency": skill.get("proficiency", "intermediate")  # Keep as string
+            })
+            
+        # Extract skill relationships
+        for rel in job.get("skill_relationships", []):
+            skill_relationships.append({
+                "source": rel["source"],
+                "target": rel["target"],
+                "type": rel["type"],
+                "weight": rel.get("weight", 1.0)
+            })
         
+        job_nodes[0]["content_hash"] = content_hash(job_nodes, job_skill_relationships, skill_relationships)
         return job_nodes, job_skill_relationships, skill_relationships
     
     def transform_resumes(self, resumes_data: List[Dict]) -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict]]:
         """Transform resumes data for loading."""
-        print("Transforming resumes data...")
         candidate_nodes = []
         candidate_skill_relationships = []
         skill_relationships = []
         experience_data = []  # New list to store experience data
         
         for resume in resumes_data:
-            # Create candidate node
-            candidate_nodes.append({
+            nodes, candidate_skill_rels, skill_rels, experiences = self._transform_resume(resume)
+            candidate_nodes.extend(nodes)
+            candidate_skill_relationships.extend(candidate_skill_rels)
+            skill_relationships.extend(skill_rels)
+            experience_data.extend(experiences)
+        
+        return candidate_nodes, candidate_skill_relationships, skill_relationships, experience_data
+    
+    @classmethod
+    def _transform_resume(cls, resume: Dict) -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict]]:
+        """Transform a single resume into its node, skill relationships and experiences."""
+        candidate_nodes = [cls._candidate_node(resume)]
+        candidate_skill_relationships = []
+        skill_relationships = []
+        experience_data = cls._experiences(resume)
+        
+        # Handle case where skills might be missing or have unexpected structure
+        skills_data = resume.get("skills", {})
+        if not isinstance(skills_data, dict):
+            skills_data = {}
+        
+        # Extract core skills
+        for skill in skills_data.get("core", []):
+            if not isinstance(skill, dict) or "skill_id" not in skill:
+                continue  # Skip invalid skill entries
+            
+            # Use proficiency field instead of proficiency_level
+            # Map string proficiency to numeric value if needed
+            proficiency_value = cls._get_proficiency_value(skill.get("proficiency", ""))
+            
+            candidate_skill_relationships.append({
                 "resume_id": resume["resume_id"],
-                "name": resume["name"],
-                "email": resume.get("email", ""),
-                "title": resume.get("title", ""),
-                "location": resume.get("location", ""),
-                "domain": resume.get("domain", ""),
-                "summary": resume.get("summary", ""),
-                "education": resume.get("education", [])
+                "skill_id": skill["skill_id"],
+                "proficiency": proficiency_value,
+                "experience_years": skill.get("experience_years", 0),
+                "is_core": True
             })
             
-            # Process experience data
-            if "experience" in resume and resume["experience"]:
-                for i, exp in enumerate(resume["experience"]):
-                    # Create a unique ID for the experience
-                    exp_id = f"{resume['resume_id']}_exp_{i}"
-                    
-                    # Create experience node data
-                    exp_data = {
-                        "exp_id": exp_id,
-                        "resume_id": resume["resume_id"],
-                        "job_title": exp.get("job_title", ""),
-                        "company": exp.get("company", ""),
-                        "start_date": exp.get("start_date", ""),
-                        "end_date": exp.get("end_date", "Present"),
-                        "description": exp.get("description", [])
-                    }
-                    
-                    # Process skills used in this experience
-                    if "skills_used" in exp and exp["skills_used"]:
-                        exp_data["skills_used"] = exp["skills_used"]
-                    
-                    experience_data.append(exp_data)
+        # Extract secondary skills
+        for skill in skills_data.get("secondary", []):
+            if not isinstance(skill, dict) or "skill_id" not in skill:
+                continue  # Skip invalid skill entries
+                
+            # Use proficiency field instead of proficiency_level
+            proficiency_value = cls._get_proficiency_value(skill.get("proficiency", ""))
             
-            # Handle case where skills might be missing or have unexpected structure
-            skills_data = resume.get("skills", {})
-            if not isinstance(skills_data, dict):
-                skills_data = {}
+            candidate_skill_relationships.append({
+                "resume_id": resume["resume_id"],
+                "skill_id": skill["skill_id"],
+                "proficiency": proficiency_value,
+                "experience_years": skill.get("experience_years", 0),
+                "is_core": False
+            })
             
-            # Extract core skills
-            for skill in skills_data.get("core", []):
-                if not isinstance(skill, dict) or "skill_id" not in skill:
-                    continue  # Skip invalid skill entries
+        # Extract skill relationships
+        for rel in resume.get("skill_relationships", []):
+            if not isinstance(rel, dict) or "source" not in rel or "target" not in rel or "type" not in rel:
+                continue  # Skip invalid relationship entries
                 
-                # Use proficiency field instead of proficiency_level
-                # Map string proficiency to numeric value if needed
-                proficiency_value = self._get_proficiency_value(skill.get("proficiency", ""))
+            skill_relationships.append({
+                "source": rel["source"],
+                "target": rel["target"],
+                "type": rel["type"],
+                "weight": rel.get("weight", 1.0)
+            })
+        
+        candidate_nodes[0]["content_hash"] = content_hash(
+            candidate_nodes, candidate_skill_relationships, skill_relationships, experience_data)
+        return candidate_nodes, candidate_skill_relationships, skill_relationships, experience_data
+    
+    @staticmethod
+    def _job_node(job: Dict) -> Dict:
+        """Build the node dictionary of a job."""
+        return {
+            "job_id": job["job_id"],
+            "title": job["title"],
+            "company": job["company"],
+            "location": job["location"],
+            "domain": job.get("domain", ""),
+            "summary": job.get("summary", ""),
+            "responsibilities": job.get("responsibilities", []),
+            "qualifications": job.get("qualifications", [])
+        }
+    
+    @staticmethod
+    def _candidate_node(resume: Dict) -> Dict:
+        """Build the node dictionary of a candidate."""
+        return {
+            "resume_id": resume["resume_id"],
+            "name": resume["name"],
+            "email": resume.get("email", ""),
+            "title": resume.get("title", ""),
+            "location": resume.get("location", ""),
+            "domain": resume.get("domain", ""),
+            "summary": resume.get("summary", ""),
+            "education": resume.get("education", [])
+        }
+    
+    @staticmethod
+    def _experiences(resume: Dict) -> List[Dict]:
+        """Build the experience dictionaries of a resume."""
+        experience_data = []
+        if "experience" in resume and resume["experience"]:
+            for i, exp in enumerate(resume["experience"]):
+                # Create a unique ID for the experience
+                exp_id = f"{resume['resume_id']}_exp_{i}"
                 
-                candidate_skill_relationships.append({
+                # Create experience node data
+                exp_data = {
+                    "exp_id": exp_id,
                     "resume_id": resume["resume_id"],
-                    "skill_id": skill["skill_id"],
-                    "proficiency": proficiency_value,
-                    "experience_years": skill.get("experience_years", 0),
-                    "is_core": True
-                })
-                
-            # Extract secondary skills
-            for skill in skills_data.get("secondary", []):
-                if not isinstance(skill, dict) or "skill_id" not in skill:
-                    continue  # Skip invalid skill entries
-                    
-                # Use proficiency field instead of proficiency_level
-                proficiency_value = self._get_proficiency_value(skill.get("proficiency", ""))
+                    "job_title": exp.get("job_title", ""),
+                    "company": exp.get("company", ""),
+                    "start_date": exp.get("start_date", ""),
+                    "end_date": exp.get("end_date", "Present"),
+                    "description": exp.get("description", [])
+                }
                 
-                candidate_skill_relationships.append({
-                    "resume_id": resume["resume_id"],
-                    "skill_id": skill["skill_id"],
-                    "proficiency": proficiency_value,
-                    "experience_years": skill.get("experience_years", 0),
-                    "is_core": False
-                })
+                # Process skills used in this experience
+                if "skills_used" in exp and exp["skills_used"]:
+                    exp_data["skills_used"] = exp["skills_used"]
                 
-            # Extract skill relationships
-            for rel in resume.get("skill_relationships", []):
-                if not isinstance(rel, dict) or "source" not in rel or "target" not in rel or "type" not in rel:
-                    continue  # Skip invalid relationship entries
-                    
-                skill_relationships.append({
-                    "source": rel["source"],
-                    "target": rel["target"],
-                    "type": rel["type"],
-                    "weight": rel.get("weight", 1.0)
-                })
-        
-        return candidate_nodes, candidate_skill_relationships, skill_relationships, experience_data
+                experience_data.append(exp_data)
+        return experience_data
     
-    def _get_proficiency_value(self, proficiency: str) -> str:
+    @staticmethod
+    def _get_proficiency_value(proficiency: str) -> str:
         """Convert proficiency to standardized string value."""
         proficiency_map = {
             "beginner": "beginner",
@@ -248,165 +339,379 @@ class ETLPipeline:
         # Default to beginner if proficiency not recognized
         return proficiency_map.get(proficiency.lower(), "beginner")
     
-    def load_skills(self, skill_nodes: List[Dict], skill_relationships: List[Dict]) -> None:
+    def load_skills(self, skill_nodes: List[Dict], skill_relationships: List[Dict],
+                    on_existing: str = "replace") -> None:
         """Load skills into knowledge graph."""
-        print(f"Loading {len(skill_nodes)} skills...")
-        for skill in skill_nodes:
-            self.skill_service.create_skill(skill)
-            
-        print(f"Loading {len(skill_relationships)} skill relationships...")
-        for rel in skill_relationships:
-            self.kg.skill_repository.add_skill_relationship(
-                rel["source"],
-                rel["target"],
-                rel["type"],
-                rel.get("weight", 1.0)
-            )
+        with self.report.stage("skills", len(skill_nodes)):
+            self.kg.skill_repository.add_skills_bulk(skill_nodes, self.batch_size)
+        if skill_relationships:
+            self.load_skill_relationships(skill_relationships, on_existing)
+    
+    def load_skill_relationships(self, skill_relationships: List[Dict], on_existing: str = "replace") -> None:
+        """Load skill-to-skill relationships into knowledge graph.
+        
+        Args:
+            skill_relationships: Relationship rows aggregated with aggregate_skill_relationships,
+                covering every occurrence of an edge so its statistics can be replaced
+            on_existing: 'replace' the statistics of existing relationships, 'keep' them
+                or 'accumulate' onto them
+        """
+        with self.report.stage("skill relationships", len(skill_relationships)):
+            self.kg.skill_repository.add_skill_relationships_bulk(skill_relationships, self.batch_size,
+                                                                  on_existing=on_existing)
     
     def load_jobs(self, job_nodes: List[Dict], job_skill_relationships: List[Dict]) -> None:
         """Load jobs into knowledge graph."""
-        print(f"Loading {len(job_nodes)} jobs...")
-        for job in job_nodes:
-            self.kg.job_repository.add_job(job)
-            
-        print(f"Loading {len(job_skill_relationships)} job skill relationships...")
-        for rel in job_skill_relationships:
-            self.kg.job_repository.add_job_skill(
-                rel["job_id"],
-                rel["skill_id"],
-                rel["proficiency"],
-                rel["importance"],
-                rel["is_primary"]
-            )
+        with self.report.stage("jobs", len(job_nodes)):
+            self.kg.job_repository.add_jobs_bulk(job_nodes, self.batch_size)
+            self.kg.job_repository.add_job_skills_bulk(job_skill_relationships, self.batch_size)
     
     def load_candidates(self, candidate_nodes: List[Dict], candidate_skill_rels: List[Dict]):
         """Load candidate data into the knowledge graph."""
-        print(f"Loading {len(candidate_nodes)} candidates into knowledge graph...")
-        for node in candidate_nodes:
-            self.kg.candidate_repository.add_candidate(node)
-            
-        print(f"Loading {len(candidate_skill_rels)} candidate-skill relationships...")
-        for rel in candidate_skill_rels:
-            self.kg.candidate_repository.add_candidate_skill(
-                rel["resume_id"],
-                rel["skill_id"],
-                rel["proficiency"],
-                rel["experience_years"],
-                rel["is_core"]
-            )
+        with self.report.stage("candidates", len(candidate_nodes)):
+            self.kg.candidate_repository.add_candidates_bulk(candidate_nodes, self.batch_size)
+            self.kg.candidate_repository.add_candidate_skills_bulk(candidate_skill_rels, self.batch_size)
     
     def load_experiences(self, experience_data: List[Dict]):
-        """Load experience data into the knowledge graph."""
-        print(f"Loading {len(experience_data)} experiences into knowledge graph...")
-        for exp in experience_data:
-            # Create the experience node
-            with self.kg.driver.session() as session:
-                # Create the experience node
-                session.run("""
-                    MERGE (e:Experience {exp_id: $exp_id})
-                    SET e.job_title = $job_title,
-                        e.company = $company,
-                        e.start_date = $start_date,
-                        e.end_date = $end_date,
-                        e.description = $description
-                """, {
-                    "exp_id": exp["exp_id"],
-                    "job_title": exp["job_title"],
-                    "company": exp["company"],
-                    "start_date": exp["start_date"],
-                    "end_date": exp["end_date"],
-                    "description": self.kg._process_text_list(exp["description"])
-                })
-                
-                # Link the experience to the candidate
-                session.run("""
-                    MATCH (c:Candidate {resume_id: $resume_id})
-                    MATCH (e:Experience {exp_id: $exp_id})
-                    MERGE (c)-[r:HAS_EXPERIENCE]->(e)
-                """, {
-                    "resume_id": exp["resume_id"],
-                    "exp_id": exp["exp_id"]
-                })
-                
-                # If there are skills used in this experience, link them
-                if "skills_used" in exp and exp["skills_used"]:
-                    for skill_name in exp["skills_used"]:
-                        # Try to find the skill by name (case insensitive)
-                        skill_result = session.run("""
-                            MATCH (s:Skill)
-                            WHERE toLower(s.name) = toLower($skill_name)
-                            RETURN s.skill_id as skill_id
-                        """, {"skill_name": skill_name})
-                        
-                        # If skill found, create the relationship
-                        skill_record = skill_result.single()
-                        if skill_record:
-                            session.run("""
-                                MATCH (e:Experience {exp_id: $exp_id})
-                                MATCH (s:Skill {skill_id: $skill_id})
-                                MERGE (e)-[r:USED_SKILL]->(s)
-                            """, {
-                                "exp_id": exp["exp_id"],
-                                "skill_id": skill_record["skill_id"]
-                            })
-        print("Experience data loading completed.")
-    
-    def run_pipeline(self, clear_db: bool = True, force: bool = False, generate_embeddings: bool = False) -> bool:
+        """Load experience data, with candidate and skill links, into the knowledge graph.
+        
+        Skill names are resolved first and the links written separately, so the
+        report shows skill lookups and experience linking as their own stages.
+        """
+        candidates = self.kg.candidate_repository
+        with self.report.stage("skill lookups", len(experience_data)):
+            experience_skills = candidates.resolve_experience_skills(experience_data)
+        with self.report.stage("experience linking", len(experience_data)):
+            candidates.add_experiences_bulk(experience_data, self.batch_size, link_skills=False)
+            candidates.add_experience_skills_bulk(experience_skills, self.batch_size)
+    
+    def transform_columnar(self, jobs_data: Iterable[Dict], resumes_data: Iterable[Dict],
+                           skill_relationships: Iterable[Dict] = ()) -> Dict:
+        """Transform jobs and resumes with relationship rows stored as NumPy columns.
+        
+        Args:
+            jobs_data: Raw job records
+            resumes_data: Raw resume records
+            skill_relationships: Taxonomy skill relationships, aggregated with those of the records
+        
+        Returns:
+            dict: Node and experience dictionaries plus columnar relationship batches
+        """
+        transformer = ColumnarTransformer()
+        transformer.add_skill_relationships(skill_relationships)
+        transformer.add_jobs(jobs_data)
+        transformer.add_resumes(resumes_data)
+        return transformer.build()
+    
+    def load_columnar(self, data: Dict) -> None:
+        """Load the output of transform_columnar into knowledge graph."""
+        job_skills = data["job_skills"]
+        with self.report.stage("jobs", len(data["job_nodes"])):
+            self.kg.job_repository.add_jobs_bulk(data["job_nodes"], self.batch_size)
+            for is_primary in (True, False):
+                mask = job_skills.columns["is_primary"] == is_primary
+                if mask.any():
+                    self.kg.job_repository.add_job_skills_columns(
+                        job_skills.to_columns(mask, ("job_id", "skill_id", "proficiency", "importance")),
+                        is_primary, self.batch_size)
+        
+        candidate_skills = data["candidate_skills"]
+        with self.report.stage("candidates", len(data["candidate_nodes"])):
+            self.kg.candidate_repository.add_candidates_bulk(data["candidate_nodes"], self.batch_size)
+            for is_core in (True, False):
+                mask = candidate_skills.columns["is_core"] == is_core
+                if mask.any():
+                    self.kg.candidate_repository.add_candidate_skills_columns(
+                        candidate_skills.to_columns(mask, ("resume_id", "skill_id", "proficiency", "experience_years")),
+                        is_core, self.batch_size)
+        
+        self.load_experiences(data["experiences"])
+        
+        skill_relationships = data["skill_relationships"]
+        with self.report.stage("skill relationships", len(skill_relationships)):
+            for code, rel_type in enumerate(skill_relationships.vocabularies["type"].values):
+                mask = skill_relationships.columns["type"] == code
+                self.kg.skill_repository.add_skill_relationships_columns(
+                    skill_relationships.to_columns(mask, ("source", "target", "weight", "weight_max", "count")),
+                    rel_type, self.batch_size)
+    
+    def transform_batches(self, records: Iterable[Dict], transform_record: Callable) -> Iterator[List[List[Dict]]]:
+        """Lazily transform records and group the output into load batches.
+        
+        Args:
+            records: Iterable of raw records, e.g. from stream_jobs()
+            transform_record: Per-record transform returning a tuple of lists
+            
+        Yields:
+            list: One list per transform output, covering at most batch_size records
+        """
+        batches = chunked(records, self.batch_size)
+        while True:
+            with self.report.stage("extract"):
+                batch = next(batches, None)
+            if batch is None:
+                return
+            with self.report.stage("transform", len(batch)):
+                outputs = None
+                for record in batch:
+                    parts = transform_record(record)
+                    if outputs is None:
+                        outputs = [[] for _ in parts]
+                    for output, items in zip(outputs, parts):
+                        output.extend(items)
+            yield outputs
+    
+    def run_streaming_load(self) -> Dict[str, int]:
+        """Extract, transform and load jobs and resumes batch by batch.
+        
+        Records are parsed incrementally and each batch is loaded before the
+        next one is read, so peak memory is bounded by the batch size rather
+        than the dataset size. Skills are loaded first so every batch can link
+        to them. Taxonomy and record skill relationships are aggregated across
+        all batches and written once at the end; their number is bounded by
+        the skill pairs, not by the number of records.
+        
+        Returns:
+            dict: Number of jobs and resumes loaded
+        """
+        skill_nodes, skill_relationships = self.transform_skills(self.extract_skills())
+        self.load_skills(skill_nodes, [])
+        
+        counts = {"jobs": 0, "resumes": 0}
+        aggregator = SkillRelationshipAggregator()
+        aggregator.add_all(skill_relationships)
+        for job_nodes, job_skill_relationships, skill_rels in self.transform_batches(self.stream_jobs(), self._transform_job):
+            self.load_jobs(job_nodes, job_skill_relationships)
+            aggregator.add_all(skill_rels)
+            counts["jobs"] += len(job_nodes)
+        
+        for candidate_nodes, candidate_skill_relationships, skill_rels, experience_data in self.transform_batches(
+                self.stream_resumes(), self._transform_resume):
+            self.load_candidates(candidate_nodes, candidate_skill_relationships)
+            self.load_experiences(experience_data)
+            aggregator.add_all(skill_rels)
+            counts["resumes"] += len(candidate_nodes)
+        
+        self.load_skill_relationships(aggregator.rows())
+        print(f"Streamed {counts['jobs']} jobs and {counts['resumes']} resumes")
+        return counts
+    
+    def run_delta_load(self) -> Dict[str, Dict[str, int]]:
+        """Upsert only new or changed records and delete records removed from the source.
+        
+        The content hash computed during the transform is compared with the hash
+        stored on each node. Unchanged records are skipped, changed records have
+        their skill links, experiences and embeddings replaced, and ETL-loaded
+        records missing from the source are deleted. Users and records created
+        through the API carry no content hash and are left alone.
+        
+        Returns:
+            dict: New, changed, unchanged and deleted counts per record type
+        """
+        summary = {}
+        
+        # Skills
+        skill_nodes, skill_relationships = self.transform_skills(self.extract_skills())
+        skill_plan = plan_changes({node["skill_id"]: node["content_hash"] for node in skill_nodes},
+                                  self.kg.skill_repository.get_content_hashes())
+        upsert = set(skill_plan["new"] + skill_plan["changed"])
+        self.load_skills([node for node in skill_nodes if node["skill_id"] in upsert],
+                         [rel for rel in skill_relationships if rel["source"] in upsert], on_existing="keep")
+        
+        # Jobs
+        stored = self.kg.job_repository.get_content_hashes()
+        source = {}
+        job_nodes, job_skill_relationships, job_skill_rels = [], [], []
+        for job in self.stream_jobs():
+            nodes, job_skill_rels_part, skill_rels = self._transform_job(job)
+            digest = source[job["job_id"]] = nodes[0]["content_hash"]
+            if stored.get(job["job_id"]) != digest:
+                job_nodes.extend(nodes)
+                job_skill_relationships.extend(job_skill_rels_part)
+                job_skill_rels.extend(skill_rels)
+        job_plan = plan_changes(source, stored)
+        self.kg.job_repository.reset_jobs_bulk(job_plan["changed"], self.batch_size)
+        self.load_jobs(job_nodes, job_skill_relationships)
+        self.kg.job_repository.delete_jobs_bulk(job_plan["deleted"], self.batch_size)
+        
+        # Candidates
+        stored = self.kg.candidate_repository.get_content_hashes()
+        source = {}
+        candidate_nodes, candidate_skill_relationships, candidate_skill_rels, experience_data = [], [], [], []
+        for resume in self.stream_resumes():
+            nodes, candidate_skill_rels_part, skill_rels, experiences = self._transform_resume(resume)
+            digest = source[resume["resume_id"]] = nodes[0]["content_hash"]
+            if stored.get(resume["resume_id"]) != digest:
+                candidate_nodes.extend(nodes)
+                candidate_skill_relationships.extend(candidate_skill_rels_part)
+                candidate_skill_rels.extend(skill_rels)
+                experience_data.extend(experiences)
+        candidate_plan = plan_changes(source, stored)
+        self.kg.candidate_repository.reset_candidates_bulk(candidate_plan["changed"], self.batch_size)
+        self.load_candidates(candidate_nodes, candidate_skill_relationships)
+        self.load_experiences(experience_data)
+        self.kg.candidate_repository.delete_candidates_bulk(candidate_plan["deleted"], self.batch_size)
+        
+        # Skill relationships observed in changed records, then skills no longer in the taxonomy.
+        # Unchanged records were counted by earlier loads, so existing relationships keep their counts.
+        self.load_skill_relationships(aggregate_skill_relationships(job_skill_rels + candidate_skill_rels),
+                                      on_existing="keep")
+        self.kg.skill_repository.delete_skills_bulk(skill_plan["deleted"], self.batch_size)
+        
+        for name, plan in (("skills", skill_plan), ("jobs", job_plan), ("candidates", candidate_plan)):
+            summary[name] = {change: len(ids) for change, ids in plan.items()}
+            print(f"Delta {name}: {summary[name]['new']} new, {summary[name]['changed']} changed, "
+                  f"{summary[name]['unchanged']} unchanged, {summary[name]['deleted']} deleted")
+        return summary
+    
+    def run_admin_export(self, output_dir: str, database: str = "neo4j") -> Dict:
+        """Write the transformed data as CSV files for neo4j-admin offline import.
+        
+        No database connection is needed; jobs and resumes are streamed from
+        the data directory.
+        
+        Args:
+            output_dir: Directory for the CSV files
+            database: Database name used in the suggested import command
+            
+        Returns:
+            dict: Export report with speed, per-file sizes and the import command
+        """
+        skill_nodes, skill_relationships = self.transform_skills(self.extract_skills())
+        exporter = AdminImportExporter(output_dir, database)
+        report = exporter.export(skill_nodes, skill_relationships, self.stream_jobs(), self.stream_resumes())
+        print_export_report(report)
+        return report
+    
+    def run_parallel_load(self, paths: Optional[List[str]] = None, workers: int = ETL_WORKERS,
+                          write_sessions: int = ETL_WRITE_SESSIONS) -> Dict:
+        """Transform input files in worker processes and load them through concurrent sessions.
+        
+        Args:
+            paths: Input JSON or JSON Lines files; defaults to the datasets in the data directory
+            workers: Number of transform processes
+            write_sessions: Maximum number of concurrent Neo4j write sessions
+            
+        Returns:
+            dict: Per-phase timing report including the bottleneck phase
+        """
+        paths = paths or self.input_files()
+        skill_nodes, skill_relationships = self.transform_skills(self.extract_skills())
+        print(f"Loading {len(paths)} files with {workers} workers and {write_sessions} write sessions...")
+        loader = ParallelLoader(self.kg, self.batch_size, workers=workers, write_sessions=write_sessions)
+        report = loader.run(paths, skill_nodes, skill_relationships)
+        print_report(report)
+        return report
+    
+    def run_pipeline(self, clear_db: bool = True, force: bool = False, generate_embeddings: bool = False,
+                     streaming: bool = False, workers: int = 0, input_paths: Optional[List[str]] = None,
+                     write_sessions: int = ETL_WRITE_SESSIONS, delta: bool = False,
+                     report_path: Optional[str] = None, columnar: bool = False) -> bool:
         """Run the complete ETL pipeline.
         
+        Every stage is measured in self.report, which is printed as a table at
+        the end of the run.
+        
         Args:
             clear_db: Whether to clear the database before loading
             force: Whether to bypass confirmation for clearing the database
             generate_embeddings: Whether to generate text embeddings for experiences and jobs
+            streaming: Whether to parse and load the input incrementally with bounded memory
+            workers: Number of transform processes; 0 runs the sequential pipeline
+            input_paths: Input files for the parallel pipeline, defaults to the datasets
+            write_sessions: Concurrent Neo4j write sessions for the parallel pipeline
+            delta: Whether to apply only the changes since the last load; the database is never cleared
+            report_path: Optional path for the JSON stage report
+            columnar: Whether to transform relationship rows into NumPy columns instead of dictionaries
             
         Returns:
             bool: True if successful, False otherwise
         """
+        self.report.reset()
         try:
             # Step 1: Clear database if requested
-            if clear_db:
-                if not self.kg.clear_database(force):
+            if clear_db and not delta:
+                with self.report.stage("clear"):
+                    cleared = self.kg.clear_database(force)
+                if not cleared:
                     return False
                 
-            # Step 2: Create constraints
-            self.kg.create_constraints()
-            
-            # Step 3: Extract data
-            skills_data = self.extract_skills()
-            jobs_data = self.extract_jobs()
-            resumes_data = self.extract_resumes()
-            
-            # Step 4: Transform data
-            skill_nodes, skill_relationships = self.transform_skills(skills_data)
-            job_nodes, job_skill_relationships, job_skill_rels = self.transform_jobs(jobs_data)
-            candidate_nodes, candidate_skill_relationships, candidate_skill_rels, experience_data = self.transform_resumes(resumes_data)
+            # Step 2: Apply pending schema migrations (constraints and indexes)
+            with self.report.stage("schema"):
+                self.kg.apply_migrations()
             
-            # Combine all skill relationships
-            all_skill_relationships = skill_relationships + job_skill_rels + candidate_skill_rels
-            
-            # Step 5: Load data
-            self.load_skills(skill_nodes, all_skill_relationships)
-            self.load_jobs(job_nodes, job_skill_relationships)
-            self.load_candidates(candidate_nodes, candidate_skill_relationships)
-            self.load_experiences(experience_data)
+            if delta:
+                # Steps 3-5: Load only new and changed records, delete removed ones
+                self.run_delta_load()
+            elif workers:
+                # Steps 3-5: Transform files in parallel, then load through concurrent sessions
+                parallel_report = self.run_parallel_load(input_paths, workers=workers, write_sessions=write_sessions)
+                for phase in parallel_report["phases"]:
+                    self.report.add(f"parallel {phase['phase']}", phase["seconds"], phase["rows"])
+            elif streaming:
+                # Steps 3-5: Extract, transform and load batch by batch
+                self.run_streaming_load()
+            elif columnar:
+                # Steps 3-5: Extract, transform relationships into columns, load column-wise
+                with self.report.stage("extract"):
+                    jobs_data = self.extract_jobs()
+                    resumes_data = self.extract_resumes()
+                with self.report.stage("transform", len(jobs_data) + len(resumes_data)):
+                    skill_nodes, skill_relationships = self.transform_skills(self.extract_skills())
+                    data = self.transform_columnar(jobs_data, resumes_data, skill_relationships)
+                del jobs_data, resumes_data
+                # Skill relationships are written once, with the columnar batches
+                self.load_skills(skill_nodes, [])
+                self.load_columnar(data)
+            else:
+                # Step 3: Extract data
+                with self.report.stage("extract"):
+                    skills_data = self.extract_skills()
+                    jobs_data = self.extract_jobs()
+                    resumes_data = self.extract_resumes()
+                
+                # Step 4: Transform data
+                with self.report.stage("transform", len(skills_data) + len(jobs_data) + len(resumes_data)):
+                    skill_nodes, skill_relationships = self.transform_skills(skills_data)
+                    job_nodes, job_skill_relationships, job_skill_rels = self.transform_jobs(jobs_data)
+                    candidate_nodes, candidate_skill_relationships, candidate_skill_rels, experience_data = self.transform_resumes(resumes_data)
+                    
+                    # Combine all skill relationships into one row per edge
+                    all_skill_relationships = aggregate_skill_relationships(
+                        skill_relationships + job_skill_rels + candidate_skill_rels)
+                
+                # Step 5: Load data
+                self.load_skills(skill_nodes, all_skill_relationships)
+                self.load_jobs(job_nodes, job_skill_relationships)
+                self.load_candidates(candidate_nodes, candidate_skill_relationships)
+                self.load_experiences(experience_data)
             
             # Step 6: Generate embeddings if requested
             if generate_embeddings:
-                print("Generating text embeddings for enhanced matching...")
                 try:
-                    success = self.kg.generate_embeddings()
+                    with self.report.stage("embeddings"):
+                        success = self.kg.generate_embeddings()
                     if not success:
                         print("Warning: Failed to generate embeddings. Enhanced matching may not work properly.")
                 except Exception as e:
                     print(f"Error generating embeddings: {str(e)}")
                     print("Enhanced matching may not work properly.")
             
+            self._emit_report(report_path)
             print("ETL pipeline completed successfully!")
             return True
             
         except Exception as e:
             print(f"Error in ETL pipeline: {str(e)}")
+            self._emit_report(report_path)
             return False
+    
+    def _emit_report(self, report_path: Optional[str]) -> None:
+        """Print the stage report and write it as JSON if a path is given."""
+        report = self.report.write_json(report_path) if report_path else self.report.to_dict()
+        print_pipeline_report(report)
+        if report_path:
+            print(f"Stage report written to {report_path}")
 
 # Legacy functions for backward compatibility
 def load_skills(kg):
@@ -590,7 +895,7 @@ def load_single_resume(kg, resume_data):
             
             with kg.driver.session() as session:
                 # Create the experience node
-                session.run("""
+                timed_run(session, "load_single_resume.experience", """
                     MERGE (e:Experience {exp_id: $exp_id})
                     SET e.job_title = $job_title,
                         e.company = $company,
@@ -604,43 +909,36 @@ def load_single_resume(kg, resume_data):
                     "start_date": exp.get("start_date", ""),
                     "end_date": exp.get("end_date", "Present"),
                     "description": kg._process_text_list(exp.get("description", []))
-                })
+                }).consume()
                 
                 # Link the experience to the candidate
-                session.run("""
+                timed_run(session, "load_single_resume.link_experience", """
                     MATCH (c:Candidate {resume_id: $resume_id})
                     MATCH (e:Experience {exp_id: $exp_id})
                     MERGE (c)-[r:HAS_EXPERIENCE]->(e)
                 """, {
                     "resume_id": resume_data["resume_id"],
                     "exp_id": exp_id
-                })
+                }).consume()
                 
-                # Process skills used in this experience if they exist
-                if "skills_used" in exp and exp["skills_used"]:
-                    for skill_name in exp["skills_used"]:
-                        # Try to find the skill by name
-                        skill_result = session.run("""
-                            MATCH (s:Skill)
-                            WHERE toLower(s.name) = toLower($skill_name)
-                            RETURN s.skill_id as skill_id
-                        """, {"skill_name": skill_name})
-                        
-                        # If skill found, create the relationship
-                        skill_record = skill_result.single()
-                        if skill_record:
-                            session.run("""
-                                MATCH (e:Experience {exp_id: $exp_id})
-                                MATCH (s:Skill {skill_id: $skill_id})
-                                MERGE (e)-[r:USED_SKILL]->(s)
-                            """, {
-                                "exp_id": exp_id,
-                                "skill_id": skill_record["skill_id"]
-                            })
+                # Resolve the skills used in memory and link them with one write
+                skill_ids = get_skill_resolver(kg.candidate_repository).resolve_many(exp.get("skills_used") or [])
+                if skill_ids:
+                    timed_run(session, "load_single_resume.link_skills", LINK_EXPERIENCE_SKILLS_QUERY, {
+                        "exp_id": exp_id,
+                        "skill_ids": skill_ids
+                    }).consume()
 
-def load_directory(kg, directory_path):
-    """Load all JSON files from a directory."""
+def load_directory(kg, directory_path, workers=0):
+    """Load all JSON files from a directory.
+    
+    With workers > 0, the files are transformed in parallel and loaded through
+    the bulk loaders instead of one record at a time.
+    """
     json_files = glob.glob(os.path.join(directory_path, "*.json"))
+    if workers:
+        ETLPipeline(kg).run_parallel_load(sorted(json_files), workers=workers)
+        return
     
     for file_path in json_files:
         filename = os.path.basename(file_path)
@@ -674,15 +972,13 @@ def initialize_knowledge_graph(data_dir=None):
         password=NEO4J_PASSWORD
     )
     
-    # Create constraints
-    kg.create_constraints()
-    
-    # Ensure user schema is set up
-    kg.ensure_user_schema()
+    # Apply pending schema migrations (constraints and indexes)
+    kg.apply_migrations()
     
     # Check if the database is empty
     with kg.driver.session() as session:
-        result = session.run("MATCH (n) RETURN count(n) as node_count")
+        result = timed_run(session, "initialize_knowledge_graph.count_nodes",
+                           "MATCH (n) RETURN count(n) as node_count")
         node_count = result.single()["node_count"]
         
     if node_count == 0:
@@ -757,9 +1053,21 @@ def main():
     parser.add_argument('--clear-only', action='store_true', help='Only clear the database without loading data')
     parser.add_argument('--generate-embeddings', action='store_true', help='Generate text embeddings for enhanced matching')
     parser.add_argument('--create-accounts-only', action='store_true', help='Only create test accounts without reloading data')
+    parser.add_argument('--batch-size', type=int, default=ETL_BATCH_SIZE, help='Rows per bulk write transaction')
+    parser.add_argument('--stream', action='store_true', help='Parse and load input incrementally with bounded memory (JSON or JSON Lines)')
+    parser.add_argument('--columnar', action='store_true', help='Transform relationship rows into NumPy columns to reduce memory')
+    parser.add_argument('--delta', action='store_true', help='Apply only new, changed and removed records instead of reloading everything')
+    parser.add_argument('--workers', type=int, default=0, help='Transform input files in this many processes (0 = sequential)')
+    parser.add_argument('--write-sessions', type=int, default=ETL_WRITE_SESSIONS, help='Concurrent Neo4j sessions for parallel loading')
+    parser.add_argument('--report', metavar='PATH', help='Write the per-stage timing and throughput report as JSON to PATH')
+    parser.add_argument('--export-admin-import', metavar='DIR', help='Write CSV files for neo4j-admin offline import to DIR instead of loading the database')
+    parser.add_argument('--input', nargs='+', help='Input files or glob patterns for parallel loading, e.g. "data/generated/*.json"')
     args = parser.parse_args()
     
-    if args.clear_only:
+    if args.export_admin_import:
+        # Offline export needs no database connection
+        ETLPipeline(None, args.data_dir or DATA_DIR).run_admin_export(args.export_admin_import)
+    elif args.clear_only:
         clear_database(args.force)
     elif args.create_accounts_only:
         # Only create test accounts
@@ -777,13 +1085,21 @@ def main():
         
         # Create ETL pipeline
         data_dir = args.data_dir or DATA_DIR
-        etl = ETLPipeline(kg, data_dir)
+        etl = ETLPipeline(kg, data_dir, batch_size=args.batch_size)
+        input_paths = sorted(path for pattern in args.input or [] for path in glob.glob(pattern)) or None
         
         # Run the pipeline
         success = etl.run_pipeline(
             clear_db=not args.no_clear,
             force=args.force,
-            generate_embeddings=args.generate_embeddings
+            generate_embeddings=args.generate_embeddings,
+            streaming=args.stream,
+            workers=args.workers,
+            input_paths=input_paths,
+            write_sessions=args.write_sessions,
+            delta=args.delta,
+            report_path=args.report,
+            columnar=args.columnar
         )
         
         # Create test accounts regardless of pipeline success
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Delta Planning for the ETL Pipeline
+
+This module provides content hashing and change detection for incremental
+loads. Each source record is hashed together with everything derived from it
+(its skill links, experiences and skill relationships). The hashes are
+compared with those stored on the graph nodes to find the new, changed and
+removed records. Nodes without a stored hash were not created by the ETL
+pipeline (e.g. jobs posted through the API) and are never touched.
+"""
+
+import hashlib
+import json
+from typing import Dict, List
+
+
+def content_hash(*parts) -> str:
+    """Compute a stable hash of JSON-serializable values.
+
+    Dictionary key order does not affect the result.
+
+    Args:
+        *parts: Values to hash together, e.g. a node and its relationships
+
+    Returns:
+        str: Hex digest
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def plan_changes(source_hashes: Dict[str, str], stored_hashes: Dict[str, str]) -> Dict[str, List[str]]:
+    """Compare source records with stored records by content hash.
+
+    Args:
+        source_hashes: Dictionary of record ID to hash for the current source data
+        stored_hashes: Dictionary of record ID to hash stored in the graph
+
+    Returns:
+        dict: Sorted 'new', 'changed', 'unchanged' and 'deleted' record ID lists
+    """
+    new, changed, unchanged = [], [], []
+    for record_id, digest in source_hashes.items():
+        stored = stored_hashes.get(record_id)
+        if stored is None:
+            new.append(record_id)
+        elif stored != digest:
+            changed.append(record_id)
+        else:
+            unchanged.append(record_id)
+    deleted = [record_id for record_id in stored_hashes if record_id not in source_hashes]
+    return {
+        "new": sorted(new),
+        "changed": sorted(changed),
+        "unchanged": sorted(unchanged),
+        "deleted": sorted(deleted)
+    }
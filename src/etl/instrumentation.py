@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+ETL Pipeline Instrumentation
+
+This module provides per-stage metrics for ETL runs. Each stage records wall
+time, the number of records handled, the process peak RSS and the database
+write counters from Neo4j result summaries. The report is a JSON document
+with a stable, versioned layout, so runs can be compared to track
+regressions, and it can be printed as a console table.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from src.backend.utils import write_counters
+
+# Bump when the layout of the JSON report changes
+REPORT_VERSION = 1
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of this process.
+
+    Returns:
+        float: Peak RSS in megabytes, or None where the resource module is unavailable
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+class PipelineReport:
+    """Collects per-stage metrics of an ETL run."""
+
+    def __init__(self):
+        """Initialize an empty report."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard recorded stages and restart the run clock."""
+        self.stages = {}
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self._started = time.perf_counter()
+        self._counters_before = write_counters.snapshot()
+
+    @contextmanager
+    def stage(self, name: str, records: int = 0):
+        """Measure a block of work as a stage.
+
+        Stages with the same name are accumulated, so batch-wise loads report
+        one line per stage.
+
+        Args:
+            name: Stage name
+            records: Number of records handled in the block
+        """
+        counters_before = write_counters.snapshot()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started, records, write_counters.since(counters_before))
+
+    def add(self, name: str, seconds: float, records: int = 0, counters: Optional[Dict[str, int]] = None) -> None:
+        """Record a measured stage.
+
+        Args:
+            name: Stage name
+            seconds: Wall time
+            records: Number of records handled
+            counters: Database write counters, see write_counters
+        """
+        entry = self.stages.setdefault(name, {
+            "stage": name, "seconds": 0.0, "records": 0, "calls": 0,
+            **dict.fromkeys(write_counters.COUNTER_NAMES, 0)
+        })
+        entry["seconds"] += seconds
+        entry["records"] += records or 0
+        entry["calls"] += 1
+        for counter, value in (counters or {}).items():
+            entry[counter] += value
+        entry["peak_rss_mb"] = peak_rss_mb()
+
+    def to_dict(self) -> Dict:
+        """Build the JSON-serializable report.
+
+        Returns:
+            dict: Versioned report with run totals and one entry per stage
+        """
+        stages = []
+        for entry in self.stages.values():
+            seconds = entry["seconds"]
+            stages.append({
+                **entry,
+                "seconds": round(seconds, 3),
+                "records_per_second": round(entry["records"] / seconds, 1) if seconds > 0 and entry["records"] else None
+            })
+        return {
+            "version": REPORT_VERSION,
+            "started_at": self.started_at,
+            "seconds": round(time.perf_counter() - self._started, 3),
+            "peak_rss_mb": peak_rss_mb(),
+            "database": write_counters.since(self._counters_before),
+            "stages": stages
+        }
+
+    def write_json(self, path: str) -> Dict:
+        """Write the report as JSON.
+
+        Args:
+            path: Output file; parent directories are created
+
+        Returns:
+            dict: The report written
+        """
+        report = self.to_dict()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        return report
+
+
+def print_pipeline_report(report: Dict) -> None:
+    """Print a pipeline report as a table.
+
+    Args:
+        report: Dictionary returned by PipelineReport.to_dict
+    """
+    print(f"ETL run finished in {report['seconds']:.2f}s, peak RSS {report['peak_rss_mb'] or '-'} MB")
+    print(f"{'stage':<22} {'seconds':>9} {'share':>6} {'records':>9} {'rec/s':>9} {'rss MB':>8} "
+          f"{'nodes+':>8} {'rels+':>8} {'props':>9}")
+    for stage in report["stages"]:
+        share = stage["seconds"] / report["seconds"] if report["seconds"] else 0
+        rate = f"{stage['records_per_second']:.0f}" if stage["records_per_second"] else "-"
+        print(f"{stage['stage']:<22} {stage['seconds']:>9.2f} {share:>6.0%} {stage['records']:>9} {rate:>9} "
+              f"{stage['peak_rss_mb'] or '-':>8} {stage['nodes_created']:>8} {stage['relationships_created']:>8} "
+              f"{stage['properties_set']:>9}")
+    database = report["database"]
+    print(f"Database: {database['nodes_created']} nodes and {database['relationships_created']} relationships "
+          f"created, {database['nodes_deleted']} nodes and {database['relationships_deleted']} relationships "
+          f"deleted, {database['properties_set']} properties set")
@@ -0,0 +1,145 @@
+"""
+Streaming JSON Reader for the ETL Pipeline
+
+This module yields records from large JSON datasets one at a time, so memory
+use stays bounded by the size of a single record rather than the whole file.
+It reads JSON Lines files, a top-level JSON array, or an object that wraps the
+array under a key (e.g. {"jobs": [...]}), using only the standard library.
+"""
+
+import json
+
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+
+_WHITESPACE = " \t\n\r"
+
+
+class _Buffer:
+    """Chunked text reader with a sliding window over the file."""
+
+    def __init__(self, handle, chunk_size):
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Read the next chunk, dropping consumed text. Returns False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.handle.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it, or '' at end of file."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char):
+        """Consume the next non-whitespace character, which must be `char`."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' but found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def decode(self, decoder):
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+                # A value ending exactly at the buffer edge may be truncated (e.g. a number)
+                if end < len(self.text) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self.fill():
+                value, end = decoder.raw_decode(self.text, self.pos)
+                self.pos = end
+                return value
+
+
+def _iter_array(buffer, decoder):
+    """Yield the elements of the array starting at the buffer position."""
+    buffer.expect("[")
+    if buffer.peek() == "]":
+        buffer.pos += 1
+        return
+    while True:
+        yield buffer.decode(decoder)
+        separator = buffer.peek()
+        buffer.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' but found '{separator or 'end of file'}'")
+
+
+def _iter_object(buffer, decoder, key):
+    """Yield the elements of the array stored under `key`, or the object itself if the key is absent."""
+    keys = key if isinstance(key, (tuple, list, set)) else (key,)
+    buffer.expect("{")
+    fields = {}
+    while buffer.peek() != "}":
+        name = buffer.decode(decoder)
+        buffer.expect(":")
+        if name in keys and buffer.peek() == "[":
+            yield from _iter_array(buffer, decoder)
+            return
+        fields[name] = buffer.decode(decoder)
+        if buffer.peek() == ",":
+            buffer.pos += 1
+    # No wrapped array: the object is a single record
+    if fields:
+        yield fields
+
+
+def iter_json_records(path, key=None, chunk_size=1 << 16):
+    """Stream records from a JSON or JSON Lines file.
+
+    Args:
+        path: Path of a .json, .jsonl or .ndjson file
+        key: Name of the array holding the records when the top-level value is
+            an object, e.g. "jobs", or a tuple of accepted names
+        chunk_size: Number of characters read at a time
+
+    Yields:
+        dict: One record at a time
+
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r") as handle:
+        if path.endswith(JSON_LINES_EXTENSIONS):
+            for line_number, line in enumerate(handle, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON on line {line_number} of {path}: {str(e)}")
+            return
+
+        buffer = _Buffer(handle, chunk_size)
+        first = buffer.peek()
+        if first == "[":
+            yield from _iter_array(buffer, decoder)
+        elif first == "{":
+            yield from _iter_object(buffer, decoder, key)
+        elif first:
+            raise ValueError(f"Unexpected content at the start of {path}: '{first}'")
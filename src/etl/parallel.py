@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+"""
+Parallel Loader for the ETL Pipeline
+
+This module parses and transforms input files in a process pool and writes
+the results through a bounded pool of concurrent Neo4j sessions. Writes run
+in dependency order (skills, then nodes, then relationships). Relationship
+rows are partitioned by skill so concurrent transactions never lock the same
+Skill node. Skill-to-skill relationships are aggregated per file by the
+workers and merged, so each edge is written once. Each phase is timed, so the report shows which stage limits
+throughput.
+"""
+
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List
+
+from src.config import ETL_WORKERS, ETL_WRITE_SESSIONS
+from src.etl.aggregation import aggregate_skill_relationships
+from src.etl.json_stream import iter_json_records
+
+RECORD_KEYS = ("jobs", "resumes")
+
+
+def transform_file(path: str) -> Dict:
+    """Parse and transform one input file. Runs in a worker process.
+
+    Records are classified by their ID field, so a file may hold jobs,
+    resumes or both.
+
+    Args:
+        path: Path of a JSON or JSON Lines file
+
+    Returns:
+        dict: Transformed rows per kind, plus record counts and elapsed seconds
+    """
+    from src.etl.data_loader import ETLPipeline
+
+    started = time.perf_counter()
+    output = {
+        "job_nodes": [], "job_skill_relationships": [],
+        "candidate_nodes": [], "candidate_skill_relationships": [],
+        "experiences": [], "skill_relationships": [],
+        "skipped": 0
+    }
+    for record in iter_json_records(path, RECORD_KEYS):
+        if not isinstance(record, dict):
+            output["skipped"] += 1
+        elif "job_id" in record:
+            nodes, job_skill_rels, skill_rels = ETLPipeline._transform_job(record)
+            output["job_nodes"].extend(nodes)
+            output["job_skill_relationships"].extend(job_skill_rels)
+            output["skill_relationships"].extend(skill_rels)
+        elif "resume_id" in record:
+            nodes, candidate_skill_rels, skill_rels, experiences = ETLPipeline._transform_resume(record)
+            output["candidate_nodes"].extend(nodes)
+            output["candidate_skill_relationships"].extend(candidate_skill_rels)
+            output["skill_relationships"].extend(skill_rels)
+            output["experiences"].extend(experiences)
+        else:
+            output["skipped"] += 1
+    output["skill_relationships"] = aggregate_skill_relationships(output["skill_relationships"])
+    output["seconds"] = time.perf_counter() - started
+    return output
+
+
+def partition(rows: List[Dict], key: str, partitions: int) -> List[List[Dict]]:
+    """Split rows into partitions so rows sharing a key always land in the same one.
+
+    The assignment is stable across calls, so the same key maps to the same
+    partition index for every row type.
+
+    Args:
+        rows: Rows to split
+        key: Row field to partition on
+        partitions: Number of partitions
+
+    Returns:
+        list: Exactly `partitions` lists, some possibly empty
+    """
+    buckets = [[] for _ in range(max(1, partitions))]
+    for row in rows:
+        buckets[zlib.crc32(str(row[key]).encode("utf-8")) % len(buckets)].append(row)
+    return buckets
+
+
+class ParallelLoader:
+    """Loads transformed input files through a process pool and concurrent write sessions."""
+
+    def __init__(self, kg, batch_size: int, workers: int = ETL_WORKERS, write_sessions: int = ETL_WRITE_SESSIONS):
+        """Initialize the loader.
+
+        Args:
+            kg: GraphService whose repositories perform the writes
+            batch_size: Rows per write transaction
+            workers: Number of transform processes
+            write_sessions: Maximum number of concurrent Neo4j sessions
+        """
+        self.kg = kg
+        self.batch_size = batch_size
+        self.workers = max(1, workers)
+        self.write_sessions = max(1, write_sessions)
+        self.phases = []
+
+    def run(self, paths: List[str], skill_nodes: List[Dict], skill_relationships: List[Dict]) -> Dict:
+        """Transform the input files in parallel and load everything in dependency order.
+
+        Args:
+            paths: Input files
+            skill_nodes: Taxonomy skill nodes, loaded before anything else
+            skill_relationships: Taxonomy skill-to-skill relationships
+
+        Returns:
+            dict: Per-phase report and the name of the slowest phase
+        """
+        self.phases = []
+        started = time.perf_counter()
+        skills = self.kg.skill_repository
+        jobs = self.kg.job_repository
+        candidates = self.kg.candidate_repository
+
+        # Skills first: every later relationship matches on them
+        self._write_phase("skills", [(skills.add_skills_bulk, skill_nodes)])
+
+        data = self._transform(paths)
+
+        self._write_phase("nodes", [
+            *[(jobs.add_jobs_bulk, rows) for rows in partition(data["job_nodes"], "job_id", self.write_sessions)],
+            *[(candidates.add_candidates_bulk, rows)
+              for rows in partition(data["candidate_nodes"], "resume_id", self.write_sessions)]
+        ])
+
+        self._write_phase("experiences", [
+            (self._add_experiences_without_skills, rows)
+            for rows in partition(data["experiences"], "resume_id", self.write_sessions)
+        ])
+
+        experience_skills = candidates.resolve_experience_skills(data["experiences"])
+        self._write_phase("skill links", self._skill_partition_tasks([
+            (jobs.add_job_skills_bulk, data["job_skill_relationships"]),
+            (candidates.add_candidate_skills_bulk, data["candidate_skill_relationships"]),
+            (candidates.add_experience_skills_bulk, experience_skills)
+        ]))
+
+        # Skill-to-skill relationships lock two Skill nodes each; write them in one session
+        self._write_phase("skill relationships", [
+            (skills.add_skill_relationships_bulk,
+             aggregate_skill_relationships(skill_relationships + data["skill_relationships"]))
+        ])
+
+        return self._report(time.perf_counter() - started, data)
+
+    # PRIVATE HELPER METHODS
+
+    def _add_experiences_without_skills(self, rows, batch_size):
+        """Write experience nodes and candidate links; skill links are written per skill partition."""
+        return self.kg.candidate_repository.add_experiences_bulk(rows, batch_size, link_skills=False)
+
+    def _skill_partition_tasks(self, writes):
+        """Group relationship writes into one task per skill partition.
+
+        A task runs its writes one after another, so at any time each Skill
+        node is written by at most one session.
+        """
+        tasks = [[] for _ in range(self.write_sessions)]
+        for write, rows in writes:
+            for index, rows_part in enumerate(partition(rows, "skill_id", self.write_sessions)):
+                if rows_part:
+                    tasks[index].append((write, rows_part))
+        return [(self._run_steps, steps) for steps in tasks if steps]
+
+    def _run_steps(self, steps, batch_size):
+        """Run a sequence of (write, rows) steps in the calling thread."""
+        return sum(write(rows, batch_size) for write, rows in steps)
+
+    def _transform(self, paths: List[str]) -> Dict:
+        """Parse and transform input files in a process pool."""
+        data = {
+            "job_nodes": [], "job_skill_relationships": [],
+            "candidate_nodes": [], "candidate_skill_relationships": [],
+            "experiences": [], "skill_relationships": []
+        }
+        started = time.perf_counter()
+        busy = 0.0
+        skipped = 0
+        workers = min(self.workers, max(1, len(paths)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for output in executor.map(transform_file, paths):
+                busy += output.pop("seconds")
+                skipped += output.pop("skipped")
+                for name, rows in output.items():
+                    data[name].extend(rows)
+
+        records = len(data["job_nodes"]) + len(data["candidate_nodes"])
+        self._record_phase("transform", time.perf_counter() - started, busy, workers, records)
+        if skipped:
+            print(f"Warning: skipped {skipped} records without a job_id or resume_id")
+        return data
+
+    def _write_phase(self, name: str, tasks: List) -> None:
+        """Run write tasks on at most write_sessions concurrent sessions and record the phase.
+
+        Args:
+            name: Phase name for the report
+            tasks: List of (write, rows) pairs; write(rows, batch_size) returns the rows written
+        """
+        tasks = [(write, rows) for write, rows in tasks if rows]
+        started = time.perf_counter()
+
+        def timed(task):
+            write, rows = task
+            task_started = time.perf_counter()
+            written = write(rows, self.batch_size)
+            return written or 0, time.perf_counter() - task_started
+
+        sessions = min(self.write_sessions, max(1, len(tasks)))
+        with ThreadPoolExecutor(max_workers=sessions, thread_name_prefix="etl-write") as executor:
+            results = list(executor.map(timed, tasks))
+
+        self._record_phase(name, time.perf_counter() - started, sum(seconds for _, seconds in results),
+                           sessions, sum(written for written, _ in results))
+
+    def _record_phase(self, name: str, wall: float, busy: float, concurrency: int, rows: int) -> None:
+        """Store timing for one phase."""
+        self.phases.append({
+            "phase": name,
+            "seconds": round(wall, 3),
+            "rows": rows,
+            "rows_per_second": round(rows / wall, 1) if wall > 0 else None,
+            "concurrency": concurrency,
+            # Share of the available worker time actually spent working
+            "utilization": round(busy / (wall * concurrency), 2) if wall > 0 else None
+        })
+
+    def _report(self, total_seconds: float, data: Dict) -> Dict:
+        """Summarize the run and identify the slowest phase."""
+        bottleneck = max(self.phases, key=lambda phase: phase["seconds"]) if self.phases else None
+        return {
+            "seconds": round(total_seconds, 3),
+            "jobs": len(data["job_nodes"]),
+            "resumes": len(data["candidate_nodes"]),
+            "phases": self.phases,
+            "bottleneck": bottleneck["phase"] if bottleneck else None
+        }
+
+
+def print_report(report: Dict) -> None:
+    """Print a parallel load report as a table.
+
+    Low utilization in a write phase means the sessions spent their time
+    waiting, i.e. the database rather than the client limits throughput.
+
+    Args:
+        report: Report returned by ParallelLoader.run
+    """
+    print(f"Loaded {report['jobs']} jobs and {report['resumes']} resumes in {report['seconds']:.2f}s")
+    print(f"{'phase':<22} {'seconds':>9} {'rows':>9} {'rows/s':>10} {'workers':>8} {'util':>6}")
+    for phase in report["phases"]:
+        rate = f"{phase['rows_per_second']:.0f}" if phase["rows_per_second"] is not None else "-"
+        utilization = f"{phase['utilization']:.0%}" if phase["utilization"] is not None else "-"
+        print(f"{phase['phase']:<22} {phase['seconds']:>9.2f} {phase['rows']:>9} {rate:>10} "
+              f"{phase['concurrency']:>8} {utilization:>6}")
+    if report["bottleneck"]:
+        hint = ("add transform workers" if report["bottleneck"] == "transform"
+                else "the database is the limit; more write sessions help only until its utilization drops")
+        print(f"Bottleneck: {report['bottleneck']} ({hint})")
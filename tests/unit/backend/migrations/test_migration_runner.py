@@ -0,0 +1,129 @@
+"""
+Unit tests for the schema migration runner
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from src.backend.migrations import MIGRATIONS, IndexedQuery, Migration, MigrationRunner, indexed_queries
+from src.backend.repositories.job_repository import JobRepository
+
+
+class TestMigrations(unittest.TestCase):
+    """Test cases for the declared migrations"""
+
+    def test_versions_are_unique_and_ordered(self):
+        """Test that versions increase and every statement is idempotent"""
+        versions = [migration.version for migration in MIGRATIONS]
+        self.assertEqual(versions, sorted(set(versions)))
+        for migration in MIGRATIONS:
+            for statement in migration.statements:
+                self.assertIn("IF NOT EXISTS", statement)
+
+    def test_indexed_queries_are_the_repository_queries(self):
+        """Test that the index-usage check explains the queries the repositories run"""
+        queries = {query.name: query for query in indexed_queries()}
+        repo = JobRepository(driver=mock.MagicMock())
+
+        with mock.patch.object(repo, 'execute_read_query', return_value=[]) as mock_read:
+            repo.find_jobs({"domain": "x"})
+            repo.get_job("job_1")
+
+        find_jobs, get_job = mock_read.call_args_list
+        self.assertEqual(find_jobs.args, (queries["JobRepository.find_jobs.domain"].query,
+                                          queries["JobRepository.find_jobs.domain"].parameters))
+        self.assertEqual(get_job.args[0], queries["JobRepository.get_job"].query)
+        self.assertIn("after_key", queries["JobRepository.find_jobs.cursor"].parameters)
+
+
+class TestMigrationRunner(unittest.TestCase):
+    """Test cases for the MigrationRunner class"""
+
+    def setUp(self):
+        self.migrations = [
+            Migration(2, "Job indexes", ("CREATE INDEX job_domain IF NOT EXISTS FOR (j:Job) ON (j.domain)",)),
+            Migration(1, "Constraints", ("CREATE CONSTRAINT a IF NOT EXISTS FOR (j:Job) REQUIRE j.job_id IS UNIQUE",)),
+            Migration(3, "Full-text", ("CREATE FULLTEXT INDEX job_text IF NOT EXISTS FOR (j:Job) ON EACH [j.title]",))
+        ]
+        self.driver = mock.MagicMock()
+        self.session = self.driver.session.return_value.__enter__.return_value
+        self.applied = []
+        self.session.run.side_effect = self._run
+        self.runner = MigrationRunner(self.driver, self.migrations)
+        patcher = mock.patch('builtins.print')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, query, *args, **kwargs):
+        result = mock.MagicMock()
+        if "MATCH (m:SchemaMigration)" in query:
+            result.data.return_value = list(self.applied)
+        return result
+
+    def _queries(self):
+        return [call.args[0] for call in self.session.run.call_args_list]
+
+    def test_migrate_applies_pending_in_version_order(self):
+        """Test that only pending migrations run, in order, and are recorded"""
+        self.applied = [{"version": 1, "description": "Constraints", "checksum": self.migrations[1].checksum,
+                         "applied_at": "2026-01-01T00:00:00Z"}]
+
+        applied = self.runner.migrate()
+
+        self.assertEqual(applied, [2, 3])
+        queries = self._queries()
+        statements = [query for query in queries if query.startswith("CREATE INDEX") or query.startswith("CREATE FULLTEXT")]
+        self.assertEqual(statements, [self.migrations[0].statements[0], self.migrations[2].statements[0]])
+        self.assertNotIn(self.migrations[1].statements[0], queries)
+        recorded = [call.args[1]["version"] for call in self.session.run.call_args_list
+                    if "MERGE (m:SchemaMigration" in call.args[0]]
+        self.assertEqual(recorded, [2, 3])
+        self.assertTrue(any("db.awaitIndexes" in query for query in queries))
+
+    def test_migrate_target_and_dry_run(self):
+        """Test that a dry run applies nothing and a target limits the versions"""
+        self.assertEqual(self.runner.migrate(dry_run=True), [1, 2, 3])
+        self.assertFalse(any(query.startswith("CREATE") for query in self._queries()))
+
+        self.assertEqual(self.runner.migrate(target=1), [1])
+
+    def test_status_detects_changed_migrations(self):
+        """Test that an applied migration whose statements changed is reported"""
+        self.applied = [
+            {"version": 1, "description": "Constraints", "checksum": self.migrations[1].checksum, "applied_at": "t1"},
+            {"version": 2, "description": "Job indexes", "checksum": "edited", "applied_at": "t2"}
+        ]
+
+        states = {migration["version"]: migration["state"] for migration in self.runner.status()}
+
+        self.assertEqual(states, {1: "applied", 2: "changed", 3: "pending"})
+
+    def test_check_index_usage(self):
+        """Test that plans scanning a label are reported and index seeks pass"""
+        plans = {
+            "EXPLAIN MATCH (j:Job {job_id: $job_id}) RETURN j": {
+                "operatorType": "ProduceResults@neo4j",
+                "children": [{"operatorType": "NodeUniqueIndexSeek@neo4j", "children": []}]
+            },
+            "EXPLAIN MATCH (j:Job) WHERE j.summary = $summary RETURN j": {
+                "operatorType": "ProduceResults@neo4j",
+                "children": [{"operatorType": "Filter@neo4j",
+                              "children": [{"operatorType": "NodeByLabelScan@neo4j", "children": []}]}]
+            }
+        }
+        self.session.run.side_effect = lambda query, *args, **kwargs: mock.MagicMock(
+            consume=mock.MagicMock(return_value=SimpleNamespace(plan=plans[query])))
+
+        report = self.runner.check_index_usage([
+            IndexedQuery("get_job", "MATCH (j:Job {job_id: $job_id}) RETURN j", {"job_id": ""}),
+            IndexedQuery("by_summary", "MATCH (j:Job) WHERE j.summary = $summary RETURN j", {"summary": ""})
+        ])
+
+        self.assertEqual([(query["uses_index"], query["scans"]) for query in report],
+                         [(True, []), (False, ["NodeByLabelScan"])])
+        self.assertEqual(report[1]["operators"], ["ProduceResults", "Filter", "NodeByLabelScan"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Unit tests for the record model.
+"""
+
+import json
+import tracemalloc
+import unittest
+
+from flask import Flask, jsonify
+
+from src.backend.models.record_model import Record, MatchRow, SkillRow, JobSummary
+from src.backend.utils.formatters import RecordJSONProvider, format_match_results
+
+MATCH_COLUMNS = ('job_id', 'title', 'company', 'resume_id', 'primaryMatchCount', 'secondaryMatchCount',
+                 'relatedMatchCount', 'primaryScore', 'secondaryScore', 'relatedScore', 'matchScore')
+ENRICHED_COLUMNS = ('hybrid_score', 'match_percentage', 'graph_score', 'graph_percentage', 'text_score',
+                    'text_percentage', 'matching_skills', 'missing_skills', 'exceeding_skills')
+
+
+class FakeNeo4jRecord:
+    """Stand-in for a neo4j Record, which exposes its columns through items()."""
+
+    def __init__(self, pairs):
+        self.pairs = pairs
+
+    def items(self):
+        return self.pairs
+
+
+class TestRecord(unittest.TestCase):
+    """Test cases for the Record types."""
+
+    def test_behaves_like_a_dictionary(self):
+        """Test mapping access, absent columns and comparison with dictionaries."""
+        row = SkillRow.from_record({"skill_id": "s1", "name": "Python", "category": None})
+
+        self.assertEqual(row["name"], "Python")
+        self.assertIsNone(row.get("category", "Other"))
+        self.assertEqual(row.get("level", 5), 5)
+        self.assertNotIn("level", row)
+        self.assertEqual(list(row), ["skill_id", "name", "category"])
+        self.assertEqual(row, {"skill_id": "s1", "name": "Python", "category": None})
+        with self.assertRaises(KeyError):
+            row["level"]
+
+        row["level"] = 7
+        del row["category"]
+        self.assertEqual(dict(row), {"skill_id": "s1", "name": "Python", "level": 7})
+        self.assertEqual(row.copy(), row)
+
+    def test_undeclared_keys_overflow(self):
+        """Test that keys outside the declared columns are kept."""
+        row = JobSummary(job_id="job_1", score=0.5)
+
+        self.assertEqual(row["score"], 0.5)
+        self.assertIn("score", row)
+        self.assertEqual(len(row), 2)
+        self.assertEqual(row.to_dict(), {"job_id": "job_1", "score": 0.5})
+        self.assertFalse(hasattr(row, "__dict__"))
+
+    def test_columns_may_not_shadow_mapping_methods(self):
+        """Test that a column named like a mapping method is rejected."""
+        with self.assertRaises(TypeError):
+            class BadRow(Record):
+                __slots__ = ('name', 'items')
+
+    def test_json_at_the_api_boundary(self):
+        """Test that jsonify encodes records nested in a response."""
+        app = Flask(__name__)
+        app.json = RecordJSONProvider(app)
+        rows = [MatchRow.from_record({"job_id": "job_1", "matchScore": 4.5})]
+
+        with app.app_context():
+            body = json.loads(jsonify({"jobs": rows}).get_data())
+
+        self.assertEqual(body, {"jobs": [{"job_id": "job_1", "matchScore": 4.5}]})
+
+    def test_match_records_are_formatted_in_place(self):
+        """Test that format_match_results enriches records without copying them."""
+        row = MatchRow.from_record({"job_id": "job_1", "matchScore": 4.0,
+                                    "primary_matching_skills": [{"skill_id": "s1"}, None]})
+
+        formatted = format_match_results([row])
+
+        self.assertIs(formatted[0], row)
+        self.assertEqual(row["match_percentage"], 40)
+        self.assertEqual(row["matching_skills"], [{"skill_id": "s1"}])
+        self.assertNotIn("primary_matching_skills", row)
+
+    def test_match_rows_allocate_less_than_dictionaries(self):
+        """Benchmark: an enriched match record allocates about half of what a dictionary row does."""
+        records = [FakeNeo4jRecord([(column, i) for column in MATCH_COLUMNS]) for i in range(5000)]
+
+        def allocated(build):
+            tracemalloc.start()
+            rows = [build(record) for record in records]
+            for row in rows:
+                for column in ENRICHED_COLUMNS:
+                    row[column] = 0
+            allocated_bytes, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return allocated_bytes
+
+        dictionary_bytes = allocated(lambda record: dict(record.items()))
+        record_bytes = allocated(MatchRow.from_record)
+
+        self.assertLess(record_bytes, dictionary_bytes * 0.6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,11 @@ import sys
 # Make sure we can import from the parent directory
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
 
+from src.backend.models.record_model import SkillRow
 from src.backend.repositories.base.repository import BaseRepository
+from src.backend.repositories.base.driver import driver_config, close_drivers
+from src.backend.utils.query_cache import QueryCache
+from src.backend.utils.query_metrics import QueryMetrics
 from neo4j import GraphDatabase, Result, ResultSummary, Record
 from neo4j.exceptions import ServiceUnavailable, AuthError
 
@@ -62,13 +66,14 @@ class TestBaseRepository(unittest.TestCase):
     def tearDown(self):
         """Clean up test environment."""
         self.repo.close()
+        close_drivers()
         
     def test_init_with_driver(self):
         """Test initialization with an existing driver."""
         repo = BaseRepository(driver=self.mock_driver)
         self.assertEqual(repo.driver, self.mock_driver)
         
-    @mock.patch('src.backend.repositories.base.repository.GraphDatabase')
+    @mock.patch('src.backend.repositories.base.driver.GraphDatabase')
     def test_init_with_connection_params(self, mock_graph_db):
         """Test initialization with connection parameters."""
         # Arrange
@@ -81,13 +86,13 @@ class TestBaseRepository(unittest.TestCase):
         repo = BaseRepository(uri=test_uri, user=test_user, password=test_password)
         
         # Assert
-        mock_graph_db.driver.assert_called_once_with(test_uri, auth=(test_user, test_password))
+        mock_graph_db.driver.assert_called_once_with(test_uri, auth=(test_user, test_password), **driver_config())
         self.assertEqual(repo.driver, self.mock_driver)
         
     @mock.patch('src.backend.repositories.base.repository.NEO4J_URI', new="bolt://default:7687")
     @mock.patch('src.backend.repositories.base.repository.NEO4J_USER', new="neo4j")
     @mock.patch('src.backend.repositories.base.repository.NEO4J_PASSWORD', new="password")
-    @mock.patch('src.backend.repositories.base.repository.GraphDatabase')
+    @mock.patch('src.backend.repositories.base.driver.GraphDatabase')
     def test_init_with_default_connection_params(self, mock_graph_db):
         """Test initialization with default connection parameters from environment."""
         # Arrange
@@ -97,12 +102,26 @@ class TestBaseRepository(unittest.TestCase):
         repo = BaseRepository()
         
         # Assert
-        mock_graph_db.driver.assert_called_once_with("bolt://default:7687", auth=("neo4j", "password"))
+        mock_graph_db.driver.assert_called_once_with("bolt://default:7687", auth=("neo4j", "password"), **driver_config())
         self.assertEqual(repo.driver, self.mock_driver)
         
     def test_close(self):
-        """Test close method."""
+        """Test that close leaves a driver passed to the constructor to its owner."""
         self.repo.close()
+        self.mock_driver.close.assert_not_called()
+        
+    @mock.patch('src.backend.repositories.base.driver.GraphDatabase')
+    def test_close_releases_the_shared_driver(self, mock_graph_db):
+        """Test that the shared driver is only closed when its last holder closes."""
+        mock_graph_db.driver.return_value = self.mock_driver
+        first = BaseRepository(uri="bolt://test:7687", user="test_user", password="test_password")
+        second = BaseRepository(uri="bolt://test:7687", user="test_user", password="test_password")
+        
+        first.close()
+        first.close()
+        self.mock_driver.close.assert_not_called()
+        
+        second.close()
         self.mock_driver.close.assert_called_once()
         
     def test_get_session(self):
@@ -144,6 +163,47 @@ class TestBaseRepository(unittest.TestCase):
         self.mock_session.execute_write.assert_called_once()
         self.assertEqual(result, self.mock_summary)
         
+    def test_execute_batched_write(self):
+        """Test that rows are written in batches, one transaction per batch, in one session."""
+        # Arrange
+        query = "UNWIND $rows AS row MERGE (n:Test {id: row.id})"
+        tx_mock = mock.MagicMock()
+        self.mock_session.execute_write.side_effect = lambda func: func(tx_mock)
+        rows = ({"id": i} for i in range(5))
+        
+        # Act
+        written = self.repo.execute_batched_write(query, rows, batch_size=2)
+        
+        # Assert
+        self.assertEqual(written, 5)
+        self.mock_driver.session.assert_called_once()
+        self.assertEqual(self.mock_session.execute_write.call_count, 3)
+        batches = [call.args[1]["rows"] for call in tx_mock.run.call_args_list]
+        self.assertEqual(batches, [[{"id": 0}, {"id": 1}], [{"id": 2}, {"id": 3}], [{"id": 4}]])
+        
+    def test_execute_batched_write_without_rows(self):
+        """Test that no transaction is opened for an empty input."""
+        written = self.repo.execute_batched_write("UNWIND $rows AS row RETURN row", [], batch_size=10)
+        
+        self.assertEqual(written, 0)
+        self.mock_session.execute_write.assert_not_called()
+
+    def test_execute_columnar_write(self):
+        """Test that columns are sliced into batches and passed as plain lists."""
+        import numpy as np
+        
+        query = "UNWIND range(0, size($id) - 1) AS i MERGE (n:Test {id: $id[i], score: $score[i]})"
+        tx_mock = mock.MagicMock()
+        self.mock_session.execute_write.side_effect = lambda func: func(tx_mock)
+        
+        written = self.repo.execute_columnar_write(
+            query, {"id": ["a", "b", "c"], "score": np.array([0.5, 0.8, 0.9])}, batch_size=2)
+        
+        self.assertEqual(written, 3)
+        batches = [call.args[1] for call in tx_mock.run.call_args_list]
+        self.assertEqual(batches, [{"id": ["a", "b"], "score": [0.5, 0.8]}, {"id": ["c"], "score": [0.9]}])
+        self.assertIsInstance(batches[0]["score"][0], float)
+
     def test_execute_read_query(self):
         """Test execute_read_query method."""
         # Arrange
@@ -157,7 +217,7 @@ class TestBaseRepository(unittest.TestCase):
         self.mock_session.execute_read.assert_called_once()
         self.assertEqual(result[0], self.test_data)
         
-    @mock.patch('src.backend.repositories.base.repository.GraphDatabase')
+    @mock.patch('src.backend.repositories.base.driver.GraphDatabase')
     def test_connect_fails_with_auth_error(self, mock_graph_db):
         """Test connection failure with authentication error."""
         # Arrange
@@ -167,7 +227,7 @@ class TestBaseRepository(unittest.TestCase):
         with self.assertRaises(AuthError):
             repo = BaseRepository(uri="bolt://test:7687", user="wrong", password="wrong")
             
-    @mock.patch('src.backend.repositories.base.repository.GraphDatabase')
+    @mock.patch('src.backend.repositories.base.driver.GraphDatabase')
     def test_connect_fails_with_service_unavailable(self, mock_graph_db):
         """Test connection failure with service unavailable."""
         # Arrange
@@ -364,5 +424,172 @@ class TestBaseRepository(unittest.TestCase):
             # Verify error was printed (line 103)
             mock_print.assert_any_call(f"Error executing query: Query execution error")
 
+    def test_execute_read_query_uses_cache(self):
+        """Test that named reads are cached and writes to their tags invalidate them."""
+        cache = QueryCache(max_entries=10, ttl_seconds=60, enabled=True)
+        query = "MATCH (j:Job {job_id: $job_id}) RETURN j.title AS title"
+        
+        with mock.patch('src.backend.repositories.base.repository.query_cache', cache):
+            first = self.repo.execute_read_query(query, {"job_id": "job_1"},
+                                                 cache_name="job.get", cache_tags=["Job:job_1"])
+            second = self.repo.execute_read_query(query, {"job_id": "job_1"},
+                                                  cache_name="job.get", cache_tags=["Job:job_1"])
+            self.repo.execute_write_query("MATCH (j:Job {job_id: $job_id}) SET j.title = 'x'", {"job_id": "job_1"})
+            self.repo.execute_read_query(query, {"job_id": "job_1"}, cache_name="job.get", cache_tags=["Job:job_1"])
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.mock_session.execute_read.call_count, 2)
+        self.assertEqual(cache.stats()["job.get"]["hits"], 1)
+        self.assertEqual(cache.stats()["job.get"]["invalidations"], 1)
+    
+    def test_failed_read_is_not_cached(self):
+        """Test that the empty result of a failed read is not cached."""
+        cache = QueryCache(max_entries=10, ttl_seconds=60, enabled=True)
+        self.mock_session.execute_read.side_effect = KeyError("Unexpected error")
+        
+        with mock.patch('src.backend.repositories.base.repository.query_cache', cache):
+            result = self.repo.execute_read_query("MATCH (s:Skill) RETURN s", cache_name="skill.all")
+        
+        self.assertEqual(result, [])
+        self.assertEqual(cache.stats()["skill.all"]["entries"], 0)
+
+    def test_transaction_shares_one_transaction_across_repositories(self):
+        """Test that all queries in a unit of work run in one transaction that commits at the end."""
+        other_repo = BaseRepository(driver=self.mock_driver)
+        tx = self.mock_session.begin_transaction.return_value
+        tx.run.return_value.__iter__.return_value = [self.mock_record]
+        
+        with mock.patch('src.backend.repositories.base.unit_of_work.write_counters') as counters:
+            with self.repo.transaction() as unit:
+                self.repo.execute_write_query("CREATE (c:Candidate)")
+                with other_repo.transaction() as nested:
+                    other_repo.execute_batched_write("UNWIND $rows AS row CREATE (:Skill)", [{}] * 3, batch_size=2)
+                records = other_repo.execute_read_query("MATCH (c:Candidate) RETURN c")
+                self.assertIs(nested, unit)
+                counters.record.assert_not_called()
+        
+        self.mock_driver.session.assert_called_once()
+        self.mock_session.begin_transaction.assert_called_once()
+        self.assertEqual(tx.run.call_count, 4)
+        self.assertEqual(records, [self.test_data])
+        tx.commit.assert_called_once()
+        tx.rollback.assert_not_called()
+        self.assertEqual(counters.record.call_count, 4)
+        self.mock_session.execute_write.assert_not_called()
+        self.mock_session.close.assert_called_once()
+    
+    def test_transaction_rolls_back_on_error(self):
+        """Test that an error inside a unit of work rolls back and the next call runs on its own."""
+        tx = self.mock_session.begin_transaction.return_value
+        
+        with self.assertRaises(ValueError):
+            with self.repo.transaction():
+                self.repo.execute_write_query("CREATE (c:Candidate)")
+                raise ValueError("invalid skill")
+        
+        tx.rollback.assert_called_once()
+        tx.commit.assert_not_called()
+        self.repo.execute_write_query("CREATE (c:Candidate)")
+        self.mock_session.execute_write.assert_called_once()
+    
+    def test_queries_are_recorded_under_the_calling_method(self):
+        """Test that executions are recorded in the query metrics under the repository method name."""
+        class JobRepository(BaseRepository):
+            def get_job(self):
+                return self.execute_query("MATCH (j:Job) RETURN j")
+        
+        metrics = QueryMetrics(slow_ms=-1)
+        repo = JobRepository(driver=self.mock_driver)
+        with mock.patch('src.backend.repositories.base.repository.query_metrics', metrics):
+            repo.get_job()
+            repo.execute_query("MATCH (s:Skill) RETURN s", query_name="SkillRepository.get_all_skills")
+        
+        queries = metrics.snapshot()['queries']
+        name = next(name for name in queries if name.endswith("JobRepository.get_job"))
+        self.assertEqual(queries[name]['count'], 1)
+        self.assertEqual(queries[name]['rows'], 1)
+        self.assertEqual(queries["SkillRepository.get_all_skills"]['count'], 1)
+    
+    def _stream_transaction(self, rows):
+        """Configure the explicit transaction of a streamed read to return rows."""
+        tx = self.mock_session.begin_transaction.return_value.__enter__.return_value
+        tx.run.return_value.__iter__.return_value = iter(rows)
+        tx.run.return_value.consume.return_value = self.mock_summary
+        return tx
+    
+    def test_stream_read_query_yields_records_lazily(self):
+        """Test that a streamed read yields records as they are consumed from one read transaction."""
+        tx = self._stream_transaction([{"job_id": "job_1"}, {"job_id": "job_2"}])
+        metrics = QueryMetrics(slow_ms=-1)
+        
+        with mock.patch('src.backend.repositories.base.repository.query_metrics', metrics):
+            stream = self.repo.stream_read_query("MATCH (j:Job) RETURN j.job_id AS job_id", fetch_size=50,
+                                                 query_name="JobRepository.export")
+            self.mock_driver.session.assert_not_called()
+            first = next(stream)
+            self.assertEqual(metrics.snapshot()['queries'], {})
+            rest = list(stream)
+        
+        self.assertEqual([first] + rest, [{"job_id": "job_1"}, {"job_id": "job_2"}])
+        self.mock_driver.session.assert_called_once_with(default_access_mode="READ", fetch_size=50)
+        tx.run.assert_called_once_with("MATCH (j:Job) RETURN j.job_id AS job_id", {})
+        stats = metrics.snapshot()['queries']["JobRepository.export"]
+        self.assertEqual((stats['count'], stats['rows'], stats['errors']), (1, 2, 0))
+    
+    def test_stream_read_query_closed_early(self):
+        """Test that a stream closed early ends its transaction without recording an error."""
+        self._stream_transaction([{"n": 1}, {"n": 2}, {"n": 3}])
+        metrics = QueryMetrics(slow_ms=-1)
+        
+        with mock.patch('src.backend.repositories.base.repository.query_metrics', metrics):
+            stream = self.repo.stream_read_query("MATCH (n) RETURN n", query_name="export")
+            next(stream)
+            stream.close()
+        
+        self.mock_session.begin_transaction.return_value.__exit__.assert_called_once()
+        self.mock_session.__exit__.assert_called_once()
+        stats = metrics.snapshot()['queries']["export"]
+        self.assertEqual((stats['rows'], stats['errors']), (1, 0))
+    
+    def test_stream_read_query_builds_record_rows(self):
+        """Test that rows are built as the requested record type."""
+        self._stream_transaction([{"skill_id": "s1", "name": "Python"}])
+        
+        rows = list(self.repo.stream_read_query("MATCH (s:Skill) RETURN s.skill_id AS skill_id, s.name AS name",
+                                                row_type=SkillRow))
+        
+        self.assertIsInstance(rows[0], SkillRow)
+        self.assertEqual(rows[0], {"skill_id": "s1", "name": "Python"})
+    
+    def test_stream_read_batches(self):
+        """Test that streamed records are grouped into bounded batches."""
+        self._stream_transaction([{"n": n} for n in range(5)])
+        
+        batches = list(self.repo.stream_read_batches("MATCH (n) RETURN n", batch_size=2))
+        
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.mock_driver.session.assert_called_once_with(default_access_mode="READ", fetch_size=2)
+    
+    def test_stream_read_query_in_transaction(self):
+        """Test that a streamed read inside a unit of work runs in its transaction."""
+        tx = self.mock_session.begin_transaction.return_value
+        tx.run.return_value.__iter__.return_value = [self.mock_record]
+        
+        with self.repo.transaction():
+            records = list(self.repo.stream_read_query("MATCH (c:Candidate) RETURN c"))
+        
+        self.assertEqual(records, [self.test_data])
+        self.mock_driver.session.assert_called_once_with(default_access_mode="WRITE")
+    
+    def test_transaction_closes_session_when_begin_fails(self):
+        """Test that a unit of work closes its session if the transaction cannot begin."""
+        self.mock_session.begin_transaction.side_effect = ServiceUnavailable("no writer")
+        
+        with self.assertRaises(ServiceUnavailable):
+            with self.repo.transaction():
+                pass
+        
+        self.mock_session.close.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
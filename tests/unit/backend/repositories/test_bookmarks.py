@@ -0,0 +1,158 @@
+"""
+Unit tests for read routing and causal consistency bookmarks.
+"""
+
+import itertools
+import unittest
+from unittest import mock
+
+from neo4j import READ_ACCESS, WRITE_ACCESS
+
+from src.backend.repositories.base import bookmarks
+from src.backend.repositories.base.bookmarks import (
+    bookmark_scope, bookmark_manager, clear_bookmarks, open_session, read_session, set_scope_resolver
+)
+from src.backend.repositories.base.repository import BaseRepository
+from src.backend.utils.query_cache import QueryCache
+
+
+class FakeRoutingDriver:
+    """Stand-in for a neo4j:// driver of a cluster with a leader and a read replica.
+
+    A write commits on the leader and hands its bookmark to the session's
+    bookmark manager. A read runs on the replica, which has only caught up
+    with the writes whose bookmarks the session waits for.
+    """
+
+    def __init__(self):
+        self.leader = []
+        self.replica = []
+        self.sessions = []
+        self._bookmarks = itertools.count(1)
+
+    def session(self, default_access_mode=WRITE_ACCESS, bookmark_manager=None, **config):
+        self.sessions.append((default_access_mode, bookmark_manager))
+        return FakeSession(self, default_access_mode, bookmark_manager)
+
+
+class FakeSession:
+    """Session of FakeRoutingDriver running a single statement per transaction function."""
+
+    def __init__(self, driver, access_mode, manager):
+        self.driver = driver
+        self.access_mode = access_mode
+        self.manager = manager
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute_write(self, work):
+        value = work(None)
+        bookmark = f"bookmark:{next(self.driver._bookmarks)}"
+        self.driver.leader.append((bookmark, value))
+        if self.manager is not None:
+            self.manager.update_bookmarks([], [bookmark])
+        return value
+
+    def execute_read(self, work):
+        seen = self.manager.get_bookmarks() if self.manager is not None else set()
+        # The replica lags behind: it has only applied the writes the session waited for
+        visible = [value for bookmark, value in self.driver.leader if bookmark in seen]
+        return work(visible)
+
+
+class TestBookmarks(unittest.TestCase):
+    """Test cases for read sessions and bookmark scopes."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.driver = FakeRoutingDriver()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        clear_bookmarks()
+        set_scope_resolver(None)
+
+    def write(self, value):
+        with open_session(self.driver) as session:
+            session.execute_write(lambda tx: value)
+
+    def read(self):
+        with read_session(self.driver) as session:
+            return session.execute_read(lambda visible: visible)
+
+    def test_reads_are_routed_to_readers(self):
+        """Test that read sessions use read access and write sessions write access."""
+        self.write("job_1")
+        self.read()
+
+        self.assertEqual([mode for mode, _ in self.driver.sessions], [WRITE_ACCESS, READ_ACCESS])
+
+    def test_user_reads_own_writes(self):
+        """Test that a write's bookmark is passed to the same user's later reads."""
+        with bookmark_scope("hm@example.com"):
+            self.write("job_1")
+            self.assertEqual(self.read(), ["job_1"])
+
+        with bookmark_scope("other@example.com"):
+            self.assertEqual(self.read(), [])
+
+    def test_no_bookmarks_outside_a_scope(self):
+        """Test that sessions outside a scope carry no bookmark manager."""
+        self.write("job_1")
+
+        self.assertEqual(self.read(), [])
+        self.assertEqual([manager for _, manager in self.driver.sessions], [None, None])
+
+    def test_scope_resolver(self):
+        """Test that the resolver supplies the scope, e.g. the request's user."""
+        set_scope_resolver(lambda: "hm@example.com")
+
+        self.write("job_1")
+
+        with bookmark_scope("hm@example.com"):
+            self.assertEqual(self.read(), ["job_1"])
+
+    def test_scopes_are_bounded(self):
+        """Test that the bookmarks of the least recently active scopes are dropped."""
+        with mock.patch.object(bookmarks, 'NEO4J_BOOKMARK_SCOPES_MAX', 2):
+            for user in ("a", "b", "c"):
+                with bookmark_scope(user):
+                    bookmark_manager(self.driver)
+
+        self.assertEqual([key for _, key in bookmarks._managers], ["b", "c"])
+
+    def test_repository_reads_use_read_sessions(self):
+        """Test that repository reads run in read sessions of the user's scope."""
+        driver = mock.MagicMock()
+        driver.session.return_value.__enter__.return_value.execute_read.return_value = []
+        repo = BaseRepository(driver=driver)
+
+        with bookmark_scope("hm@example.com"):
+            repo.execute_read_query("MATCH (j:Job) RETURN j")
+            manager = bookmark_manager(driver)
+
+        driver.session.assert_called_once_with(default_access_mode=READ_ACCESS, bookmark_manager=manager)
+
+    def test_scoped_reads_bypass_the_query_cache(self):
+        """Test that a user's reads are not served a result cached from a lagging replica."""
+        driver = mock.MagicMock()
+        driver.session.return_value.__enter__.return_value.execute_read.return_value = []
+        repo = BaseRepository(driver=driver)
+        cache = QueryCache(max_entries=10, ttl_seconds=60, enabled=True)
+
+        with mock.patch('src.backend.repositories.base.repository.query_cache', cache):
+            for _ in range(2):
+                repo.execute_read_query("MATCH (j:Job) RETURN j", cache_name="job.all")
+            with bookmark_scope("hm@example.com"):
+                repo.execute_read_query("MATCH (j:Job) RETURN j", cache_name="job.all")
+
+        self.assertEqual(cache.stats()["job.all"]["hits"], 1)
+        self.assertEqual(driver.session.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,7 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
 
 from src.backend.repositories.candidate_repository import CandidateRepository
+from src.backend.utils.skill_resolver import SkillResolver
 from neo4j import GraphDatabase, Result, ResultSummary, Record
 
 class TestCandidateRepository(unittest.TestCase):
@@ -125,6 +126,47 @@ class TestCandidateRepository(unittest.TestCase):
         self.assertTrue(result)
         self.repo.execute_write_query.assert_called_once()
         
+    def test_add_candidate_skills_bulk(self):
+        """Test that candidate skills are bulk written grouped by core and secondary skill."""
+        # Arrange
+        candidate_skills = [
+            {"resume_id": "resume_1", "skill_id": "python", "proficiency": "advanced", "experience_years": 5, "is_core": True},
+            {"resume_id": "resume_1", "skill_id": "sql", "proficiency": "beginner", "experience_years": 1, "is_core": False}
+        ]
+        
+        with mock.patch.object(self.repo, 'execute_batched_write', side_effect=lambda query, rows, batch_size: len(rows)) as mock_write:
+            # Act
+            written = self.repo.add_candidate_skills_bulk(candidate_skills, batch_size=100)
+            
+            # Assert
+            self.assertEqual(written, 2)
+            self.assertIn("HAS_CORE_SKILL", mock_write.call_args_list[0].args[0])
+            self.assertIn("HAS_SECONDARY_SKILL", mock_write.call_args_list[1].args[0])
+            
+    def test_add_experiences_bulk(self):
+        """Test that experience rows carry candidate links and skill names for one bulk write."""
+        experiences = [
+            {"exp_id": "resume_1_exp_0", "resume_id": "resume_1", "job_title": "Developer",
+             "description": ["Built APIs"], "skills_used": ["Python"]},
+            {"exp_id": "resume_1_exp_1", "resume_id": "resume_1", "job_title": "Intern"}
+        ]
+        captured = []
+        
+        def capture(query, rows, batch_size):
+            captured.extend(rows)
+            return len(captured)
+        
+        resolver = SkillResolver.build(graph_skills=[])
+        with mock.patch('src.backend.repositories.candidate_repository.get_skill_resolver', return_value=resolver):
+            with mock.patch.object(self.repo, 'execute_batched_write', side_effect=capture):
+                written = self.repo.add_experiences_bulk(experiences)
+            
+        self.assertEqual(written, 2)
+        self.assertEqual(captured[0]["skill_ids"], ["python"])
+        self.assertEqual(captured[0]["description"], json.dumps(["Built APIs"]))
+        self.assertEqual(captured[1]["skill_ids"], [])
+        self.assertEqual(captured[1]["end_date"], "Present")
+
     def test_add_candidate_experience(self):
         """Test add_candidate_experience method."""
         # Arrange
@@ -166,6 +208,27 @@ class TestCandidateRepository(unittest.TestCase):
         self.assertTrue(result)
         self.repo.execute_write_query.assert_called_once()
         
+    def test_add_candidate_experiences_and_education_batch(self):
+        """Test that experiences and education entries are each written with one query."""
+        experiences = [
+            {"experience_id": "exp_0", "title": "Developer", "company": "Acme", "start_date": datetime(2018, 1, 1)},
+            {"experience_id": "exp_1", "title": "Lead", "company": "Acme", "location": "Remote"}
+        ]
+        education = [{"education_id": "edu_0", "institution": "MIT", "degree": "BSc", "field": "CS",
+                      "end_date": datetime(2014, 6, 1)}]
+        
+        self.assertEqual(self.repo.add_candidate_experiences_batch(self.test_resume_id, experiences), 2)
+        self.assertEqual(self.repo.add_candidate_education_batch(self.test_resume_id, education), 1)
+        self.assertEqual(self.repo.add_candidate_experiences_batch(self.test_resume_id, []), 0)
+        
+        self.assertEqual(self.repo.execute_write_query.call_count, 2)
+        experience_params = self.repo.execute_write_query.call_args_list[0].args[1]
+        self.assertEqual(experience_params["experiences"][0]["start_date"], "2018-01-01")
+        self.assertEqual(experience_params["experiences"][0]["end_date"], "Present")
+        self.assertEqual(experience_params["experiences"][1]["location"], "Remote")
+        education_params = self.repo.execute_write_query.call_args_list[1].args[1]
+        self.assertEqual(education_params["education"][0]["end_date"], "2014-06-01")
+        
     def test_find_matching_jobs(self):
         """Test find_matching_jobs method."""
         # Arrange
@@ -392,6 +455,38 @@ class TestCandidateRepository(unittest.TestCase):
             self.assertEqual(len(result), 2)
             self.assertEqual(result[0]["institution"], "Test University")
             self.assertEqual(result[1]["institution"], "Another University")
+    
+    def test_get_candidate_profile(self):
+        """Test that get_candidate_profile reads all parts of a candidate in one query."""
+        # Arrange
+        resume_id = self.test_resume_id
+        row = [{
+            "candidate": {"resume_id": resume_id, "name": "John Doe"},
+            "skills": [{"skill_id": "skill_1", "name": "Python", "relationship_type": "HAS_CORE_SKILL"}],
+            "experiences": [{
+                "experience_id": "exp_1",
+                "title": "Software Developer",
+                "description": json.dumps(["Built APIs"]),
+                "skills": [{"skill_id": "skill_1", "name": "Python", "category": "Programming"}]
+            }],
+            "education": [{"education_id": "edu_1", "institution": "Test University"}]
+        }]
+        
+        with mock.patch.object(self.repo, 'execute_read_query', return_value=row) as mock_execute:
+            # Act
+            result = self.repo.get_candidate_profile(resume_id)
+            
+            # Assert
+            mock_execute.assert_called_once()
+            self.assertEqual(result.candidate["name"], "John Doe")
+            self.assertEqual(result.skills[0]["name"], "Python")
+            self.assertEqual(result.experiences[0]["description"], ["Built APIs"])
+            self.assertEqual(result.education[0]["institution"], "Test University")
+    
+    def test_get_candidate_profile_not_found(self):
+        """Test get_candidate_profile method when candidate doesn't exist."""
+        with mock.patch.object(self.repo, 'execute_read_query', return_value=[]):
+            self.assertIsNone(self.repo.get_candidate_profile("nonexistent_resume"))
 
     def test_process_text_list_with_list(self):
         """Test _process_text_list method with a list input."""
@@ -725,23 +820,35 @@ class TestCandidateRepository(unittest.TestCase):
         )
         
     def test_link_experience_skills(self):
-        """Test _link_experience_skills method."""
+        """Test _link_experience_skills resolves names in memory and links them in one write."""
         # Arrange
         exp_id = "test_exp_123"
-        skills_used = ["Python", "JavaScript"]
+        skills_used = ["Python", "python3", "JS", "Underwater Basket Weaving"]
+        resolver = SkillResolver.build(graph_skills=[])
         
-        # Mock skill query results
-        skill_results = [{"skill_id": "skill_1"}]
+        with mock.patch('src.backend.repositories.candidate_repository.get_skill_resolver', return_value=resolver):
+            with mock.patch.object(self.repo, 'execute_read_query') as mock_read:
+                with mock.patch.object(self.repo, 'execute_write_query') as mock_write:
+                    # Act
+                    self.repo._link_experience_skills(exp_id, skills_used)
+                    
+                    # Assert
+                    mock_read.assert_not_called()
+                    mock_write.assert_called_once()
+                    self.assertEqual(mock_write.call_args.args[1], {
+                        "exp_id": exp_id,
+                        "skill_ids": ["python", "javascript"]
+                    })
+                    
+    def test_link_experience_skills_without_known_skills(self):
+        """Test that no write is issued when none of the names resolve."""
+        resolver = SkillResolver.build(graph_skills=[])
         
-        # Configure mock to return skill results for execute_read_query
-        with mock.patch.object(self.repo, 'execute_read_query', return_value=skill_results):
-            # Patch execute_write_query to track calls
+        with mock.patch('src.backend.repositories.candidate_repository.get_skill_resolver', return_value=resolver):
             with mock.patch.object(self.repo, 'execute_write_query') as mock_write:
-                # Act
-                self.repo._link_experience_skills(exp_id, skills_used)
+                self.repo._link_experience_skills("test_exp_123", ["Cooking"])
                 
-                # Assert
-                self.assertEqual(mock_write.call_count, len(skills_used))
+                mock_write.assert_not_called()
                 
     def test_add_candidate_experiences_full(self):
         """Test _add_candidate_experiences method with full experience data."""
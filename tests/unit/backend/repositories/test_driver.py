@@ -0,0 +1,144 @@
+"""
+Unit tests for the shared Neo4j drivers.
+"""
+
+import threading
+import unittest
+from collections import deque
+from unittest import mock
+
+from neo4j.exceptions import ClientError, ServiceUnavailable
+
+from src.backend.repositories.base import driver as driver_module
+from src.backend.repositories.base.driver import (
+    get_driver, close_driver, close_drivers, driver_config, warm_up_pool, pool_status
+)
+from src.backend.utils.query_metrics import QueryMetrics
+
+
+class FakePool:
+    """Stand-in for the driver's connection pool internals."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.connections = {}
+        self.acquire = mock.MagicMock(return_value="connection")
+
+
+class TestDriver(unittest.TestCase):
+    """Test cases for driver creation, warm-up and pool status."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.graph_db_patcher = mock.patch('src.backend.repositories.base.driver.GraphDatabase')
+        self.mock_graph_db = self.graph_db_patcher.start()
+        self.mock_graph_db.driver.side_effect = lambda *args, **kwargs: mock.MagicMock(_pool=FakePool())
+        self.metrics_patcher = mock.patch.object(driver_module, 'acquisition_metrics', QueryMetrics(slow_ms=-1))
+        self.metrics_patcher.start()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        close_drivers()
+        self.metrics_patcher.stop()
+        self.graph_db_patcher.stop()
+
+    def test_driver_is_shared_and_configured(self):
+        """Test that one configured driver is created per database and user."""
+        driver = get_driver("bolt://db:7687", "neo4j", "secret")
+
+        self.assertIs(get_driver("bolt://db:7687", "neo4j", "secret"), driver)
+        self.assertIsNot(get_driver("bolt://db:7687", "reader", "secret"), driver)
+        self.mock_graph_db.driver.assert_any_call("bolt://db:7687", auth=("neo4j", "secret"), **driver_config())
+        self.assertEqual(self.mock_graph_db.driver.call_count, 2)
+        self.assertIn("max_connection_pool_size", driver_config())
+        self.assertIn("connection_acquisition_timeout", driver_config())
+
+    def test_driver_is_keyed_by_password(self):
+        """Test that a different password gets its own driver instead of the cached one."""
+        driver = get_driver("bolt://db:7687", "neo4j", "secret")
+
+        other = get_driver("bolt://db:7687", "neo4j", "rotated")
+
+        self.assertIsNot(other, driver)
+        self.mock_graph_db.driver.assert_called_with("bolt://db:7687", auth=("neo4j", "rotated"), **driver_config())
+
+    def test_close_driver_evicts_it(self):
+        """Test that a closed driver is replaced on the next request."""
+        driver = get_driver("bolt://db:7687", "neo4j", "secret")
+
+        close_driver(driver)
+
+        driver.close.assert_called_once()
+        self.assertIsNot(get_driver("bolt://db:7687", "neo4j", "secret"), driver)
+
+    def test_close_driver_releases_a_reference(self):
+        """Test that a shared driver stays open until every holder released it."""
+        driver = get_driver("bolt://db:7687", "neo4j", "secret")
+        get_driver("bolt://db:7687", "neo4j", "secret")
+
+        close_driver(driver)
+        driver.close.assert_not_called()
+        self.assertIs(get_driver("bolt://db:7687", "neo4j", "secret"), driver)
+
+        close_driver(driver)
+        close_driver(driver)
+        driver.close.assert_called_once()
+
+    def test_pool_status_reports_utilization_and_waits(self):
+        """Test that pool status counts pooled connections and timed acquisitions."""
+        driver = get_driver("bolt://db:7687", "neo4j", "secret")
+        pool = driver._pool
+        pool.connections["db:7687"] = deque([mock.Mock(in_use=True), mock.Mock(in_use=False)])
+
+        self.assertEqual(pool.acquire("db:7687"), "connection")
+        with mock.patch.object(driver_module, 'NEO4J_MAX_CONNECTION_POOL_SIZE', 4):
+            status = pool_status(driver)
+
+        self.assertEqual(status['max_size'], 4)
+        self.assertEqual(status['in_use'], 1)
+        self.assertEqual(status['idle'], 1)
+        self.assertEqual(status['utilization'], 0.25)
+        self.assertEqual(status['servers'], {"db:7687": {'in_use': 1, 'idle': 1}})
+        self.assertEqual(status['acquisition']['count'], 1)
+
+    def test_acquisition_timeouts_are_counted(self):
+        """Test that a failed acquisition is recorded as an error and re-raised."""
+        pool = FakePool()
+        pool.acquire.side_effect = ClientError("failed to obtain a connection from the pool within 60.0s")
+        self.mock_graph_db.driver.side_effect = None
+        self.mock_graph_db.driver.return_value = mock.MagicMock(_pool=pool)
+        driver = get_driver("bolt://db:7687", "neo4j", "secret")
+
+        with self.assertRaises(ClientError):
+            driver._pool.acquire("db:7687")
+
+        self.assertEqual(pool_status(driver)['acquisition']['errors'], 1)
+
+    def test_warm_up_holds_distinct_connections(self):
+        """Test that warm-up keeps all its transactions open until every connection is opened."""
+        driver = mock.MagicMock()
+        transactions = [mock.MagicMock() for _ in range(3)]
+        driver.session.return_value.begin_transaction.side_effect = transactions
+
+        opened = warm_up_pool(driver, connections=3)
+
+        self.assertEqual(opened, 3)
+        self.assertEqual(driver.session.call_count, 3)
+        for transaction in transactions:
+            transaction.run.assert_called_once_with("RETURN 1")
+            transaction.close.assert_called_once()
+
+    def test_warm_up_tolerates_an_unavailable_database(self):
+        """Test that warm-up does not prevent startup when the database is down."""
+        driver = mock.MagicMock()
+        driver.session.return_value.begin_transaction.side_effect = ServiceUnavailable("down")
+
+        with mock.patch('builtins.print'):
+            opened = warm_up_pool(driver, connections=3)
+
+        self.assertEqual(opened, 0)
+        driver.session.return_value.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
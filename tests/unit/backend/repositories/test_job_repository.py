@@ -12,6 +12,7 @@ import json
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
 
 from src.backend.repositories.job_repository import JobRepository
+from src.backend.utils.pagination import encode_cursor
 from neo4j import GraphDatabase, Result, ResultSummary, Record
 
 class TestJobRepository(unittest.TestCase):
@@ -129,6 +130,65 @@ class TestJobRepository(unittest.TestCase):
         self.assertTrue(result)
         self.repo.execute_write_query.assert_called_once()
         
+    def test_add_job_skills_bulk(self):
+        """Test that job skills are bulk written grouped by primary and secondary requirement."""
+        # Arrange
+        job_skills = [
+            {"job_id": "job_1", "skill_id": "python", "proficiency": "advanced", "importance": 0.8, "is_primary": True},
+            {"job_id": "job_1", "skill_id": "sql", "proficiency": "beginner", "importance": 0.4, "is_primary": False},
+            {"job_id": "job_2", "skill_id": "python", "proficiency": "expert", "importance": 0.9, "is_primary": True}
+        ]
+        
+        with mock.patch.object(self.repo, 'execute_batched_write', side_effect=lambda query, rows, batch_size: len(rows)) as mock_write:
+            # Act
+            written = self.repo.add_job_skills_bulk(job_skills, batch_size=100)
+            
+            # Assert
+            self.assertEqual(written, 3)
+            primary_query, primary_rows, _ = mock_write.call_args_list[0].args
+            secondary_query, secondary_rows, _ = mock_write.call_args_list[1].args
+            self.assertIn("REQUIRES_PRIMARY", primary_query)
+            self.assertIn("REQUIRES_SECONDARY", secondary_query)
+            self.assertEqual([row["skill_id"] for row in primary_rows], ["python", "python"])
+            self.assertEqual(secondary_rows[0]["importance"], 0.4)
+            
+    def test_add_jobs_bulk(self):
+        """Test that job rows are prepared like add_job before the bulk write."""
+        jobs = [{"job_id": "job_1", "title": "Engineer", "company": "Acme", "summary": "Build things",
+                 "responsibilities": ["Code"]}]
+        
+        with mock.patch.object(self.repo, 'execute_batched_write', side_effect=lambda query, rows, batch_size: len(list(rows))) as mock_write:
+            written = self.repo.add_jobs_bulk(jobs)
+            
+            self.assertEqual(written, 1)
+            self.assertIn("UNWIND $rows AS row", mock_write.call_args.args[0])
+    
+    def test_add_jobs_bulk_always_writes_created_at(self):
+        """Test that jobs without a creation time get an empty sort key instead of null."""
+        jobs = [{"job_id": "job_1", "title": "Engineer", "company": "Acme", "created_at": None}]
+        
+        with mock.patch.object(self.repo, 'execute_batched_write', return_value=1) as mock_write:
+            self.repo.add_jobs_bulk(jobs)
+        
+        self.assertEqual(list(mock_write.call_args.args[1])[0]["created_at"], "")
+
+    def test_get_content_hashes(self):
+        """Test that stored content hashes are returned by job ID."""
+        with mock.patch.object(self.repo, 'stream_read_query',
+                               return_value=iter([{"job_id": "job_1", "content_hash": "abc"}])) as mock_read:
+            hashes = self.repo.get_content_hashes()
+            
+            self.assertEqual(hashes, {"job_1": "abc"})
+            self.assertIn("content_hash IS NOT NULL", mock_read.call_args.args[0])
+    
+    def test_delete_jobs_bulk(self):
+        """Test that jobs are deleted through a batched write."""
+        with mock.patch.object(self.repo, 'execute_batched_write', side_effect=lambda query, rows, batch_size: len(list(rows))) as mock_write:
+            deleted = self.repo.delete_jobs_bulk(["job_1", "job_2"], batch_size=10)
+            
+            self.assertEqual(deleted, 2)
+            self.assertIn("DETACH DELETE j", mock_write.call_args.args[0])
+
     def test_find_matching_candidates(self):
         """Test find_matching_candidates method."""
         # Arrange
@@ -286,6 +346,35 @@ class TestJobRepository(unittest.TestCase):
             self.assertEqual(len(result), 2)
             self.assertEqual(result[0]["name"], "Python")
             self.assertEqual(result[1]["name"], "Testing")
+    
+    def test_get_job_profile(self):
+        """Test that get_job_profile reads a job and its skills in one query."""
+        # Arrange
+        row = [{
+            "job": {
+                "job_id": self.test_job_id,
+                "title": "Test Engineer",
+                "responsibilities": json.dumps(["Responsibility 1"]),
+                "qualifications": None
+            },
+            "skills": [{"skill_id": "skill_1", "name": "Python", "relationship_type": "REQUIRES_PRIMARY"}]
+        }]
+        
+        with mock.patch.object(self.repo, 'execute_read_query', return_value=row) as mock_execute:
+            # Act
+            result = self.repo.get_job_profile(self.test_job_id)
+            
+            # Assert
+            mock_execute.assert_called_once()
+            self.assertEqual(result.job["title"], "Test Engineer")
+            self.assertEqual(result.job["responsibilities"], ["Responsibility 1"])
+            self.assertEqual(result.job["qualifications"], [])
+            self.assertEqual(result.skills[0]["name"], "Python")
+    
+    def test_get_job_profile_not_found(self):
+        """Test get_job_profile method when job doesn't exist."""
+        with mock.patch.object(self.repo, 'execute_read_query', return_value=[]):
+            self.assertIsNone(self.repo.get_job_profile("nonexistent_job"))
             
     def test_process_text_list_with_list(self):
         """Test _process_text_list method with a list."""
@@ -393,6 +482,35 @@ class TestJobRepository(unittest.TestCase):
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0]["company"], "Tech Corp")
             self.assertEqual(result[0]["location"], "San Francisco")
+    
+    def test_find_jobs_with_cursor(self):
+        """Test that a cursor seeks past the last job of the previous page instead of skipping."""
+        cursor = encode_cursor(["2023-01-03", "job_2"])
+        
+        with mock.patch.object(self.repo, 'execute_read_query', return_value=[]) as mock_execute:
+            self.repo.find_jobs(filters={"domain": "Software"}, limit=10, offset=40, cursor=cursor)
+        
+        query, params = mock_execute.call_args[0]
+        self.assertIn("j.created_at <= $after_key AND (j.created_at < $after_key OR j.job_id < $after_id)", query)
+        self.assertIn("ORDER BY j.created_at DESC, j.job_id DESC", query)
+        self.assertEqual((params["after_key"], params["after_id"], params["offset"]), ("2023-01-03", "job_2", 0))
+    
+    def test_find_jobs_with_null_sort_key_cursor(self):
+        """Test that the page after a job without created_at is not compared with null."""
+        cursor = encode_cursor([None, "job_2"])
+        
+        with mock.patch.object(self.repo, 'execute_read_query', return_value=[]) as mock_execute:
+            self.repo.find_jobs(limit=10, cursor=cursor)
+        
+        query, params = mock_execute.call_args[0]
+        self.assertIn("(j.created_at IS NOT NULL OR j.job_id < $after_id)", query)
+        self.assertNotIn("$after_key", query)
+        self.assertEqual(params["after_id"], "job_2")
+    
+    def test_find_jobs_with_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        with self.assertRaises(ValueError):
+            self.repo.find_jobs(cursor="not-a-cursor")
             
     def test_get_job_filter_options(self):
         """Test get_job_filter_options method."""
@@ -139,6 +139,59 @@ class TestSkillRepository(unittest.TestCase):
         self.assertTrue(result)
         self.repo.execute_write_query.assert_called_once()
         
+    def test_add_skill_relationships_bulk(self):
+        """Test that skill relationships are bulk written with one query per relationship type."""
+        # Arrange
+        relationships = [
+            {"source": "python", "target": "django", "type": "RELATED_TO"},
+            {"source": "python", "target": "flask", "type": "RELATED_TO", "weight": 0.5},
+            {"source": "django", "target": "python", "type": "REQUIRES", "weight": 0.9}
+        ]
+        
+        with mock.patch.object(self.repo, 'execute_batched_write', side_effect=lambda query, rows, batch_size: len(rows)) as mock_write:
+            # Act
+            written = self.repo.add_skill_relationships_bulk(relationships, batch_size=100)
+            
+            # Assert
+            self.assertEqual(written, 3)
+            self.assertEqual(mock_write.call_count, 2)
+            related_query, related_rows, _ = mock_write.call_args_list[0].args
+            self.assertIn("MERGE (s1)-[r:`RELATED_TO`]->(s2)", related_query)
+            self.assertIn("SET r.weight = row.weight, r.weight_max = row.weight_max, r.count = row.count",
+                          related_query)
+            self.assertNotIn("ON CREATE", related_query)
+            self.assertEqual(related_rows[0], {"source": "python", "target": "django", "weight": 1.0,
+                                               "weight_max": 1.0, "count": 1})
+            self.assertEqual(len(related_rows), 2)
+    
+    def test_add_skill_relationships_bulk_keeping_existing(self):
+        """Test that aggregated rows only set statistics on new relationships when existing ones are kept."""
+        relationships = [{"source": "python", "target": "flask", "type": "RELATED_TO",
+                          "weight": 0.6, "weight_max": 0.9, "count": 12}]
+        
+        with mock.patch.object(self.repo, 'execute_batched_write', return_value=1) as mock_write:
+            self.repo.add_skill_relationships_bulk(relationships, batch_size=100, on_existing="keep")
+        
+        query, rows, _ = mock_write.call_args.args
+        self.assertIn("ON CREATE SET r.weight = row.weight, r.weight_max = row.weight_max, r.count = row.count", query)
+        self.assertNotIn("seen", query)
+        self.assertEqual(rows[0]["count"], 12)
+    
+    def test_add_skill_relationships_bulk_accumulating(self):
+        """Test that accumulated statistics are combined with the stored ones."""
+        relationships = [{"source": "python", "target": "flask", "type": "RELATED_TO", "count": 2}]
+        
+        with mock.patch.object(self.repo, 'execute_batched_write', return_value=1) as mock_write:
+            self.repo.add_skill_relationships_bulk(relationships, batch_size=100, on_existing="accumulate")
+        
+        self.assertIn("r.count = seen + count", mock_write.call_args.args[0])
+    
+    def test_add_skill_relationships_bulk_unknown_mode(self):
+        """Test that an unknown mode for existing relationships is rejected."""
+        with self.assertRaises(ValueError):
+            self.repo.add_skill_relationships_bulk([{"source": "a", "target": "b", "type": "RELATED_TO"}],
+                                                   on_existing="merge")
+
     def test_get_skill(self):
         """Test get_skill method."""
         # Arrange
@@ -661,7 +714,7 @@ class TestSkillRepository(unittest.TestCase):
         ]
         
         # Configure mock to return different results based on query
-        def mock_execute_read(query, params):
+        def mock_execute_read(query, params, **cache_options):
             if "related:Skill" in query:
                 return related_nodes
             return central_node
@@ -728,7 +781,7 @@ class TestSkillRepository(unittest.TestCase):
         ]
         
         # Configure mock to return different results based on query
-        def mock_execute_read(query, params):
+        def mock_execute_read(query, params, **cache_options):
             if "s1:Skill)-[r]-(s2:Skill" in query:
                 return edges
             return nodes
@@ -0,0 +1,71 @@
+"""
+Unit tests for the Admin Routes.
+"""
+
+import unittest
+import os
+import sys
+from unittest import mock
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+
+# Make sure we can import from the parent directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
+
+from src.backend.models.user_model import User
+from src.backend.routes.admin_routes import init_routes
+from src.backend.utils.query_metrics import QueryMetrics
+
+
+class TestAdminRoutes(unittest.TestCase):
+    """Test case for the Admin Routes."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.app = Flask(__name__)
+        self.app.config["JWT_SECRET_KEY"] = "test-secret-key-of-sufficient-length"
+        self.app.config["TESTING"] = True
+        self.jwt = JWTManager(self.app)
+        init_routes(self.app)
+        
+        @self.jwt.user_lookup_loader
+        def user_lookup_callback(_jwt_header, jwt_data):
+            if jwt_data["sub"] == "admin@example.com":
+                return User("admin@example.com", "hash", "Admin", "admin")
+            return User("candidate@example.com", "hash", "Candidate", "candidate", "resume_123")
+        
+        self.client = self.app.test_client()
+    
+    def get_metrics(self, email):
+        with self.app.test_request_context():
+            token = create_access_token(identity=email)
+        return self.client.get('/api/admin/metrics', headers={'Authorization': f'Bearer {token}'})
+    
+    def test_get_metrics(self):
+        """Test that admins get the query metrics and slow-query log."""
+        metrics = QueryMetrics(slow_ms=100)
+        metrics.record("JobRepository.get_job", 3, rows=1)
+        with mock.patch('builtins.print'):
+            metrics.record("JobRepository.find_jobs", 250, rows=20, query="MATCH (j:Job) RETURN j")
+        
+        with mock.patch('src.backend.routes.admin_routes.query_metrics', metrics):
+            response = self.get_metrics("admin@example.com")
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data["queries"]["JobRepository.get_job"]["count"], 1)
+        self.assertEqual([entry["name"] for entry in data["slow_queries"]], ["JobRepository.find_jobs"])
+        self.assertEqual(data["slow_query_ms"], 100)
+        self.assertIn("query_cache", data)
+        self.assertIn("nodes_created", data["write_counters"])
+        self.assertIn("connection_pool", data)
+    
+    def test_get_metrics_requires_admin(self):
+        """Test that non-admin users are rejected."""
+        response = self.get_metrics("candidate@example.com")
+        
+        self.assertEqual(response.status_code, 403)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -205,7 +205,7 @@ class TestCandidateRoutes(unittest.TestCase):
             'location': 'San Francisco',
             'skill': 'Python'
         }
-        self.mock_candidate_service.find_candidates.assert_called_once_with(expected_filters, 10, 0)
+        self.mock_candidate_service.find_candidates.assert_called_once_with(expected_filters, 10, 0, None)
 
     def test_get_all_candidates_error(self):
         """Test getting all candidates when service returns an error."""
@@ -571,6 +571,33 @@ class TestCandidateRoutes(unittest.TestCase):
         # which calls the service method, so we only expect one call
         self.assertEqual(self.mock_candidate_service.get_matching_jobs.call_count, 1)
 
+        # Hybrid retrieval is opt-in; the graph ranking stays the default
+        call_args = self.mock_candidate_service.get_matching_jobs.call_args
+        self.assertEqual(call_args[1]['retrieval'], 'graph')
+
+    def test_get_candidate_matches_enhanced_hybrid_retrieval(self):
+        """Test that hybrid retrieval is used when requested."""
+        self.mock_candidate_service.get_matching_jobs.return_value = {'success': True, 'jobs': [], 'total': 0}
+
+        response = self.client.get(
+            '/api/candidates/resume_123/jobs/enhanced?retrieval=hybrid',
+            headers={'Authorization': 'Bearer test_token'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        call_args = self.mock_candidate_service.get_matching_jobs.call_args
+        self.assertEqual(call_args[1]['retrieval'], 'hybrid')
+
+    def test_get_candidate_matches_enhanced_invalid_retrieval(self):
+        """Test that an unknown retrieval mode is rejected."""
+        response = self.client.get(
+            '/api/candidates/resume_123/jobs/enhanced?retrieval=magic',
+            headers={'Authorization': 'Bearer test_token'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.mock_candidate_service.get_matching_jobs.assert_not_called()
+
     def test_get_matches_enhanced_error(self):
         """Test getting enhanced matches with service error."""
         # Mock the service response
@@ -0,0 +1,63 @@
+"""
+Unit tests for the Health Routes.
+"""
+
+import unittest
+from unittest import mock
+from flask import Flask
+from neo4j.exceptions import ServiceUnavailable
+
+from src.backend.routes.health_routes import init_routes
+
+
+class TestHealthRoutes(unittest.TestCase):
+    """Test case for the Health Routes."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.app = Flask(__name__)
+        self.app.config["TESTING"] = True
+        self.graph_service = mock.MagicMock()
+        init_routes(self.app, self.graph_service)
+        self.client = self.app.test_client()
+
+        self.pool_status = {
+            'max_size': 100, 'in_use': 2, 'idle': 3, 'utilization': 0.02,
+            'servers': {'db:7687': {'in_use': 2, 'idle': 3}},
+            'acquisition': {'count': 10, 'errors': 0, 'mean_ms': 0.4, 'p95_ms': 1, 'max_ms': 2.5, 'histogram': {}}
+        }
+        self.status_patcher = mock.patch('src.backend.routes.health_routes.pool_status', return_value=self.pool_status)
+        self.status_patcher.start()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.status_patcher.stop()
+
+    def test_get_health(self):
+        """Test that the pool utilization and wait times are reported without server addresses."""
+        response = self.client.get('/api/health')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data["status"], "ok")
+        self.assertEqual(data["database"], {"status": "up"})
+        self.assertEqual(data["connection_pool"]["in_use"], 2)
+        self.assertEqual(data["connection_pool"]["acquisition"],
+                         {'count': 10, 'errors': 0, 'mean_ms': 0.4, 'p95_ms': 1, 'max_ms': 2.5})
+        self.assertNotIn("servers", data["connection_pool"])
+
+    def test_get_health_database_down(self):
+        """Test that an unreachable database is reported as unavailable."""
+        self.graph_service.driver.session.side_effect = ServiceUnavailable("Connection refused")
+
+        response = self.client.get('/api/health')
+
+        self.assertEqual(response.status_code, 503)
+        data = response.get_json()
+        self.assertEqual(data["status"], "unavailable")
+        self.assertEqual(data["database"]["status"], "down")
+        self.assertIn("connection_pool", data)
+
+
+if __name__ == '__main__':
+    unittest.main()
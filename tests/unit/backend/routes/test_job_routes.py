@@ -127,7 +127,7 @@ class TestJobRoutes(unittest.TestCase):
             'location': 'San Francisco',
             'owner_email': 'employer@example.com'
         }
-        self.mock_job_service.find_jobs.assert_called_once_with(expected_filters, 5, 10)
+        self.mock_job_service.find_jobs.assert_called_once_with(expected_filters, 5, 10, None)
     
     def test_get_all_jobs_failure(self):
         """Test getting all jobs when service returns an error."""
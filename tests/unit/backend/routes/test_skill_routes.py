@@ -152,7 +152,7 @@ class TestSkillRoutes(unittest.TestCase):
         
         # Verify service was called with correct filters
         expected_filters = {'name': 'Python', 'category': 'Programming'}
-        self.mock_skill_service.find_skills.assert_called_once_with(expected_filters, 10, 0)
+        self.mock_skill_service.find_skills.assert_called_once_with(expected_filters, 10, 0, None)
 
     def test_get_all_skills_failure(self):
         """Test getting all skills with service error."""
@@ -11,6 +11,7 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
 
 from src.backend.services.candidate_service import CandidateService
+from src.backend.repositories.candidate_repository import CandidateProfile
 from src.backend.models.candidate_model import Candidate, CandidateSkill, Experience, Education
 
 
@@ -38,6 +39,10 @@ class TestCandidateService(unittest.TestCase):
         # Replace the matching_service directly
         self.candidate_service.matching_service = self.mock_matching_service
         
+        # Replace the embedding worker directly
+        self.mock_embedding_worker = MagicMock()
+        self.candidate_service.embedding_worker = self.mock_embedding_worker
+        
         # Sample candidate data
         self.sample_candidate_data = {
             "name": "John Doe",
@@ -116,7 +121,19 @@ class TestCandidateService(unittest.TestCase):
         
         # Verify repository calls
         self.mock_candidate_repository.add_candidate.assert_called_once()
-        self.assertEqual(self.mock_candidate_repository.add_candidate_skill.call_count, 2)  # One for core and one for secondary skill
+        # All writes run in one transaction, with one batched write per kind of related data
+        self.mock_candidate_repository.transaction.assert_called_once()
+        self.mock_candidate_repository.transaction.return_value.__exit__.assert_called_once_with(None, None, None)
+        skill_rows = self.mock_candidate_repository.add_candidate_skills_bulk.call_args.args[0]
+        self.assertEqual([(row['skill_id'], row['is_core']) for row in skill_rows], [("s1", True), ("s2", False)])
+        self.mock_candidate_repository.add_candidate_skill.assert_not_called()
+        experiences = self.mock_candidate_repository.add_candidate_experiences_batch.call_args.args[1]
+        self.assertEqual(experiences[0]['experience_id'], f"{resume_id}_exp_0")
+        self.assertEqual(experiences[0]['description'], '["Led a team of 5 developers", "Implemented new features"]')
+        education = self.mock_candidate_repository.add_candidate_education_batch.call_args.args[1]
+        self.assertEqual(education[0]['education_id'], f"{resume_id}_edu_0")
+        # Verify the new profile is queued for embedding
+        self.mock_embedding_worker.enqueue_candidate.assert_called_once_with(resume_id)
     
     def test_create_candidate_validation_error(self):
         """Test creating a candidate with validation errors."""
@@ -175,10 +192,8 @@ class TestCandidateService(unittest.TestCase):
         ]
         
         # Set up mock repository
-        self.mock_candidate_repository.get_candidate.return_value = self.sample_candidate
-        self.mock_candidate_repository.get_candidate_skills.return_value = skills
-        self.mock_candidate_repository.get_candidate_experiences.return_value = experiences
-        self.mock_candidate_repository.get_candidate_education.return_value = education
+        self.mock_candidate_repository.get_candidate_profile.return_value = CandidateProfile(
+            self.sample_candidate, skills, experiences, education)
         
         # Call service method
         result = self.candidate_service.get_candidate(resume_id)
@@ -191,18 +206,18 @@ class TestCandidateService(unittest.TestCase):
         self.assertEqual(len(result['candidate']['experience']), 1)
         self.assertEqual(len(result['candidate']['education']), 1)
         
-        # Verify repository calls
-        self.mock_candidate_repository.get_candidate.assert_called_once_with(resume_id)
-        self.mock_candidate_repository.get_candidate_skills.assert_called_once_with(resume_id)
-        self.mock_candidate_repository.get_candidate_experiences.assert_called_once_with(resume_id)
-        self.mock_candidate_repository.get_candidate_education.assert_called_once_with(resume_id)
+        # Verify the profile is read in one repository call
+        self.mock_candidate_repository.get_candidate_profile.assert_called_once_with(resume_id)
+        self.mock_candidate_repository.get_candidate_skills.assert_not_called()
+        self.mock_candidate_repository.get_candidate_experiences.assert_not_called()
+        self.mock_candidate_repository.get_candidate_education.assert_not_called()
     
     def test_get_candidate_not_found(self):
         """Test getting a candidate that doesn't exist."""
         resume_id = "resume_nonexistent"
         
         # Set up mock repository to return None for non-existent candidate
-        self.mock_candidate_repository.get_candidate.return_value = None
+        self.mock_candidate_repository.get_candidate_profile.return_value = None
         
         # Call service method
         result = self.candidate_service.get_candidate(resume_id)
@@ -212,10 +227,7 @@ class TestCandidateService(unittest.TestCase):
         self.assertIn("not found", result['error'])
         
         # Verify repository calls
-        self.mock_candidate_repository.get_candidate.assert_called_once_with(resume_id)
-        self.mock_candidate_repository.get_candidate_skills.assert_not_called()
-        self.mock_candidate_repository.get_candidate_experiences.assert_not_called()
-        self.mock_candidate_repository.get_candidate_education.assert_not_called()
+        self.mock_candidate_repository.get_candidate_profile.assert_called_once_with(resume_id)
     
     def test_update_candidate_success(self):
         """Test updating a candidate successfully."""
@@ -244,7 +256,8 @@ class TestCandidateService(unittest.TestCase):
         # Verify repository calls
         self.mock_candidate_repository.get_candidate.assert_called_once_with(resume_id)
         self.mock_candidate_repository.add_candidate.assert_called_once()
-        self.assertTrue(self.mock_candidate_repository.add_candidate_skill.called)
+        self.mock_candidate_repository.transaction.assert_called_once()
+        self.assertTrue(self.mock_candidate_repository.add_candidate_skills_bulk.called)
     
     def test_update_candidate_not_found(self):
         """Test updating a candidate that doesn't exist."""
@@ -347,7 +360,7 @@ class TestCandidateService(unittest.TestCase):
         self.assertEqual(result['jobs'][0]['job_id'], "job_1")
         
         # Verify matching service was called correctly
-        self.mock_matching_service.get_matching_jobs_for_candidate.assert_called_once_with(resume_id, 10, 0.0, None)
+        self.mock_matching_service.get_matching_jobs_for_candidate.assert_called_once_with(resume_id, 10, 0.0, None, retrieval='graph')
     
     def test_get_matching_jobs_candidate_not_found(self):
         """Test getting matching jobs for a candidate that doesn't exist."""
@@ -367,7 +380,7 @@ class TestCandidateService(unittest.TestCase):
         self.assertIn("not found", result['error'])
         
         # Verify matching service was called correctly
-        self.mock_matching_service.get_matching_jobs_for_candidate.assert_called_once_with(resume_id, 10, 0.0, None)
+        self.mock_matching_service.get_matching_jobs_for_candidate.assert_called_once_with(resume_id, 10, 0.0, None, retrieval='graph')
     
     def test_validate_candidate_data(self):
         """Test validating candidate data."""
@@ -0,0 +1,116 @@
+"""
+Unit tests for the background embedding worker
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+from src.backend.services.embedding_worker import EmbeddingWorker
+from src.backend.services.graph_service import GraphService
+
+
+class TestEmbeddingWorker(unittest.TestCase):
+    """Unit tests for the EmbeddingWorker class."""
+
+    def setUp(self):
+        """Set up before each test."""
+        EmbeddingWorker._instance = None
+        self.mock_graph_service = mock.MagicMock(spec=GraphService)
+        self.mock_graph_service.embed_jobs.side_effect = lambda ids: len(ids)
+        self.mock_graph_service.embed_candidates.side_effect = lambda ids: len(ids)
+
+        self.print_patcher = mock.patch('builtins.print')
+        self.print_patcher.start()
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.print_patcher.stop()
+        EmbeddingWorker._instance = None
+
+    def test_records_are_micro_batched_and_deduplicated(self):
+        """Test that queued records are grouped by type and encoded together"""
+        worker = EmbeddingWorker(self.mock_graph_service, batch_size=10, flush_ms=200)
+        try:
+            worker.enqueue_job('job_1')
+            worker.enqueue_job('job_2')
+            worker.enqueue_job('job_1')
+            worker.enqueue_candidate('resume_1')
+            self.assertTrue(worker.flush(timeout=5))
+        finally:
+            worker.stop()
+
+        self.mock_graph_service.embed_jobs.assert_called_once_with(['job_1', 'job_2'])
+        self.mock_graph_service.embed_candidates.assert_called_once_with(['resume_1'])
+        self.mock_graph_service.refresh_semantic_matches_for.assert_called_once_with(['job_1', 'job_2'], ['resume_1'])
+        stats = worker.get_stats()
+        self.assertEqual(stats['enqueued'], 4)
+        self.assertEqual(stats['embedded'], 3)
+        self.assertEqual(stats['batches'], 1)
+        self.assertEqual(stats['pending'], 0)
+
+    def test_full_batch_is_processed_without_waiting_for_flush_interval(self):
+        """Test that a batch is encoded as soon as it reaches batch_size"""
+        worker = EmbeddingWorker(self.mock_graph_service, batch_size=2, flush_ms=60000)
+        try:
+            worker.enqueue_job('job_1')
+            worker.enqueue_job('job_2')
+            self.assertTrue(worker.flush(timeout=5))
+        finally:
+            worker.stop()
+
+        self.mock_graph_service.embed_jobs.assert_called_once_with(['job_1', 'job_2'])
+
+    def test_semantic_matches_are_not_refreshed_without_embeddings(self):
+        """Test that no semantic matches are recomputed when nothing was embedded"""
+        self.mock_graph_service.embed_jobs.side_effect = lambda ids: 0
+        worker = EmbeddingWorker(self.mock_graph_service, batch_size=1, flush_ms=10)
+        try:
+            worker.enqueue_job('job_1')
+            self.assertTrue(worker.flush(timeout=5))
+        finally:
+            worker.stop()
+
+        self.mock_graph_service.refresh_semantic_matches_for.assert_not_called()
+
+    def test_enqueue_never_blocks_when_queue_is_full(self):
+        """Test that records are dropped instead of blocking the request"""
+        release = threading.Event()
+        self.mock_graph_service.embed_jobs.side_effect = lambda ids: release.wait(5) and len(ids)
+
+        worker = EmbeddingWorker(self.mock_graph_service, batch_size=1, flush_ms=0, max_queue=1)
+        try:
+            results = [worker.enqueue_job(f"job_{i}") for i in range(5)]
+        finally:
+            release.set()
+            worker.stop()
+
+        self.assertIn(False, results)
+        self.assertGreater(worker.get_stats()['dropped'], 0)
+
+    def test_errors_do_not_stop_the_worker(self):
+        """Test that the worker keeps running after a failing batch"""
+        self.mock_graph_service.embed_jobs.side_effect = [Exception("boom"), 1]
+
+        worker = EmbeddingWorker(self.mock_graph_service, batch_size=1, flush_ms=0)
+        try:
+            worker.enqueue_job('job_1')
+            self.assertTrue(worker.flush(timeout=5))
+            worker.enqueue_job('job_2')
+            self.assertTrue(worker.flush(timeout=5))
+        finally:
+            worker.stop()
+
+        stats = worker.get_stats()
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(stats['embedded'], 1)
+
+    def test_empty_ids_are_ignored(self):
+        """Test that missing IDs are not queued"""
+        worker = EmbeddingWorker(self.mock_graph_service)
+        self.assertFalse(worker.enqueue_candidate(None))
+        self.assertIsNone(worker._thread)
+
+
+if __name__ == '__main__':
+    unittest.main()
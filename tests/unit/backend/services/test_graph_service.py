@@ -13,6 +13,7 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
 
 from src.backend.services.graph_service import GraphService
+from src.backend.repositories.base.driver import close_drivers
 from src.backend.repositories.job_repository import JobRepository
 from src.backend.repositories.candidate_repository import CandidateRepository
 from src.backend.repositories.skill_repository import SkillRepository
@@ -42,8 +43,9 @@ class TestGraphService(unittest.TestCase):
         self.driver_patcher.stop()
         self.print_patcher.stop()
         
-        # Reset the singleton for the next test
+        # Reset the singleton and the shared drivers for the next test
         GraphService._instance = None
+        close_drivers()
     
     def test_initialization(self):
         """Test that service initialization works correctly."""
@@ -148,27 +150,114 @@ class TestGraphService(unittest.TestCase):
                 # Verify the model was instantiated
                 mock_sentence_transformers.SentenceTransformer.assert_called_with('all-MiniLM-L6-v2')
                 
+    def _clear_database_session(self, nodes, relationships, schema=None):
+        """Create a mock session that simulates a graph for clear_database."""
+        remaining = {"nodes": nodes, "relationships": relationships}
+        schema = schema or {}
+        
+        def run(query, limit=None, **kwargs):
+            result = mock.MagicMock()
+            if query.startswith("SHOW CONSTRAINTS"):
+                result.__iter__.return_value = iter(schema.get("constraints", []))
+            elif query.startswith("SHOW INDEXES"):
+                result.__iter__.return_value = iter(schema.get("indexes", []))
+            elif "LIMIT $limit" in query:
+                kind = "relationships" if "()-[r]->()" in query else "nodes"
+                deleted = min(limit, remaining[kind])
+                remaining[kind] -= deleted
+                result.single.return_value = {"deleted": deleted}
+            elif "count(r)" in query:
+                result.single.return_value = {"count": remaining["relationships"]}
+            elif "count(n)" in query:
+                result.single.return_value = {"count": remaining["nodes"]}
+            return result
+        
+        session = mock.MagicMock()
+        session.run.side_effect = run
+        return session, remaining
+    
     def test_clear_database_with_force(self):
-        """Test the clear_database method with force=True."""
+        """Test that clear_database deletes relationships, then nodes, in bounded batches."""
         # Create service
         service = GraphService()
-        
-        # Create mock session
-        mock_session = mock.MagicMock()
-        mock_session_instance = mock.MagicMock()
-        mock_session.return_value.__enter__.return_value = mock_session_instance
-        
-        # Setup driver.session to return our mock session
-        service.driver.session = mock_session
+        mock_session_instance, remaining = self._clear_database_session(nodes=25, relationships=12)
+        service.driver.session = mock.MagicMock()
+        service.driver.session.return_value.__enter__.return_value = mock_session_instance
         
         # Call the method with force=True to skip confirmation
-        result = service.clear_database(force=True)
+        with mock.patch('builtins.print'):
+            result = service.clear_database(force=True, batch_size=10)
         
         # Verify the result
         self.assertTrue(result)
+        self.assertEqual(remaining, {"nodes": 0, "relationships": 0})
+        delete_calls = [call for call in mock_session_instance.run.call_args_list if "LIMIT $limit" in call.args[0]]
+        # 2 relationship batches (10 + 2), 3 node batches (10 + 10 + 5)
+        self.assertEqual(len(delete_calls), 5)
+        self.assertTrue(all(call.kwargs["limit"] == 10 for call in delete_calls))
+        self.assertNotIn(mock.call("MATCH (n) DETACH DELETE n"), mock_session_instance.run.call_args_list)
+    
+    def test_clear_database_drops_and_recreates_schema_for_large_graphs(self):
+        """Test that indexes and constraints are dropped during a large wipe and recreated afterwards."""
+        service = GraphService()
+        schema = {
+            "constraints": [{"name": "job_id", "createStatement": "CREATE CONSTRAINT job_id ..."}],
+            "indexes": [{"name": "job_embedding", "createStatement": "CREATE VECTOR INDEX job_embedding ..."}]
+        }
+        mock_session_instance, _ = self._clear_database_session(nodes=5, relationships=0, schema=schema)
+        service.driver.session = mock.MagicMock()
+        service.driver.session.return_value.__enter__.return_value = mock_session_instance
+        
+        with mock.patch('builtins.print'), \
+                mock.patch('src.backend.services.graph_service.CLEAR_SCHEMA_DROP_THRESHOLD', 5):
+            self.assertTrue(service.clear_database(force=True, batch_size=10))
+        
+        queries = [call.args[0] for call in mock_session_instance.run.call_args_list]
+        self.assertIn("DROP CONSTRAINT `job_id` IF EXISTS", queries)
+        self.assertIn("DROP INDEX `job_embedding` IF EXISTS", queries)
+        self.assertEqual(queries[-2:], ["CREATE CONSTRAINT job_id ...", "CREATE VECTOR INDEX job_embedding ..."])
+    
+    def test_clear_database_recreates_dropped_schema_when_a_drop_fails(self):
+        """Test that indexes already dropped are recreated when a later drop fails."""
+        service = GraphService()
+        schema = {
+            "constraints": [{"name": "job_id", "createStatement": "CREATE CONSTRAINT job_id ..."}],
+            "indexes": [{"name": "job_embedding", "createStatement": "CREATE VECTOR INDEX job_embedding ..."}]
+        }
+        mock_session_instance, remaining = self._clear_database_session(nodes=5, relationships=0, schema=schema)
+        run = mock_session_instance.run.side_effect
+        
+        def failing_run(query, **kwargs):
+            if query.startswith("DROP INDEX"):
+                raise RuntimeError("drop failed")
+            return run(query, **kwargs)
+        
+        mock_session_instance.run.side_effect = failing_run
+        service.driver.session = mock.MagicMock()
+        service.driver.session.return_value.__enter__.return_value = mock_session_instance
+        
+        with mock.patch('builtins.print'), \
+                mock.patch('src.backend.services.graph_service.CLEAR_SCHEMA_DROP_THRESHOLD', 5):
+            with self.assertRaises(RuntimeError):
+                service.clear_database(force=True, batch_size=10)
+        
+        queries = [call.args[0] for call in mock_session_instance.run.call_args_list]
+        self.assertEqual(queries[-1], "CREATE CONSTRAINT job_id ...")
+        self.assertNotIn("CREATE VECTOR INDEX job_embedding ...", queries)
+        self.assertEqual(remaining["nodes"], 5)
+    
+    def test_clear_database_keeps_schema_for_small_graphs(self):
+        """Test that the schema is left alone below the drop threshold."""
+        service = GraphService()
+        mock_session_instance, _ = self._clear_database_session(nodes=5, relationships=3)
+        service.driver.session = mock.MagicMock()
+        service.driver.session.return_value.__enter__.return_value = mock_session_instance
         
-        # Verify the session run call
-        mock_session_instance.run.assert_called_once_with("MATCH (n) DETACH DELETE n")
+        with mock.patch('builtins.print'):
+            self.assertTrue(service.clear_database(force=True))
+        
+        queries = [call.args[0] for call in mock_session_instance.run.call_args_list]
+        self.assertFalse(any(query.startswith(("SHOW", "DROP")) for query in queries))
             
     def test_clear_database_with_confirmation_yes(self):
         """Test the clear_database method with user confirmation 'y'."""
@@ -185,8 +274,8 @@ class TestGraphService(unittest.TestCase):
         
         # Mock the input function to return 'y'
         with mock.patch('builtins.input', return_value='y'):
-            # Call the method without force to trigger confirmation
-            result = service.clear_database(force=False)
+            # Call the method without force to trigger confirmation, in a single transaction
+            result = service.clear_database(force=False, batch_size=0)
             
             # Verify the result
             self.assertTrue(result)
@@ -399,6 +488,126 @@ class TestGraphService(unittest.TestCase):
             # Verify the result is False due to the exception
             self.assertFalse(result)
     
+    def test_refresh_semantic_matches(self):
+        """Test that semantic matches are computed from streamed job and experience embeddings."""
+        service = GraphService()
+
+        # Counts, then the batched delete and the write
+        mock_session_instance = mock.MagicMock()
+        count = lambda value: mock.MagicMock(single=mock.MagicMock(return_value={"count": value}))
+        deleted = mock.MagicMock(single=mock.MagicMock(return_value={"deleted": 0}))
+        mock_session_instance.run.side_effect = [count(1), count(2), count(3), deleted, mock.MagicMock()]
+        service.driver.session.return_value.__enter__.return_value = mock_session_instance
+        streams = [
+            iter([{"id": "job_1", "embeddings": [[1.0, 0.0]]}]),
+            iter([{"id": "resume_1", "embeddings": [[1.0, 0.0], [0.0, 1.0]]}]),
+        ]
+
+        with mock.patch.object(service.job_repository, 'stream_read_query',
+                               side_effect=lambda *args, **kwargs: streams.pop(0)):
+            result = service.refresh_semantic_matches(top_k=5)
+
+        # Verify one pair was written with the best experience similarity
+        self.assertEqual(result, 1)
+        calls = mock_session_instance.run.call_args_list
+        self.assertIn("WITH r LIMIT $limit DELETE r", calls[3][0][0])
+        self.assertIn("MERGE (c)-[r:SEMANTIC_MATCH]->(j)", calls[4][0][0])
+        rows = calls[4][0][1]["rows"]
+        self.assertEqual(rows[0]["job_id"], "job_1")
+        self.assertEqual(rows[0]["resume_id"], "resume_1")
+        self.assertAlmostEqual(rows[0]["score"], 1.0, places=5)
+
+    def test_read_embeddings_fills_a_float32_matrix(self):
+        """Test that streamed embeddings are copied into a preallocated matrix that grows if needed."""
+        service = GraphService()
+        session = service.driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {"count": 1}
+        records = [{"id": "a", "embeddings": [[1.0, 2.0]]}, {"id": "b", "embeddings": []},
+                   {"id": "c", "embeddings": [[3.0, 4.0], [5.0, 6.0]]}]
+
+        with mock.patch.object(service.job_repository, 'stream_read_query', return_value=iter(records)):
+            ids, matrix, counts = service._read_embeddings("count", "query", "test")
+
+        self.assertEqual(ids, ["a", "c"])
+        self.assertEqual(counts, [1, 2])
+        self.assertEqual(str(matrix.dtype), "float32")
+        self.assertEqual(matrix.tolist(), [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+
+    def test_refresh_semantic_matches_for_updated_job(self):
+        """Test that the matches of re-embedded records are found by vector search and replaced in one transaction."""
+        service = GraphService()
+
+        tx = mock.MagicMock()
+        tx.run.side_effect = [
+            mock.MagicMock(),
+            [{"job_id": "job_1", "resume_id": "resume_1", "score": 0.9}],
+            [],
+            mock.MagicMock()
+        ]
+        session = service.driver.session.return_value.__enter__.return_value
+        session.execute_write.side_effect = lambda work: work(tx)
+
+        result = service.refresh_semantic_matches_for(job_ids=["job_1"], top_k=1)
+
+        self.assertEqual(result, 1)
+        session.run.assert_not_called()
+        calls = tx.run.call_args_list
+        self.assertIn("DELETE r", calls[0][0][0])
+        self.assertEqual((calls[0][0][1]["job_ids"], calls[0][0][1]["resume_ids"]), (["job_1"], []))
+        # Only the neighbours of the updated job are read, from the vector indexes
+        self.assertIn("db.index.vector.queryNodes('experience_text_embedding'", calls[1][0][0])
+        self.assertEqual(calls[1][0][1]["neighbours"], 4)
+        self.assertIn("db.index.vector.queryNodes('job_embedding'", calls[2][0][0])
+        rows = calls[3][0][1]["rows"]
+        self.assertEqual(rows, [{"job_id": "job_1", "resume_id": "resume_1", "score": 0.9}])
+
+    def test_refresh_semantic_matches_for_nothing(self):
+        """Test that no queries run without updated records."""
+        service = GraphService()
+
+        self.assertEqual(service.refresh_semantic_matches_for(), 0)
+        self.mock_driver.session.assert_not_called()
+
+    def test_embed_jobs_uses_embedding_cache(self):
+        """Test that job embeddings go through the embedding cache and are stored."""
+        from src.backend.utils.embedding_cache import EmbeddingCache
+
+        # Create service with a preloaded model
+        service = GraphService()
+        mock_model = mock.MagicMock()
+        mock_model.encode.side_effect = lambda texts, batch_size=32: [[1.0, 0.0] for _ in texts]
+        service._embedding_model = mock_model
+
+        mock_session = mock.MagicMock()
+        mock_session_instance = mock.MagicMock()
+        mock_session_instance.run.side_effect = [
+            [{"job_id": "job_1", "title": "Developer", "description": "Build APIs",
+              "responsibilities": None, "qualifications": None}],
+            mock.MagicMock(),
+            [{"job_id": "job_1", "title": "Developer", "description": "Build APIs",
+              "responsibilities": None, "qualifications": None}],
+            mock.MagicMock()
+        ]
+        mock_session.return_value.__enter__.return_value = mock_session_instance
+        service.driver.session = mock_session
+
+        cache = EmbeddingCache(":memory:", "test-model@1")
+        with mock.patch('src.backend.utils.embedding_cache.get_embedding_cache', return_value=cache):
+            self.assertEqual(service.embed_jobs(["job_1"]), 1)
+            self.assertEqual(service.embed_jobs(["job_1"]), 1)
+        cache.close()
+
+        # The second call is served from the cache
+        self.assertEqual(mock_model.encode.call_count, 1)
+        write_call = mock_session_instance.run.call_args_list[3]
+        self.assertEqual(write_call[0][1]["rows"], [{"id": "job_1", "embedding": [1.0, 0.0]}])
+
+    def test_embed_candidates_without_sentence_transformers(self):
+        """Test that embedding candidates degrades gracefully without the model library."""
+        service = GraphService()
+        with mock.patch.dict(sys.modules, {'sentence_transformers': None}):
+            self.assertEqual(service.embed_candidates(["resume_1"]), 0)
+
     def test_process_neo4j_datetime(self):
         """Test process_neo4j_datetime method."""
         # Create service
@@ -459,6 +668,18 @@ class TestGraphService(unittest.TestCase):
         # Verify driver.close was called
         service.driver.close.assert_called_once()
         
+    def test_close_method_keeps_the_shared_driver_of_other_holders(self):
+        """Test that closing the service does not close the driver other holders still use."""
+        service = GraphService()
+        repository = JobRepository()
+        
+        service.close()
+        service.close()
+        service.driver.close.assert_not_called()
+        
+        repository.close()
+        service.driver.close.assert_called_once()
+        
     def test_close_method_with_none_driver(self):
         """Test the close method when driver is None."""
         # Create service and set driver to None
@@ -13,7 +13,9 @@ import json
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
 
 from src.backend.services.job_service import JobService
+from src.backend.repositories.job_repository import JobProfile
 from src.backend.models.job_model import Job, JobSkill
+from src.backend.utils.pagination import decode_cursor
 
 
 class TestJobService(unittest.TestCase):
@@ -40,6 +42,10 @@ class TestJobService(unittest.TestCase):
         # Replace the matching_service directly
         self.job_service.matching_service = self.mock_matching_service
         
+        # Replace the embedding worker directly
+        self.mock_embedding_worker = MagicMock()
+        self.job_service.embedding_worker = self.mock_embedding_worker
+        
         # Sample job data
         self.sample_job_data = {
             "title": "Software Engineer",
@@ -102,6 +108,8 @@ class TestJobService(unittest.TestCase):
         self.assertEqual(self.mock_job_repository.add_job_skill.call_count, 2)  # One for primary and one for secondary skill
         # Verify relationship creation
         self.mock_job_repository.create_job_owner_relationship.assert_called_once_with(job_id, owner_email)
+        # Verify the new job is queued for embedding
+        self.mock_embedding_worker.enqueue_job.assert_called_once_with(job_id)
     
     def test_create_job_validation_error(self):
         """Test creating a job with validation errors."""
@@ -155,11 +163,10 @@ class TestJobService(unittest.TestCase):
         job_id = "job_123"
         
         # Set up mock repository
-        self.mock_job_repository.get_job.return_value = self.sample_job
-        self.mock_job_repository.get_job_skills.return_value = {
+        self.mock_job_repository.get_job_profile.return_value = JobProfile(self.sample_job, {
             "primary": [{"skill_id": "s1", "name": "Python"}],
             "secondary": [{"skill_id": "s2", "name": "JavaScript"}]
-        }
+        })
         
         # Call service method
         result = self.job_service.get_job(job_id)
@@ -170,16 +177,16 @@ class TestJobService(unittest.TestCase):
         self.assertEqual(len(result['skills']['primary']), 1)
         self.assertEqual(len(result['skills']['secondary']), 1)
         
-        # Verify repository calls
-        self.mock_job_repository.get_job.assert_called_once_with(job_id)
-        self.mock_job_repository.get_job_skills.assert_called_once_with(job_id)
+        # Verify the job and skills are read in one repository call
+        self.mock_job_repository.get_job_profile.assert_called_once_with(job_id)
+        self.mock_job_repository.get_job_skills.assert_not_called()
     
     def test_get_job_not_found(self):
         """Test getting a job that doesn't exist."""
         job_id = "job_nonexistent"
         
         # Set up mock repository to return None for non-existent job
-        self.mock_job_repository.get_job.return_value = None
+        self.mock_job_repository.get_job_profile.return_value = None
         
         # Call service method
         result = self.job_service.get_job(job_id)
@@ -189,8 +196,7 @@ class TestJobService(unittest.TestCase):
         self.assertIn("not found", result['error'])
         
         # Verify repository calls
-        self.mock_job_repository.get_job.assert_called_once_with(job_id)
-        self.mock_job_repository.get_job_skills.assert_not_called()
+        self.mock_job_repository.get_job_profile.assert_called_once_with(job_id)
     
     def test_update_job_success(self):
         """Test updating a job successfully."""
@@ -345,8 +351,20 @@ class TestJobService(unittest.TestCase):
         self.assertEqual(result['offset'], 0)
         
         # Verify repository calls
-        self.mock_job_repository.find_jobs.assert_called_once_with({"company": "Tech Company"}, 10, 0)
+        self.mock_job_repository.find_jobs.assert_called_once_with({"company": "Tech Company"}, 10, 0, None)
         self.mock_job_repository.get_job_filter_options.assert_called_once()
+        self.assertIsNone(result['next_cursor'])
+    
+    def test_find_jobs_full_page_returns_cursor(self):
+        """Test that a full page of jobs returns the cursor of the next page."""
+        jobs = [{"job_id": "job_1", "created_at": "2023-01-02"}, {"job_id": "job_2", "created_at": "2023-01-01"}]
+        self.mock_job_repository.find_jobs.return_value = jobs
+        self.mock_job_repository.get_job_filter_options.return_value = {}
+        
+        result = self.job_service.find_jobs({}, 2, 0, "cursor")
+        
+        self.mock_job_repository.find_jobs.assert_called_once_with({}, 2, 0, "cursor")
+        self.assertEqual(decode_cursor(result['next_cursor']), ["2023-01-01", "job_2"])
     
     def test_get_matching_candidates_success(self):
         """Test getting matching candidates successfully."""
@@ -388,7 +406,7 @@ class TestJobService(unittest.TestCase):
         self.assertEqual(result['candidates'][0]['email'], "candidate1@example.com")
         
         # Verify matching service was called correctly
-        self.mock_matching_service.get_matching_candidates_for_job.assert_called_once_with(job_id, 10, 0.0, None)
+        self.mock_matching_service.get_matching_candidates_for_job.assert_called_once_with(job_id, 10, 0.0, None, retrieval='graph')
     
     def test_get_matching_candidates_job_not_found(self):
         """Test getting matching candidates for a job that doesn't exist."""
@@ -408,7 +426,7 @@ class TestJobService(unittest.TestCase):
         self.assertIn("not found", result['error'])
         
         # Verify matching service was called correctly
-        self.mock_matching_service.get_matching_candidates_for_job.assert_called_once_with(job_id, 10, 0.0, None)
+        self.mock_matching_service.get_matching_candidates_for_job.assert_called_once_with(job_id, 10, 0.0, None, retrieval='graph')
     
     def test_validate_job_data(self):
         """Test validating job data."""
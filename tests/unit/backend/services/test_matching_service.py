@@ -171,6 +171,56 @@ class TestMatchingService(unittest.TestCase):
         # Verify we got some results
         self.assertIsNotNone(result)
     
+    def test_match_candidate_to_jobs_hybrid(self):
+        """Test that hybrid matching reranks fused results from all retrievers."""
+        resume_id = "test_resume_456"
+        fused = [
+            {"id": "job1", "rrf_score": 0.032, "sources": {"graph": 1, "lexical": 2},
+             "hits": {"graph": {"job_id": "job1", "title": "Job 1", "company": "Acme", "matchScore": 0.9},
+                      "lexical": {"bm25_score": 3.1}}},
+            {"id": "job2", "rrf_score": 0.016, "sources": {"semantic": 1},
+             "hits": {"semantic": {"job_id": "job2", "similarity": 0.8}}}
+        ]
+        retrieval_stats = {"graph": {"status": "ok"}, "lexical": {"status": "ok"}, "semantic": {"status": "ok"}}
+        self.matching_service.retrieval_service = mock.MagicMock()
+        self.matching_service.retrieval_service.retrieve_jobs_for_candidate.return_value = (fused, retrieval_stats)
+        self.mock_job_repo.get_job_texts.return_value = [
+            {"job_id": "job1", "title": "Job 1", "company": "Acme"},
+            {"job_id": "job2", "title": "Job 2", "company": "Globex"}
+        ]
+
+        matches, stats = self.matching_service.match_candidate_to_jobs_hybrid(resume_id, limit=5)
+
+        self.matching_service.retrieval_service.retrieve_jobs_for_candidate.assert_called_once_with(resume_id, limit=15)
+        self.mock_job_repo.get_job_texts.assert_called_once_with(["job1", "job2"])
+        self.assertIs(stats, retrieval_stats)
+        self.assertEqual({m["job_id"] for m in matches}, {"job1", "job2"})
+
+        # Jobs found only by the embedding retriever get their display fields from the graph
+        job2 = next(m for m in matches if m["job_id"] == "job2")
+        self.assertEqual(job2["title"], "Job 2")
+        self.assertEqual(job2["company"], "Globex")
+        self.assertEqual(job2["retrieval_sources"], {"semantic": 1})
+        self.assertIn("hybrid_score", job2)
+
+    def test_get_matching_candidates_for_job_hybrid(self):
+        """Test that the hybrid retrieval mode returns retriever statistics."""
+        job_id = "test_job_123"
+        self.mock_job_repo.get_job.return_value = {"job_id": job_id}
+        retrieval_stats = {"graph": {"status": "timeout"}}
+        self.matching_service.match_job_to_candidates_hybrid = mock.MagicMock(
+            return_value=([{"resume_id": "r1", "hybrid_score": 0.5, "match_percentage": 50}], retrieval_stats)
+        )
+        self.matching_service.match_job_to_candidates = mock.MagicMock()
+
+        result = self.matching_service.get_matching_candidates_for_job(job_id, limit=10, retrieval='hybrid')
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['retrieval'], retrieval_stats)
+        self.assertEqual(result['candidates'][0]['resume_id'], "r1")
+        self.matching_service.match_job_to_candidates_hybrid.assert_called_once_with(job_id, 10, 0.0)
+        self.matching_service.match_job_to_candidates.assert_not_called()
+
     def test_recommend_skills_for_job(self):
         """Test recommending skills for a job."""
         # Prepare mock data
@@ -0,0 +1,250 @@
+"""
+Unit tests for the retrieval service
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+from src.backend.repositories.base.bookmarks import bookmark_scope, current_scope, set_scope_resolver
+from src.backend.services.graph_service import GraphService
+from src.backend.services.retrieval_service import RetrievalService, reciprocal_rank_fusion
+from src.backend.repositories.job_repository import JobRepository
+from src.backend.repositories.candidate_repository import CandidateRepository
+
+
+class TestReciprocalRankFusion(unittest.TestCase):
+    """Test cases for reciprocal rank fusion"""
+
+    def test_documents_found_by_several_retrievers_rank_first(self):
+        """Test that agreement between retrievers is rewarded"""
+        fused = reciprocal_rank_fusion({
+            'graph': [('a', {}), ('b', {})],
+            'lexical': [('b', {}), ('c', {})],
+        }, k=60)
+
+        self.assertEqual([entry['id'] for entry in fused], ['b', 'a', 'c'])
+        self.assertAlmostEqual(fused[0]['rrf_score'], 1 / 62 + 1 / 61)
+        self.assertEqual(fused[0]['sources'], {'graph': 2, 'lexical': 1})
+
+    def test_duplicate_hits_keep_best_rank(self):
+        """Test that a retriever returning a document twice only counts once"""
+        fused = reciprocal_rank_fusion({'graph': [('a', {'n': 1}), ('a', {'n': 2})]}, k=0)
+        self.assertEqual(len(fused), 1)
+        self.assertAlmostEqual(fused[0]['rrf_score'], 1.0)
+        self.assertEqual(fused[0]['hits']['graph'], {'n': 1})
+
+
+class TestRetrievalService(unittest.TestCase):
+    """Unit tests for the RetrievalService class."""
+
+    def setUp(self):
+        """Set up before each test."""
+        RetrievalService._instance = None
+
+        self.mock_graph_service = mock.MagicMock(spec=GraphService)
+        self.mock_graph_service.driver = mock.MagicMock()
+        self.mock_job_repo = mock.MagicMock(spec=JobRepository)
+        self.mock_candidate_repo = mock.MagicMock(spec=CandidateRepository)
+
+        self.service = RetrievalService(
+            self.mock_graph_service,
+            budgets_ms={'graph': 1000, 'lexical': 1000, 'semantic': 1000}
+        )
+        self.service.job_repository = self.mock_job_repo
+        self.service.candidate_repository = self.mock_candidate_repo
+
+        # Default repository data
+        self.mock_candidate_repo.find_matching_jobs.return_value = [
+            {'job_id': 'job_1', 'title': 'Python Developer', 'matchScore': 2.0},
+            {'job_id': 'job_2', 'title': 'Java Developer', 'matchScore': 1.0}
+        ]
+        self.mock_candidate_repo.find_similar_jobs.return_value = [
+            {'job_id': 'job_3', 'similarity': 0.9},
+            {'job_id': 'job_1', 'similarity': 0.8}
+        ]
+        self.mock_candidate_repo.get_candidate_texts.return_value = [
+            {'resume_id': 'r1', 'name': 'Jane', 'title': 'Python engineer', 'summary': 'Django APIs',
+             'experiences': [], 'skills': ['Python']}
+        ]
+        self.mock_job_repo.get_job_texts.return_value = [
+            {'job_id': 'job_1', 'title': 'Python Developer', 'description': 'Django APIs', 'skills': ['Python']},
+            {'job_id': 'job_4', 'title': 'Accountant', 'description': 'Ledgers', 'skills': []}
+        ]
+        # The lexical indexes are built from the streamed corpus
+        self.mock_candidate_repo.stream_candidate_texts.side_effect = \
+            lambda: iter(self.mock_candidate_repo.get_candidate_texts.return_value)
+        self.mock_job_repo.stream_job_texts.side_effect = \
+            lambda: iter(self.mock_job_repo.get_job_texts.return_value)
+
+    def tearDown(self):
+        """Clean up after each test."""
+        RetrievalService._instance = None
+
+    def test_retrieve_jobs_for_candidate_fuses_all_retrievers(self):
+        """Test that all retrievers run and their results are fused"""
+        fused, stats = self.service.retrieve_jobs_for_candidate('r1', limit=10)
+
+        self.assertEqual(fused[0]['id'], 'job_1')
+        self.assertEqual(set(fused[0]['sources']), {'graph', 'lexical', 'semantic'})
+        self.assertEqual({entry['id'] for entry in fused}, {'job_1', 'job_2', 'job_3'})
+
+        for name in ('graph', 'lexical', 'semantic'):
+            self.assertEqual(stats[name]['status'], 'ok')
+            self.assertIn('latency_ms', stats[name])
+        self.assertEqual(stats['graph']['contributed'], 2)
+        self.assertEqual(stats['semantic']['unique'], 1)
+
+        self.mock_candidate_repo.find_matching_jobs.assert_called_once_with('r1', limit=10)
+        self.mock_candidate_repo.find_similar_jobs.assert_called_once_with('r1', limit=10)
+
+    def test_slow_retriever_is_skipped_after_its_budget(self):
+        """Test that a retriever exceeding its budget does not block the request"""
+        release = threading.Event()
+
+        def slow_similar_jobs(resume_id, limit=10):
+            release.wait(5)
+            return [{'job_id': 'job_9', 'similarity': 1.0}]
+
+        self.mock_candidate_repo.find_similar_jobs.side_effect = slow_similar_jobs
+        self.service.budgets['semantic'] = 0.05
+
+        try:
+            fused, stats = self.service.retrieve_jobs_for_candidate('r1', limit=10)
+        finally:
+            release.set()
+
+        self.assertEqual(stats['semantic']['status'], 'timeout')
+        self.assertEqual(stats['semantic']['contributed'], 0)
+        self.assertEqual(stats['graph']['status'], 'ok')
+        self.assertNotIn('job_9', {entry['id'] for entry in fused})
+        self.assertEqual(self.service.get_stats()['semantic']['timeouts'], 1)
+
+    def test_failing_retriever_is_recorded_as_error(self):
+        """Test that retriever exceptions degrade to the remaining retrievers"""
+        self.mock_candidate_repo.find_matching_jobs.side_effect = Exception("boom")
+
+        with mock.patch('builtins.print'):
+            fused, stats = self.service.retrieve_jobs_for_candidate('r1', limit=5)
+
+        self.assertEqual(stats['graph']['status'], 'error')
+        self.assertEqual(stats['graph']['error'], 'boom')
+        self.assertTrue(fused)
+
+    def test_retrieve_candidates_for_job(self):
+        """Test retrieval in the job to candidates direction"""
+        self.mock_job_repo.find_matching_candidates.return_value = [{'resume_id': 'r1', 'matchScore': 1.0}]
+        self.mock_job_repo.find_similar_candidates.return_value = [{'resume_id': 'r2', 'similarity': 0.7}]
+
+        fused, stats = self.service.retrieve_candidates_for_job('job_1', limit=5)
+
+        self.assertEqual(fused[0]['id'], 'r1')
+        self.assertEqual({entry['id'] for entry in fused}, {'r1', 'r2'})
+        self.mock_job_repo.find_matching_candidates.assert_called_once_with('job_1', limit=5)
+        self.mock_job_repo.get_job_texts.assert_called_once_with(['job_1'])
+
+    def test_lexical_index_is_cached(self):
+        """Test that the BM25 index is built once and reused until invalidated"""
+        self.service.retrieve_jobs_for_candidate('r1')
+        self.service.retrieve_jobs_for_candidate('r1')
+        self.mock_job_repo.stream_job_texts.assert_called_once_with()
+
+        self.service.invalidate_lexical_indexes()
+        self.service.retrieve_jobs_for_candidate('r1')
+        self.wait_for_index_builds()
+        self.assertEqual(self.mock_job_repo.stream_job_texts.call_count, 2)
+
+    def test_expired_lexical_index_keeps_serving_while_rebuilt(self):
+        """Test that an expired index is rebuilt in the background instead of blocking requests"""
+        self.service.retrieve_jobs_for_candidate('r1')
+        release = threading.Event()
+        previous_texts = self.mock_job_repo.stream_job_texts.side_effect
+
+        def slow_job_texts():
+            release.wait(5)
+            return previous_texts()
+
+        self.mock_job_repo.stream_job_texts.side_effect = slow_job_texts
+        self.service.lexical_index_ttl = 0
+        self.service.budgets['lexical'] = 0.5
+
+        try:
+            fused, stats = self.service.retrieve_jobs_for_candidate('r1', limit=10)
+        finally:
+            release.set()
+        self.wait_for_index_builds()
+
+        self.assertEqual(stats['lexical']['status'], 'ok')
+        self.assertIn('lexical', fused[0]['sources'])
+        self.assertEqual(self.mock_job_repo.stream_job_texts.call_count, 2)
+
+    def test_saturated_retriever_is_rejected(self):
+        """Test that a retriever whose threads are all stalled does not delay other requests"""
+        release = threading.Event()
+
+        def stalled_similar_jobs(resume_id, limit=10):
+            release.wait(5)
+            return []
+
+        service = RetrievalService(self.mock_graph_service, budgets_ms={'semantic': 20}, max_workers=1)
+        service.job_repository = self.mock_job_repo
+        service.candidate_repository = self.mock_candidate_repo
+        self.mock_candidate_repo.find_similar_jobs.side_effect = stalled_similar_jobs
+
+        try:
+            _, first = service.retrieve_jobs_for_candidate('r1', limit=10)
+            _, second = service.retrieve_jobs_for_candidate('r1', limit=10)
+        finally:
+            release.set()
+
+        self.assertEqual(first['semantic']['status'], 'timeout')
+        self.assertEqual(second['semantic']['status'], 'rejected')
+        self.assertEqual(second['graph']['status'], 'ok')
+        self.assertEqual(service.get_stats()['semantic']['rejected'], 1)
+
+    def wait_for_index_builds(self):
+        """Wait for the background lexical index builds to finish."""
+        for build in list(self.service._index_builds.values()):
+            build.result(timeout=5)
+
+    def test_retrievers_read_in_the_callers_bookmark_scope(self):
+        """Test that the retriever threads use the bookmarks of the caller, e.g. the request's user"""
+        scopes = {}
+
+        def record_scope(name, hits):
+            def retriever(resume_id, limit=10):
+                scopes[name] = current_scope()
+                return hits
+            return retriever
+
+        self.mock_candidate_repo.find_matching_jobs.side_effect = record_scope('graph', [])
+        self.mock_candidate_repo.find_similar_jobs.side_effect = record_scope('semantic', [])
+        # Like the request's identity, the resolver only answers on the request's thread
+        request_thread = threading.current_thread()
+        set_scope_resolver(lambda: "hm@example.com" if threading.current_thread() is request_thread else None)
+        self.addCleanup(set_scope_resolver, None)
+
+        _, stats = self.service.retrieve_jobs_for_candidate('r1', limit=10)
+        self.assertEqual(stats['graph']['status'], 'ok')
+        self.assertEqual(scopes, {'graph': "hm@example.com", 'semantic': "hm@example.com"})
+
+        with bookmark_scope("admin@example.com"):
+            self.service.retrieve_jobs_for_candidate('r1', limit=10)
+        self.assertEqual(scopes, {'graph': "admin@example.com", 'semantic': "admin@example.com"})
+
+    def test_get_stats_accumulates(self):
+        """Test cumulative statistics and reset"""
+        self.service.retrieve_jobs_for_candidate('r1')
+        self.service.retrieve_jobs_for_candidate('r1')
+
+        stats = self.service.get_stats()
+        self.assertEqual(stats['graph']['calls'], 2)
+        self.assertEqual(stats['graph']['timeouts'], 0)
+        self.assertIn('avg_latency_ms', stats['lexical'])
+
+        self.service.reset_stats()
+        self.assertEqual(self.service.get_stats()['graph']['calls'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -119,7 +119,7 @@ class TestSkillService(unittest.TestCase):
         self.assertEqual(result['offset'], 0)
         
         # Verify repo was called with correct parameters
-        self.mock_repo.find_skills.assert_called_once_with(filters, 10, 0)
+        self.mock_repo.find_skills.assert_called_once_with(filters, 10, 0, None)
     
     def test_get_skill_success(self):
         """Test getting a skill by ID successfully."""
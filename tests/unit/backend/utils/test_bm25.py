@@ -0,0 +1,61 @@
+"""
+Unit tests for the BM25 utility module
+"""
+
+import unittest
+
+from src.backend.utils.bm25 import tokenize, BM25Index
+
+
+class TestTokenize(unittest.TestCase):
+    """Test cases for the tokenizer"""
+
+    def test_tokenize_lowercases_and_removes_stopwords(self):
+        """Test that tokens are lowercased and stopwords dropped"""
+        self.assertEqual(tokenize("The Python and Django developer."), ['python', 'django', 'developer'])
+
+    def test_tokenize_keeps_technical_terms(self):
+        """Test that terms like C++, C# and node.js survive tokenization"""
+        self.assertEqual(tokenize("C++, C# or Node.js"), ['c++', 'c#', 'node.js'])
+
+    def test_tokenize_empty(self):
+        """Test that empty text yields no tokens"""
+        self.assertEqual(tokenize(None), [])
+        self.assertEqual(tokenize(""), [])
+
+
+class TestBM25Index(unittest.TestCase):
+    """Test cases for the BM25 index"""
+
+    def setUp(self):
+        self.index = BM25Index({
+            'job_1': "Senior Python developer building Django APIs",
+            'job_2': "Java developer for Spring microservices",
+            'job_3': "Data scientist using Python, pandas and machine learning",
+        })
+
+    def test_search_ranks_by_relevance(self):
+        """Test that the document matching the most rare terms ranks first"""
+        results = self.index.search("python django", limit=3)
+        self.assertEqual([doc_id for doc_id, _ in results], ['job_1', 'job_3'])
+        self.assertGreater(results[0][1], results[1][1])
+
+    def test_search_only_returns_overlapping_documents(self):
+        """Test that documents without query terms are not returned"""
+        self.assertEqual(self.index.search("kubernetes"), [])
+
+    def test_search_limit_and_exclude(self):
+        """Test limiting results and excluding a document"""
+        self.assertEqual(len(self.index.search("developer", limit=1)), 1)
+        results = self.index.search("python", exclude='job_1')
+        self.assertEqual([doc_id for doc_id, _ in results], ['job_3'])
+
+    def test_empty_index(self):
+        """Test that an empty index returns no results"""
+        index = BM25Index({})
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.search("python"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
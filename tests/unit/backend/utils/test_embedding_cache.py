@@ -0,0 +1,93 @@
+"""
+Unit tests for the embedding cache module
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.backend.utils.embedding_cache import EmbeddingCache, normalize_text, text_hash
+
+
+class FakeModel:
+    """Minimal stand-in for a SentenceTransformer model."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, batch_size=32):
+        self.encoded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestTextHash(unittest.TestCase):
+    """Test cases for text normalization and hashing"""
+
+    def test_normalize_text_collapses_whitespace(self):
+        """Test that whitespace differences are normalized away"""
+        self.assertEqual(normalize_text("  Python \n developer\t"), "Python developer")
+        self.assertEqual(normalize_text(None), "")
+
+    def test_text_hash_ignores_whitespace_only_changes(self):
+        """Test that texts differing only in whitespace share a hash"""
+        self.assertEqual(text_hash("Python developer"), text_hash(" Python   developer "))
+        self.assertNotEqual(text_hash("Python developer"), text_hash("Java developer"))
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    """Test cases for the SQLite embedding cache"""
+
+    def setUp(self):
+        self.cache = EmbeddingCache(":memory:", "test-model@1")
+        self.model = FakeModel()
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_encode_only_runs_model_for_misses(self):
+        """Test that cached texts are not encoded again"""
+        first = self.cache.encode(self.model, ["abc", "de"])
+        second = self.cache.encode(self.model, ["de", "fghi", "abc"])
+
+        self.assertEqual(first, [[3.0, 1.0], [2.0, 1.0]])
+        self.assertEqual(second, [[2.0, 1.0], [4.0, 1.0], [3.0, 1.0]])
+        self.assertEqual(self.model.encoded, ["abc", "de", "fghi"])
+        self.assertEqual(self.cache.stats(), {"hits": 2, "misses": 3, "size": 3})
+
+    def test_encode_deduplicates_texts(self):
+        """Test that duplicate texts in one call are encoded once"""
+        vectors = self.cache.encode(self.model, ["abc", "abc "])
+        self.assertEqual(vectors, [[3.0, 1.0], [3.0, 1.0]])
+        self.assertEqual(self.model.encoded, ["abc"])
+
+    def test_vectors_are_scoped_by_model(self):
+        """Test that another model key never sees cached vectors"""
+        self.cache.put_many(["abc"], [[0.5, 0.25]])
+        self.assertEqual(self.cache.get_many(["abc"]), {text_hash("abc"): [0.5, 0.25]})
+
+        other = EmbeddingCache(":memory:", "other-model@1")
+        try:
+            self.assertEqual(other.get_many(["abc"]), {})
+        finally:
+            other.close()
+
+    def test_cache_persists_on_disk(self):
+        """Test that vectors survive reopening the cache file"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "nested", "embeddings.sqlite3")
+            cache = EmbeddingCache(path, "test-model@1")
+            cache.encode(self.model, ["abc"])
+            cache.close()
+
+            reopened = EmbeddingCache(path, "test-model@1")
+            try:
+                model = mock.MagicMock()
+                self.assertEqual(reopened.encode(model, ["abc"]), [[3.0, 1.0]])
+                model.encode.assert_not_called()
+            finally:
+                reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
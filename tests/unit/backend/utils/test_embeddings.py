@@ -0,0 +1,104 @@
+"""
+Unit tests for the embeddings utility module
+"""
+
+import unittest
+import json
+
+import numpy as np
+
+from src.backend.utils.embeddings import (
+    job_embedding_text,
+    experience_embedding_text,
+    candidate_embedding_text,
+    normalize_rows,
+    max_similarity_by_group,
+    top_k_semantic_matches
+)
+
+
+class TestEmbeddingTexts(unittest.TestCase):
+    """Test cases for embedding text builders"""
+
+    def test_job_embedding_text(self):
+        """Test that job text joins title, description and JSON encoded lists"""
+        job = {
+            'title': 'Python Developer',
+            'description': 'Build APIs',
+            'responsibilities': json.dumps(['Write code', 'Review code']),
+            'qualifications': ['BSc']
+        }
+        self.assertEqual(
+            job_embedding_text(job),
+            'Python Developer Build APIs Write code Review code BSc'
+        )
+
+    def test_experience_embedding_text_supports_both_title_fields(self):
+        """Test that experience text works with job_title and title fields"""
+        self.assertEqual(
+            experience_embedding_text({'job_title': 'Engineer', 'company': 'Acme', 'description': '["Built X"]'}),
+            'Engineer Acme Built X'
+        )
+        self.assertEqual(
+            experience_embedding_text({'title': 'Engineer', 'company': None, 'description': 'Plain text'}),
+            'Engineer Plain text'
+        )
+
+    def test_candidate_embedding_text(self):
+        """Test that candidate text includes experiences"""
+        candidate = {'name': 'Jane', 'title': 'Developer', 'summary': None}
+        experiences = [{'job_title': 'Engineer', 'company': 'Acme', 'description': []}]
+        self.assertEqual(candidate_embedding_text(candidate, experiences), 'Jane Developer Engineer Acme')
+
+
+class TestSemanticSimilarity(unittest.TestCase):
+    """Test cases for vectorized similarity helpers"""
+
+    def test_normalize_rows(self):
+        """Test that rows are unit length and zero rows are left untouched"""
+        result = normalize_rows([[3.0, 4.0], [0.0, 0.0]])
+        np.testing.assert_allclose(result[0], [0.6, 0.8], rtol=1e-6)
+        np.testing.assert_allclose(result[1], [0.0, 0.0])
+
+    def test_max_similarity_by_group(self):
+        """Test maximum similarity per group including an empty group"""
+        jobs = [[1.0, 0.0], [0.0, 1.0]]
+        experiences = [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]
+        result = max_similarity_by_group(jobs, experiences, [2, 0, 1])
+
+        self.assertEqual(result.shape, (2, 3))
+        np.testing.assert_allclose(result[0], [1.0, 0.0, np.sqrt(0.5)], rtol=1e-6)
+        np.testing.assert_allclose(result[1], [1.0, 0.0, np.sqrt(0.5)], rtol=1e-6)
+
+    def test_top_k_semantic_matches(self):
+        """Test that the best candidates per job and jobs per candidate are kept"""
+        job_ids = ['job_a', 'job_b']
+        job_vectors = [[1.0, 0.0], [0.0, 1.0]]
+        resume_ids = ['r1', 'r2', 'r3']
+        experience_vectors = [[1.0, 0.1], [0.2, 1.0], [0.9, 0.0], [0.0, 1.0]]
+        experience_counts = [1, 2, 1]
+
+        pairs = top_k_semantic_matches(
+            job_ids, job_vectors, resume_ids, experience_vectors, experience_counts,
+            top_k=1, block_size=1
+        )
+        scores = {(p['job_id'], p['resume_id']): p['score'] for p in pairs}
+
+        # Best jobs per candidate
+        self.assertIn(('job_a', 'r1'), scores)
+        self.assertIn(('job_a', 'r2'), scores)
+        self.assertIn(('job_b', 'r3'), scores)
+        # Best candidate for job_b is r3 (exact match)
+        self.assertAlmostEqual(scores[('job_b', 'r3')], 1.0, places=5)
+        # r2 uses its best experience for job_a
+        self.assertAlmostEqual(scores[('job_a', 'r2')], 1.0, places=5)
+        self.assertEqual(len(scores), 3)
+
+    def test_top_k_semantic_matches_empty(self):
+        """Test that no pairs are returned without jobs or candidates"""
+        self.assertEqual(top_k_semantic_matches([], [], ['r1'], [[1.0]], [1]), [])
+        self.assertEqual(top_k_semantic_matches(['j1'], [[1.0]], [], [], []), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
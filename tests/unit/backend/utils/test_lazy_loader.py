@@ -0,0 +1,86 @@
+"""
+Unit tests for the lazy loader module
+"""
+
+import sys
+import unittest
+from unittest import mock
+
+from src.backend.utils import lazy_loader
+from src.backend.startup_benchmark import parse_importtime
+
+
+class TestLazyLoader(unittest.TestCase):
+    """Test cases for deferred imports and warm-up"""
+
+    def setUp(self):
+        self.loaders = dict(lazy_loader._loaders)
+        self.hooks = dict(lazy_loader._warmup_hooks)
+
+    def tearDown(self):
+        lazy_loader._loaders.clear()
+        lazy_loader._loaders.update(self.loaders)
+        lazy_loader._warmup_hooks.clear()
+        lazy_loader._warmup_hooks.update(self.hooks)
+
+    def test_heavy_libraries_are_not_imported_by_the_app(self):
+        """Test that importing the services does not pull in scikit-learn or NLTK"""
+        import subprocess
+        code = (
+            "import sys\n"
+            "import src.backend.services.matching_service\n"
+            "print(','.join(m for m in ('sklearn', 'nltk', 'sentence_transformers', 'torch') if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_load_records_first_load_time(self):
+        """Test that load runs the loader and records its duration"""
+        loader = mock.MagicMock(return_value="module")
+        lazy_loader.register_loader('test_module', loader)
+
+        self.assertEqual(lazy_loader.load('test_module'), "module")
+        self.assertEqual(lazy_loader.load('test_module'), "module")
+        self.assertEqual(loader.call_count, 2)
+        self.assertIn('test_module', lazy_loader.get_load_times())
+
+    def test_warm_up_reports_failures_and_runs_hooks(self):
+        """Test that warm-up keeps going when a dependency is missing"""
+        lazy_loader.register_loader('missing', mock.MagicMock(side_effect=ImportError("No module named 'x'")))
+        lazy_loader.register_loader('present', mock.MagicMock())
+        hook = mock.MagicMock()
+        lazy_loader.register_warmup_hook('model', hook)
+
+        report = lazy_loader.warm_up(['missing', 'present'])
+
+        self.assertTrue(report['missing'].startswith("failed"))
+        self.assertIsInstance(report['present'], float)
+        hook.assert_called_once_with()
+        self.assertIn('model', report)
+
+    def test_is_available(self):
+        """Test module availability checks without importing"""
+        self.assertTrue(lazy_loader.is_available('json'))
+        self.assertFalse(lazy_loader.is_available('definitely_not_a_module_123'))
+
+
+class TestStartupBenchmark(unittest.TestCase):
+    """Test cases for the startup benchmark parser"""
+
+    def test_parse_importtime(self):
+        """Test that import times are aggregated per top-level package"""
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     neo4j.api",
+            "import time:        50 |        150 |   neo4j",
+            "import time:        20 |         20 | flask",
+            "some unrelated warning",
+        ])
+        total, per_package = parse_importtime(output)
+        self.assertEqual(total, 170)
+        self.assertEqual(per_package, {'neo4j': 150, 'flask': 20})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the keyset pagination cursors
+"""
+
+import unittest
+
+from src.backend.utils.pagination import (
+    encode_cursor, decode_cursor, next_cursor, keyset_condition, cursor_parameters
+)
+
+
+class TestPagination(unittest.TestCase):
+    """Test cases for the pagination helpers"""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the key it encodes and is URL safe"""
+        cursor = encode_cursor(["2023-01-01T10:00:00", "job/1?"])
+
+        self.assertNotIn("=", cursor)
+        self.assertEqual(decode_cursor(cursor), ["2023-01-01T10:00:00", "job/1?"])
+        self.assertEqual(cursor_parameters(cursor), {"after_key": "2023-01-01T10:00:00", "after_id": "job/1?"})
+
+    def test_invalid_cursor(self):
+        """Test that malformed cursors raise ValueError"""
+        for cursor in ("not-a-cursor", encode_cursor(["only one"]), "", "ÿ"):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+    def test_next_cursor(self):
+        """Test that only a full page gets the cursor of its last row"""
+        rows = [{"name": "Go", "skill_id": "s1"}, {"name": "Python", "skill_id": "s2"}]
+
+        self.assertEqual(decode_cursor(next_cursor(rows, 2, ("name", "skill_id"))), ["Python", "s2"])
+        self.assertIsNone(next_cursor(rows, 3, ("name", "skill_id")))
+        self.assertIsNone(next_cursor([], 2, ("name", "skill_id")))
+
+    def test_keyset_condition(self):
+        """Test the predicate for ascending and descending orders"""
+        self.assertEqual(keyset_condition("s.name", "s.skill_id"),
+                         "s.name >= $after_key AND (s.name > $after_key OR s.skill_id > $after_id)")
+        self.assertEqual(keyset_condition("j.created_at", "j.job_id", descending=True),
+                         "j.created_at <= $after_key AND (j.created_at < $after_key OR j.job_id < $after_id)")
+
+    def test_keyset_condition_after_null_key(self):
+        """Test that a null sort key continues with the remaining null rows instead of comparing with null"""
+        # Descending: nulls come first, followed by every row with a key
+        self.assertEqual(keyset_condition("j.created_at", "j.job_id", descending=True, null_key=True),
+                         "(j.created_at IS NOT NULL OR j.job_id < $after_id)")
+        # Ascending: nulls come last
+        self.assertEqual(keyset_condition("s.name", "s.skill_id", null_key=True),
+                         "s.name IS NULL AND s.skill_id > $after_id")
+        self.assertEqual(cursor_parameters(next_cursor([{"created_at": None, "job_id": "job_7"}], 1,
+                                                       ("created_at", "job_id"))),
+                         {"after_key": None, "after_id": "job_7"})
+
+
+if __name__ == '__main__':
+    unittest.main()
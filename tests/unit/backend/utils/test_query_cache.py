@@ -0,0 +1,102 @@
+"""
+Unit tests for the query result cache
+"""
+
+import unittest
+from unittest import mock
+
+from src.backend.utils.query_cache import QueryCache, query_labels
+
+
+class TestQueryLabels(unittest.TestCase):
+    """Test cases for label extraction from Cypher"""
+
+    def test_labels_and_relationship_types(self):
+        """Test that labels and relationship types are found, property keys are not"""
+        query = "MATCH (j:Job {job_id: $job_id}) MATCH (s:`Skill`) MERGE (j)-[:REQUIRES_PRIMARY]->(s)"
+        self.assertEqual(query_labels(query), ('Job', 'REQUIRES_PRIMARY', 'Skill'))
+
+
+class TestQueryCache(unittest.TestCase):
+    """Test cases for the QueryCache class"""
+
+    def setUp(self):
+        self.cache = QueryCache(max_entries=2, ttl_seconds=60, enabled=True)
+
+    def _key(self, name, value=1):
+        return QueryCache.make_key(name, "MATCH (n) RETURN n", {"id": value})
+
+    def test_hit_returns_copies(self):
+        """Test that a stored result is returned and callers cannot modify the cached rows"""
+        key = self._key("job.get")
+        self.cache.put(key, [{"title": "Engineer"}])
+
+        hit, rows = self.cache.get(key)
+        rows[0]["title"] = "changed"
+
+        self.assertTrue(hit)
+        self.assertEqual(self.cache.get(key)[1], [{"title": "Engineer"}])
+        self.assertEqual(self.cache.stats()["job.get"]["hits"], 2)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted beyond max_entries"""
+        first, second, third = self._key("q", 1), self._key("q", 2), self._key("q", 3)
+        self.cache.put(first, [])
+        self.cache.put(second, [])
+        self.cache.get(first)
+        self.cache.put(third, [])
+
+        self.assertTrue(self.cache.get(first)[0])
+        self.assertFalse(self.cache.get(second)[0])
+        self.assertEqual(self.cache.stats()["q"]["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after their TTL"""
+        key = self._key("skill.all")
+        with mock.patch('src.backend.utils.query_cache.time.monotonic', return_value=100.0):
+            self.cache.put(key, [], ttl=5)
+        with mock.patch('src.backend.utils.query_cache.time.monotonic', return_value=104.0):
+            self.assertTrue(self.cache.get(key)[0])
+        with mock.patch('src.backend.utils.query_cache.time.monotonic', return_value=105.0):
+            self.assertFalse(self.cache.get(key)[0])
+        self.assertEqual(self.cache.stats()["skill.all"]["expired"], 1)
+
+    def test_entity_invalidation(self):
+        """Test that an entity write drops that entity and label-level entries only"""
+        cache = QueryCache(max_entries=10, ttl_seconds=60, enabled=True)
+        job_1, job_2, jobs, skills = (self._key("job.get", 1), self._key("job.get", 2),
+                                      self._key("job.filter_options"), self._key("skill.all"))
+        cache.put(job_1, [], ["Job:job_1"])
+        cache.put(job_2, [], ["Job:job_2"])
+        cache.put(jobs, [], ["Job"])
+        cache.put(skills, [], ["Skill"])
+
+        cache.invalidate(["Job:job_1"])
+
+        self.assertEqual([cache.get(key)[0] for key in (job_1, job_2, jobs, skills)], [False, True, False, True])
+        self.assertEqual(cache.stats()["job.get"]["invalidations"], 1)
+
+    def test_label_invalidation(self):
+        """Test that a label write drops all entries of that label"""
+        cache = QueryCache(max_entries=10, ttl_seconds=60, enabled=True)
+        job_1, jobs = self._key("job.get", 1), self._key("job.filter_options")
+        cache.put(job_1, [], ["Job:job_1"])
+        cache.put(jobs, [], ["Job"])
+
+        cache.invalidate(("Job", "REQUIRES_PRIMARY"))
+
+        self.assertFalse(cache.get(job_1)[0])
+        self.assertFalse(cache.get(jobs)[0])
+
+    def test_result_read_before_invalidation_is_not_stored(self):
+        """Test that a read racing with a write does not cache the stale result"""
+        key = self._key("job.get")
+        version = self.cache.version
+        self.cache.invalidate(["Job:job_1"])
+        self.cache.put(key, [{"title": "stale"}], ["Job:job_1"], version=version)
+
+        self.assertFalse(self.cache.get(key)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Unit tests for the query metrics
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from src.backend.utils import query_metrics as query_metrics_module
+from src.backend.utils.query_metrics import QueryMetrics, timed_run
+
+
+def make_summary(nodes_created=0, available_after=2, consumed_after=1):
+    counters = SimpleNamespace(nodes_created=nodes_created, nodes_deleted=0, relationships_created=0,
+                               relationships_deleted=0, properties_set=0)
+    return SimpleNamespace(counters=counters, result_available_after=available_after,
+                           result_consumed_after=consumed_after)
+
+
+class TestQueryMetrics(unittest.TestCase):
+    """Test cases for the QueryMetrics class"""
+
+    def setUp(self):
+        self.metrics = QueryMetrics(slow_ms=100, slow_log_size=2)
+
+    def test_histogram_and_percentiles(self):
+        """Test that executions are bucketed and percentiles estimated from the buckets"""
+        for elapsed_ms in [0.5] * 90 + [20] * 9 + [7000]:
+            self.metrics.record("JobRepository.get_job", elapsed_ms, rows=1)
+
+        stats = self.metrics.snapshot()['queries']["JobRepository.get_job"]
+
+        self.assertEqual(stats['count'], 100)
+        self.assertEqual(stats['rows'], 100)
+        self.assertEqual(stats['histogram']['1'], 90)
+        self.assertEqual(stats['histogram']['25'], 9)
+        self.assertEqual(stats['histogram']['+Inf'], 1)
+        self.assertEqual(stats['p50_ms'], 1)
+        self.assertEqual(stats['p95_ms'], 25)
+        self.assertEqual(stats['p99_ms'], 25)
+        self.assertEqual(stats['max_ms'], 7000)
+
+    def test_summary_counters_and_server_time(self):
+        """Test that update counters and server time are taken from result summaries"""
+        self.metrics.record("SkillRepository.add_skill", 3, summary=make_summary(nodes_created=2))
+        self.metrics.record("SkillRepository.add_skill", 3, summary=mock.MagicMock())
+
+        stats = self.metrics.snapshot()['queries']["SkillRepository.add_skill"]
+
+        self.assertEqual(stats['counters']['nodes_created'], 2)
+        self.assertEqual(stats['server_ms'], 3)
+
+    def test_slow_query_log(self):
+        """Test that slow executions are logged with parameter names only, newest kept"""
+        with mock.patch('builtins.print'):
+            for name in ("first", "second", "third"):
+                self.metrics.record(name, 150, query="MATCH (u:User)\n  RETURN u", parameters={"password": "secret"})
+        self.metrics.record("fast", 5)
+
+        slow = self.metrics.snapshot()['slow_queries']
+
+        self.assertEqual([entry['name'] for entry in slow], ["second", "third"])
+        self.assertEqual(slow[0]['query'], "MATCH (u:User) RETURN u")
+        self.assertEqual(slow[0]['parameters'], ["password"])
+
+    def test_measure_records_errors(self):
+        """Test that a failing execution is recorded as an error and re-raised"""
+        with self.assertRaises(ValueError):
+            with self.metrics.measure("JobRepository.get_job"):
+                raise ValueError("boom")
+
+        self.assertEqual(self.metrics.snapshot()['queries']["JobRepository.get_job"]['errors'], 1)
+
+    def test_reset(self):
+        """Test that reset drops all executions"""
+        self.metrics.record("q", 500)
+        self.metrics.reset()
+
+        self.assertEqual(self.metrics.snapshot()['queries'], {})
+        self.assertEqual(self.metrics.snapshot()['slow_queries'], [])
+
+
+class TestTimedRun(unittest.TestCase):
+    """Test cases for timing queries run on a session"""
+
+    def setUp(self):
+        self.metrics = QueryMetrics(slow_ms=-1)
+        patcher = mock.patch.object(query_metrics_module, 'query_metrics', self.metrics)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session = mock.MagicMock()
+
+    def test_iteration_is_recorded_when_exhausted(self):
+        """Test that iterating a result records its rows and summary once"""
+        result = mock.MagicMock()
+        result.__iter__.return_value = iter([{"id": 1}, {"id": 2}])
+        result.consume.return_value = make_summary()
+        self.session.run.return_value = result
+
+        rows = list(timed_run(self.session, "AnalyticsService.get_career_path", "MATCH (n) RETURN n", {"id": 1}))
+
+        self.session.run.assert_called_once_with("MATCH (n) RETURN n", {"id": 1})
+        stats = self.metrics.snapshot()['queries']["AnalyticsService.get_career_path"]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual((stats['count'], stats['rows'], stats['server_ms']), (1, 2, 3))
+
+    def test_single_and_consume(self):
+        """Test that single() and consume() record the execution and return the result values"""
+        self.session.run.return_value.single.return_value = {"count": 3}
+        self.session.run.return_value.consume.return_value = make_summary(nodes_created=1)
+
+        record = timed_run(self.session, "AuthService.find_user_by_email", "MATCH (u:User) RETURN u",
+                           email="a@example.com").single()
+        summary = timed_run(self.session, "AuthService.register_user", "CREATE (u:User)").consume()
+
+        self.session.run.assert_any_call("MATCH (u:User) RETURN u", email="a@example.com")
+        queries = self.metrics.snapshot()['queries']
+        self.assertEqual(record, {"count": 3})
+        self.assertEqual(summary.counters.nodes_created, 1)
+        self.assertEqual(queries["AuthService.find_user_by_email"]['rows'], 1)
+        self.assertEqual(queries["AuthService.register_user"]['counters']['nodes_created'], 1)
+
+    def test_failed_run_is_recorded(self):
+        """Test that a query the session rejects is recorded as an error"""
+        self.session.run.side_effect = Exception("syntax error")
+
+        with self.assertRaises(Exception):
+            timed_run(self.session, "GraphService.create_constraints", "CREATE CONSTRAINT")
+
+        self.assertEqual(self.metrics.snapshot()['queries']["GraphService.create_constraints"]['errors'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
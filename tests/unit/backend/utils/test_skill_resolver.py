@@ -0,0 +1,99 @@
+"""
+Unit tests for the skill name resolver
+"""
+
+import unittest
+from unittest import mock
+
+from src.backend.utils import skill_resolver
+from src.backend.utils.skill_resolver import (
+    SkillResolver,
+    get_skill_resolver,
+    invalidate_skill_resolver,
+    normalize_skill_name
+)
+
+
+SKILLS = {
+    "python": {"name": "Python"},
+    "nodejs": {"name": "Node.js"},
+    "ci_cd": {"name": "CI/CD"},
+    "cpp": {"name": "C++"},
+    "csharp": {"name": "C#"}
+}
+
+
+class TestSkillResolver(unittest.TestCase):
+    """Test cases for SkillResolver"""
+
+    def setUp(self):
+        self.resolver = SkillResolver.build(
+            skills=SKILLS,
+            aliases={"python": ["py"]},
+            graph_skills=[{"skill_id": "skill_ab12", "name": "Kubernetes"}],
+            fuzzy_threshold=0.6
+        )
+
+    def test_normalize_skill_name(self):
+        """Test that case, punctuation and whitespace are normalized"""
+        self.assertEqual(normalize_skill_name("  Node.JS "), "node js")
+        self.assertEqual(normalize_skill_name("CI / CD"), "ci cd")
+        self.assertEqual(normalize_skill_name("C++"), "c++")
+        self.assertEqual(normalize_skill_name(None), "")
+
+    def test_exact_and_alias_resolution(self):
+        """Test that names, aliases, IDs and graph-only skills resolve"""
+        self.assertEqual(self.resolver.resolve("PYTHON"), "python")
+        self.assertEqual(self.resolver.resolve("py"), "python")
+        self.assertEqual(self.resolver.resolve("nodejs"), "nodejs")
+        self.assertEqual(self.resolver.resolve("ci-cd"), "ci_cd")
+        self.assertEqual(self.resolver.resolve("kubernetes"), "skill_ab12")
+        self.assertEqual(self.resolver.resolve("c#"), "csharp")
+        self.assertEqual(self.resolver.resolve("C++"), "cpp")
+
+    def test_fuzzy_resolution(self):
+        """Test that near misses resolve through trigrams only when fuzzy matching is enabled"""
+        self.assertEqual(self.resolver.resolve("Kubernets", fuzzy=True), "skill_ab12")
+        self.assertIsNone(self.resolver.resolve("Kubernets"))
+        self.assertIsNone(self.resolver.resolve("Cooking", fuzzy=True))
+
+    def test_related_skills_are_not_linked_by_default(self):
+        """Test that names only resembling a known skill stay unresolved without fuzzy matching"""
+        resolver = SkillResolver.build()
+
+        for name in ("React Native", "Tensorflow.js", "Docker Compose", "Machine Learning Ops"):
+            self.assertIsNone(resolver.resolve(name), name)
+        self.assertEqual(resolver.resolve_many(["Docker Compose", "Docker"]), [resolver.resolve("Docker")])
+
+    def test_resolve_many_deduplicates(self):
+        """Test that resolve_many drops unknown names and duplicates"""
+        skill_ids = self.resolver.resolve_many(["Python", "py", "Cooking", "Node.js"])
+
+        self.assertEqual(skill_ids, ["python", "nodejs"])
+        self.assertEqual(self.resolver.resolve_many("Python"), [])
+        stats = self.resolver.get_stats()
+        self.assertEqual(stats['exact'], 3)
+        self.assertEqual(stats['unresolved'], 1)
+
+    def test_shared_resolver_is_built_once_and_invalidated(self):
+        """Test that the graph is read once until the resolver is invalidated"""
+        invalidate_skill_resolver()
+        repository = mock.MagicMock()
+        repository.execute_read_query.return_value = [{"skill_id": "skill_ab12", "name": "Kubernetes"}]
+
+        with mock.patch('builtins.print'):
+            first = get_skill_resolver(repository)
+            second = get_skill_resolver(repository)
+            invalidate_skill_resolver()
+            third = get_skill_resolver(repository)
+        invalidate_skill_resolver()
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(first.resolve("Kubernetes"), "skill_ab12")
+        self.assertEqual(repository.execute_read_query.call_count, 2)
+        repository.execute_read_query.assert_called_with(skill_resolver.SKILL_NAMES_QUERY)
+
+
+if __name__ == '__main__':
+    unittest.main()
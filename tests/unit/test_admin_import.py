@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Unit tests for admin_import.py."""
+
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.etl.admin_import import AdminImportExporter, NODE_FILES, RELATIONSHIP_FILES
+
+
+class TestAdminImportExporter(unittest.TestCase):
+    """Test case for the neo4j-admin import export."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.skill_nodes = [
+            {"skill_id": "python", "name": "Python", "category": "languages", "domain": "software"},
+            {"skill_id": "sql", "name": "SQL", "category": "databases", "domain": "data"}
+        ]
+        self.skill_relationships = [{"source": "python", "target": "sql", "type": "RELATED_TO"}]
+        self.jobs = [{
+            "job_id": "job_1", "title": "Engineer", "company": "Acme", "location": "Remote",
+            "summary": "Build things,\nwith \"care\"", "responsibilities": ["Code", "Review"],
+            "skills": {"primary": [{"skill_id": "python"}, {"skill_id": "cobol"}],
+                       "secondary": [{"skill_id": "sql"}]},
+            "skill_relationships": [{"source": "python", "target": "sql", "type": "RELATED_TO"},
+                                    {"source": "python", "target": "cobol", "type": "RELATED_TO"}]
+        }]
+        self.resumes = [{
+            "resume_id": "resume_1", "name": "Jane",
+            "skills": {"core": [{"skill_id": "python", "proficiency": "expert", "experience_years": 4.5}]},
+            "experience": [{"job_title": "Developer", "company": "Acme", "skills_used": ["Python", "Unknown"]}]
+        }]
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def _read(self, name, header=False):
+        path = os.path.join(self.temp_dir.name, f"{name}_header.csv" if header else f"{name}.csv")
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))
+    
+    def _export(self):
+        exporter = AdminImportExporter(self.temp_dir.name)
+        return exporter.export(self.skill_nodes, self.skill_relationships,
+                               iter(self.jobs + self.jobs), iter(self.resumes))
+    
+    def test_export_writes_header_and_data_files(self):
+        """Test that every node and relationship type gets an ID-spaced header and a data file."""
+        report = self._export()
+        
+        self.assertEqual(set(report["files"]), set(NODE_FILES) | set(RELATIONSHIP_FILES))
+        self.assertEqual(self._read("jobs", header=True)[0][0], "job_id:ID(Job)")
+        self.assertEqual(self._read("has_core_skill", header=True)[0][:2], [":START_ID(Candidate)", ":END_ID(Skill)"])
+        self.assertEqual(report["records"], 2)
+        self.assertGreater(report["bytes"], 0)
+        self.assertIn("--nodes=Job=", report["command"])
+        self.assertIn("--multiline-fields=true", report["command"])
+    
+    def test_export_matches_online_loader_semantics(self):
+        """Test deduplication, JSON list properties and skipping of unknown skills."""
+        self._export()
+        
+        jobs = self._read("jobs")
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0][5], "Build things,\nwith \"care\"")
+        self.assertEqual(jobs[0][6], '["Code", "Review"]')
+        self.assertEqual(self._read("requires_primary"), [["job_1", "python", "advanced", "0.8"]])
+        self.assertEqual(self._read("skill_relationships"), [["python", "sql", "RELATED_TO", "1.0", "1.0", "2"]])
+        self.assertEqual(self._read("has_core_skill"), [["resume_1", "python", "expert", "4.5"]])
+        self.assertEqual(self._read("has_experience"), [["resume_1", "resume_1_exp_0"]])
+        self.assertEqual(self._read("used_skill"), [["resume_1_exp_0", "python"]])
+    
+    def test_run_admin_export_needs_no_database(self):
+        """Test that the pipeline export works without a graph connection."""
+        from src.etl.data_loader import ETLPipeline
+        
+        etl = ETLPipeline(None, self.temp_dir.name)
+        with patch('builtins.print'), \
+                patch.object(etl, 'stream_jobs', return_value=iter(self.jobs)), \
+                patch.object(etl, 'stream_resumes', return_value=iter(self.resumes)):
+            report = etl.run_admin_export(os.path.join(self.temp_dir.name, "import"))
+        
+        self.assertEqual(report["records"], 2)
+        self.assertGreater(report["files"]["skills"]["rows"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""Unit tests for aggregation.py."""
+
+import unittest
+
+from src.etl.aggregation import SkillRelationshipAggregator, aggregate_skill_relationships
+
+
+class TestSkillRelationshipAggregation(unittest.TestCase):
+    """Test case for skill relationship aggregation."""
+
+    def test_rows_are_reduced_per_edge(self):
+        """Test that repeated edges become one row with count, mean and maximum weight."""
+        rows = aggregate_skill_relationships([
+            {"source": "python", "target": "sql", "type": "USES", "weight": 0.5},
+            {"source": "python", "target": "sql", "type": "USES", "weight": 1.0},
+            {"source": "python", "target": "sql", "type": "USES"},
+            {"source": "python", "target": "sql", "type": "RELATED_TO", "weight": 0.3},
+            {"source": "sql", "target": "python", "type": "USES", "weight": 0.4}
+        ])
+
+        self.assertEqual(rows, [
+            {"source": "python", "target": "sql", "type": "USES", "weight": 2.5 / 3, "weight_max": 1.0, "count": 3},
+            {"source": "python", "target": "sql", "type": "RELATED_TO", "weight": 0.3, "weight_max": 0.3, "count": 1},
+            {"source": "sql", "target": "python", "type": "USES", "weight": 0.4, "weight_max": 0.4, "count": 1}
+        ])
+
+    def test_aggregated_rows_combine_exactly(self):
+        """Test that aggregating partial results equals aggregating all rows at once."""
+        first = [{"source": "a", "target": "b", "type": "USES", "weight": 0.2}] * 3
+        second = [{"source": "a", "target": "b", "type": "USES", "weight": 0.8}]
+
+        aggregator = SkillRelationshipAggregator()
+        aggregator.add_all(aggregate_skill_relationships(first))
+        aggregator.add_all(aggregate_skill_relationships(second))
+
+        combined = aggregator.rows()[0]
+        self.assertEqual(combined["count"], 4)
+        self.assertAlmostEqual(combined["weight"], 0.35)
+        self.assertEqual(combined["weight_max"], 0.8)
+        self.assertEqual(len(aggregator), 1)
+        self.assertEqual(aggregator.occurrences, 4)
+
+    def test_empty_input(self):
+        """Test that no rows aggregate to no rows."""
+        self.assertEqual(aggregate_skill_relationships([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -244,6 +244,31 @@ class TestDataLoader(unittest.TestCase):
             "python", "javascript", "USES", 0.7
         )
     
+    @patch('src.etl.data_loader.get_skill_resolver')
+    def test_load_single_resume_links_experience_skills_in_one_write(self, mock_get_resolver):
+        """Test that experience skills are resolved in memory and linked with a single write."""
+        resume_data = {
+            "resume_id": "resume_1",
+            "experience": [
+                {"job_title": "Engineer", "skills_used": ["Python", "JS", "Unknown"]}
+            ]
+        }
+        mock_kg = MagicMock()
+        mock_session = MagicMock()
+        mock_kg.driver.session.return_value.__enter__.return_value = mock_session
+        mock_kg._process_text_list = lambda x: x if isinstance(x, list) else [x]
+        mock_get_resolver.return_value.resolve_many.return_value = ["python", "javascript"]
+        
+        load_single_resume(mock_kg, resume_data)
+        
+        mock_get_resolver.assert_called_with(mock_kg.candidate_repository)
+        mock_get_resolver.return_value.resolve_many.assert_called_once_with(["Python", "JS", "Unknown"])
+        queries = [call.args[0] for call in mock_session.run.call_args_list]
+        self.assertFalse(any("toLower" in query for query in queries))
+        link_calls = [call for call in mock_session.run.call_args_list if "USED_SKILL" in call.args[0]]
+        self.assertEqual(len(link_calls), 1)
+        self.assertEqual(link_calls[0].args[1]["skill_ids"], ["python", "javascript"])
+    
     @patch('src.etl.data_loader.glob.glob')
     @patch('src.etl.data_loader.os.path.basename')
     @patch('src.etl.data_loader.json.load')
@@ -313,8 +338,7 @@ class TestDataLoader(unittest.TestCase):
         mock_graph_class.assert_called_once_with(
             uri=ANY, user=ANY, password=ANY
         )
-        mock_kg.create_constraints.assert_called_once()
-        mock_kg.ensure_user_schema.assert_called_once()
+        mock_kg.apply_migrations.assert_called_once()
         
         # Verify session query
         mock_session.run.assert_called_with("MATCH (n) RETURN count(n) as node_count")
@@ -341,8 +365,7 @@ class TestDataLoader(unittest.TestCase):
         
         # Verify
         assert result == mock_kg
-        mock_kg.create_constraints.assert_called_once()
-        mock_kg.ensure_user_schema.assert_called_once()
+        mock_kg.apply_migrations.assert_called_once()
         
         # Verify session query
         mock_session.run.assert_called_with("MATCH (n) RETURN count(n) as node_count")
@@ -384,8 +407,7 @@ class TestDataLoader(unittest.TestCase):
         # Verify
         assert result == mock_kg  # Should still return the KG instance
         mock_graph_class.assert_called_once()
-        mock_kg.create_constraints.assert_called_once()
-        mock_kg.ensure_user_schema.assert_called_once()
+        mock_kg.apply_migrations.assert_called_once()
         
         # Verify ETL pipeline was instantiated and run successfully
         mock_etl_pipeline_class.assert_called_once_with(mock_kg, data_dir="/path/to/data")
@@ -428,8 +450,7 @@ class TestDataLoader(unittest.TestCase):
         mock_graph_class.assert_called_once_with(
             uri=ANY, user=ANY, password=ANY
         )
-        mock_kg.create_constraints.assert_called_once()
-        mock_kg.ensure_user_schema.assert_called_once()
+        mock_kg.apply_migrations.assert_called_once()
         
         # Verify ETL pipeline was instantiated but the error was caught
         mock_etl_pipeline_class.assert_called_once_with(mock_kg, data_dir="/path/to/data")
@@ -557,7 +578,8 @@ class TestETLPipeline(unittest.TestCase):
         self.assertEqual(len(skill_nodes), 2)
         self.assertEqual(len(skill_relationships), 1)
         
-        # Verify node structure
+        # Verify node structure; every node also carries a content hash
+        skill_nodes = [{key: value for key, value in node.items() if key != "content_hash"} for node in skill_nodes]
         self.assertIn({"skill_id": "python", "name": "Python", "category": "Programming", "domain": "Software Development"}, skill_nodes)
         self.assertIn({"skill_id": "javascript", "name": "JavaScript", "category": "Programming", "domain": "Web Development"}, skill_nodes)
         
@@ -624,6 +646,147 @@ class TestETLPipeline(unittest.TestCase):
         self.assertEqual(self.etl._get_proficiency_value("unknown"), "beginner")
         self.assertEqual(self.etl._get_proficiency_value(""), "beginner")
 
+    def test_run_streaming_load(self):
+        """Test that streamed records are transformed and loaded in bounded batches."""
+        self.mock_kg.skill_repository = MagicMock()
+        etl = ETLPipeline(self.mock_kg, batch_size=1)
+        resumes = self.sample_resumes * 3
+        
+        with patch.object(etl, 'extract_skills', return_value=self.sample_skills), \
+                patch.object(etl, 'stream_jobs', return_value=iter(self.sample_jobs)), \
+                patch.object(etl, 'stream_resumes', return_value=iter(resumes)), \
+                patch.object(etl, 'load_skills') as mock_load_skills, \
+                patch.object(etl, 'load_jobs') as mock_load_jobs, \
+                patch.object(etl, 'load_candidates') as mock_load_candidates, \
+                patch.object(etl, 'load_experiences') as mock_load_experiences:
+            counts = etl.run_streaming_load()
+        
+        self.assertEqual(counts, {"jobs": 1, "resumes": 3})
+        mock_load_skills.assert_called_once()
+        self.assertEqual(mock_load_jobs.call_count, 1)
+        self.assertEqual(mock_load_candidates.call_count, 3)
+        self.assertEqual(mock_load_experiences.call_count, 3)
+        candidate_nodes, candidate_skill_rels = mock_load_candidates.call_args.args
+        self.assertEqual(len(candidate_nodes), 1)
+        self.assertEqual(len(candidate_skill_rels), 2)
+        # Taxonomy and record skill relationships are aggregated and written once, replacing stored statistics
+        self.assertEqual(mock_load_skills.call_args.args[1], [])
+        self.mock_kg.skill_repository.add_skill_relationships_bulk.assert_called_once()
+        relationship_call = self.mock_kg.skill_repository.add_skill_relationships_bulk.call_args
+        self.assertEqual(relationship_call.kwargs["on_existing"], "replace")
+        self.assertEqual([(row["source"], row["target"], row["type"], row["count"], row["weight_max"])
+                          for row in relationship_call.args[0]],
+                         [("python", "javascript", "REQUIRES", 1, 1.0), ("python", "javascript", "USES", 4, 0.8)])
+    
+    def test_stream_jobs_prefers_json_lines(self):
+        """Test that a JSON Lines dataset is used when present."""
+        with patch('src.etl.data_loader.os.path.exists', side_effect=lambda path: path.endswith(".jsonl")), \
+                patch('src.etl.data_loader.iter_json_records', return_value=iter([{"job_id": "job_1"}])) as mock_iter:
+            jobs = list(self.etl.stream_jobs())
+        
+        self.assertEqual(jobs, [{"job_id": "job_1"}])
+        mock_iter.assert_called_once_with(os.path.join(self.etl.data_dir, "job_dataset.jsonl"), "jobs")
+    
+    def test_load_methods_use_bulk_writes(self):
+        """Test that the load steps delegate to the batched repository writes."""
+        self.mock_kg.skill_repository = MagicMock()
+        self.mock_kg.job_repository = MagicMock()
+        self.mock_kg.candidate_repository = MagicMock()
+        etl = ETLPipeline(self.mock_kg, batch_size=250)
+        
+        etl.load_skills(["skill1"], ["rel1"])
+        etl.load_jobs(["job1"], ["job_skill1"])
+        etl.load_candidates(["candidate1"], ["candidate_skill1"])
+        etl.load_experiences(["exp1"])
+        
+        self.mock_kg.skill_repository.add_skills_bulk.assert_called_once_with(["skill1"], 250)
+        self.mock_kg.skill_repository.add_skill_relationships_bulk.assert_called_once_with(["rel1"], 250, on_existing="replace")
+        self.mock_kg.job_repository.add_jobs_bulk.assert_called_once_with(["job1"], 250)
+        self.mock_kg.job_repository.add_job_skills_bulk.assert_called_once_with(["job_skill1"], 250)
+        self.mock_kg.candidate_repository.add_candidates_bulk.assert_called_once_with(["candidate1"], 250)
+        self.mock_kg.candidate_repository.add_candidate_skills_bulk.assert_called_once_with(["candidate_skill1"], 250)
+        self.mock_kg.candidate_repository.resolve_experience_skills.assert_called_once_with(["exp1"])
+        self.mock_kg.candidate_repository.add_experiences_bulk.assert_called_once_with(["exp1"], 250, link_skills=False)
+        self.mock_kg.candidate_repository.add_experience_skills_bulk.assert_called_once_with(
+            self.mock_kg.candidate_repository.resolve_experience_skills.return_value, 250)
+        self.mock_kg.skill_repository.add_skill_relationship.assert_not_called()
+        stages = [stage["stage"] for stage in etl.report.to_dict()["stages"]]
+        self.assertEqual(stages, ["skills", "skill relationships", "jobs", "candidates",
+                                  "skill lookups", "experience linking"])
+
+    def test_transforms_record_content_hashes(self):
+        """Test that transformed nodes carry a hash that changes with the record."""
+        job_nodes, _, _ = self.etl.transform_jobs(self.sample_jobs)
+        changed_job = {**self.sample_jobs[0], "title": "Senior Python Developer"}
+        changed_nodes, _, _ = self.etl.transform_jobs([changed_job])
+        skill_nodes, _ = self.etl.transform_skills(self.sample_skills)
+        
+        self.assertEqual(job_nodes[0]["content_hash"], self.etl.transform_jobs(self.sample_jobs)[0][0]["content_hash"])
+        self.assertNotEqual(job_nodes[0]["content_hash"], changed_nodes[0]["content_hash"])
+        self.assertTrue(all(node["content_hash"] for node in skill_nodes))
+    
+    def test_run_delta_load(self):
+        """Test that only new and changed records are loaded and removed records are deleted."""
+        self.mock_kg.skill_repository = MagicMock()
+        self.mock_kg.job_repository = MagicMock()
+        self.mock_kg.candidate_repository = MagicMock()
+        skill_nodes, _ = self.etl.transform_skills(self.sample_skills)
+        unchanged_job = {**self.sample_jobs[0], "job_id": "job_unchanged"}
+        new_job = {**self.sample_jobs[0], "job_id": "job_new"}
+        job_hashes = {node["job_id"]: node["content_hash"]
+                      for node in self.etl.transform_jobs([unchanged_job])[0]}
+        self.mock_kg.skill_repository.get_content_hashes.return_value = {
+            node["skill_id"]: node["content_hash"] for node in skill_nodes}
+        self.mock_kg.job_repository.get_content_hashes.return_value = {
+            **job_hashes, "job_123": "stale", "job_removed": "old"}
+        self.mock_kg.candidate_repository.get_content_hashes.return_value = {}
+        
+        with patch.object(self.etl, 'extract_skills', return_value=self.sample_skills), \
+                patch.object(self.etl, 'stream_jobs', return_value=iter(self.sample_jobs + [unchanged_job, new_job])), \
+                patch.object(self.etl, 'stream_resumes', return_value=iter(self.sample_resumes)):
+            summary = self.etl.run_delta_load()
+        
+        self.assertEqual(summary["skills"], {"new": 0, "changed": 0, "unchanged": 2, "deleted": 0})
+        self.assertEqual(summary["jobs"], {"new": 1, "changed": 1, "unchanged": 1, "deleted": 1})
+        self.assertEqual(summary["candidates"], {"new": 1, "changed": 0, "unchanged": 0, "deleted": 0})
+        self.mock_kg.skill_repository.add_skills_bulk.assert_called_once_with([], self.etl.batch_size)
+        self.mock_kg.job_repository.reset_jobs_bulk.assert_called_once_with(["job_123"], self.etl.batch_size)
+        self.mock_kg.job_repository.delete_jobs_bulk.assert_called_once_with(["job_removed"], self.etl.batch_size)
+        loaded_jobs = self.mock_kg.job_repository.add_jobs_bulk.call_args.args[0]
+        self.assertEqual([node["job_id"] for node in loaded_jobs], ["job_123", "job_new"])
+        self.mock_kg.candidate_repository.add_candidates_bulk.assert_called_once()
+        self.mock_kg.skill_repository.delete_skills_bulk.assert_called_once_with([], self.etl.batch_size)
+        # Relationships of reloaded records must not inflate the stored occurrence counts
+        relationship_call = self.mock_kg.skill_repository.add_skill_relationships_bulk.call_args
+        self.assertEqual(relationship_call.kwargs["on_existing"], "keep")
+        self.assertEqual([row["count"] for row in relationship_call.args[0]], [3])
+    
+    def test_run_pipeline_delta_does_not_clear_database(self):
+        """Test that a delta run never clears the database."""
+        self.mock_kg.clear_database = MagicMock(return_value=True)
+        
+        with patch.object(self.etl, 'run_delta_load') as mock_delta:
+            result = self.etl.run_pipeline(clear_db=True, force=True, delta=True)
+        
+        self.assertTrue(result)
+        mock_delta.assert_called_once()
+        self.mock_kg.clear_database.assert_not_called()
+    
+    def test_run_pipeline_writes_stage_report(self):
+        """Test that a run writes a JSON report covering its stages."""
+        import tempfile
+        
+        self.mock_kg.clear_database = MagicMock(return_value=True)
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch.object(self.etl, 'run_streaming_load'):
+            path = os.path.join(temp_dir, "etl_report.json")
+            self.assertTrue(self.etl.run_pipeline(clear_db=True, force=True, streaming=True, report_path=path))
+            with open(path) as f:
+                report = json.load(f)
+        
+        self.assertEqual([stage["stage"] for stage in report["stages"]], ["clear", "schema"])
+        self.assertIn("peak_rss_mb", report)
+    
     def test_run_pipeline_with_clear_database(self):
         """Test run_pipeline when clear_db is True."""
         # Setup - patch the clear_database method on the mock_kg object
@@ -646,7 +809,7 @@ class TestETLPipeline(unittest.TestCase):
                                                 # Verify
                                                 self.assertTrue(result)
                                                 self.mock_kg.clear_database.assert_called_once_with(True)
-                                                self.mock_kg.create_constraints.assert_called_once()
+                                                self.mock_kg.apply_migrations.assert_called_once()
 
     @patch.object(ETLPipeline, 'load_experiences')
     @patch.object(ETLPipeline, 'load_candidates')
@@ -669,9 +832,10 @@ class TestETLPipeline(unittest.TestCase):
         mock_extract_resumes.return_value = self.sample_resumes
         
         # Setup transform mock return values
-        mock_transform_skills.return_value = (["skill1"], ["rel1"])
-        mock_transform_jobs.return_value = (["job1"], ["job_skill1"], ["rel2"])
-        mock_transform_resumes.return_value = (["candidate1"], ["candidate_skill1"], ["rel3"], ["exp1"])
+        rel = {"source": "python", "target": "javascript", "type": "USES"}
+        mock_transform_skills.return_value = (["skill1"], [rel])
+        mock_transform_jobs.return_value = (["job1"], ["job_skill1"], [{**rel, "weight": 0.25}])
+        mock_transform_resumes.return_value = (["candidate1"], ["candidate_skill1"], [{**rel, "weight": 0.25}], ["exp1"])
         
         # Mock GraphService.clear_database
         with patch.object(self.mock_kg, 'clear_database', return_value=True) as mock_clear_database:
@@ -682,7 +846,7 @@ class TestETLPipeline(unittest.TestCase):
                 
                 # Verify all methods were called in order
                 mock_clear_database.assert_called_once_with(True)
-                self.mock_kg.create_constraints.assert_called_once()
+                self.mock_kg.apply_migrations.assert_called_once()
                 mock_extract_skills.assert_called_once()
                 mock_extract_jobs.assert_called_once()
                 mock_extract_resumes.assert_called_once()
@@ -691,7 +855,9 @@ class TestETLPipeline(unittest.TestCase):
                 mock_transform_resumes.assert_called_once_with(self.sample_resumes)
                 
                 # Verify combined skill relationships are passed to load_skills
-                mock_load_skills.assert_called_once_with(["skill1"], ["rel1", "rel2", "rel3"])
+                # Skill relationships are aggregated into one row per edge
+                mock_load_skills.assert_called_once_with(["skill1"], [
+                    {**rel, "weight": 0.5, "weight_max": 1.0, "count": 3}])
                 mock_load_jobs.assert_called_once_with(["job1"], ["job_skill1"])
                 mock_load_candidates.assert_called_once_with(["candidate1"], ["candidate_skill1"])
                 mock_load_experiences.assert_called_once_with(["exp1"])
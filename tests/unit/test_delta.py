@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""Unit tests for delta.py."""
+
+import unittest
+
+from src.etl.delta import content_hash, plan_changes
+
+
+class TestContentHash(unittest.TestCase):
+    """Test case for content hashing."""
+    
+    def test_key_order_does_not_matter(self):
+        """Test that equal dictionaries hash equally regardless of key order."""
+        self.assertEqual(content_hash({"a": 1, "b": [1, 2]}), content_hash({"b": [1, 2], "a": 1}))
+    
+    def test_content_changes_the_hash(self):
+        """Test that any changed value or extra part changes the hash."""
+        node = {"job_id": "job_1", "title": "Engineer"}
+        self.assertNotEqual(content_hash(node), content_hash({**node, "title": "Senior Engineer"}))
+        self.assertNotEqual(content_hash(node), content_hash(node, []))
+
+
+class TestPlanChanges(unittest.TestCase):
+    """Test case for change planning."""
+    
+    def test_plan_changes(self):
+        """Test that records are classified as new, changed, unchanged or deleted."""
+        plan = plan_changes(
+            {"job_3": "c", "job_1": "a", "job_2": "b2", "job_4": "d"},
+            {"job_1": "a", "job_2": "b", "job_5": "e"}
+        )
+        
+        self.assertEqual(plan, {
+            "new": ["job_3", "job_4"],
+            "changed": ["job_2"],
+            "unchanged": ["job_1"],
+            "deleted": ["job_5"]
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
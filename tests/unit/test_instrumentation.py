@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""Unit tests for instrumentation.py."""
+
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.backend.utils import write_counters
+from src.etl.instrumentation import REPORT_VERSION, PipelineReport, print_pipeline_report
+
+
+def _summary(**counters):
+    """Create a stand-in for a neo4j ResultSummary."""
+    values = dict.fromkeys(write_counters.COUNTER_NAMES, 0)
+    values.update(counters)
+    return SimpleNamespace(counters=SimpleNamespace(**values))
+
+
+class TestPipelineReport(unittest.TestCase):
+    """Test case for ETL stage metrics."""
+    
+    def test_stages_accumulate_time_records_and_write_counters(self):
+        """Test that repeated stages are merged and attributed their database writes."""
+        report = PipelineReport()
+        with report.stage("jobs", 10):
+            write_counters.record(_summary(nodes_created=10, properties_set=50))
+        with report.stage("jobs", 5):
+            write_counters.record(_summary(nodes_created=5, relationships_created=7))
+        with report.stage("embeddings"):
+            pass
+        
+        result = report.to_dict()
+        jobs, embeddings = result["stages"]
+        self.assertEqual(result["version"], REPORT_VERSION)
+        self.assertEqual((jobs["stage"], jobs["records"], jobs["calls"]), ("jobs", 15, 2))
+        self.assertEqual((jobs["nodes_created"], jobs["relationships_created"], jobs["properties_set"]), (15, 7, 50))
+        self.assertIsNone(embeddings["records_per_second"])
+        self.assertEqual(result["database"]["nodes_created"], 15)
+    
+    def test_failing_stage_is_still_recorded(self):
+        """Test that a stage raising an exception is measured before the exception propagates."""
+        report = PipelineReport()
+        with self.assertRaises(ValueError):
+            with report.stage("transform", 3):
+                raise ValueError("bad record")
+        
+        self.assertEqual(report.to_dict()["stages"][0]["records"], 3)
+    
+    def test_write_json_and_print(self):
+        """Test that the report is written as JSON and printed as a table."""
+        report = PipelineReport()
+        report.add("extract", 0.5, 100)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "reports", "etl.json")
+            written = report.write_json(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f), written)
+        
+        self.assertEqual(written["stages"][0]["records_per_second"], 200.0)
+        with patch('builtins.print') as mock_print:
+            print_pipeline_report(written)
+        self.assertTrue(any("extract" in str(call) for call in mock_print.call_args_list))
+    
+    def test_record_ignores_summaries_without_counters(self):
+        """Test that mocked or missing summaries do not change the totals."""
+        before = write_counters.snapshot()
+        write_counters.record(None)
+        write_counters.record(SimpleNamespace(counters=SimpleNamespace(nodes_created="n/a")))
+        
+        self.assertEqual(write_counters.since(before), dict.fromkeys(write_counters.COUNTER_NAMES, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""Unit tests for json_stream.py."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from src.etl.json_stream import iter_json_records
+
+
+class TestIterJsonRecords(unittest.TestCase):
+    """Test case for streaming JSON records."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.records = [
+            {"job_id": f"job_{i}", "title": "Engineer, \"Senior\" [Backend]", "salary": 100000 + i,
+             "skills": {"primary": [{"skill_id": "python", "importance": 0.9}]}}
+            for i in range(25)
+        ]
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+    
+    def test_wrapped_array_with_small_chunks(self):
+        """Test reading records wrapped under a key with chunks smaller than a record."""
+        path = self._write("jobs.json", json.dumps({"meta": {"version": 2}, "jobs": self.records}, indent=2))
+        
+        for chunk_size in (1, 7, 1 << 16):
+            self.assertEqual(list(iter_json_records(path, "jobs", chunk_size=chunk_size)), self.records)
+    
+    def test_top_level_array(self):
+        """Test reading a top-level array, including an empty one."""
+        path = self._write("jobs.json", json.dumps(self.records))
+        empty = self._write("empty.json", " [ ] ")
+        
+        self.assertEqual(list(iter_json_records(path, chunk_size=16)), self.records)
+        self.assertEqual(list(iter_json_records(empty)), [])
+    
+    def test_json_lines(self):
+        """Test reading JSON Lines, skipping blank lines."""
+        path = self._write("jobs.jsonl", "\n".join(json.dumps(r) for r in self.records) + "\n\n")
+        
+        self.assertEqual(list(iter_json_records(path, "jobs")), self.records)
+    
+    def test_single_object_without_key(self):
+        """Test that an object without the wrapping key is a single record."""
+        path = self._write("resume.json", json.dumps({"resume_id": "resume_1", "name": "Jane"}))
+        
+        self.assertEqual(list(iter_json_records(path, "resumes", chunk_size=4)), [{"resume_id": "resume_1", "name": "Jane"}])
+    
+    def test_records_are_yielded_lazily(self):
+        """Test that records before a syntax error are yielded before the error is raised."""
+        path = self._write("broken.json", '[{"a": 1}, {"a": 2}, {"a": ')
+        records = iter_json_records(path, chunk_size=8)
+        
+        self.assertEqual(next(records), {"a": 1})
+        self.assertEqual(next(records), {"a": 2})
+        with self.assertRaises(ValueError):
+            next(records)
+    
+    def test_invalid_json_lines_reports_line(self):
+        """Test that a bad JSON Lines record reports its line number."""
+        path = self._write("bad.jsonl", '{"a": 1}\nnot json\n')
+        
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            list(iter_json_records(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
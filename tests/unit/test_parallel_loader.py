@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""Unit tests for parallel.py."""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.etl.parallel import ParallelLoader, partition, print_report, transform_file
+
+
+class RecordingRepository:
+    """Fake repository that records every bulk write it receives."""
+    
+    def __init__(self, log):
+        self.log = log
+        self.lock = threading.Lock()
+    
+    def __getattr__(self, name):
+        if not name.startswith("add_"):
+            raise AttributeError(name)
+        
+        def write(rows, batch_size, **kwargs):
+            rows = list(rows)
+            with self.lock:
+                self.log.append((name, rows, kwargs))
+            return len(rows)
+        return write
+    
+    def resolve_experience_skills(self, experiences):
+        return [{"exp_id": exp["exp_id"], "skill_id": skill} for exp in experiences for skill in exp.get("skills_used", [])]
+
+
+class TestParallelLoader(unittest.TestCase):
+    """Test case for the parallel ETL loader."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.job_path = os.path.join(self.temp_dir.name, "job_1.json")
+        self.resume_path = os.path.join(self.temp_dir.name, "resumes.json")
+        with open(self.job_path, "w") as f:
+            json.dump({"job_id": "job_1", "title": "Engineer", "company": "Acme", "location": "Remote",
+                       "skills": {"primary": [{"skill_id": "python"}], "secondary": [{"skill_id": "sql"}]}}, f)
+        with open(self.resume_path, "w") as f:
+            json.dump({"resumes": [
+                {"resume_id": f"resume_{i}", "name": "Jane",
+                 "skills": {"core": [{"skill_id": "python", "proficiency": "expert"}]},
+                 "experience": [{"job_title": "Dev", "skills_used": ["sql"]}]}
+                for i in range(3)
+            ] + [{"unknown": True}]}, f)
+        
+        self.log = []
+        self.kg = MagicMock()
+        self.kg.skill_repository = RecordingRepository(self.log)
+        self.kg.job_repository = RecordingRepository(self.log)
+        self.kg.candidate_repository = RecordingRepository(self.log)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_partition_keeps_keys_together(self):
+        """Test that rows with the same key always land in the same partition."""
+        rows = [{"skill_id": f"skill_{i % 5}", "n": i} for i in range(50)]
+        
+        first = partition(rows, "skill_id", 3)
+        second = partition(list(reversed(rows)), "skill_id", 3)
+        
+        self.assertEqual(len(first), 3)
+        self.assertEqual(sum(len(bucket) for bucket in first), 50)
+        for bucket_a, bucket_b in zip(first, second):
+            self.assertEqual({row["skill_id"] for row in bucket_a}, {row["skill_id"] for row in bucket_b})
+    
+    def test_transform_file_classifies_records(self):
+        """Test that a worker transforms jobs and resumes and skips unknown records."""
+        jobs = transform_file(self.job_path)
+        resumes = transform_file(self.resume_path)
+        
+        self.assertEqual(len(jobs["job_nodes"]), 1)
+        self.assertEqual(len(jobs["job_skill_relationships"]), 2)
+        self.assertEqual(len(resumes["candidate_nodes"]), 3)
+        self.assertEqual(len(resumes["experiences"]), 3)
+        self.assertEqual(resumes["skipped"], 1)
+    
+    def test_run_loads_in_dependency_order(self):
+        """Test that skills load first, skill links are split by skill and skill relationships load last."""
+        loader = ParallelLoader(self.kg, batch_size=100, workers=2, write_sessions=2)
+        
+        with patch('builtins.print'):
+            report = loader.run([self.job_path, self.resume_path],
+                                [{"skill_id": "python", "name": "Python"}, {"skill_id": "sql", "name": "SQL"}],
+                                [{"source": "python", "target": "sql", "type": "related_to"}])
+        
+        writes = [name for name, _, _ in self.log]
+        self.assertEqual(writes[0], "add_skills_bulk")
+        self.assertEqual(writes[-1], "add_skill_relationships_bulk")
+        self.assertLess(max(writes.index("add_jobs_bulk"), writes.index("add_candidates_bulk")),
+                        writes.index("add_experiences_bulk"))
+        
+        experience_writes = [kwargs for name, _, kwargs in self.log if name == "add_experiences_bulk"]
+        self.assertTrue(all(kwargs == {"link_skills": False} for kwargs in experience_writes))
+        
+        # No skill appears in two different link writes of the same relationship type
+        for name in ("add_job_skills_bulk", "add_candidate_skills_bulk", "add_experience_skills_bulk"):
+            seen = [{row["skill_id"] for row in rows} for write, rows, _ in self.log if write == name]
+            for i, skills_a in enumerate(seen):
+                for skills_b in seen[i + 1:]:
+                    self.assertFalse(skills_a & skills_b)
+        
+        self.assertEqual(report["jobs"], 1)
+        self.assertEqual(report["resumes"], 3)
+        self.assertIn(report["bottleneck"], [phase["phase"] for phase in report["phases"]])
+        with patch('builtins.print') as mock_print:
+            print_report(report)
+        self.assertTrue(any("Bottleneck" in str(call) for call in mock_print.call_args_list))
+
+
+if __name__ == '__main__':
+    unittest.main()